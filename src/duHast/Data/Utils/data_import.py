@@ -33,6 +33,8 @@ Data storage reader class.
 # from System import Linq
 # clr.ImportExtensions(Linq)
 
+import json
+
 from duHast.Data.Objects import data_ceiling as dc
 from duHast.Data.Objects import data_room as dr
 from duHast.Data.Utils.data_to_file import CONSTANT_DATA_FIELDS
@@ -62,7 +64,13 @@ class ReadDataFromFile:
         self.data_type = ""
         self.data = []
         self.data_by_type = {}
+        # level name -> list of data objects (in load order)
+        self.data_by_level = {}
+        # (level name, data type) -> list of data objects (in load order)
+        self.data_by_level_and_type = {}
         self.debug_messages = []
+        # list of [line number, error message] of lines which failed to load in streamed mode
+        self.malformed_lines = []
 
     # list of data types supported by this class
     SUPPORTED_DATA_TYPES = {
@@ -98,6 +106,8 @@ class ReadDataFromFile:
                     self.data_by_type[data_type_name].append(p)
                 else:
                     self.data_by_type[data_type_name] = [p]
+                # append to level and level / type indexes
+                self._add_to_level_indexes(p)
                 # append to overall data list
                 self.data.append(p)
 
@@ -105,6 +115,25 @@ class ReadDataFromFile:
             pass
             # not all data types are always present in the json object!
 
+    def _add_to_level_indexes(self, data_object):
+        """
+        Adds a data object to the level and the level and data type index.
+
+        :param data_object: A data object.
+        :type data_object: :class:`.DataRoom` or :class:`.DataCeiling`
+        """
+
+        level_name = data_object.level.name
+        if level_name in self.data_by_level:
+            self.data_by_level[level_name].append(data_object)
+        else:
+            self.data_by_level[level_name] = [data_object]
+        key = (level_name, data_object.data_type)
+        if key in self.data_by_level_and_type:
+            self.data_by_level_and_type[key].append(data_object)
+        else:
+            self.data_by_level_and_type[key] = [data_object]
+
     def add_debug_message_from_load(self, json):
         """
         Returns a list of debug messages from the load process.
@@ -136,6 +165,185 @@ class ReadDataFromFile:
             )
         )
 
+    def _add_debug_message_load_stats(self):
+        """
+        Adds the number of data objects loaded, overall and per data type, to the debug messages.
+        """
+
+        self.debug_messages.append(
+            "Data loaded: {} data objects".format(len(self.data))
+        )
+        for data_type_name in self.SUPPORTED_DATA_TYPES:
+            if data_type_name in self.data_by_type:
+                self.debug_messages.append(
+                    "...Data type {} has: {} entries".format(
+                        data_type_name, len(self.data_by_type[data_type_name])
+                    )
+                )
+            else:
+                self.debug_messages.append(
+                    "...Data type {} has: 0 entries".format(data_type_name)
+                )
+
+    def _add_malformed_line(self, line_number, message):
+        """
+        Records a line which failed to load in streamed mode.
+
+        :param line_number: The line number (one based) in the data file.
+        :type line_number: int
+        :param message: The reason the line failed to load.
+        :type message: str
+        """
+
+        self.malformed_lines.append([line_number, message])
+        self.debug_messages.append(
+            "Malformed data in line {}: {}".format(line_number, message)
+        )
+
+    def iter_data_objects(self, level_names=None, data_types=None):
+        """
+        Reads the data file line by line and yields data objects one at the time.
+
+        Each line of the file is expected to contain one json document: either a dictionary as written by a single export\
+            ( keys: 'date processed', 'room', 'ceiling', 'file name' ) or a list of such dictionaries.
+
+        Lines which can not be parsed, data type values which are not a list, or data entries which fail to convert into a data object, are recorded in\
+            the malformed lines property and the debug messages. Processing continues with the next line ( or data type ).
+
+        A single debug message summarising the json documents read is added once the file is read completely.
+
+        Note: Data objects yielded are not stored in this class. Use :meth:`load_data_streamed` for that.
+
+        :param level_names: If provided, only data objects on these levels are returned.
+        :type level_names: list [str]
+        :param data_types: If provided, only data objects of these data types are returned. ( refer to property .data_type on data object class )
+        :type data_types: list [str]
+
+        :return: Data objects.
+        :rtype: generator [:class:`.DataRoom` or :class:`.DataCeiling`]
+        """
+
+        if level_names is not None:
+            level_names = set(level_names)
+        data_type_names = [
+            data_type_name
+            for data_type_name in self.SUPPORTED_DATA_TYPES
+            if data_types is None or data_type_name in data_types
+        ]
+
+        # load summary counters, a debug message per json document would grow with the file size
+        number_of_documents = 0
+        number_of_data_objects = 0
+        with open(self.data_file_path) as f:
+            line_number = 0
+            for line in f:
+                line_number = line_number + 1
+                if not line.strip():
+                    continue
+                try:
+                    json_document = json.loads(line)
+                except ValueError as e:
+                    self._add_malformed_line(line_number, "Invalid json: {}".format(e))
+                    continue
+
+                if isinstance(json_document, dict):
+                    entries = [json_document]
+                elif isinstance(json_document, list):
+                    entries = json_document
+                else:
+                    self._add_malformed_line(
+                        line_number,
+                        "Data format not supported: {}".format(type(json_document)),
+                    )
+                    continue
+
+                for entry in entries:
+                    if not isinstance(entry, dict):
+                        self._add_malformed_line(
+                            line_number,
+                            "Data format not supported: {}".format(type(entry)),
+                        )
+                        continue
+                    number_of_documents = number_of_documents + 1
+                    for data_type_name in data_type_names:
+                        data_type_class = self.SUPPORTED_DATA_TYPES[data_type_name]
+                        data_type_entries = entry.get(data_type_name, [])
+                        if not isinstance(data_type_entries, list):
+                            self._add_malformed_line(
+                                line_number,
+                                "Data type {} is not a list: {}".format(
+                                    data_type_name, type(data_type_entries)
+                                ),
+                            )
+                            continue
+                        for d in data_type_entries:
+                            try:
+                                data_object = data_type_class(d)
+                            except Exception as e:
+                                self._add_malformed_line(
+                                    line_number,
+                                    "Failed to load {}: {}".format(data_type_name, e),
+                                )
+                                continue
+                            number_of_data_objects = number_of_data_objects + 1
+                            if (
+                                level_names is None
+                                or data_object.level.name in level_names
+                            ):
+                                yield data_object
+        self.debug_messages.append(
+            "...Loaded {} json documents in {} lines containing {} data objects.".format(
+                number_of_documents, line_number, number_of_data_objects
+            )
+        )
+
+    def load_data_streamed(self, level_names=None, data_types=None):
+        """
+        Load json formatted rows, one json document per line, into data objects and stores them in this class.
+
+        Unlike :meth:`load_data` the file is not read into memory in one go and data objects not matching the\
+            level and data type filters are discarded while reading.
+
+        Malformed lines are recorded in the malformed lines property and the debug messages.
+
+        :param level_names: If provided, only data objects on these levels are loaded.
+        :type level_names: list [str]
+        :param data_types: If provided, only data objects of these data types are loaded.
+        :type data_types: list [str]
+        """
+
+        self.debug_messages.append(
+            "Data format: one json document per line in file: {}".format(
+                self.data_file_path
+            )
+        )
+        try:
+            for data_object in self.iter_data_objects(
+                level_names=level_names, data_types=data_types
+            ):
+                # append to data by type dictionary
+                if data_object.data_type in self.data_by_type:
+                    self.data_by_type[data_object.data_type].append(data_object)
+                else:
+                    self.data_by_type[data_object.data_type] = [data_object]
+                # append to level and level / type indexes
+                self._add_to_level_indexes(data_object)
+                # append to overall data list
+                self.data.append(data_object)
+        except (IOError, OSError) as e:
+            self.debug_messages.append(
+                "Failed to read file: {} with exception: {}".format(
+                    self.data_file_path, e
+                )
+            )
+
+        if len(self.malformed_lines) > 0:
+            self.debug_messages.append(
+                "Malformed lines: {}".format(len(self.malformed_lines))
+            )
+        # final load stats
+        self._add_debug_message_load_stats()
+
     def load_data(self):
         """
         Load json formatted rows into data objects and stores them in this class.
@@ -200,20 +408,7 @@ class ReadDataFromFile:
             )
 
         # final load stats
-        self.debug_messages.append(
-            "Data loaded: {} data objects".format(len(self.data))
-        )
-        for data_type_name in self.SUPPORTED_DATA_TYPES:
-            if data_type_name in self.data_by_type:
-                self.debug_messages.append(
-                    "...Data type {} has: {} entries".format(
-                        data_type_name, len(self.data_by_type[data_type_name])
-                    )
-                )
-            else:
-                self.debug_messages.append(
-                    "...Data type {} has: 0 entries".format(data_type_name)
-                )
+        self._add_debug_message_load_stats()
 
     def get_data_by_level(self, level_name):
         """
@@ -226,7 +421,17 @@ class ReadDataFromFile:
         :rtype: list [data objects]
         """
 
-        return list(filter(lambda x: (x.level.name == level_name), self.data))
+        return list(self.data_by_level.get(level_name, []))
+
+    def get_level_names(self):
+        """
+        Returns all level names in the order they were first encountered when loading the data.
+
+        :return: A list of level names.
+        :rtype: list [str]
+        """
+
+        return list(self.data_by_level.keys())
 
     def get_data_by_type(self, data_type):
         """
@@ -239,7 +444,7 @@ class ReadDataFromFile:
         :rtype: list [data objects]
         """
 
-        return list(filter(lambda x: (x.data_type == data_type), self.data))
+        return list(self.data_by_type.get(data_type, []))
 
     def get_data_by_level_and_data_type(self, level_name, data_type):
         """
@@ -255,9 +460,4 @@ class ReadDataFromFile:
         :rtype: list [data objects]
         """
 
-        return list(
-            filter(
-                lambda x: (x.level.name == level_name and x.data_type == data_type),
-                self.data,
-            )
-        )
+        return list(self.data_by_level_and_type.get((level_name, data_type), []))
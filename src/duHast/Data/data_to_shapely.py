@@ -36,6 +36,7 @@ This module requires python >3.9 due to dependencies:
 # to avoid an exception stopping the entire package to load these are within a try catch block
 
 import shapely.geometry as sg
+from shapely.strtree import STRtree
 import numpy as np
 
 from duHast.Data.Objects import data_ceiling as dc
@@ -50,6 +51,8 @@ def get_translation_matrix(geometry_object):
     """
     Gets the rotation/ translation matrix from the geometry object
 
+    Note: The geometry object past in is not changed.
+
     :param geometry_object: A data geometry object instance.
     :type geometry_object: :class:`.DataGeometry`
 
@@ -57,24 +60,107 @@ def get_translation_matrix(geometry_object):
     :rtype: numpy array
     """
 
-    translation_matrix = []  # translation only matrix
     # note numpy creates arrays by row!
     # need to append one more row since matrix dot multiplication rule:
     # number of columns in first matrix must match number of rows in second matrix (point later on)
-    for vector in geometry_object.rotation_coord:
-        vector.append(0.0)
-        translation_matrix.append(vector)
-    rotation_matrix = geometry_object.translation_coord  # rotation matrix
-    # adding extra row here
-    rotation_matrix.append(1.0)
-    translation_matrix.append(rotation_matrix)
-    # build combined rotation and translation matrix
-    combined_matrix = np.array(translation_matrix)
+    combined_matrix = np.zeros((4, 4))
+    # rotation vectors with an extra 0.0
+    combined_matrix[:3, :3] = np.array(geometry_object.rotation_coord, dtype=float)
+    # translation vector with an extra 1.0
+    combined_matrix[3, :3] = np.array(geometry_object.translation_coord, dtype=float)
+    combined_matrix[3, 3] = 1.0
     # transpose matrix (translation matrix in json file is stored by columns not by rows!)
     combined_matrix = np.transpose(combined_matrix)
     return combined_matrix
 
 
+def get_loop_as_coordinates(loop, translation_matrix):
+    """
+    Returns the points of a loop translated with the past in matrix as a numpy array of shape (N,3).
+
+    All points are transformed with a single matrix multiplication. 2D points are assumed to have a Z value of 0.0 (room loops are 2D).
+
+    Note: The loop past in is not changed.
+
+    :param loop: List of points, each point is a list of 2 or 3 doubles.
+    :type loop: [[float]]
+    :param translation_matrix: A translation matrix.
+    :type translation_matrix: numpy array
+
+    :return: Translated coordinates, one row per point.
+    :rtype: numpy array
+    """
+
+    if len(loop) == 0:
+        return np.zeros((0, 3))
+    try:
+        points = np.array(loop, dtype=float)
+    except ValueError:
+        # mix of 2D and 3D points
+        points = None
+    if points is None or points.ndim != 2:
+        points = np.array(
+            [[p[0], p[1], p[2] if len(p) > 2 else 0.0] for p in loop], dtype=float
+        )
+    elif points.shape[1] == 2:
+        # assume a Z value of 0.0 (room loops are 2D)
+        points = np.hstack((points, np.zeros((points.shape[0], 1))))
+    # need to add 1 to each point for matrix multiplication
+    # number of columns in first matrix (translation) must match number of rows in second matrix (point)
+    homogeneous_points = np.hstack((points[:, :3], np.ones((points.shape[0], 1))))
+    return np.dot(homogeneous_points, np.transpose(translation_matrix))[:, :3]
+
+
+def get_outer_loop_as_coordinates(geometry_object, translation_matrix):
+    """
+    Returns the boundary loop of an object as a numpy array of translated coordinates.
+
+    Any loops containing less then 3 points will be ignored. (Empty array will be returned)
+
+    :param geometry_object: A data geometry object instance.
+    :type geometry_object: :class:`.DataGeometry`
+    :param translation_matrix: A translation matrix.
+    :type translation_matrix: numpy array
+
+    :return: Coordinates of shape (N,3) defining a polygon. (Empty array will be returned if less then 3 points in loop.)
+    :rtype: numpy array
+    """
+
+    if geometry_object.data_type == geometry_polygon.DataPolygon.data_type:
+        coordinates = get_loop_as_coordinates(
+            geometry_object.outer_loop, translation_matrix
+        )
+        # ignore any poly loops with less then 3 sides (less then 3 points)
+        if len(coordinates) > 2:
+            return coordinates
+    return np.zeros((0, 3))
+
+
+def get_inner_loops_as_coordinates(geometry_object, translation_matrix):
+    """
+    Returns the inner loops (holes) of an object as a list of numpy arrays of translated coordinates.
+
+    Any inner loops containing less then 3 points will be ignored.
+
+    :param geometry_object: A data geometry object instance.
+    :type geometry_object: :class:`.DataGeometry`
+    :param translation_matrix: A translation matrix.
+    :type translation_matrix: numpy array
+
+    :return: List of coordinate arrays of shape (N,3) defining polygons.
+    :rtype: list [numpy array]
+    """
+
+    loops = []
+    # there might be more then one inner loop
+    for inner_loop in geometry_object.inner_loops:
+        coordinates = get_loop_as_coordinates(inner_loop, translation_matrix)
+        # ignore any poly loops with less then 3 sides ( less then 3 points)
+        if len(coordinates) > 2:
+            loops.append(coordinates)
+    return loops
+
+
 def get_outer_loop_as_shapely_points(geometry_object, translation_matrix):
     """
     Returns the boundary loop of an object as list of shapely points.
@@ -91,27 +177,8 @@ def get_outer_loop_as_shapely_points(geometry_object, translation_matrix):
     :rtype: List[shapely.point]
     """
 
-    single_polygon_loop = []
-    if geometry_object.data_type == geometry_polygon.DataPolygon.data_type:
-        for point_double in geometry_object.outer_loop:
-            # check if a 2D or 3D point
-            if len(point_double) == 2:
-                # assume a Z value of 0.0 (room loops are 2D)
-                point_double.append(0.0)
-
-            # need to add 1 to list for matrix multiplication
-            # number of columns in first matrix (translation) must match number of rows in second matrix (point)
-            translated_point = np.dot(
-                translation_matrix,
-                [point_double[0], point_double[1], point_double[2], 1.0],
-            )
-            p = sg.Point(translated_point[0], translated_point[1], translated_point[2])
-            single_polygon_loop.append(p)
-    # ignore any poly loops with less then 3 sides (less then 3 points)
-    if len(single_polygon_loop) > 2:
-        return single_polygon_loop
-    else:
-        return []
+    coordinates = get_outer_loop_as_coordinates(geometry_object, translation_matrix)
+    return [sg.Point(c[0], c[1], c[2]) for c in coordinates]
 
 
 def get_inner_loops_as_shapely_points(geometry_object, translation_matrix):
@@ -130,31 +197,12 @@ def get_inner_loops_as_shapely_points(geometry_object, translation_matrix):
     :rtype: list [list[shapely.point]]
     """
 
-    shapely_points = []
-    # get inner loops
-    if len(geometry_object.inner_loops) > 0:
-        # there might be more then one inner loop
-        for inner_loop in geometry_object.inner_loops:
-            single_polygon_loop = []
-            for point_double in inner_loop:
-                # check if a 2D or 3D point
-                if len(point_double) == 2:
-                    # assume a Z value of 0.0 (room loops are 2D)
-                    point_double.append(0.0)
-                # need to add 1 to list for matrix multiplication
-                # number of columns in first matrix (translation) must match number of rows in second matrix (point)
-                translated_point = np.dot(
-                    translation_matrix,
-                    [point_double[0], point_double[1], point_double[2], 1.0],
-                )
-                p = sg.Point(
-                    translated_point[0], translated_point[1], translated_point[2]
-                )
-                single_polygon_loop.append(p)
-            # ignore any poly loops with less then 3 sides ( less then 3 points)
-            if len(single_polygon_loop) > 2:
-                shapely_points.append(single_polygon_loop)
-    return shapely_points
+    return [
+        [sg.Point(c[0], c[1], c[2]) for c in coordinates]
+        for coordinates in get_inner_loops_as_coordinates(
+            geometry_object, translation_matrix
+        )
+    ]
 
 
 def build_shapely_polygon(shapely_polygons):
@@ -164,8 +212,8 @@ def build_shapely_polygon(shapely_polygons):
     Assumptions is: first polygon describes the boundary loop and any subsequent polygons are describing\
          holes within the boundary 
 
-    :param shapely_polygons: list of shapely polygons
-    :type shapely_polygons: list[shapely.polygon]
+    :param shapely_polygons: list of loops, each loop is either a list of shapely points or an array of coordinates
+    :type shapely_polygons: list[list[shapely.point]] or list[numpy array]
 
     :return: A shapely polygon.
     :rtype: shapely.polygon
@@ -218,17 +266,16 @@ def get_shapely_polygons_from_data_instance(data_instance):
         if geometry_object.data_type == geometry_polygon.DataPolygon.data_type:
             translation_matrix = get_translation_matrix(geometry_object)
             shape_shapely = []
-            outer_loop = get_outer_loop_as_shapely_points(
+            outer_loop = get_outer_loop_as_coordinates(
                 geometry_object, translation_matrix
             )
             shape_shapely.append(outer_loop)
             if len(outer_loop) > 0:
-                inner_loops = get_inner_loops_as_shapely_points(
+                inner_loops = get_inner_loops_as_coordinates(
                     geometry_object, translation_matrix
                 )
-                if len(inner_loops) > 0:
-                    for l in inner_loops:
-                        shape_shapely.append(l)
+                for l in inner_loops:
+                    shape_shapely.append(l)
             poly = build_shapely_polygon(shape_shapely)
             all_polygons.append(poly)
         else:
@@ -269,3 +316,64 @@ def get_shapely_polygons_from_geo_object(geometry_objects, data_type):
             if p != None:
                 multi_polygons[geometry_objects[i].instance_properties.id].append(p)
     return multi_polygons
+
+
+# --------------- spatial index ------------------
+
+
+def build_polygon_index(polygons_by_id):
+    """
+    Builds a spatial index (STRtree) over polygons returned by :func:`get_shapely_polygons_from_geo_object`.
+
+    Empty polygons are not added to the index.
+
+    :param polygons_by_id: A dictionary where key is the geometry objects id and value is a list of shapely polygons.
+    :type polygons_by_id: {int:[shapely.polygon]}
+
+    :return: A tuple of the spatial index (None if no polygons where added) and a list of tuples (id, polygon) in order of insertion.
+    :rtype: (shapely.strtree.STRtree, [(int, shapely.polygon)])
+    """
+
+    entries = []
+    for polygon_id, polygons in polygons_by_id.items():
+        for polygon in polygons:
+            if polygon is not None and not polygon.is_empty:
+                entries.append((polygon_id, polygon))
+    if len(entries) == 0:
+        return None, entries
+    tree = STRtree([entry[1] for entry in entries])
+    return tree, entries
+
+
+def query_polygon_index(polygon_index, polygon):
+    """
+    Returns all indexed polygons which bounding box intersects the bounding box of the polygon past in.
+
+    Note: This is a candidate search only. An actual intersection check is still required.
+
+    :param polygon_index: A spatial index as returned by :func:`build_polygon_index`
+    :type polygon_index: (shapely.strtree.STRtree, [(int, shapely.polygon)])
+    :param polygon: The polygon to find candidates for.
+    :type polygon: shapely.polygon
+
+    :return: A list of tuples (id, polygon) in order of insertion into the index.
+    :rtype: [(int, shapely.polygon)]
+    """
+
+    tree, entries = polygon_index
+    if tree is None or polygon is None or polygon.is_empty:
+        return []
+    candidates = tree.query(polygon)
+    indices = []
+    # shapely 2.x returns indices, shapely 1.8 returns the geometries
+    geometry_index = None
+    for candidate in candidates:
+        if isinstance(candidate, (int, np.integer)):
+            indices.append(int(candidate))
+        else:
+            if geometry_index is None:
+                geometry_index = dict(
+                    (id(entries[i][1]), i) for i in range(len(entries))
+                )
+            indices.append(geometry_index[id(candidate)])
+    return [entries[i] for i in sorted(indices)]
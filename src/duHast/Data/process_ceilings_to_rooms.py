@@ -54,7 +54,7 @@ from duHast.Data import data_to_shapely as dToS
 # --------------- writing out data ------------------
 
 
-def _read_data(file_path):
+def _read_data(file_path, streamed=False):
     """
     Reads text files into data objects within data reader class which is returned
 
@@ -62,6 +62,8 @@ def _read_data(file_path):
 
     :param filePath: Fully qualified path to json formatted data file.
     :type filePath: str
+    :param streamed: If True the file is read line by line, one json document per line, and malformed lines are reported. Otherwise the file is read in one go.
+    :type streamed: bool
 
     :return: A file data reader instance.
     :rtype: :class:`.ReadDataFromFile`
@@ -69,7 +71,10 @@ def _read_data(file_path):
 
     # read json file and convert into data objects
     dataReader = dReader.ReadDataFromFile(file_path)
-    dataReader.load_data()
+    if streamed:
+        dataReader.load_data_streamed()
+    else:
+        dataReader.load_data()
     return dataReader
 
 
@@ -149,15 +154,14 @@ def _build_dictionary_by_level_and_data_type(data_reader):
     """
 
     dic = {}
-    for d_object in data_reader.data:
-        if d_object.level.name not in dic:
-            rooms_by_level = data_reader.get_data_by_level_and_data_type(
-                d_object.level.name, dr.DataRoom.data_type
-            )
-            ceilings_by_level = data_reader.get_data_by_level_and_data_type(
-                d_object.level.name, dc.DataCeiling.data_type
-            )
-            dic[d_object.level.name] = (rooms_by_level, ceilings_by_level)
+    for level_name in data_reader.get_level_names():
+        rooms_by_level = data_reader.get_data_by_level_and_data_type(
+            level_name, dr.DataRoom.data_type
+        )
+        ceilings_by_level = data_reader.get_data_by_level_and_data_type(
+            level_name, dc.DataCeiling.data_type
+        )
+        dic[level_name] = (rooms_by_level, ceilings_by_level)
     return dic
 
 
@@ -251,13 +255,33 @@ def _convert_object_data_into_report_data(
     return data
 
 
+def _get_data_objects_by_id(data_objects):
+    """
+    Returns a dictionary of data objects where key is the Revit element id.
+
+    If more than one data object has the same id, the first one is used.
+
+    :param data_objects: A list of data objects.
+    :type data_objects: [:class:`.DataRoom`] or [:class:`.DataCeiling`]
+
+    :return: A dictionary where key is the Revit element id and value is the data object.
+    :rtype: {int: data object}
+    """
+
+    data_objects_by_id = {}
+    for data_object in data_objects:
+        if data_object.instance_properties.id not in data_objects_by_id:
+            data_objects_by_id[data_object.instance_properties.id] = data_object
+    return data_objects_by_id
+
+
 def _intersect_ceiling_vs_room(
     ceiling_poly_id,
     ceiling_polygon,
     room_poly_id,
     room_polygon,
-    data_objects,
-    level_name,
+    rooms_by_id,
+    ceilings_by_id,
 ):
     """
     Does an intersection check of a ceiling polygon with a room polygon. If there is an intersection, the ceiling object will be added to the associated elements list of the room object.
@@ -265,7 +289,7 @@ def _intersect_ceiling_vs_room(
     Note:
 
     - To avoid false positives: only ceiling which overlap a room by an area greater then 0.1 percent of the ceiling area will be considered as intersecting.
-    - Manipulates the past in data_objects by reference!
+    - Manipulates the room data object by reference!
 
     :param ceiling_poly_id: The Revit ceiling element id.
     :type ceiling_poly_id: int
@@ -275,10 +299,10 @@ def _intersect_ceiling_vs_room(
     :type  room_poly_id: int
     :param room_polygon: A polygon representing the room element.
     :type room_polygon: shapely.polygon
-    :param data_objects: A dictionary where key is the level name, value is a tuple of two lists: first one are rooms, second ones are ceiling data objects.
-    :type data_objects: [str:([:class:`.DataRoom`],[:class:`.DataCeiling`])]
-    :type  level_name: The level name where room and ceiling are on.
-    :param room_polygon: str
+    :param rooms_by_id: A dictionary where key is the Revit element id and value is the room data object.
+    :type rooms_by_id: {int: :class:`.DataRoom`}
+    :param ceilings_by_id: A dictionary where key is the Revit element id and value is the ceiling data object.
+    :type ceilings_by_id: {int: :class:`.DataCeiling`}
 
     :return:
         Result class instance.
@@ -327,19 +351,9 @@ def _intersect_ceiling_vs_room(
             else:
                 # ceiling is within the room: add to room data object
                 # get the room object by its Revit ID
-                data_object_room = list(
-                    filter(
-                        lambda x: (x.instance_properties.id == room_poly_id),
-                        data_objects[level_name][0],
-                    )
-                )[0]
+                data_object_room = rooms_by_id[room_poly_id]
                 # get the ceiling object by its Revit id
-                data_object_ceiling = list(
-                    filter(
-                        lambda x: (x.instance_properties.id == ceiling_poly_id),
-                        data_objects[level_name][1],
-                    )
-                )[0]
+                data_object_ceiling = ceilings_by_id[ceiling_poly_id]
                 # add ceiling object to associated elements list of room object
                 data_object_room.associated_elements.append(data_object_ceiling)
                 return_value.append_message(
@@ -347,12 +361,7 @@ def _intersect_ceiling_vs_room(
                 )
     except Exception as e:
         # get the offending elements:
-        data_object_room = list(
-            filter(
-                lambda x: (x.instance_properties.id == room_poly_id),
-                data_objects[level_name][0],
-            )
-        )[0]
+        data_object_room = rooms_by_id.get(room_poly_id, None)
         # set some predefined values in case the room object is not found
         room_name = "unknown"
         room_number = "unknown"
@@ -363,12 +372,7 @@ def _intersect_ceiling_vs_room(
             room_number = data_object_room.instance_properties.properties["Number"]
             room_id = data_object_room.instance_properties.id
 
-        data_object_ceiling = list(
-            filter(
-                lambda x: (x.instance_properties.id == ceiling_poly_id),
-                data_objects[level_name][1],
-            )
-        )[0]
+        data_object_ceiling = ceilings_by_id.get(ceiling_poly_id, None)
         # set some predefined values in case the ceiling object is not found
         ceiling_id = "unknown"
         # populate values if ceiling object is found
@@ -483,15 +487,19 @@ def write_data_to_file(
     return return_value
 
 
-def get_ceilings_by_room(data_source_path):
+def get_ceilings_by_room(data_source_path, streamed=False):
     """
     Reads Revit data from file and runs an intersection check of each ceiling on a level with each room on the same level.
 
+    Ceiling polygons are stored in a spatial index per level, so only ceilings with a bounding box overlapping the room bounding box are checked.
+
     Note:
     DataRoom instance will contain any ceilings in that room in associated elements property.
 
     :param data_source_path: Fully qualified file path to json formatted file containing DataRoom and DataCeiling objects.
     :type data_source_path: str
+    :param streamed: If True the file is read line by line, one json document per line. Any malformed lines are reported in the result message.
+    :type streamed: bool
 
     :return:
         Result class instance.
@@ -511,7 +519,21 @@ def get_ceilings_by_room(data_source_path):
 
     return_value = res.Result()
     # read exported ceiling and room data from file
-    data_reader = _read_data(data_source_path)
+    data_reader = _read_data(data_source_path, streamed=streamed)
+    # report any lines which failed to load
+    if len(data_reader.malformed_lines) > 0:
+        return_value.append_message(
+            "File: {} contains {} malformed lines: \n{}".format(
+                data_source_path,
+                len(data_reader.malformed_lines),
+                "\n".join(
+                    [
+                        "...line {}: {}".format(line_number, message)
+                        for line_number, message in data_reader.malformed_lines
+                    ]
+                ),
+            )
+        )
     # check if read returned anything
     if len(data_reader.data) == 0:
         return_value.update_sep(
@@ -547,7 +569,6 @@ def get_ceilings_by_room(data_source_path):
         if len(data_objects[level_name][0]) > 0:
             # check ceilings are on this level
             if len(data_objects[level_name][1]) > 0:
-                polygons_by_type = {}
                 # convert geometry data off all rooms and ceilings into dictionaries : key is Revit element id, values are shapely polygons
                 room_polygons = dToS.get_shapely_polygons_from_geo_object(
                     data_objects[level_name][0], dr.DataRoom.data_type
@@ -555,31 +576,47 @@ def get_ceilings_by_room(data_source_path):
                 ceiling_polygons = dToS.get_shapely_polygons_from_geo_object(
                     data_objects[level_name][1], dc.DataCeiling.data_type
                 )
-                polygons_by_type[dr.DataRoom.data_type] = room_polygons
-                polygons_by_type[dc.DataCeiling.data_type] = ceiling_polygons
+                # look up of data objects by Revit element id
+                rooms_by_id = _get_data_objects_by_id(data_objects[level_name][0])
+                ceilings_by_id = _get_data_objects_by_id(data_objects[level_name][1])
+                # spatial index over all ceiling polygons on this level
+                ceiling_index = dToS.build_polygon_index(ceiling_polygons)
+                for ceiling_poly_id in ceiling_polygons:
+                    for ceiling_polygon in ceiling_polygons[ceiling_poly_id]:
+                        if ceiling_polygon.is_empty:
+                            return_value.append_message(
+                                "Ceiling {} polygon is empty. Ignored!".format(
+                                    ceiling_poly_id
+                                )
+                            )
                 # loop over rooms ids and find intersecting ceilings
-                for room_poly_id in polygons_by_type[dr.DataRoom.data_type]:
+                for room_poly_id in room_polygons:
                     # check if valid room poly ( just in case that is a room in schedule only >> not placed in model , or unbound, or overlapping with other room)
                     if len(room_polygons[room_poly_id]) > 0:
                         # loop over each room polygon per room...there should only be one...
                         for room_polygon in room_polygons[room_poly_id]:
-                            # find overlapping ceiling polygons
-                            for ceiling_poly_id in polygons_by_type[
-                                dc.DataCeiling.data_type
-                            ]:
-                                for ceiling_polygon in ceiling_polygons[
-                                    ceiling_poly_id
-                                ]:
-                                    return_value.update(
-                                        _intersect_ceiling_vs_room(
-                                            ceiling_poly_id,
-                                            ceiling_polygon,
-                                            room_poly_id,
-                                            room_polygon,
-                                            data_objects,
-                                            level_name,
-                                        )
+                            if room_polygon.is_empty:
+                                return_value.append_message(
+                                    "Room {} polygon is empty. Ignored!".format(
+                                        room_poly_id
+                                    )
+                                )
+                                continue
+                            # only check ceilings which bounding box overlaps the room bounding box
+                            for (
+                                ceiling_poly_id,
+                                ceiling_polygon,
+                            ) in dToS.query_polygon_index(ceiling_index, room_polygon):
+                                return_value.update(
+                                    _intersect_ceiling_vs_room(
+                                        ceiling_poly_id,
+                                        ceiling_polygon,
+                                        room_poly_id,
+                                        room_polygon,
+                                        rooms_by_id,
+                                        ceilings_by_id,
                                     )
+                                )
                     else:
                         return_value.append_message(
                             "Room with id {} has no valid room poly lines.".format(
@@ -0,0 +1,234 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Vectorised point in polygon and polygon loop nesting functions working on plain coordinate arrays.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+These are the batch equivalents of point_in_polygon and build_loops_dictionary in duHast.Revit.Common.Geometry.geometry
+and can be used ( and benchmarked ) without Revit.
+
+Polygons are given as sequences of [x, y] points ( additional coordinates are ignored ). The closing point does not need to be repeated.
+
+This module requires python >3.9 due to dependencies:
+
+- numpy
+
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import numpy as np
+
+
+def get_polygon_as_array(polygon):
+    """
+    Returns the x and y coordinates of a polygon as a numpy array.
+
+    :param polygon: A polygon as a list of points.
+    :type polygon: [[float]] or numpy.ndarray
+    :return: Array of shape ( number of points, 2 )
+    :rtype: numpy.ndarray
+    """
+
+    if len(polygon) == 0:
+        return np.zeros((0, 2))
+    if isinstance(polygon, np.ndarray):
+        return polygon[:, :2].astype(float)
+    # points may be a mix of 2D and 3D points
+    return np.array([[point[0], point[1]] for point in polygon], dtype=float)
+
+
+def get_polygon_bounding_boxes(polygons):
+    """
+    Returns the bounding boxes of polygons.
+
+    :param polygons: List of polygons.
+    :type polygons: [[[float]]]
+    :return: Array of shape ( number of polygons, 4 ) where each row is min x, min y, max x, max y
+    :rtype: numpy.ndarray
+    """
+
+    bounding_boxes = np.zeros((len(polygons), 4))
+    for index, polygon in enumerate(polygons):
+        coordinates = get_polygon_as_array(polygon)
+        bounding_boxes[index, :2] = coordinates.min(axis=0)
+        bounding_boxes[index, 2:] = coordinates.max(axis=0)
+    return bounding_boxes
+
+
+def get_signed_polygon_areas(polygons):
+    """
+    Returns the signed areas of polygons ( shoelace formula ). Counter clockwise polygons have a positive area.
+
+    :param polygons: List of polygons.
+    :type polygons: [[[float]]]
+    :return: Array of signed areas, one per polygon.
+    :rtype: numpy.ndarray
+    """
+
+    areas = np.zeros(len(polygons))
+    for index, polygon in enumerate(polygons):
+        coordinates = get_polygon_as_array(polygon)
+        x = coordinates[:, 0]
+        y = coordinates[:, 1]
+        areas[index] = 0.5 * (np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+    return areas
+
+
+def points_in_polygon(points, polygon):
+    """
+    Checks which points are within a polygon using the even-odd ( ray casting ) rule.
+
+    All points are tested against all polygon edges at once. Points on the polygon boundary may be reported as inside or outside.
+
+    :param points: List of points to check.
+    :type points: [[float]] or numpy.ndarray
+    :param polygon: The polygon.
+    :type polygon: [[float]] or numpy.ndarray
+    :return: Array of flags, True if the point at the same index is within the polygon.
+    :rtype: numpy.ndarray of bool
+    """
+
+    point_coordinates = get_polygon_as_array(points)
+    coordinates = get_polygon_as_array(polygon)
+    if len(point_coordinates) == 0 or len(coordinates) < 3:
+        return np.zeros(len(point_coordinates), dtype=bool)
+
+    # edges from each vertex to the next one, as rows ( broadcast against points as columns )
+    x_start = coordinates[:, 0][:, np.newaxis]
+    y_start = coordinates[:, 1][:, np.newaxis]
+    x_end = np.roll(coordinates[:, 0], -1)[:, np.newaxis]
+    y_end = np.roll(coordinates[:, 1], -1)[:, np.newaxis]
+    x = point_coordinates[:, 0][np.newaxis, :]
+    y = point_coordinates[:, 1][np.newaxis, :]
+
+    # edges crossing the horizontal line through each point ( horizontal edges never cross )
+    crosses = (y_start > y) != (y_end > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_intersection = x_start + (y - y_start) * (x_end - x_start) / (y_end - y_start)
+    # count crossings to the right of each point
+    crossings = np.count_nonzero(crosses & (x < x_intersection), axis=0)
+    return crossings % 2 == 1
+
+
+def points_in_polygons(points, polygons):
+    """
+    Checks which points are within which polygons.
+
+    Only points within the bounding box of a polygon are tested against that polygon.
+
+    :param points: List of points to check.
+    :type points: [[float]] or numpy.ndarray
+    :param polygons: List of polygons.
+    :type polygons: [[[float]]]
+    :return: Array of shape ( number of polygons, number of points ). True if the point is within the polygon.
+    :rtype: numpy.ndarray of bool
+    """
+
+    point_coordinates = get_polygon_as_array(points)
+    result = np.zeros((len(polygons), len(point_coordinates)), dtype=bool)
+    if len(point_coordinates) == 0:
+        return result
+    bounding_boxes = get_polygon_bounding_boxes(polygons)
+    for index, polygon in enumerate(polygons):
+        min_x, min_y, max_x, max_y = bounding_boxes[index]
+        candidates = np.flatnonzero(
+            (point_coordinates[:, 0] >= min_x)
+            & (point_coordinates[:, 0] <= max_x)
+            & (point_coordinates[:, 1] >= min_y)
+            & (point_coordinates[:, 1] <= max_y)
+        )
+        if len(candidates) > 0:
+            result[index, candidates] = points_in_polygon(
+                point_coordinates[candidates], polygon
+            )
+    return result
+
+
+def get_loop_parents(loops):
+    """
+    Returns the index of the smallest loop containing each loop.
+
+    Loops are assumed not to intersect each other ( as is the case with Revit sketches ), therefore a loop is within another loop
+    if its first point is. Only larger loops whose bounding box contains the bounding box of a loop are tested.
+
+    :param loops: List of polygon loops.
+    :type loops: [[[float]]]
+    :return: A list of the parent loop index per loop ( None if the loop is not within any other loop ) and a list of loop indices sorted by area, largest first.
+    :rtype: [int or None], [int]
+    """
+
+    areas = np.abs(get_signed_polygon_areas(loops))
+    bounding_boxes = get_polygon_bounding_boxes(loops)
+    # stable sort: loops of equal area stay in their original order
+    sorted_indices = [int(i) for i in np.argsort(-areas, kind="stable")]
+    parents = [None] * len(loops)
+    for position, index in enumerate(sorted_indices):
+        if position == 0:
+            continue
+        larger_indices = np.asarray(sorted_indices[:position])
+        larger_boxes = bounding_boxes[larger_indices]
+        box = bounding_boxes[index]
+        candidates = larger_indices[
+            (larger_boxes[:, 0] <= box[0])
+            & (larger_boxes[:, 1] <= box[1])
+            & (larger_boxes[:, 2] >= box[2])
+            & (larger_boxes[:, 3] >= box[3])
+        ]
+        if len(candidates) == 0:
+            continue
+        point = get_polygon_as_array(loops[index])[:1]
+        # containing loops are nested: the smallest one containing this loop is its parent
+        for candidate in candidates[::-1]:
+            if points_in_polygon(point, loops[candidate])[0]:
+                parents[index] = int(candidate)
+                break
+    return parents, sorted_indices
+
+
+def build_loops_hierarchy(loops):
+    """
+    Sorts polygon loops into exterior loops and the loops describing holes within them.
+
+    Loops nested an even number of times ( including not at all ) are exterior loops, loops nested an odd number of times are holes in
+    their parent loop. Islands within holes are therefore returned as exterior loops of their own.
+
+    :param loops: List of polygon loops.
+    :type loops: [[[float]]]
+    :return: A dictionary where key is the index of an exterior loop and value is a list of the indices of loops describing holes in it.
+        Keys and holes are ordered by area, largest first.
+    :rtype: {int: [int]}
+    """
+
+    parents, sorted_indices = get_loop_parents(loops)
+    depths = [0] * len(loops)
+    return_value = {}
+    # parents are larger than their children and processed first
+    for index in sorted_indices:
+        parent = parents[index]
+        if parent is not None:
+            depths[index] = depths[parent] + 1
+        if depths[index] % 2 == 0:
+            return_value[index] = []
+        else:
+            return_value[parent].append(index)
+    return return_value
@@ -638,6 +638,41 @@ def get_unique_horizontal_faces(faces):
     return faces_filtered
 
 
+def get_uv_loop_bounding_box(uv_loop):
+    """
+    Returns the bounding box of a polygon loop.
+
+    :param uv_loop: A polygon loop.
+    :type uv_loop: list of Autodesk.Revit.DB.UV
+
+    :return: Min U, min V, max U, max V
+    :rtype: (double, double, double, double)
+    """
+
+    us = [point.U for point in uv_loop]
+    vs = [point.V for point in uv_loop]
+    return min(us), min(vs), max(us), max(vs)
+
+
+def is_uv_point_within_bounding_box(bounding_box, point):
+    """
+    Checks whether a point is within ( or on the boundary of ) a bounding box.
+
+    :param bounding_box: Min U, min V, max U, max V
+    :type bounding_box: (double, double, double, double)
+    :param point: A point
+    :type point: Autodesk.Revit.DB.UV
+
+    :return: True if within bounding box, otherwise False.
+    :rtype: bool
+    """
+
+    return (
+        bounding_box[0] <= point.U <= bounding_box[2]
+        and bounding_box[1] <= point.V <= bounding_box[3]
+    )
+
+
 def is_loop_within_other_loop_but_not_reference_loops(
     exterior_loop, other_loop, hole_loops
 ):
@@ -685,6 +720,8 @@ def build_loops_dictionary(loops):
     - key is the outer loop of a polygon id
     - values is a list of tuples describing holes in the key polygon
 
+    Loops are expected to be sorted by area, largest first, and loop ids to be unique.
+
     :param loops: A list of named tuples describing polygons.\
         .Loop is a list of UV points defining a polygon loop
         .area is a double describing the polygon area
@@ -696,45 +733,40 @@ def build_loops_dictionary(loops):
     :rtype: dic {int: list[namedtuple('uvLoop', 'loop area id threeDPoly')]}
     """
 
-    # duplicate list since I'am about to manipulate it...
-    copy_loops = list(loops)
-    flag = False
     return_value = {}
-    counter = 0
-    # check if there is more then one loop  to start with
-    if len(copy_loops) > 1:
-        loop_flag = True
-        while loop_flag:
-            # add the biggest loop as exterior to dictionary (first one in list)
-            key = copy_loops[0].id
-            return_value[key] = []
-            # assign loop to be checked for holes
-            reference_loop = copy_loops[0]
-            # remove the first exterior loop from list of loops
-            copy_loops.pop(0)
-            # loop over remaining loops and work out which ones are holes ... if any
-            for loop in copy_loops:
-                # build list of hole loops already known belonging to this exterior loop
-                hole_loops = []
-                for geo_loop in return_value[key]:
-                    hole_loops.append(geo_loop)
-                # check whether this is another hole loop
-                flag = is_loop_within_other_loop_but_not_reference_loops(
-                    reference_loop.loop, loop.loop, hole_loops
-                )
-                if flag:
-                    return_value[key].append(loop)
-            # remove loops identified as holes from overall list as to avoid double counting
-            for hole in return_value[key]:
-                counter = counter + 1
-                copy_loops.remove(hole)
-            # check whether all loops are accounted for
-            if len(copy_loops) == 0:
-                loop_flag = False
-    elif len(copy_loops) == 1:
-        key = copy_loops[0].id
-        # only one exterior loop exists, no interior loops
+    # loops not yet assigned, largest first
+    remaining_loops = list(loops)
+    bounding_boxes = {}
+    for loop in remaining_loops:
+        bounding_boxes[loop.id] = get_uv_loop_bounding_box(loop.loop)
+    while len(remaining_loops) > 0:
+        # add the biggest loop as exterior to dictionary (first one in list)
+        reference_loop = remaining_loops[0]
+        key = reference_loop.id
         return_value[key] = []
+        # loop over remaining loops and work out which ones are holes ... if any
+        not_holes = []
+        for loop in remaining_loops[1:]:
+            point = loop.loop[0]
+            # only loops with a bounding box containing the point need a polygon check
+            if is_uv_point_within_bounding_box(
+                bounding_boxes[key], point
+            ) and is_loop_within_other_loop_but_not_reference_loops(
+                reference_loop.loop,
+                loop.loop,
+                [
+                    hole_loop
+                    for hole_loop in return_value[key]
+                    if is_uv_point_within_bounding_box(
+                        bounding_boxes[hole_loop.id], point
+                    )
+                ],
+            ):
+                return_value[key].append(loop)
+            else:
+                not_holes.append(loop)
+        # loops identified as holes are not checked again as to avoid double counting
+        remaining_loops = not_holes
     return return_value
 
 
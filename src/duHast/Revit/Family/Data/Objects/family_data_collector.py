@@ -4,6 +4,8 @@ Family data collector class.
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 - Collects data from current family document and then recursively from any nested family.
+- Optionally, nested families already processed in this session (identified by family name, category and a content signature) are not opened again. \
+    Instead the data previously collected from them is copied to the new nesting path.
 
 """
 #
@@ -32,20 +34,31 @@ Family data collector class.
 from duHast.Utilities.Objects import result as res
 
 # import Autodesk
-from Autodesk.Revit.DB import Element, FamilySymbol, FilteredElementCollector
+from Autodesk.Revit.DB import (
+    Element,
+    FamilySymbol,
+    FilteredElementCollector,
+    StorageType,
+)
 from duHast.Utilities.Objects import base
 from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (
     NESTING_SEPARATOR,
 )
+from duHast.Revit.Family.Data.Objects.ifamily_data_storage import rebase_nesting_path
 
 
 class RevitFamilyDataCollector(base.Base):
-    def __init__(self, data_processors):
+    def __init__(self, data_processors, use_nested_family_cache=False):
         """
         Class constructor taking a list of processor instances as argument.
 
         :param data_processors: List of processor instances
         :type data_processors: [IFamilyProcessor]
+        :param use_nested_family_cache: If True, nested families already processed by this collector are not opened again\
+            but their data is copied to the new nesting path. Defaults to False.\
+            Note: Families are matched by name, category and their type parameter values only. Changes to a nested family\
+            not reflected in its type parameters (i.e. geometry) are not detected.
+        :type use_nested_family_cache: bool
         """
 
         # forwards all unused arguments
@@ -53,6 +66,9 @@ class RevitFamilyDataCollector(base.Base):
         super(RevitFamilyDataCollector, self).__init__()
 
         self.dataProcessors = data_processors
+        self.use_nested_family_cache = use_nested_family_cache
+        # nested family key -> [name nesting path, category nesting path, [data instances added per processor]]
+        self.nested_family_cache = {}
 
     def _get_family_ids(self, doc):
         """
@@ -75,6 +91,137 @@ class RevitFamilyDataCollector(base.Base):
                 family_ids.append(fam_symbol.Family.Id)
         return family_ids
 
+    def _get_parameter_signature(self, parameter):
+        """
+        Returns a signature of a family type parameter: its name, GUID (shared parameters only) and value.
+
+        Values of element id parameters are represented by the element name, since ids differ between documents.
+
+        :param parameter: A family type parameter.
+        :type parameter: Autodesk.Revit.DB.Parameter
+        :return: Tuple of parameter name, GUID and value.
+        :rtype: (str, str, str)
+        """
+
+        guid = ""
+        if parameter.IsShared:
+            guid = str(parameter.GUID)
+        if parameter.StorageType == StorageType.String:
+            value = parameter.AsString()
+        else:
+            value = parameter.AsValueString()
+        return (parameter.Definition.Name, guid, "{}".format(value))
+
+    def _get_nested_family_signature(self, doc, family):
+        """
+        Returns a signature of a nested family without opening it: the parameters and their values of each family type.
+
+        Type parameters include the type name.
+
+        :param doc: The family document the family is nested into.
+        :type doc: Autodesk.Revit.DB.Document
+        :param family: The nested family.
+        :type family: Autodesk.Revit.DB.Family
+        :return: Sorted tuple of family type signatures, each a sorted tuple of parameter signatures.
+        :rtype: (((str, str, str)))
+        """
+
+        type_signatures = []
+        for symbol_id in family.GetFamilySymbolIds():
+            symbol = doc.GetElement(symbol_id)
+            type_signatures.append(
+                tuple(
+                    sorted(
+                        self._get_parameter_signature(parameter)
+                        for parameter in symbol.Parameters
+                    )
+                )
+            )
+        return tuple(sorted(type_signatures))
+
+    def _get_nested_family_key(self, doc, family, family_name, family_category_name):
+        """
+        Returns the key identifying a nested family in the nested family cache.
+
+        :return: Tuple of family name, family category name and family signature
+        :rtype: (str, str, (((str, str, str))))
+        """
+
+        return (
+            family_name,
+            family_category_name,
+            self._get_nested_family_signature(doc, family),
+        )
+
+    def _get_processor_data_counts(self):
+        """
+        Returns the number of data instances stored in each processor.
+
+        :return: List of data instance counts in processor order.
+        :rtype: [int]
+        """
+
+        return [len(pro.data) for pro in self.dataProcessors]
+
+    def _add_to_nested_family_cache(
+        self, family_key, root_name, root_category, data_counts
+    ):
+        """
+        Stores copies of the data instances added to each processor since the counts provided in the nested family cache.
+
+        Copies are stored since post processing actions of the host family may update the data instances collected.
+
+        :param family_key: The nested family key.
+        :type family_key: (str, str, (((str, str, str))))
+        :param root_name: The name nesting path the data was collected under.
+        :type root_name: str
+        :param root_category: The category nesting path the data was collected under.
+        :type root_category: str
+        :param data_counts: The number of data instances in each processor before the family was processed.
+        :type data_counts: [int]
+        """
+
+        self.nested_family_cache[family_key] = [
+            root_name,
+            root_category,
+            [
+                [
+                    data.copy_to_nesting_path(data.root_path, data.root_category_path)
+                    for data in pro.data[data_count:]
+                ]
+                for pro, data_count in zip(self.dataProcessors, data_counts)
+            ],
+        ]
+
+    def _replay_nested_family_cache(self, family_key, root_name, root_category):
+        """
+        Copies the data instances of a nested family (and its nested families) stored in the cache to each processor\
+            rebased to the nesting path provided.
+
+        :param family_key: The nested family key.
+        :type family_key: (str, str, (((str, str, str))))
+        :param root_name: The name nesting path to rebase the data to.
+        :type root_name: str
+        :param root_category: The category nesting path to rebase the data to.
+        :type root_category: str
+        """
+
+        cached_root_name, cached_root_category, data_by_processor = (
+            self.nested_family_cache[family_key]
+        )
+        for pro, cached_data in zip(self.dataProcessors, data_by_processor):
+            for data in cached_data:
+                pro.data.append(
+                    data.copy_to_nesting_path(
+                        rebase_nesting_path(data.root_path, cached_root_name, root_name),
+                        rebase_nesting_path(
+                            data.root_category_path,
+                            cached_root_category,
+                            root_category,
+                        ),
+                    )
+                )
+
     def _dive(self, doc, root_name, root_category, is_root=False):
         """
         Loops recursively over each family nested into root family document and and calls processor instance\
@@ -119,20 +266,49 @@ class RevitFamilyDataCollector(base.Base):
                     family = doc.GetElement(family_id)
                     try:
                         if family.IsEditable and family.IsValidObject:
-                            family_doc = doc.EditFamily(family)
                             fam_name = family.Name
                             # strip .rfa of name
                             if fam_name.lower().endswith(".rfa"):
                                 fam_name = fam_name[:-4]
                             # get category
                             fam_category_name = family.FamilyCategory.Name
-                            # go recursive
-                            dive_result = self._dive(
-                                family_doc,
-                                root_name + NESTING_SEPARATOR + fam_name,
-                                root_category + NESTING_SEPARATOR + fam_category_name,
+                            nested_root_name = root_name + NESTING_SEPARATOR + fam_name
+                            nested_root_category = (
+                                root_category + NESTING_SEPARATOR + fam_category_name
                             )
-                            return_value.update(dive_result)
+                            family_key = None
+                            if self.use_nested_family_cache:
+                                family_key = self._get_nested_family_key(
+                                    doc, family, fam_name, fam_category_name
+                                )
+                            # check if this family was processed before
+                            if family_key in self.nested_family_cache:
+                                self._replay_nested_family_cache(
+                                    family_key, nested_root_name, nested_root_category
+                                )
+                                return_value.append_message(
+                                    "Reused data of nested family: {} [CACHED]".format(
+                                        nested_root_name
+                                    )
+                                )
+                            else:
+                                data_counts = self._get_processor_data_counts()
+                                family_doc = doc.EditFamily(family)
+                                # go recursive
+                                dive_result = self._dive(
+                                    family_doc,
+                                    nested_root_name,
+                                    nested_root_category,
+                                )
+                                return_value.update(dive_result)
+                                # only reuse data of families processed without an exception
+                                if family_key is not None and dive_result.status:
+                                    self._add_to_nested_family_cache(
+                                        family_key,
+                                        nested_root_name,
+                                        nested_root_category,
+                                        data_counts,
+                                    )
                     except Exception as e:
                         message = ""
                         if family != None:
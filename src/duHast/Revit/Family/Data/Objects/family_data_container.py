@@ -112,6 +112,9 @@ class FamilyDataContainer(base.Base):
         self.is_root_family = False
         self.family_file_path = None
 
+        # hashed identity keys of storage instances used for uniqueness checks
+        self._reset_storage_keys()
+
         # populate class from past in data
         # start with family base data storage
         # if a valid family base data storage instance is passed in this will also set the following properties:
@@ -213,6 +216,68 @@ class FamilyDataContainer(base.Base):
         else:
             self.is_root_family = True
 
+    def _reset_storage_keys(self):
+        """
+        Resets the sets of identity keys of all storage instances (other than family base data storage) in this container.
+        """
+
+        self._category_storage_keys = set()
+        self._line_pattern_storage_keys = set()
+        self._shared_parameter_storage_keys = set()
+        self._warnings_storage_keys = set()
+
+    def _get_category_storage_key(self, storage_instance):
+        """
+        Returns the properties identifying a unique category storage instance within this container.
+
+        :param storage_instance: a category data storage instance
+        :type storage_instance: :class:`.FamilyCategoryDataStorage`
+        :return: category name, sub category name and sub category id
+        :rtype: tuple
+        """
+
+        return (
+            storage_instance.category_name,
+            storage_instance.sub_category_name,
+            storage_instance.sub_category_id,
+        )
+
+    def _get_line_pattern_storage_key(self, storage_instance):
+        """
+        Returns the properties identifying a unique line pattern storage instance within this container.
+
+        :param storage_instance: a line pattern data storage instance
+        :type storage_instance: :class:`.FamilyLinePatternDataStorage`
+        :return: pattern name and pattern id
+        :rtype: tuple
+        """
+
+        return (storage_instance.pattern_name, storage_instance.pattern_id)
+
+    def _get_shared_parameter_storage_key(self, storage_instance):
+        """
+        Returns the properties identifying a unique shared parameter storage instance within this container.
+
+        :param storage_instance: a shared parameter data storage instance
+        :type storage_instance: :class:`.FamilySharedParameterDataStorage`
+        :return: parameter name and parameter id
+        :rtype: tuple
+        """
+
+        return (storage_instance.parameter_name, storage_instance.parameter_id)
+
+    def _get_warnings_storage_key(self, storage_instance):
+        """
+        Returns the properties identifying a unique warnings storage instance within this container.
+
+        :param storage_instance: a warnings data storage instance
+        :type storage_instance: :class:`.FamilyWarningsDataStorage`
+        :return: warning text and warning guid
+        :rtype: tuple
+        """
+
+        return (storage_instance.warning_text, storage_instance.warning_guid)
+
     def add_family_base_data_storage(self, other):
         """
         Will add a family base data storage instance and infer some other class properties from it.
@@ -249,6 +314,7 @@ class FamilyDataContainer(base.Base):
                 self.line_pattern_data_storage = []
                 self.shared_parameter_data_storage = []
                 self.warnings_data_storage = []
+                self._reset_storage_keys()
 
             # set other class properties based on storage
             self._update_base_properties_from_storage(other)
@@ -273,59 +339,40 @@ class FamilyDataContainer(base.Base):
         if isinstance(other, FamilyCategoryDataStorage) == False:
             raise TypeError("other must be a list of FamilyCategoryDataStorage")
 
-        # only add if not already in list
-        if other not in self.category_data_storage:
-            # check if nesting path and category nesting path are different to the current values but not None!
-            # if so  throw error!
-            if (
-                self.family_nesting_path != other.root_name_path
-                and self.family_nesting_path != None
-                or self.family_category_nesting_path != other.root_category_path
-                and self.family_category_nesting_path != None
-            ):
-                raise ValueError(
-                    "other root_name_path and root_category_path must match current values"
-                )
-            elif (
-                self.family_nesting_path == None
-                and self.family_category_nesting_path == None
-            ):
-                # looks like this might be the only storage class added or
-                # family base data storage is absent and this is the first storage class added
-                self._update_base_properties_from_storage(other)
+        # check if nesting path and category nesting path are different to the current values but not None!
+        # if so  throw error!
+        if (
+            self.family_nesting_path != other.root_name_path
+            and self.family_nesting_path != None
+            or self.family_category_nesting_path != other.root_category_path
+            and self.family_category_nesting_path != None
+        ):
+            raise ValueError(
+                "other root_name_path and root_category_path must match current values"
+            )
+        elif (
+            self.family_nesting_path == None
+            and self.family_category_nesting_path == None
+        ):
+            # looks like this might be the only storage class added or
+            # family base data storage is absent and this is the first storage class added
+            self._update_base_properties_from_storage(other)
 
-            # add to class property only if unique (unique is if category name, sub category name and sub category id are unique)
-            if len(self.category_data_storage) == 0:
-                # add to class property
-                self.category_data_storage.append(other)
-            else:
-                found_match = False
-                for entry in self.category_data_storage:
-                    if (
-                        entry.category_name == other.category_name
-                        and entry.sub_category_name == other.sub_category_name
-                        and entry.sub_category_id == other.sub_category_id
-                    ):
-                        found_match = True
-                        break
-                if not found_match:
-                    # add to class property
-                    self.category_data_storage.append(other)
-                else:
-                    raise ValueError(
-                        "Category storage is not unique: category: {} sub category: {} id: {}".format(
-                            other.category_name,
-                            other.sub_category_name,
-                            other.sub_category_id,
-                        )
-                    )
-        else:
+        # only add if unique (unique is if category name, sub category name and sub category id are unique)
+        storage_key = self._get_category_storage_key(other)
+        if storage_key in self._category_storage_keys:
             raise ValueError(
                 "Category storage is not unique: category: {} sub category: {} id: {}".format(
-                    other.category_name, other.sub_category_name, other.sub_category_id
+                    other.category_name,
+                    other.sub_category_name,
+                    other.sub_category_id,
                 )
             )
 
+        # add to class property
+        self.category_data_storage.append(other)
+        self._category_storage_keys.add(storage_key)
+
     def add_line_pattern_data_storage(self, other):
         """
         Will add a line pattern data storage instance.
@@ -340,56 +387,39 @@ class FamilyDataContainer(base.Base):
         if isinstance(other, FamilyLinePatternDataStorage) == False:
             raise TypeError("other must be a list of FamilyLinePatternDataStorage")
 
-        # only add if not already in list
-        if other not in self.line_pattern_data_storage:
-            # check if nesting path and category nesting path are different to the current values but not None!
-            # if so throw error!
-            if (
-                self.family_nesting_path != other.root_name_path
-                and self.family_nesting_path != None
-                or self.family_category_nesting_path != other.root_category_path
-                and self.family_category_nesting_path != None
-            ):
-                raise ValueError(
-                    "other root_name_path and root_category_path must match current values"
-                )
-            elif (
-                self.family_nesting_path == None
-                and self.family_category_nesting_path == None
-            ):
-                # looks like this might be the only storage class added or
-                # family base data storage is absent and this is the first storage class added
-                self._update_base_properties_from_storage(other)
+        # check if nesting path and category nesting path are different to the current values but not None!
+        # if so throw error!
+        if (
+            self.family_nesting_path != other.root_name_path
+            and self.family_nesting_path != None
+            or self.family_category_nesting_path != other.root_category_path
+            and self.family_category_nesting_path != None
+        ):
+            raise ValueError(
+                "other root_name_path and root_category_path must match current values"
+            )
+        elif (
+            self.family_nesting_path == None
+            and self.family_category_nesting_path == None
+        ):
+            # looks like this might be the only storage class added or
+            # family base data storage is absent and this is the first storage class added
+            self._update_base_properties_from_storage(other)
 
-            # add to class property only if unique (unique is if pattern name and pattern id are unique)
-            if len(self.line_pattern_data_storage) == 0:
-                # add to class property
-                self.line_pattern_data_storage.append(other)
-            else:
-                found_match = False
-                for entry in self.line_pattern_data_storage:
-                    if (
-                        entry.pattern_name == other.pattern_name
-                        and entry.pattern_id == other.pattern_id
-                    ):
-                        found_match = True
-                        break
-                if not found_match:
-                    # add to class property
-                    self.line_pattern_data_storage.append(other)
-                else:
-                    raise ValueError(
-                        "Line pattern storage is not unique: name: {} id: {}".format(
-                            other.pattern_name, other.pattern_id
-                        )
-                    )
-        else:
+        # only add if unique (unique is if pattern name and pattern id are unique)
+        storage_key = self._get_line_pattern_storage_key(other)
+        if storage_key in self._line_pattern_storage_keys:
             raise ValueError(
                 "Line pattern storage is not unique: name: {} id: {}".format(
-                    other.pattern_name, other.pattern_id
+                    other.pattern_name,
+                    other.pattern_id,
                 )
             )
 
+        # add to class property
+        self.line_pattern_data_storage.append(other)
+        self._line_pattern_storage_keys.add(storage_key)
+
     def add_shared_parameter_data_storage(self, other):
         """
         Will add a shared parameter data storage instance.
@@ -404,56 +434,39 @@ class FamilyDataContainer(base.Base):
         if isinstance(other, FamilySharedParameterDataStorage) == False:
             raise TypeError("other must be a list of FamilySharedParameterDataStorage")
 
-        # only add if not already in list
-        if other not in self.shared_parameter_data_storage:
-            # check if nesting path and category nesting path are different to the current values but not None!
-            # if so wipe throw error!
-            if (
-                self.family_nesting_path != other.root_name_path
-                and self.family_nesting_path != None
-                or self.family_category_nesting_path != other.root_category_path
-                and self.family_category_nesting_path != None
-            ):
-                raise ValueError(
-                    "other root_name_path and root_category_path must match current values"
-                )
-            elif (
-                self.family_nesting_path == None
-                and self.family_category_nesting_path == None
-            ):
-                # looks like this might be the only storage class added or
-                # family base data storage is absent and this is the first storage class added
-                self._update_base_properties_from_storage(other)
+        # check if nesting path and category nesting path are different to the current values but not None!
+        # if so wipe throw error!
+        if (
+            self.family_nesting_path != other.root_name_path
+            and self.family_nesting_path != None
+            or self.family_category_nesting_path != other.root_category_path
+            and self.family_category_nesting_path != None
+        ):
+            raise ValueError(
+                "other root_name_path and root_category_path must match current values"
+            )
+        elif (
+            self.family_nesting_path == None
+            and self.family_category_nesting_path == None
+        ):
+            # looks like this might be the only storage class added or
+            # family base data storage is absent and this is the first storage class added
+            self._update_base_properties_from_storage(other)
 
-            # add to class property only if unique (unique is if parameter name and parameter id are unique)
-            if len(self.shared_parameter_data_storage) == 0:
-                # add to class property
-                self.shared_parameter_data_storage.append(other)
-            else:
-                found_match = False
-                for entry in self.shared_parameter_data_storage:
-                    if (
-                        entry.parameter_name == other.parameter_name
-                        and entry.parameter_id == other.parameter_id
-                    ):
-                        found_match = True
-                        break
-                if not found_match:
-                    # add to class property
-                    self.shared_parameter_data_storage.append(other)
-                else:
-                    raise ValueError(
-                        "Shared parameter storage is not unique: name: {} id: {}".format(
-                            other.parameter_name, other.parameter_id
-                        )
-                    )
-        else:
+        # only add if unique (unique is if parameter name and parameter id are unique)
+        storage_key = self._get_shared_parameter_storage_key(other)
+        if storage_key in self._shared_parameter_storage_keys:
             raise ValueError(
                 "Shared parameter storage is not unique: name: {} id: {}".format(
-                    other.parameter_name, other.parameter_id
+                    other.parameter_name,
+                    other.parameter_id,
                 )
             )
 
+        # add to class property
+        self.shared_parameter_data_storage.append(other)
+        self._shared_parameter_storage_keys.add(storage_key)
+
     def add_warnings_data_storage(self, other):
         """
         Will add a warnings data storage instance.
@@ -468,56 +481,39 @@ class FamilyDataContainer(base.Base):
         if isinstance(other, FamilyWarningsDataStorage) == False:
             raise TypeError("other must be type of FamilyWarningsDataStorage")
 
-        # only add if not already in list
-        if other not in self.warnings_data_storage:
-            # check if nesting path and category nesting path are different to the current values but not None!
-            # if so wipe throw error!
-            if (
-                self.family_nesting_path != other.root_name_path
-                and self.family_nesting_path != None
-                or self.family_category_nesting_path != other.root_category_path
-                and self.family_category_nesting_path != None
-            ):
-                raise ValueError(
-                    "other root_name_path and root_category_path must match current values"
-                )
-            elif (
-                self.family_nesting_path == None
-                and self.family_category_nesting_path == None
-            ):
-                # looks like this might be the only storage class added or
-                # family base data storage is absent and this is the first storage class added
-                self._update_base_properties_from_storage(other)
+        # check if nesting path and category nesting path are different to the current values but not None!
+        # if so wipe throw error!
+        if (
+            self.family_nesting_path != other.root_name_path
+            and self.family_nesting_path != None
+            or self.family_category_nesting_path != other.root_category_path
+            and self.family_category_nesting_path != None
+        ):
+            raise ValueError(
+                "other root_name_path and root_category_path must match current values"
+            )
+        elif (
+            self.family_nesting_path == None
+            and self.family_category_nesting_path == None
+        ):
+            # looks like this might be the only storage class added or
+            # family base data storage is absent and this is the first storage class added
+            self._update_base_properties_from_storage(other)
 
-            # add to class property only if unique (unique is if warning text and warning guid are unique)
-            if len(self.warnings_data_storage) == 0:
-                # add to class property
-                self.warnings_data_storage.append(other)
-            else:
-                found_match = False
-                for entry in self.warnings_data_storage:
-                    if (
-                        entry.warning_text == other.warning_text
-                        and entry.warning_guid == other.warning_guid
-                    ):
-                        found_match = True
-                        break
-                if not found_match:
-                    # add to class property
-                    self.warnings_data_storage.append(other)
-                else:
-                    raise ValueError(
-                        "Warnings storage is not unique: text: {} guid: {}".format(
-                            other.warning_text, other.warning_guid
-                        )
-                    )
-        else:
+        # only add if unique (unique is if warning text and warning guid are unique)
+        storage_key = self._get_warnings_storage_key(other)
+        if storage_key in self._warnings_storage_keys:
             raise ValueError(
                 "Warnings storage is not unique: text: {} guid: {}".format(
-                    other.warning_text, other.warning_guid
+                    other.warning_text,
+                    other.warning_guid,
                 )
             )
 
+        # add to class property
+        self.warnings_data_storage.append(other)
+        self._warnings_storage_keys.add(storage_key)
+
     def add_data_storage(self, other):
         """
         Adds a new data storage instance to this container.
@@ -0,0 +1,243 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Family data container class creating its storage instances from report rows on first access.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2024, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+from duHast.Revit.Family.Data.Objects.family_data_container import FamilyDataContainer
+from duHast.Revit.Family.Data.Objects.family_base_data_storage import (
+    FamilyBaseDataStorage,
+)
+from duHast.Revit.Categories.Data.Objects.category_data_storage import (
+    FamilyCategoryDataStorage,
+)
+from duHast.Revit.LinePattern.Data.Objects.line_pattern_data_storage import (
+    FamilyLinePatternDataStorage,
+)
+from duHast.Revit.SharedParameters.Data.Objects.shared_parameter_data_storage import (
+    FamilySharedParameterDataStorage,
+)
+from duHast.Revit.Warnings.Data.Objects.warnings_data_storage import (
+    FamilyWarningsDataStorage,
+)
+from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (
+    NESTING_SEPARATOR,
+)
+
+#: per storage data type: the storage class, the container property storing its instances, the container property storing their identity keys
+#: and the container function returning the identity key of an instance (family base data storage instances have no identity keys)
+STORAGE_PROPERTIES = {
+    FamilyBaseDataStorage.data_type: (
+        FamilyBaseDataStorage,
+        "family_base_data_storage",
+        None,
+        None,
+    ),
+    FamilyCategoryDataStorage.data_type: (
+        FamilyCategoryDataStorage,
+        "category_data_storage",
+        "_category_storage_keys",
+        FamilyDataContainer._get_category_storage_key,
+    ),
+    FamilyLinePatternDataStorage.data_type: (
+        FamilyLinePatternDataStorage,
+        "line_pattern_data_storage",
+        "_line_pattern_storage_keys",
+        FamilyDataContainer._get_line_pattern_storage_key,
+    ),
+    FamilySharedParameterDataStorage.data_type: (
+        FamilySharedParameterDataStorage,
+        "shared_parameter_data_storage",
+        "_shared_parameter_storage_keys",
+        FamilyDataContainer._get_shared_parameter_storage_key,
+    ),
+    FamilyWarningsDataStorage.data_type: (
+        FamilyWarningsDataStorage,
+        "warnings_data_storage",
+        "_warnings_storage_keys",
+        FamilyDataContainer._get_warnings_storage_key,
+    ),
+}
+
+#: storage data type by container property name ( storage list and identity keys properties )
+_DATA_TYPE_BY_PROPERTY = {}
+for _data_type, (_, _storage_name, _keys_name, _) in STORAGE_PROPERTIES.items():
+    _DATA_TYPE_BY_PROPERTY[_storage_name] = _data_type
+    if _keys_name is not None:
+        _DATA_TYPE_BY_PROPERTY[_keys_name] = _data_type
+
+
+class FamilyDataContainerLazy(FamilyDataContainer):
+    # report rows not yet converted into storage instances are kept in a slot, so they are not part of vars() or to_json()
+    __slots__ = ("_pending_rows",)
+
+    def __init__(
+        self,
+        family_name=None,
+        family_file_path=None,
+        family_nesting_path=None,
+        family_category_nesting_path=None,
+        row_ranges=None,
+        **kwargs
+    ):
+        """
+        Family data container class creating its storage instances from report rows on first access of a storage property.
+
+        Rows are expected to have been converted into storage instances and added to a :class:`.FamilyDataContainer` without error before
+        ( i.e. when they were written to a report cache ). The family properties past in are expected to be the ones of that container.
+
+        Note: Storage properties are not part of vars() until they are accessed. Use load_storage() to create all storage properties.
+
+        :param family_name: The family name.
+        :type family_name: str
+        :param family_file_path: The family file path.
+        :type family_file_path: str
+        :param family_nesting_path: The family nesting path ( root name path of the storage instances ).
+        :type family_nesting_path: str
+        :param family_category_nesting_path: The family category nesting path ( root category path of the storage instances ).
+        :type family_category_nesting_path: str
+        :param row_ranges: Per storage data type: a list of report rows ( data type, root name path, root category path, family name, family file path, ... ), \
+            the index of the first row and the number of rows belonging to this container. Defaults to None.
+        :type row_ranges: {str: ([[str]], int, int)}, optional
+        :raises TypeError: If a storage data type is not supported.
+        """
+
+        # forwards all unused arguments
+        # skips the family data container initialisation: storage properties are created on first access
+        super(FamilyDataContainer, self).__init__(**kwargs)
+
+        self.family_name = family_name
+        self.family_nesting_path = family_nesting_path
+        self.family_category = None
+        self.family_category_nesting_path = family_category_nesting_path
+        self.is_root_family = False
+        self.family_file_path = family_file_path
+
+        # set the category and root family properties the same way as from a storage instance
+        if family_category_nesting_path is not None:
+            self.family_category = family_category_nesting_path.split(
+                NESTING_SEPARATOR
+            )[-1]
+        if family_nesting_path is not None:
+            self.is_root_family = NESTING_SEPARATOR not in family_nesting_path
+
+        pending_rows = {}
+        if row_ranges is not None:
+            for data_type, row_range in row_ranges.items():
+                if data_type not in STORAGE_PROPERTIES:
+                    raise TypeError(
+                        "Data storage type : {} is not supported.".format(data_type)
+                    )
+                pending_rows[data_type] = row_range
+        self._pending_rows = pending_rows
+
+    def _load_storage_of_type(self, data_type):
+        """
+        Converts the pending report rows of a storage data type into storage instances and stores them in the container properties.
+
+        Storage properties without pending rows are set to their default values ( empty list and set ).
+
+        :param data_type: The storage data type.
+        :type data_type: str
+        """
+
+        rows, start, count = self._pending_rows.pop(data_type, ([], 0, 0))
+        storage_type, storage_name, keys_name, get_key = STORAGE_PROPERTIES[
+            data_type
+        ]
+        # storage properties set before first access ( i.e. wiped when a family base data storage with different nesting paths was added ) are kept
+        if storage_name in self.__dict__:
+            return
+        storage_instances = [
+            storage_type(*row[1:]) for row in rows[start : start + count]
+        ]
+        self.__dict__[storage_name] = storage_instances
+        if keys_name is not None:
+            self.__dict__[keys_name] = set(
+                get_key(self, storage_instance) for storage_instance in storage_instances
+            )
+
+    def load_storage(self):
+        """
+        Converts all pending report rows into storage instances and sets up all storage properties.
+        """
+
+        for data_type in STORAGE_PROPERTIES:
+            self._load_storage_of_type(data_type)
+
+    def __getattr__(self, name):
+        """
+        Sets up a storage property on first access.
+
+        Only called if the property is not set yet.
+        """
+
+        data_type = _DATA_TYPE_BY_PROPERTY.get(name, None)
+        if data_type is not None:
+            self._load_storage_of_type(data_type)
+            return self.__dict__[name]
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+        )
+
+    def __repr__(self):
+        """
+        Enables detailed debug output of all class properties, including all storage instances, using: rep(obj)
+        """
+
+        self.load_storage()
+        return super(FamilyDataContainerLazy, self).__repr__()
+
+    def __str__(self, indent=0):
+        """
+        Formatted output of all class properties, including all storage instances.
+        """
+
+        self.load_storage()
+        return super(FamilyDataContainerLazy, self).__str__(indent=indent)
+
+    def to_json(self):
+        """
+        Convert the instance of this class, including all storage instances, to json.
+        """
+
+        self.load_storage()
+        return super(FamilyDataContainerLazy, self).to_json()
+
+    def to_json_utf(self):
+        """
+        Convert the instance of this class, including all storage instances, to json. Any string properties are converted to utf-8
+        """
+
+        self.load_storage()
+        return super(FamilyDataContainerLazy, self).to_json_utf()
+
+    def class_to_dict(self):
+        """
+        Returns all class properties, including all storage instances, and their values as a dictionary.
+        """
+
+        self.load_storage()
+        return super(FamilyDataContainerLazy, self).class_to_dict()
@@ -127,6 +127,8 @@ class FamilyDataFamily(base.Base):
 
         # nested family tree
         self.nested_families_unsorted = []
+        # identity keys of nested families used for fast uniqueness checks
+        self._nested_family_keys = set()
         if nested_families is not None:
             for nested in nested_families:
                 if not isinstance(nested, FamilyDataFamily):
@@ -136,6 +138,7 @@ class FamilyDataFamily(base.Base):
                         )
                     )
                 self.nested_families_unsorted.append(nested)
+                self._nested_family_keys.add(nested.get_key())
 
         # default value for data containers
         self.data_containers_unsorted = []
@@ -162,16 +165,23 @@ class FamilyDataFamily(base.Base):
         :rtype: bool
         """
 
-        return isinstance(other, FamilyDataFamily) and (
+        return isinstance(other, FamilyDataFamily) and self.get_key() == other.get_key()
+
+    def get_key(self):
+        """
+        Returns the properties used to compare family instances as a tuple.
+
+        Use this as a dictionary key or set entry instead of comparing instances one by one.
+
+        :return: A tuple of family_name, family_category, family_nesting_path and family_category_nesting_path
+        :rtype: (str, str, str, str)
+        """
+
+        return (
             self.family_name,
             self.family_category,
             self.family_nesting_path,
             self.family_category_nesting_path,
-        ) == (
-            other.family_name,
-            other.family_category,
-            other.family_nesting_path,
-            other.family_category_nesting_path,
         )
 
     # python 2.7 needs custom implementation of not equal
@@ -222,6 +232,56 @@ class FamilyDataFamily(base.Base):
                         family_instance_data
                     ]
 
+    def _get_nesting_path_chunks(self, nesting_path):
+        """
+        Splits a nesting path tuple into a list of tuples of family name and family category, one per nesting level.
+
+        :param nesting_path: A tuple of family name nesting path at 0 and family category nesting path at 1
+        :type nesting_path: (str, str)
+        :return: List of tuples of family name and family category
+        :rtype: [(str, str)]
+        """
+
+        return list(
+            zip(
+                nesting_path[0].split(NESTING_SEPARATOR),
+                nesting_path[1].split(NESTING_SEPARATOR),
+            )
+        )
+
+    def _add_to_nesting_path_trie(self, nesting_path_trie, nesting_path):
+        """
+        Adds a nesting path to a prefix trie made of nested dictionaries keyed by family name and family category.
+
+        :param nesting_path_trie: The trie root node.
+        :type nesting_path_trie: dict
+        :param nesting_path: A tuple of family name nesting path at 0 and family category nesting path at 1
+        :type nesting_path: (str, str)
+        """
+
+        node = nesting_path_trie
+        for chunk in self._get_nesting_path_chunks(nesting_path):
+            node = node.setdefault(chunk, {})
+
+    def _is_in_nesting_path_trie(self, nesting_path_trie, nesting_path):
+        """
+        Checks whether a nesting path is in a prefix trie, i.e. is equal to or a prefix of a nesting path added to the trie.
+
+        :param nesting_path_trie: The trie root node.
+        :type nesting_path_trie: dict
+        :param nesting_path: A tuple of family name nesting path at 0 and family category nesting path at 1
+        :type nesting_path: (str, str)
+        :return: True if the nesting path is in the trie, otherwise False
+        :rtype: bool
+        """
+
+        node = nesting_path_trie
+        for chunk in self._get_nesting_path_chunks(nesting_path):
+            if chunk not in node:
+                return False
+            node = node[chunk]
+        return True
+
     def get_longest_unique_nesting_path(self):
         """
         Get the longest unique family name nesting path(s) and family category nesting path(s) of the family data.
@@ -267,6 +327,12 @@ class FamilyDataFamily(base.Base):
                     )
                 )
 
+            # prefix trie over the name and category chunks of all nesting path added so far
+            # a nesting path is not unique if it is a prefix of a nesting path at a higher nesting level
+            nesting_path_trie = {}
+            for unique_nesting_path in unique_nesting_paths:
+                self._add_to_nesting_path_trie(nesting_path_trie, unique_nesting_path)
+
             # loop over the nesting levels from the highest to the lowest
             for nesting_level in range(highest_nesting_level - 1, 0, -1):
                 # get the data containers at the current nesting level
@@ -280,32 +346,16 @@ class FamilyDataFamily(base.Base):
                 # loop over the data containers at the current nesting level
                 for family_data_instance in family_data_instances:
                     # get the nesting path of the current data container
-                    nesting_path_family_name_current_level = (
-                        family_data_instance.family_nesting_path
-                    )
-                    nesting_path_category_current_level = (
-                        family_data_instance.family_category_nesting_path
+                    nesting_path = (
+                        family_data_instance.family_nesting_path,
+                        family_data_instance.family_category_nesting_path,
                     )
-                    # check for match of both path
-                    for unique_nesting_path in unique_nesting_paths:
-                        found_match = False
-                        # check if the current nesting path overlaps with the unique nesting path
-                        if (
-                            nesting_path_family_name_current_level
-                            in unique_nesting_path[0]
-                            and nesting_path_category_current_level
-                            in unique_nesting_path[1]
-                        ):
-                            # if it overlaps, remove it from the unique nesting paths
-                            found_match = True
-                            break
-                    if not found_match:
-                        unique_nesting_paths.append(
-                            (
-                                nesting_path_family_name_current_level,
-                                nesting_path_category_current_level,
-                            )
-                        )
+                    # check whether the nesting path is a prefix of any nesting path already added
+                    if not self._is_in_nesting_path_trie(
+                        nesting_path_trie, nesting_path
+                    ):
+                        unique_nesting_paths.append(nesting_path)
+                        self._add_to_nesting_path_trie(nesting_path_trie, nesting_path)
         # return the unique nesting paths
         return unique_nesting_paths
 
@@ -365,7 +415,8 @@ class FamilyDataFamily(base.Base):
             )
 
         # check if nested family instance already exists...if so raise an exception
-        if nested_family_instance in self.nested_families_unsorted:
+        nested_family_key = nested_family_instance.get_key()
+        if nested_family_key in self._nested_family_keys:
             raise ValueError(
                 "family instance {} {}  already exists in family".format(
                     nested_family_instance.family_name,
@@ -375,6 +426,7 @@ class FamilyDataFamily(base.Base):
 
         # add the instance
         self.nested_families_unsorted.append(nested_family_instance)
+        self._nested_family_keys.add(nested_family_key)
 
         # set flag indicating that the family data has changed and needs to be processed again
         self.is_processed = False
@@ -483,8 +535,8 @@ class FamilyDataFamily(base.Base):
                     )
                 )
 
-            # check if a chunk is already in the list, indicating a circular nesting
-            node_names = []
+            # check if a chunk is already in the set, indicating a circular nesting
+            node_names = set()
             for i in range(len(nesting_chunks_family_names)):
 
                 # build a test value made from family name and category name
@@ -499,7 +551,7 @@ class FamilyDataFamily(base.Base):
                     # add family name and category to duplicated list including the nesting level
                     duplicated_family_names.append((i, test_value, nesting_path[0]))
                 else:
-                    # add test value to nodes list
-                    node_names.append(test_value)
+                    # add test value to nodes set
+                    node_names.add(test_value)
 
         return duplicated_family_names
@@ -0,0 +1,231 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Family dependency graph class.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+- nodes are families identified by family name and family category
+- edges point from a host family to a family nested into it
+
+The graph is built from family name and category nesting path of an entire library. Circular nesting (family A nests family B which \
+    nests family A) shows up as a strongly connected component of more than one family, or as a family nesting itself.
+
+Strongly connected components are found with Tarjan's algorithm in a single pass over all nodes and edges.
+
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2024, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+from duHast.Utilities.Objects import base
+from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (
+    NESTING_SEPARATOR,
+)
+
+
+class FamilyDependencyGraph(base.Base):
+    def __init__(self):
+        """
+        Class constructor.
+        """
+
+        super(FamilyDependencyGraph, self).__init__()
+
+        # node (family name, family category) -> list of nested nodes in order added
+        self.edges = {}
+        # used to check whether an edge was already added
+        self._edge_lookup = set()
+
+    def add_node(self, node):
+        """
+        Adds a family to the graph.
+
+        :param node: A tuple of family name and family category
+        :type node: (str, str)
+        """
+
+        if node not in self.edges:
+            self.edges[node] = []
+
+    def add_edge(self, host_node, nested_node):
+        """
+        Adds a nesting relationship to the graph.
+
+        :param host_node: A tuple of family name and family category of the host family
+        :type host_node: (str, str)
+        :param nested_node: A tuple of family name and family category of the nested family
+        :type nested_node: (str, str)
+        """
+
+        self.add_node(host_node)
+        self.add_node(nested_node)
+        if (host_node, nested_node) not in self._edge_lookup:
+            self._edge_lookup.add((host_node, nested_node))
+            self.edges[host_node].append(nested_node)
+
+    def add_nesting_path(self, family_nesting_path, family_category_nesting_path):
+        """
+        Adds all families and nesting relationships of a nesting path to the graph.
+
+        :param family_nesting_path: The family name nesting path: rootFamilyName :: nestedFamilyNameOne :: nestedFamilyTwo
+        :type family_nesting_path: str
+        :param family_category_nesting_path: The family category nesting path: rootFamilyCategory :: nestedFamilyOneCategory :: nestedFamilyTwoCategory
+        :type family_category_nesting_path: str
+        """
+
+        name_chunks = family_nesting_path.split(NESTING_SEPARATOR)
+        category_chunks = family_category_nesting_path.split(NESTING_SEPARATOR)
+        if len(name_chunks) != len(category_chunks):
+            raise ValueError(
+                "Length of nesting name path: {} is not the same as length of nesting category path: {}".format(
+                    len(name_chunks), len(category_chunks)
+                )
+            )
+        nodes = list(zip(name_chunks, category_chunks))
+        self.add_node(nodes[0])
+        for i in range(1, len(nodes)):
+            self.add_edge(nodes[i - 1], nodes[i])
+
+    def get_strongly_connected_components(self):
+        """
+        Returns the strongly connected components of the graph using Tarjan's algorithm.
+
+        The depth first search is iterative to avoid hitting the recursion limit on deep nesting.
+
+        :return: List of strongly connected components, each a list of nodes
+        :rtype: [[(str, str)]]
+        """
+
+        index_by_node = {}
+        low_link_by_node = {}
+        on_stack = set()
+        stack = []
+        components = []
+        next_index = 0
+
+        for start_node in self.edges:
+            if start_node in index_by_node:
+                continue
+            # work stack of (node, iterator over nested nodes)
+            index_by_node[start_node] = next_index
+            low_link_by_node[start_node] = next_index
+            next_index += 1
+            stack.append(start_node)
+            on_stack.add(start_node)
+            work = [(start_node, iter(self.edges[start_node]))]
+            while work:
+                node, nested_nodes = work[-1]
+                descended = False
+                for nested_node in nested_nodes:
+                    if nested_node not in index_by_node:
+                        index_by_node[nested_node] = next_index
+                        low_link_by_node[nested_node] = next_index
+                        next_index += 1
+                        stack.append(nested_node)
+                        on_stack.add(nested_node)
+                        work.append((nested_node, iter(self.edges[nested_node])))
+                        descended = True
+                        break
+                    elif nested_node in on_stack:
+                        low_link_by_node[node] = min(
+                            low_link_by_node[node], index_by_node[nested_node]
+                        )
+                if descended:
+                    continue
+                # all nested nodes visited
+                work.pop()
+                if work:
+                    host_node = work[-1][0]
+                    low_link_by_node[host_node] = min(
+                        low_link_by_node[host_node], low_link_by_node[node]
+                    )
+                if low_link_by_node[node] == index_by_node[node]:
+                    component = []
+                    while True:
+                        component_node = stack.pop()
+                        on_stack.discard(component_node)
+                        component.append(component_node)
+                        if component_node == node:
+                            break
+                    components.append(component)
+        return components
+
+    def _get_cycle(self, component):
+        """
+        Returns the shortest cycle through the first family (sorted by name and category) of a strongly connected component.
+
+        :param component: A strongly connected component
+        :type component: [(str, str)]
+        :return: List of nodes, first and last node are the same
+        :rtype: [(str, str)]
+        """
+
+        component_nodes = set(component)
+        start_node = min(component)
+        # breadth first search for the shortest path back to the start node within the component
+        previous_by_node = {start_node: None}
+        queue = [start_node]
+        queue_index = 0
+        while queue_index < len(queue):
+            node = queue[queue_index]
+            queue_index += 1
+            for nested_node in self.edges[node]:
+                if nested_node == start_node:
+                    # walk back to start node
+                    cycle = [start_node]
+                    while node is not None:
+                        cycle.append(node)
+                        node = previous_by_node[node]
+                    cycle.reverse()
+                    return cycle
+                if nested_node in component_nodes and nested_node not in previous_by_node:
+                    previous_by_node[nested_node] = node
+                    queue.append(nested_node)
+        return []
+
+    def get_circular_references(self):
+        """
+        Returns one cycle per group of families nesting each other (strongly connected component of more than one family, or a family\
+            nesting itself).
+
+        :return: List of cycles, each a list of nodes where the first and last node are the same. Cycles are sorted by their first node.
+        :rtype: [[(str, str)]]
+        """
+
+        cycles = []
+        for component in self.get_strongly_connected_components():
+            if len(component) > 1 or component[0] in self.edges[component[0]]:
+                cycles.append(self._get_cycle(component))
+        return sorted(cycles)
+
+    def get_circular_reference_nodes(self):
+        """
+        Returns all families which are part of a circular reference.
+
+        :return: Set of tuples of family name and family category
+        :rtype: set((str, str))
+        """
+
+        nodes = set()
+        for component in self.get_strongly_connected_components():
+            if len(component) > 1 or component[0] in self.edges[component[0]]:
+                nodes.update(component)
+        return nodes
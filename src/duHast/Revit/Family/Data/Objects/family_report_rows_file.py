@@ -0,0 +1,81 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Family report rows file class reading the rows of a family report cache file on first access.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2024, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+from duHast.Utilities.Objects import base
+from duHast.Utilities.files_json import read_json_data_from_file
+
+
+class FamilyReportRowsFile(base.Base):
+    # rows read from file are kept in a slot, so they are not part of vars() or to_json()
+    __slots__ = ("_rows",)
+
+    def __init__(self, file_path, data_type, **kwargs):
+        """
+        Family report rows file class: a list of report rows of one storage data type, read from a family report cache file on first access.
+
+        Supports len() and indexing / slicing like a list of rows.
+
+        :param file_path: Fully qualified file path of the json file containing the report rows.
+        :type file_path: str
+        :param data_type: The storage data type of the report rows.
+        :type data_type: str
+        """
+
+        # forwards all unused arguments
+        # ini super class to allow multi inheritance in children!
+        super(FamilyReportRowsFile, self).__init__(**kwargs)
+
+        self.file_path = file_path
+        self.data_type = data_type
+        self._rows = None
+
+    def get_rows(self):
+        """
+        Returns the report rows, reading them from file on first call.
+
+        :raises ValueError: If the file does not contain a list of report rows.
+        :return: List of report rows.
+        :rtype: [[str]]
+        """
+
+        if self._rows is None:
+            rows = read_json_data_from_file(self.file_path)
+            if not isinstance(rows, list):
+                raise ValueError(
+                    "Failed to read {} report rows from file: {}".format(
+                        self.data_type, self.file_path
+                    )
+                )
+            self._rows = rows
+        return self._rows
+
+    def __len__(self):
+        return len(self.get_rows())
+
+    def __getitem__(self, key):
+        return self.get_rows()[key]
@@ -27,10 +27,16 @@ Interface for family data storage / processing class.
 #
 #
 
+import copy
+
 from duHast.Utilities.Objects import base
 from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (
     NESTING_SEPARATOR,
 )
+from duHast.Revit.Family.Data.Objects.ifamily_data_storage import (
+    IFamilyDataStorage,
+    rebase_nesting_path,
+)
 
 # common data dictionary keys
 ROOT = "root"
@@ -85,6 +91,37 @@ class IFamilyData(base.Base):
                 root_data_storage.append(storage)
         return root_data_storage
 
+    def copy_to_nesting_path(self, new_root_path, new_root_category_path):
+        """
+        Returns a copy of this data instance with the nesting paths of the data instance and its storage objects rebased from this\
+            instance root path to another nesting path.
+
+        :param new_root_path: The name nesting path to rebase the data to.
+        :type new_root_path: str
+        :param new_root_category_path: The category nesting path to rebase the data to.
+        :type new_root_category_path: str
+        :return: A copy of this data instance.
+        :rtype: :class:`.IFamilyData`
+        """
+
+        data_copy = copy.copy(self)
+        data_copy.root_path = new_root_path
+        data_copy.root_category_path = new_root_category_path
+        data_copy.data = []
+        for storage in self.data:
+            if isinstance(storage, IFamilyDataStorage):
+                data_copy.data.append(
+                    storage.copy_to_nesting_path(
+                        self.root_path,
+                        self.root_category_path,
+                        new_root_path,
+                        new_root_category_path,
+                    )
+                )
+            else:
+                data_copy.data.append(storage)
+        return data_copy
+
     def get_property_names(self):
         """
         Get the property names of the storage object.
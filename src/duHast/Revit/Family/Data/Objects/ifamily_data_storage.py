@@ -40,10 +40,37 @@ from duHast.Utilities.utility import encode_utf8
 from duHast.Revit.Family.Data.Objects.ifamily_data_storage_used_by import (
     IFamilyDataStorageUsedBy,
 )
+from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (
+    NESTING_SEPARATOR,
+)
 import System
+import copy
 import json
 
 
+def rebase_nesting_path(nesting_path, old_nesting_path, new_nesting_path):
+    """
+    Replaces the start of a nesting path with another nesting path.
+
+    Nesting paths which do not start with the old nesting path are returned unchanged.
+
+    :param nesting_path: A nesting path: rootFamilyName :: nestedFamilyNameOne :: nestedFamilyTwo
+    :type nesting_path: str
+    :param old_nesting_path: The nesting path to be replaced: rootFamilyName :: nestedFamilyNameOne
+    :type old_nesting_path: str
+    :param new_nesting_path: The replacement nesting path: otherRootFamilyName :: nestedFamilyNameOne
+    :type new_nesting_path: str
+    :return: The rebased nesting path: otherRootFamilyName :: nestedFamilyNameOne :: nestedFamilyTwo
+    :rtype: str
+    """
+
+    if nesting_path == old_nesting_path or nesting_path.startswith(
+        old_nesting_path + NESTING_SEPARATOR
+    ):
+        return new_nesting_path + nesting_path[len(old_nesting_path) :]
+    return nesting_path
+
+
 class IFamilyDataStorage(base.Base):
     def __init__(
         self,
@@ -112,6 +139,51 @@ class IFamilyDataStorage(base.Base):
     def __ne__(self, other):
         return not self.__eq__(other=other)
 
+    def copy_to_nesting_path(
+        self,
+        old_root_name_path,
+        old_root_category_path,
+        new_root_name_path,
+        new_root_category_path,
+    ):
+        """
+        Returns a copy of this storage object with its nesting paths (and those of any used by entries) rebased to another nesting path.
+
+        Used to reuse data collected from a nested family when the same family is nested into another host family.
+
+        :param old_root_name_path: The name nesting path the data was collected under.
+        :type old_root_name_path: str
+        :param old_root_category_path: The category nesting path the data was collected under.
+        :type old_root_category_path: str
+        :param new_root_name_path: The name nesting path to rebase the data to.
+        :type new_root_name_path: str
+        :param new_root_category_path: The category nesting path to rebase the data to.
+        :type new_root_category_path: str
+        :return: A copy of this storage object.
+        :rtype: :class:`.IFamilyDataStorage`
+        """
+
+        storage_copy = copy.copy(self)
+        storage_copy.root_name_path = rebase_nesting_path(
+            self.root_name_path, old_root_name_path, new_root_name_path
+        )
+        storage_copy.root_category_path = rebase_nesting_path(
+            self.root_category_path, old_root_category_path, new_root_category_path
+        )
+        used_by = getattr(self, "used_by", None)
+        if isinstance(used_by, list):
+            storage_copy.used_by = []
+            for used_by_entry in used_by:
+                used_by_copy = copy.copy(used_by_entry)
+                if isinstance(used_by_entry, IFamilyDataStorageUsedBy):
+                    used_by_copy.root_name_path = rebase_nesting_path(
+                        used_by_entry.root_name_path,
+                        old_root_name_path,
+                        new_root_name_path,
+                    )
+                storage_copy.used_by.append(used_by_copy)
+        return storage_copy
+
     def update_usage(self, other_storage):
         """
         Update the usage of this storage object with the usage of another storage object by:
@@ -10,8 +10,10 @@ Algorithm description:
 
 - read families into data family objects
 - process them ( to get the internal nesting set up)
-- get the shortest path from each family
-- check for duplicates in those paths ( may need to get unique path for name and category!)
+- get the longest unique nesting path from each family
+- build a library wide family dependency graph from those path ( nodes: family name and category, edges: host family nests family )
+- find all circular references as strongly connected components of that graph in a single pass
+- check for duplicates in the path of families which are part of a circular reference only
 
 """
 
@@ -41,6 +43,13 @@ Algorithm description:
 from duHast.Utilities.Objects.timer import Timer
 from duHast.Utilities.Objects import result as res
 from duHast.Revit.Family.Data.family_data_family_processor_utils import process_data
+from duHast.Revit.Family.Data.family_base_data_missing_families import process_families
+from duHast.Revit.Family.Data.Objects.family_dependency_graph import (
+    FamilyDependencyGraph,
+)
+from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (
+    NESTING_SEPARATOR,
+)
 
 
 def find_circular_reference(family_data, result_list):
@@ -69,21 +78,134 @@ def find_circular_reference(family_data, result_list):
     return result_list
 
 
+def build_family_dependency_graph(families_longest_path):
+    """
+    Builds a library wide family dependency graph from the longest unique nesting path of families.
+
+    :param families_longest_path: list of tuples of family name nesting path at 0 and family category nesting path at 1
+    :type families_longest_path: [(str, str)]
+    :return: The family dependency graph
+    :rtype: :class:`.FamilyDependencyGraph`
+    """
+
+    graph = FamilyDependencyGraph()
+    for nesting_path in families_longest_path:
+        graph.add_nesting_path(nesting_path[0], nesting_path[1])
+    return graph
+
+
+def format_circular_reference(cycle):
+    """
+    Returns a circular reference as a string in format: family name :: family category -> family name :: family category -> ...
+
+    :param cycle: List of tuples of family name and family category, first and last entry are the same
+    :type cycle: [(str, str)]
+    :return: The formatted circular reference
+    :rtype: str
+    """
+
+    return " -> ".join([node[0] + NESTING_SEPARATOR + node[1] for node in cycle])
+
+
+def _read_families_into_dependency_graph(family_base_data_report_file_path):
+    """
+    Reads families from a family base data report and builds the library wide family dependency graph from their nesting paths.
+
+    :param family_base_data_report_file_path: path to family base data report file
+    :type family_base_data_report_file_path: str
+    :raises ValueError: If the families could not be read or processed.
+    :return: The result of processing the families (result is a list of tuples of family at 0 and its longest unique nesting path at 1) and the family dependency graph
+    :rtype: (:class:`.Result`, :class:`.FamilyDependencyGraph`)
+    """
+
+    # load and process families
+    families_processed_result = process_data(
+        family_base_data_report_file_path=family_base_data_report_file_path,
+        do_this=process_families,
+    )
+
+    # check if processing was successful, otherwise get out
+    if families_processed_result.status == False:
+        raise ValueError(families_processed_result.message)
+
+    # build the dependency graph of the entire library
+    graph = build_family_dependency_graph(
+        [nested_tuple[1] for nested_tuple in families_processed_result.result]
+    )
+    return families_processed_result, graph
+
+
+def get_circular_references_in_library(family_base_data_report_file_path):
+    """
+    Function returning all circular references in a family library.
+
+    All circular references in the library are found in a single pass over a family dependency graph. Each circular reference is returned once,\
+        as a cycle of families nesting each other.
+
+    :param family_base_data_report_file_path: path to family base data report file
+    :type family_base_data_report_file_path: str
+
+    :return: A result object with the success status and the circular references found
+
+        . result is a list of cycles, each a list of tuples of family name at 0 and family category at 1, where the first and last entry are the same.\
+            (refer :meth:`.FamilyDependencyGraph.get_circular_references`)
+
+    :rtype: :class:`.Result`
+    """
+
+    return_value = res.Result()
+
+    # set up a timer
+    t_process = Timer()
+    t_process.start()
+
+    try:
+        families_processed_result, graph = _read_families_into_dependency_graph(
+            family_base_data_report_file_path
+        )
+
+        # append messages debug
+        return_value.append_message(families_processed_result.message)
+
+        circular_references = graph.get_circular_references()
+        for cycle in circular_references:
+            return_value.append_message(
+                "Circular reference: {}".format(format_circular_reference(cycle))
+            )
+        return_value.append_message(
+            "{} Found: {} circular references in library.".format(
+                t_process.stop(), len(circular_references)
+            )
+        )
+        return_value.result = circular_references
+    except Exception as e:
+        return_value.update_sep(
+            False,
+            "An error occurred while reading the families into data objects.{}".format(
+                e
+            ),
+        )
+
+    return return_value
+
+
 def check_families_have_circular_references(family_base_data_report_file_path):
     """
     Function to check if families have circular references.
 
+    All circular references in the library are found in a single pass over a family dependency graph and are reported in the\
+        result message with their full cycle. Use :func:`get_circular_references_in_library` to get the cycles themselves.
+
     :param family_base_data_report_file_path: path to family base data report file
     :type family_base_data_report_file_path: str
 
     :return: A result object with the success status and the circular reference check result
 
-        . result is a list of tuples with two entries (
-            0 index the family_data_family object,
-            1 index list of tuples with two entries in format
-                0 index the nesting level as integer at which the circular nesting occurs
-                1 index a string in format  family name :: family category
-                )
+        . result is a list of tuples with three entries (
+            0 index the nesting level as integer at which the circular nesting occurs
+            1 index a string in format  family name :: family category
+            2 index the family name nesting path the circular reference appeared on
+            )
 
     :rtype: :class:`.Result`
 
@@ -100,25 +222,49 @@ def check_families_have_circular_references(family_base_data_report_file_path):
 
     try:
 
-        # load and process families
-        families_processed_result = process_data(
-            family_base_data_report_file_path=family_base_data_report_file_path,
-            do_this=find_circular_reference,
+        # load and process families and build the dependency graph of the entire library
+        families_processed_result, graph = _read_families_into_dependency_graph(
+            family_base_data_report_file_path
         )
 
-        # check if processing was successful, otherwise get out
-        if families_processed_result.status == False:
-            raise ValueError(families_processed_result.message)
+        # append messages debug
+        return_value.append_message(families_processed_result.message)
 
-        # get results
+        # get all families which are part of a circular reference
+        circular_references = graph.get_circular_references()
+        circular_reference_nodes = graph.get_circular_reference_nodes()
+        return_value.append_message(
+            "Found: {} circular references in library.".format(
+                len(circular_references)
+            )
+        )
+        for cycle in circular_references:
+            return_value.append_message(
+                "Circular reference: {}".format(format_circular_reference(cycle))
+            )
+
+        # get the families with a nesting path containing a family which is part of a circular reference
         families = []
-        families_with_circular_nesting = []
+        family_keys = set()
         for nested_tuple in families_processed_result.result:
-            families.append(nested_tuple[0])
-            families_with_circular_nesting.extend(nested_tuple[1])
-
-        # append messages debug
-        return_value.append_message(families_processed_result.message)
+            family = nested_tuple[0]
+            family_key = family.get_key()
+            if family_key in family_keys:
+                continue
+            nesting_path = nested_tuple[1]
+            for node in zip(
+                nesting_path[0].split(NESTING_SEPARATOR),
+                nesting_path[1].split(NESTING_SEPARATOR),
+            ):
+                if node in circular_reference_nodes:
+                    family_keys.add(family_key)
+                    families.append(family)
+                    break
+
+        # get the circular nesting within those families nesting path
+        families_with_circular_nesting = []
+        for family, circular_families in find_circular_reference(families, []):
+            families_with_circular_nesting.extend(circular_families)
 
         return_value.append_message(
             "{} Found: {} circular references in families.".format(
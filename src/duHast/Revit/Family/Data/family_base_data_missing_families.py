@@ -37,18 +37,45 @@ Algorithm description:
 from duHast.Utilities.Objects.timer import Timer
 from duHast.Utilities.Objects import result as res
 from duHast.Revit.Family.Data.family_data_family_processor_utils import process_data
+from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (
+    NESTING_SEPARATOR,
+)
+
+
+def _split_nesting_path(nesting_path):
+    """
+    Splits a nesting path string into its chunks. Nesting path already split are returned unchanged.
+
+    :param nesting_path: A nesting path: rootFamilyName :: nestedFamilyNameOne :: nestedFamilyTwo or a list of its chunks
+    :type nesting_path: str or [str]
+    :return: List of nesting path chunks
+    :rtype: [str]
+    """
+
+    if isinstance(nesting_path, str):
+        return nesting_path.split(NESTING_SEPARATOR)
+    return nesting_path
 
 
 def get_unique_nested_families_from_path_data(path_data):
-    # path data is a list of tuples list[(family_name_nesting, family_category_nesting)] or None
+    """
+    Returns the unique nested families (any family but the root family) from nesting path data.
+
+    :param path_data: list of tuples of family name nesting path at 0 and family category nesting path at 1
+    :type path_data: [(str, str)]
+    :return: List of tuples of family name and family category in order of first occurrence
+    :rtype: [(str, str)]
+    """
 
     # will be a list of tuples 0: family name, 1 family category
     unique_nested_families = []
+    # used for membership checks
+    unique_nested_families_lookup = set()
 
     # loop over all unique nesting path
     for entry in path_data:
-        family_name_nesting = entry[0]
-        category_name_nesting = entry[1]
+        family_name_nesting = _split_nesting_path(entry[0])
+        category_name_nesting = _split_nesting_path(entry[1])
         if len(family_name_nesting) != len(category_name_nesting):
             raise ValueError(
                 "Name path length: {} is different to category path length: {}".format(
@@ -56,23 +83,35 @@ def get_unique_nested_families_from_path_data(path_data):
                 )
             )
         # loop over each entry in path ignoring the first entry (root family)
-        for i in range(1, len(entry[0])):
+        for i in range(1, len(family_name_nesting)):
             test_value = (family_name_nesting[i], category_name_nesting[i])
-            if test_value not in unique_nested_families:
+            if test_value not in unique_nested_families_lookup:
+                unique_nested_families_lookup.add(test_value)
                 unique_nested_families.append(test_value)
 
     return unique_nested_families
 
 
 def get_unique_root_families_from_family_data(family_data):
-    # family data is a list of family_data_family instances
+    """
+    Returns the name and category of root families.
+
+    :param family_data: List of family instances
+    :type family_data: [:class:`.FamilyDataFamily`]
+    :raises ValueError: If a family name and category combination is found more than once.
+    :return: List of tuples of family name and family category
+    :rtype: [(str, str)]
+    """
 
     # will be a list of tuples 0: family name, 1 family category
     unique_root_families = []
+    # used for membership checks
+    unique_root_families_lookup = set()
 
     for family in family_data:
         test_data = (family.family_name, family.family_category)
-        if test_data not in unique_root_families:
+        if test_data not in unique_root_families_lookup:
+            unique_root_families_lookup.add(test_data)
             unique_root_families.append(test_data)
         else:
             raise ValueError("Duplicated root family found: {}".format(test_data))
@@ -81,13 +120,21 @@ def get_unique_root_families_from_family_data(family_data):
 
 
 def get_missing_families(root_families, nested_families):
-    # root_families and nested_families is a list of tuples in format 0: family name, 1: family category
-
-    missing_families = []
+    """
+    Returns nested families without a matching root family.
+
+    :param root_families: List of tuples of family name and family category
+    :type root_families: [(str, str)]
+    :param nested_families: List of tuples of family name and family category
+    :type nested_families: [(str, str)]
+    :return: List of tuples of family name and family category
+    :rtype: [(str, str)]
+    """
 
-    for nested in nested_families:
-        if nested not in root_families:
-            missing_families.append(nested)
+    root_families_lookup = set(root_families)
+    missing_families = [
+        nested for nested in nested_families if nested not in root_families_lookup
+    ]
 
     return missing_families
 
@@ -114,6 +161,30 @@ def process_families(family_data, result_list):
     return result_list
 
 
+def _get_families_and_longest_path(processing_result):
+    """
+    Splits the result of :func:`process_families` into unique families and their longest unique nesting path.
+
+    :param processing_result: List of tuples of family instance and a longest unique nesting path of that family
+    :type processing_result: [(:class:`.FamilyDataFamily`, (str, str))]
+    :return: List of unique family instances and list of tuples of family name nesting path and family category nesting path
+    :rtype: [:class:`.FamilyDataFamily`], [(str, str)]
+    """
+
+    families = []
+    families_longest_path = []
+    # used for membership checks
+    family_keys = set()
+    for nested_tuple in processing_result:
+        # per nested path there might be multiple entries of the same family
+        family_key = nested_tuple[0].get_key()
+        if family_key not in family_keys:
+            family_keys.add(family_key)
+            families.append(nested_tuple[0])
+        families_longest_path.append(nested_tuple[1])
+    return families, families_longest_path
+
+
 def _find_missing_families(families, families_longest_path):
     """
     Returns a list of tuples representing nested family name and category which does not have a matching root family.
@@ -178,9 +249,6 @@ def check_families_missing_from_library(family_base_data_report_file_path):
 
     try:
 
-        # start timer again
-        t_process.start()
-
         # load and process families
         families_processed = process_data(
             family_base_data_report_file_path=family_base_data_report_file_path,
@@ -192,8 +260,9 @@ def check_families_missing_from_library(family_base_data_report_file_path):
             raise ValueError(families_processed.message)
 
         # get results
-        families = families_processed.result[0]
-        families_longest_path = families_processed.result[1]
+        families, families_longest_path = _get_families_and_longest_path(
+            families_processed.result
+        )
 
         return_value.append_message(
             "{} Found: {} unique longest path in families.".format(
@@ -230,9 +299,21 @@ def check_families_missing_from_library(family_base_data_report_file_path):
 
 
 def get_direct_root_families(families, missing_families):
+    """
+    Returns the families at nesting level one of any family which match a missing family.
+
+    :param families: List of family instances
+    :type families: [:class:`.FamilyDataFamily`]
+    :param missing_families: List of tuples of family name and family category
+    :type missing_families: [(str, str)]
+    :return: List of family instances
+    :rtype: [:class:`.FamilyDataFamily`]
+    """
 
     # return value
     direct_host_families = []
+    # used for membership checks
+    missing_families_lookup = set(missing_families)
 
     # loop over families and check for match at nesting level 01
     for family in families:
@@ -244,7 +325,7 @@ def get_direct_root_families(families, missing_families):
                     family_at_level_one.family_name,
                     family_at_level_one.family_category,
                 )
-                if test_value in missing_families:
+                if test_value in missing_families_lookup:
                     # match found...
                     direct_host_families.append(family_at_level_one)
 
@@ -285,9 +366,6 @@ def find_missing_families_direct_host_families(family_base_data_report_file_path
 
     try:
 
-        # start timer again
-        t_process.start()
-
         # load and process families
         families_processed_result = process_data(
             family_base_data_report_file_path=family_base_data_report_file_path,
@@ -299,13 +377,9 @@ def find_missing_families_direct_host_families(family_base_data_report_file_path
             raise ValueError(families_processed_result.message)
 
         # get results
-        families = []
-        families_longest_path = []
-        for nested_tuple in families_processed_result.result:
-            # per nested path there might be multiple entries of the same family
-            if nested_tuple[0] not in families:
-                families.append(nested_tuple[0])
-            families_longest_path.append(nested_tuple[1])
+        families, families_longest_path = _get_families_and_longest_path(
+            families_processed_result.result
+        )
 
         return_value.append_message(
             "{} Found: {} unique longest path in families.".format(
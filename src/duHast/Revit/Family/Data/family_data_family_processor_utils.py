@@ -86,7 +86,8 @@ def process_data(family_base_data_report_file_path, do_this):
             end_value = start_value + chunk_size
             # set up threads
             for i in range(core_count):
-                if start_value + chunk_size <= len(read_result.result) - 1:
+                # last chunk picks up any remainder of the int division
+                if i < core_count - 1:
                     end_value = start_value + chunk_size
                 else:
                     end_value = len(read_result.result)
@@ -104,8 +105,8 @@ def process_data(family_base_data_report_file_path, do_this):
                 )
                 threads.append(t)
 
-                # increase the start value for the next processing chunk by 1 to avoid duplicate processing
-                start_value = end_value + 1
+                # the next processing chunk starts where this one ends (slice end values are exclusive)
+                start_value = end_value
 
             # start up threads
             for t in threads:
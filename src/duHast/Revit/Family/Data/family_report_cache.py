@@ -0,0 +1,325 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Family report cache: validated report rows stored in columnar files next to the report files, read back into family containers.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2024, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import os
+
+from duHast.Revit.Family.Data.Objects.family_data_container_lazy import (
+    FamilyDataContainerLazy,
+    STORAGE_PROPERTIES,
+)
+from duHast.Revit.Family.Data.Objects.family_base_data_storage import (
+    FamilyBaseDataStorage,
+)
+from duHast.Revit.Family.Data.Objects.family_report_rows_file import (
+    FamilyReportRowsFile,
+)
+from duHast.Utilities.Objects.result import Result
+from duHast.Utilities.files_io import get_files_size_and_modified_time
+from duHast.Utilities.files_json import read_json_data_from_file, write_json_to_file
+
+#: version of the cache file layout, caches with a different version are ignored
+REPORT_CACHE_VERSION = 2
+#: file name of the cache written into a report directory
+REPORT_CACHE_FILE_NAME = "FamilyReportCache.json"
+#: extension appended to a single report file path to get its cache file path
+REPORT_CACHE_FILE_EXTENSION = ".cache.json"
+
+#: container properties stored in the cache, one list of values per property
+CACHED_CONTAINER_PROPERTIES = [
+    "family_name",
+    "family_file_path",
+    "family_nesting_path",
+    "family_category_nesting_path",
+]
+
+
+def get_report_cache_file_path(path_to_data):
+    """
+    Returns the fully qualified file path of the cache of a report directory or a single report file.
+
+    :param path_to_data: The path to the directory containing the csv files or fully qualified file path to a single data file.
+    :type path_to_data: str
+    :return: The fully qualified cache file path.
+    :rtype: str
+    """
+
+    if os.path.isdir(path_to_data):
+        return os.path.join(path_to_data, REPORT_CACHE_FILE_NAME)
+    return path_to_data + REPORT_CACHE_FILE_EXTENSION
+
+
+def get_report_cache_rows_file_path(cache_file_path, data_type):
+    """
+    Returns the fully qualified file path of the cache file storing the report rows of a storage data type.
+
+    :param cache_file_path: The fully qualified file path of the cache file.
+    :type cache_file_path: str
+    :param data_type: The storage data type.
+    :type data_type: str
+    :return: The fully qualified rows file path.
+    :rtype: str
+    """
+
+    root, extension = os.path.splitext(cache_file_path)
+    return "{}_{}{}".format(root, data_type, extension)
+
+
+def get_report_files_signature(file_paths):
+    """
+    Returns the signature of report files: file name, size and last modified time of each file.
+
+    :param file_paths: Fully qualified file paths of the report files.
+    :type file_paths: [str]
+    :raises ValueError: If a file does not exist.
+    :return: List of file name, size and last modified time per file, sorted by file name.
+    :rtype: [[str, int, float]]
+    """
+
+    signature = []
+    for file_path, file_stats in zip(
+        file_paths, get_files_size_and_modified_time(file_paths)
+    ):
+        if file_stats is None:
+            raise ValueError("File not found: {}".format(file_path))
+        signature.append([os.path.basename(file_path), file_stats[0], file_stats[1]])
+    signature.sort()
+    return signature
+
+
+def _get_rows_by_data_type_and_container(data_read):
+    """
+    Groups report rows by storage data type and by the family container they belong to.
+
+    Rows belong to the same container if their root name path and root category path match.
+
+    :param data_read: List of report data, one entry per report file: a header row followed by data rows.
+    :type data_read: [[[str]]]
+    :return: Per storage data type: rows by root name path + root category path.
+    :rtype: {str: {str: [[str]]}}
+    """
+
+    rows_by_data_type = {}
+    for data in data_read:
+        for row in data[1:]:
+            rows_by_container = rows_by_data_type.setdefault(row[0], {})
+            key = row[1] + row[2]
+            if key in rows_by_container:
+                rows_by_container[key].append(row)
+            else:
+                rows_by_container[key] = [row]
+    return rows_by_data_type
+
+
+def write_family_report_cache(
+    cache_file_path, file_paths, data_read, containers, message=""
+):
+    """
+    Writes report rows and the family containers they were converted into to cache files.
+
+    The cache is columnar: the cache file stores one list of values per container property and, per storage data type, the index of the first row
+    and the number of rows of each container. The rows of each storage data type are stored in a separate file next to the cache file
+    (refer :func:`get_report_cache_rows_file_path`), so they only need to be read if storage instances of that type are accessed.
+
+    Only rows converted into the containers past in without error should be cached: they are not checked again when the cache is read.
+    The message past in (usually the log of converting the report rows into containers) is stored in the cache and returned when the cache is read.
+
+    :param cache_file_path: The fully qualified file path of the cache file.
+    :type cache_file_path: str
+    :param file_paths: Fully qualified file paths of the report files the rows were read from.
+    :type file_paths: [str]
+    :param data_read: List of report data, one entry per report file: a header row followed by data rows.
+    :type data_read: [[[str]]]
+    :param containers: The family containers the report rows were converted into.
+    :type containers: [:class:`.FamilyDataContainer`]
+    :param message: The message to store in the cache, defaults to ""
+    :type message: str, optional
+    :return:
+        Result class instance.
+
+        - result.status. True if the cache files were written successfully, otherwise False.
+        - result.message will confirm path of the cache files.
+        - result.result empty list
+
+        On exception:
+
+        - result.status (bool) will be False.
+        - result.message will contain exception message.
+        - result.result will be empty
+
+    :rtype: :class:`.Result`
+    """
+
+    return_value = Result()
+    try:
+        rows_by_data_type = _get_rows_by_data_type_and_container(data_read)
+
+        # container properties, one list of values per property
+        container_columns = dict(
+            (property_name, []) for property_name in CACHED_CONTAINER_PROPERTIES
+        )
+        # per data type: rows in container order, index of first row and number of rows of each container
+        rows_columns = dict(
+            (data_type, {"rows": [], "start": [], "count": []})
+            for data_type in rows_by_data_type
+        )
+        for container in containers:
+            for property_name in CACHED_CONTAINER_PROPERTIES:
+                container_columns[property_name].append(
+                    getattr(container, property_name)
+                )
+            key = (
+                container.family_nesting_path + container.family_category_nesting_path
+            )
+            for data_type, rows_by_container in rows_by_data_type.items():
+                rows = rows_by_container.get(key, [])
+                if data_type == FamilyBaseDataStorage.data_type:
+                    # there is only ever one family base data storage instance: the last one added
+                    rows = rows[-1:]
+                rows_column = rows_columns[data_type]
+                rows_column["start"].append(len(rows_column["rows"]))
+                rows_column["count"].append(len(rows))
+                rows_column["rows"].extend(rows)
+
+        # write the rows files first: the cache file is only valid if all rows files exist
+        rows_files = {}
+        for data_type, rows_column in rows_columns.items():
+            rows_file_path = get_report_cache_rows_file_path(cache_file_path, data_type)
+            write_result = write_json_to_file(rows_column["rows"], rows_file_path)
+            if not write_result.status:
+                raise ValueError(write_result.message)
+            rows_files[data_type] = {
+                "file": os.path.basename(rows_file_path),
+                "start": rows_column["start"],
+                "count": rows_column["count"],
+            }
+
+        cache_data = {
+            "version": REPORT_CACHE_VERSION,
+            "files": get_report_files_signature(file_paths),
+            "message": message,
+            "containers": container_columns,
+            "rows": rows_files,
+        }
+        return_value = write_json_to_file(cache_data, cache_file_path)
+    except Exception as e:
+        return_value.update_sep(
+            False, "Failed to write family report cache with exception: {}".format(e)
+        )
+    return return_value
+
+
+def read_family_report_cache(cache_file_path, file_paths):
+    """
+    Reads family containers from cache files.
+
+    The cache is only used if it was written from report files with the same names, sizes and last modified times as the files past in.
+    Containers create their storage instances on first access of a storage property (refer :class:`.FamilyDataContainerLazy`) and rows of a
+    storage data type are read from file on first access of a storage property of that type. Analyses using only some report data types,
+    or only the family properties of the containers, do not read all rows nor create all storage instances.
+
+    :param cache_file_path: The fully qualified file path of the cache file.
+    :type cache_file_path: str
+    :param file_paths: Fully qualified file paths of the report files the cache is expected to be written from.
+    :type file_paths: [str]
+    :return:
+        Result class instance.
+
+        - result.status. True if the cache file exists, is up to date and was read successfully, otherwise False.
+        - result.message will contain the message stored in the cache and the number of family containers read.
+        - result.result list of family containers
+
+        On exception or outdated cache:
+
+        - result.status (bool) will be False.
+        - result.message will contain the reason.
+        - result.result will be empty
+
+    :rtype: :class:`.Result`
+    """
+
+    return_value = Result()
+    try:
+        if not os.path.isfile(cache_file_path):
+            raise ValueError("Cache file not found: {}".format(cache_file_path))
+        cache_data = read_json_data_from_file(cache_file_path)
+        if cache_data.get("version", None) != REPORT_CACHE_VERSION:
+            raise ValueError("Cache file version mismatch.")
+        if cache_data.get("files", None) != get_report_files_signature(file_paths):
+            raise ValueError("Report files changed since cache was written.")
+
+        # set up the rows files, rows are read on first access
+        rows_columns = []
+        for data_type, rows_column in cache_data["rows"].items():
+            if data_type not in STORAGE_PROPERTIES:
+                raise TypeError("Invalid data type.Got: {}.".format(data_type))
+            rows_file_path = os.path.join(
+                os.path.dirname(cache_file_path), rows_column["file"]
+            )
+            if not os.path.isfile(rows_file_path):
+                raise ValueError("Cache file not found: {}".format(rows_file_path))
+            rows_columns.append(
+                (
+                    data_type,
+                    FamilyReportRowsFile(rows_file_path, data_type),
+                    rows_column["start"],
+                    rows_column["count"],
+                )
+            )
+
+        container_columns = cache_data["containers"]
+        containers = []
+        for index in range(len(container_columns["family_nesting_path"])):
+            row_ranges = {}
+            for data_type, rows_file, starts, counts in rows_columns:
+                if counts[index] > 0:
+                    row_ranges[data_type] = (rows_file, starts[index], counts[index])
+            containers.append(
+                FamilyDataContainerLazy(
+                    family_name=container_columns["family_name"][index],
+                    family_file_path=container_columns["family_file_path"][index],
+                    family_nesting_path=container_columns["family_nesting_path"][
+                        index
+                    ],
+                    family_category_nesting_path=container_columns[
+                        "family_category_nesting_path"
+                    ][index],
+                    row_ranges=row_ranges,
+                )
+            )
+        return_value.result = containers
+        return_value.append_message(cache_data.get("message", ""))
+        return_value.append_message(
+            "Read {} family containers from cache: {}".format(
+                len(containers), cache_file_path
+            )
+        )
+    except Exception as e:
+        return_value.update_sep(
+            False, "Failed to read family report cache: {}".format(e)
+        )
+    return return_value
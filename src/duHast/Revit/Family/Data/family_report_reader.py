@@ -49,6 +49,11 @@ from duHast.Revit.Family.Data.Objects.family_data_family import FamilyDataFamily
 from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (
     NESTING_SEPARATOR,
 )
+from duHast.Revit.Family.Data.family_report_cache import (
+    get_report_cache_file_path,
+    read_family_report_cache,
+    write_family_report_cache,
+)
 
 from duHast.Utilities.Objects.result import Result
 from duHast.Utilities.files_io import file_exist
@@ -324,7 +329,7 @@ def read_family_warnings_data(file_path):
     return return_value
 
 
-def read_data_into_family_containers(path_to_data):
+def read_data_into_family_containers(path_to_data, use_cache=False):
     """
     Get all csv files in directory provided and attempts to read them into varies lists of data storage objects:
 
@@ -339,8 +344,14 @@ def read_data_into_family_containers(path_to_data):
 
     Note: The content of multiple csv files of the same data type will be combined into a single list of objects.
 
+    If use_cache is True the family containers are read from a cache file next to the csv file(s) if none of the csv files changed since the cache \
+        was written. Otherwise the csv files are read and the cache file is (re-)written. Containers read from the cache create their storage \
+        instances on first access of a storage property. (refer to :mod:`.family_report_cache`)
+
     :param path_to_data: The path to the directory containing the csv files or fully qualified file path to a single data file.
     :type directory_path: str
+    :param use_cache: Flag indicating whether a family report cache file is to be used, defaults to False
+    :type use_cache: bool, optional
 
     :return: A Result object containing the list of Family Containers objects if successful.
     :rtype: Result
@@ -374,6 +385,16 @@ def read_data_into_family_containers(path_to_data):
                 else:
                     files.append(path_to_data)
 
+        # check for an up to date cache of the files
+        cache_file_path = None
+        if use_cache and len(files) > 0:
+            cache_file_path = get_report_cache_file_path(path_to_data)
+            cache_read_result = read_family_report_cache(cache_file_path, files)
+            if cache_read_result.status:
+                return_value.update(cache_read_result)
+                return return_value
+            return_value.append_message(cache_read_result.message)
+
         # read the data from each file into rows
         data_read = []
         for data_file in files:
@@ -390,9 +411,53 @@ def read_data_into_family_containers(path_to_data):
                 )
         return_value.append_message("Read {} files".format(len(data_read)))
 
+        # convert the data rows into family containers
+        data_converted = []
+        conversion_result = read_data_rows_into_family_containers(
+            data_read, data_converted=data_converted
+        )
+        return_value.update(conversion_result)
+
+        # only cache rows of files converted without error
+        if cache_file_path is not None and conversion_result.status:
+            return_value.append_message(
+                write_family_report_cache(
+                    cache_file_path,
+                    files,
+                    data_converted,
+                    conversion_result.result,
+                    conversion_result.message,
+                ).message
+            )
+
+    except Exception as e:
+        return_value.update_sep(
+            False, "Failed to read data with exception: {}".format(e)
+        )
+    return return_value
+
+
+def read_data_rows_into_family_containers(data_read, data_converted=None):
+    """
+    Converts report data rows into family container objects.
+
+    Each entry in data_read represents the content of a report file: a header row followed by data rows. The first entry in the
+    second row contains the storage data type.
+
+    :param data_read: List of report data, one entry per report file.
+    :type data_read: [[[str]]]
+    :param data_converted: Optional list the report data of files converted without error is appended to, defaults to None
+    :type data_converted: [[[str]]], optional
+
+    :return: A Result object containing the list of Family Containers objects if successful.
+    :rtype: Result
+    """
+
+    return_value = Result()
+    try:
         # convert the data rows into storage objects depending on the data type
         # this will end up containing lists of storage objects, one list per file read
-        data_converted = []
+        storage_converted = []
         for data in data_read:
             # check the first entry in the second row, since it contains the storage data type
             if len(data[1]) == 0:
@@ -409,17 +474,19 @@ def read_data_into_family_containers(path_to_data):
                     )
                     # check what came back before adding to converted data
                     if data_storage_conversion_result.status:
-                        data_converted.append(data_storage_conversion_result.result)
+                        storage_converted.append(data_storage_conversion_result.result)
+                        if data_converted is not None:
+                            data_converted.append(data)
                     # just append the log message
                     return_value.append_message(data_storage_conversion_result.message)
 
         return_value.append_message(
-            "Converted {} data entries".format(len(data_converted))
+            "Converted {} data entries".format(len(storage_converted))
         )
         # group storage containers by family root path and category root path identifying unique families
         containers_grouped_by_family_data = {}
         # loop over all storage lists and assign data to container
-        for storage_list in data_converted:
+        for storage_list in storage_converted:
             for storage_instance in storage_list:
                 if (
                     storage_instance.root_name_path
@@ -447,7 +514,7 @@ def read_data_into_family_containers(path_to_data):
 
     except Exception as e:
         return_value.update_sep(
-            False, "Failed to read data with exception: {}".format(e)
+            False, "Failed to convert data rows with exception: {}".format(e)
         )
     return return_value
 
@@ -487,70 +554,149 @@ def _assign_nested_families_to_root_families(root_families, families):
     """
     Adds nested families to their respective root families ( root family here is the top most family in the nesting tree)
 
-    :param root_families: List of roo
-    :type root_families: _type_
-    :param families: _description_
-    :type families: _type_
-    :raises ValueError: _description_
-    :return: _description_
-    :rtype: _type_
+    Root families are looked up by family name and category in a dictionary, so each nested family is assigned in constant time.
+    If more than one root family with the same name and category exists, the first one is used.
+
+    :param root_families: List of root families
+    :type root_families: [:class:`.FamilyDataFamily`]
+    :param families: List of all families (root and nested)
+    :type families: [:class:`.FamilyDataFamily`]
+    :raises ValueError: If no root family can be found for a nested family
+    :return: List of root families with nested families assigned
+    :rtype: [:class:`.FamilyDataFamily`]
     """
+
+    # set up root family look up by family name and category
+    root_families_by_key = {}
+    for root_family in root_families:
+        root_key = (root_family.family_name, root_family.family_category)
+        if root_key not in root_families_by_key:
+            root_families_by_key[root_key] = root_family
+
     for family in families:
         # check if this is a nested family ( not a root family )
         if family.is_root_family == False:
             # get the root family name and category
-            root_name_path_chunks = family.family_nesting_path.split(NESTING_SEPARATOR)
-            compare_family_name = root_name_path_chunks[0]
-            category_name_path_chunks = family.family_category_nesting_path.split(
+            compare_family_name = family.family_nesting_path.split(NESTING_SEPARATOR)[
+                0
+            ]
+            compare_family_category = family.family_category_nesting_path.split(
                 NESTING_SEPARATOR
-            )
-            compare_family_category = category_name_path_chunks[0]
+            )[0]
 
-            # loop over root families and find the host
-            found_root_family = False
-            for root_family in root_families:
-                if (
-                    root_family.family_name == compare_family_name
-                    and root_family.family_category == compare_family_category
-                ):
-                    root_family.add_nested_family_instance(family)
-                    found_root_family = True
-                    break
+            # find the host
+            root_family = root_families_by_key.get(
+                (compare_family_name, compare_family_category), None
+            )
 
             # do a sanity check
-            if found_root_family == False:
+            if root_family is None:
                 raise ValueError(
                     "Cant find root family for {} {}".format(
                         compare_family_name, compare_family_category
                     )
                 )
+            root_family.add_nested_family_instance(family)
     return root_families
 
 
-def read_data_into_families(path_to_data):
+def _get_family_key_from_container(container):
     """
-    Read the data from the csv files in the directory and return a list of FamilyDataFamily objects.
+    Returns the properties identifying the family a container belongs to as a tuple.
 
-    :param path_to_data: The path to the directory containing the csv files or fully qualified file path to single report csv file.
-    :type path_to_data: str
+    :param container: A family data container
+    :type container: :class:`.FamilyDataContainer`
+    :return: A tuple of family name, family category, family nesting path, family category nesting path and root family flag
+    :rtype: (str, str, str, str, bool)
+    """
+
+    return (
+        container.family_name,
+        container.family_category,
+        container.family_nesting_path,
+        container.family_category_nesting_path,
+        container.is_root_family,
+    )
+
+
+def _build_families_from_containers(containers):
+    """
+    Assigns containers to family instances.
+
+    Families are identified by family name, family category, family nesting path, family category nesting path and the root family flag.
+    Families are looked up in a dictionary by these properties, so containers are assigned in linear time.
+
+    :param containers: List of family data containers
+    :type containers: [:class:`.FamilyDataContainer`]
+    :return: List of families in order of first occurrence in containers list and a list of log messages
+    :rtype: [:class:`.FamilyDataFamily`], [str]
+    """
+
+    families = []
+    messages = []
+    # families by key, used to find the family a container belongs to
+    families_by_key = {}
+    # loop over containers and assign to families
+    for container in containers:
+        family_key = _get_family_key_from_container(container)
+        # check if the family is already in the list
+        if family_key in families_by_key:
+            families_by_key[family_key].add_data_container(container)
+            messages.append(
+                "Added container to family: {} - {} {} - {}".format(
+                    container.family_name,
+                    container.family_category,
+                    container.family_nesting_path,
+                    container.family_category_nesting_path,
+                )
+            )
+        else:
+            # if the family is not in the list, add it
+            new_family = FamilyDataFamily(
+                family_name=container.family_name,
+                family_category=container.family_category,
+                family_file_path=container.family_file_path,
+                family_nesting_path=container.family_nesting_path,
+                family_category_nesting_path=container.family_category_nesting_path,
+                is_root_family=container.is_root_family,
+            )
+            new_family.add_data_container(container)
+            families.append(new_family)
+            families_by_key[family_key] = new_family
+            messages.append(
+                "Added new family: {} - {} {} - {}".format(
+                    container.family_name,
+                    container.family_category,
+                    container.family_nesting_path,
+                    container.family_category_nesting_path,
+                )
+            )
+    return families, messages
+
+
+def _convert_containers_into_families(container_read_result, data_source):
+    """
+    Assembles families from the family containers read and assigns nested families to their root families.
+
+    :param container_read_result: The result of reading report data into family containers.
+    :type container_read_result: :class:`.Result`
+    :param data_source: Description of the data source used in log messages.
+    :type data_source: str
     :return: A Result object containing the list of FamilyDataFamily objects if successful.
     :rtype: Result
-
     """
 
     return_value = Result()
     families = []
 
     try:
-        # first read reports into containers
-        container_read_result = read_data_into_family_containers(path_to_data)
         return_value.update(container_read_result)
 
         # check if the read was successful
         if container_read_result.status == False:
             raise ValueError(
                 "Failed to read data from: {} into family containers: {} ".format(
-                    path_to_data, container_read_result.message
+                    data_source, container_read_result.message
                 )
             )
 
@@ -559,71 +705,13 @@ def read_data_into_families(path_to_data):
         # - the family name
         # - the family category
 
-        containers = container_read_result.result
-        # loop over containers and assign to families
-        for container in containers:
-
-            # check if the family is already in the list
-            # compare_family_name = container.family_nesting_path
-            # compare_family_category = container.family_category_nesting_path
-
-            # if container.is_root_family:
-            # if family is a root family use directly the containers family name and family category
-            #    compare_family_name = container.family_nesting_path
-            #    compare_family_category = container.family_category_nesting_path
-            # else:
-            # if a nested family get, need to get to the root family at the top of the nesting tree
-            #    root_name_path_chunks = container.family_nesting_path.split(
-            #        NESTING_SEPARATOR
-            #    )
-            #    compare_family_name = root_name_path_chunks[0]
-            #    category_name_path_chunks = (
-            #        container.family_category_nesting_path.split(NESTING_SEPARATOR)
-            #    )
-            #    compare_family_category = category_name_path_chunks[0]
-
-            # check if the family is already in the list
-            family_found = False
-            for family in families:
-                if (
-                    family.family_name == container.family_name
-                    and family.family_category == container.family_category
-                    and family.family_nesting_path == container.family_nesting_path
-                    and family.family_category_nesting_path
-                    == container.family_category_nesting_path
-                    and family.is_root_family == container.is_root_family
-                ):
-                    family_found = True
-                    family.add_data_container(container)
-                    return_value.append_message(
-                        "Added container to family: {} - {} {} - {}".format(
-                            container.family_name,
-                            container.family_category,
-                            container.family_nesting_path,
-                            container.family_category_nesting_path,
-                        )
-                    )
-                    break
-            # if the family is not in the list, add it
-            if family_found == False:
-                new_family = FamilyDataFamily(
-                    family_name=container.family_name,
-                    family_category=container.family_category,
-                    family_file_path=container.family_file_path,
-                    family_nesting_path=container.family_nesting_path,
-                    family_category_nesting_path=container.family_category_nesting_path,
-                    is_root_family=container.is_root_family,
-                )
-                new_family.add_data_container(container)
-                families.append(new_family)
-                return_value.append_message(
-                    "Added new family: {} - {} {} - {}".format(
-                        container.family_name,
-                        container.family_category,
-                        container.family_nesting_path,
-                        container.family_category_nesting_path,
-                    )
-                )
+        # assemble families from containers
+        families, messages = _build_families_from_containers(
+            container_read_result.result
+        )
+        # append all messages in one go
+        if len(messages) > 0:
+            return_value.append_message("\n".join(messages))
 
         # need to add nested families to root families
         # filter out root families
@@ -638,3 +726,38 @@ def read_data_into_families(path_to_data):
 
     return_value.result = families
     return return_value
+
+
+def read_data_into_families(path_to_data, use_cache=False):
+    """
+    Read the data from the csv files in the directory and return a list of FamilyDataFamily objects.
+
+    :param path_to_data: The path to the directory containing the csv files or fully qualified file path to single report csv file.
+    :type path_to_data: str
+    :param use_cache: Flag indicating whether a family report cache file is to be used, defaults to False (refer to :func:`read_data_into_family_containers`)
+    :type use_cache: bool, optional
+    :return: A Result object containing the list of FamilyDataFamily objects if successful.
+    :rtype: Result
+
+    """
+
+    # first read reports into containers
+    container_read_result = read_data_into_family_containers(
+        path_to_data, use_cache=use_cache
+    )
+    return _convert_containers_into_families(container_read_result, path_to_data)
+
+
+def read_data_rows_into_families(data_read):
+    """
+    Converts report data rows, already read from file, into a list of FamilyDataFamily objects.
+
+    :param data_read: List of report data, one entry per report file: a header row followed by data rows.
+    :type data_read: [[[str]]]
+    :return: A Result object containing the list of FamilyDataFamily objects if successful.
+    :rtype: Result
+    """
+
+    # first convert rows into containers
+    container_read_result = read_data_rows_into_family_containers(data_read)
+    return _convert_containers_into_families(container_read_result, "data rows")
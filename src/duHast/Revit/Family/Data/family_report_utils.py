@@ -28,12 +28,36 @@ Family report data utility module containing functions to manipulate report file
 #
 #
 
-from duHast.Utilities.Objects.result import Result
-from duHast.Revit.Family.Data.family_report_reader import read_data_into_families
-from duHast.Utilities.files_io import file_exist
-
+import hashlib
+import json
+import os
 
-def _check_families_still_exist(family_data):
+from duHast.Utilities.Objects.result import Result
+from duHast.Revit.Family.Data.family_report_reader import (
+    read_data_into_families,
+    read_data_rows_into_families,
+)
+from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (
+    NESTING_SEPARATOR,
+)
+from duHast.Revit.Family.Data.Objects.family_base_data_storage import (
+    FamilyBaseDataStorage,
+)
+from duHast.Utilities.files_io import files_exist, get_files_size_and_modified_time
+from duHast.Utilities.files_csv import read_csv_file, write_report_data_as_csv
+from duHast.Utilities.files_get import get_files_single_directory
+from duHast.Utilities.files_json import read_json_data_from_file, write_json_to_file
+
+#: Default number of threads used to check whether family files still exist
+FILE_EXIST_CHECK_WORKERS = 8
+
+#: File name of the manifest stored next to the combined report files
+REPORT_MANIFEST_FILE_NAME = "FamilyReportManifest.json"
+#: Version of the manifest format, a manifest of a different version is ignored
+REPORT_MANIFEST_VERSION = 1
+
+
+def _check_families_still_exist(family_data, max_workers=FILE_EXIST_CHECK_WORKERS):
     """
     Checks whether families still exist on file server.
 
@@ -44,6 +68,8 @@ def _check_families_still_exist(family_data):
 
     :param famData: A list containing FamilyDataFamily instances.
     :type famData: [:class:`.FamilyDataFamily`]
+    :param max_workers: Number of threads used to check whether family files exist.
+    :type max_workers: int
 
     :return:
         Result class instance.
@@ -65,8 +91,15 @@ def _check_families_still_exist(family_data):
     family_was_removed = False
     try:
         # check which ones do not exist anymore
-        for family_data_instance in family_data:
-            if file_exist(family_data_instance.family_file_path):
+        file_exist_status = files_exist(
+            [
+                family_data_instance.family_file_path
+                for family_data_instance in family_data
+            ],
+            max_workers=max_workers,
+        )
+        for family_data_instance, exists in zip(family_data, file_exist_status):
+            if exists:
                 filtered_list.append(family_data_instance)
             else:
                 return_value.append_message(
@@ -89,7 +122,9 @@ def _check_families_still_exist(family_data):
     return return_value
 
 
-def combine_reports(previous_report_path, new_report_path):
+def combine_reports(
+    previous_report_path, new_report_path, max_workers=FILE_EXIST_CHECK_WORKERS
+):
     """
     This combines family reports:
 
@@ -104,6 +139,8 @@ def combine_reports(previous_report_path, new_report_path):
     :type previous_report_path: str
     :param new_report_path: A fully qualified file path to the new report file.
     :type new_report_path: str
+    :param max_workers: Number of threads used to check whether family files still exist.
+    :type max_workers: int
 
     :return:
         Result class instance.
@@ -172,10 +209,14 @@ def combine_reports(previous_report_path, new_report_path):
         if len(new_families_read_result.result) > 0:
             new_families_added = len(new_families_read_result.result)
             combined_families = new_families_read_result.result
+            # keys of families in combined list ( same properties as used by FamilyDataFamily equal comparison )
+            combined_family_keys = set(family.get_key() for family in combined_families)
             # take new families as base line and append previous report families only which have no match in new families
             for previous_family in previous_families_read_result.result:
-                if previous_family not in combined_families:
+                previous_family_key = previous_family.get_key()
+                if previous_family_key not in combined_family_keys:
                     combined_families.append(previous_family)
+                    combined_family_keys.add(previous_family_key)
                     previous_families_retained += 1
         else:
             # return previous families unchanged since no new families exist
@@ -191,7 +232,9 @@ def combine_reports(previous_report_path, new_report_path):
         return_value.result = combined_families
 
         # check if all families still exist on the server...if not remove from list
-        check_files_exists = _check_families_still_exist(combined_families)
+        check_files_exists = _check_families_still_exist(
+            combined_families, max_workers=max_workers
+        )
         if check_files_exists.status:
             if len(check_files_exists.result) != len(combined_families):
                 return_value.append_message(
@@ -220,3 +263,395 @@ def combine_reports(previous_report_path, new_report_path):
         )
 
     return return_value
+
+
+def _read_report_rows_by_data_type(report_directory, single_file_per_data_type=False):
+    """
+    Reads all csv report files in a directory into rows grouped by report data type.
+
+    :param report_directory: Fully qualified directory path containing report csv files.
+    :type report_directory: str
+    :param single_file_per_data_type: If True, an exception is raised if more than one report file of the same data type exists.
+    :type single_file_per_data_type: bool
+
+    :return: Dictionary of data type to [file path, header row, data rows]
+    :rtype: {str: [str, [str], [[str]]]}
+    """
+
+    rows_by_data_type = {}
+    files = get_files_single_directory(
+        folder_path=report_directory,
+        file_prefix="",
+        file_suffix="",
+        file_extension=".csv",
+    )
+    for file_path in files:
+        data = read_csv_file(file_path)
+        # ignore empty files, same as the report reader
+        if not data or len(data) <= 1:
+            continue
+        if len(data[1]) == 0:
+            raise ValueError("Data type missing in the file: {}".format(file_path))
+        data_type = data[1][0]
+        if data_type in rows_by_data_type:
+            if single_file_per_data_type:
+                raise ValueError(
+                    "More than one report file of data type {} in: {}".format(
+                        data_type, report_directory
+                    )
+                )
+            if rows_by_data_type[data_type][1] != data[0]:
+                raise ValueError(
+                    "Report files of data type {} have different headers: {}".format(
+                        data_type, file_path
+                    )
+                )
+            rows_by_data_type[data_type][2].extend(data[1:])
+        else:
+            rows_by_data_type[data_type] = [file_path, data[0], data[1:]]
+    return rows_by_data_type
+
+
+def _get_root_family_key(row, name_path_index, category_path_index):
+    """
+    Returns the root family name and category of a report row.
+
+    Rows of nested families belong to the root family at the start of their nesting path.
+
+    :return: The root family name and root family category
+    :rtype: (str, str)
+    """
+
+    return (
+        row[name_path_index].split(NESTING_SEPARATOR)[0],
+        row[category_path_index].split(NESTING_SEPARATOR)[0],
+    )
+
+
+def _group_rows_by_root_family(rows_by_data_type):
+    """
+    Groups report rows of all data types by their root family.
+
+    :param rows_by_data_type: Dictionary of data type to [file path, header row, data rows]
+    :type rows_by_data_type: {str: [str, [str], [[str]]]}
+
+    :return: List of root family keys in order of first occurrence and a dictionary of root family key to a dictionary of data type to rows
+    :rtype: [(str, str)], {(str, str): {str: [[str]]}}
+    """
+
+    family_keys = []
+    rows_by_family = {}
+    for data_type in sorted(rows_by_data_type.keys()):
+        file_path, header, rows = rows_by_data_type[data_type]
+        name_path_index = header.index("root_name_path")
+        category_path_index = header.index("root_category_path")
+        for row in rows:
+            family_key = _get_root_family_key(
+                row, name_path_index, category_path_index
+            )
+            if family_key not in rows_by_family:
+                rows_by_family[family_key] = {}
+                family_keys.append(family_key)
+            family_rows = rows_by_family[family_key]
+            if data_type in family_rows:
+                family_rows[data_type].append(row)
+            else:
+                family_rows[data_type] = [row]
+    return family_keys, rows_by_family
+
+
+def _get_root_family_file_path(family_rows, rows_by_data_type):
+    """
+    Returns the file path of a root family from its family base report row.
+
+    :return: The fully qualified file path of the root family or None if no root family base row exists.
+    :rtype: str
+    """
+
+    data_type = FamilyBaseDataStorage.data_type
+    if data_type not in family_rows:
+        return None
+    header = rows_by_data_type[data_type][1]
+    name_path_index = header.index("root_name_path")
+    file_path_index = header.index("family_file_path")
+    for row in family_rows[data_type]:
+        # the root family row is the only row without a nesting separator in its name path
+        if NESTING_SEPARATOR not in row[name_path_index]:
+            return row[file_path_index]
+    return None
+
+
+def _get_family_rows_hash(family_rows):
+    """
+    Returns a content hash of all report rows of a family.
+
+    :param family_rows: Dictionary of data type to report rows of a single family
+    :type family_rows: {str: [[str]]}
+
+    :return: A hex digest of the report rows.
+    :rtype: str
+    """
+
+    hash_value = hashlib.sha1()
+    for data_type in sorted(family_rows.keys()):
+        hash_value.update(
+            json.dumps([data_type, family_rows[data_type]]).encode("utf-8")
+        )
+    return hash_value.hexdigest()
+
+
+def _read_manifest(manifest_file_path):
+    """
+    Reads a report manifest file into a dictionary of root family key to manifest entry.
+
+    A missing, unreadable or outdated manifest returns an empty dictionary, which results in all families being re-parsed.
+
+    :return: Dictionary of root family key to manifest entry.
+    :rtype: {(str, str): {}}
+    """
+
+    manifest = read_json_data_from_file(manifest_file_path)
+    entries_by_family = {}
+    if manifest.get("version", None) != REPORT_MANIFEST_VERSION:
+        return entries_by_family
+    for entry in manifest.get("families", []):
+        entries_by_family[
+            (entry["root_name_path"], entry["root_category_path"])
+        ] = entry
+    return entries_by_family
+
+
+def refresh_combined_report(
+    combined_report_directory,
+    new_report_directory,
+    max_workers=FILE_EXIST_CHECK_WORKERS,
+):
+    """
+    Incrementally combines a new family report into a previously combined family report.
+
+    Unlike :func:`combine_reports` this function works on report rows: rows are grouped by root family (root family and its nested families)
+    and only families which changed are converted into FamilyDataFamily instances. A manifest file stored next to the combined report
+    records per root family:
+
+    - the family file path, size and last modified time
+    - a content hash of its report rows
+
+    A family is considered unchanged if its report rows hash, file size and modified time match the manifest entry. The rows of unchanged
+    families are copied into the combined report as is. Any other family (new, changed report rows or changed family file) is
+    converted into FamilyDataFamily instances to validate its rows. Families which no longer exist on the file server are removed.
+
+    Families in the new report replace families of the same root name and category in the combined report, same as :func:`combine_reports`.
+
+    The combined report files (one per data type, the combined report directory must not contain more than one file per data type) and the
+    manifest are written to the combined report directory. If no manifest exists yet,
+    all families are considered changed.
+
+    :param combined_report_directory: Fully qualified directory path containing the combined report files and manifest.
+    :type combined_report_directory: str
+    :param new_report_directory: Fully qualified directory path containing the new report files.
+    :type new_report_directory: str
+    :param max_workers: Number of threads used to check family files on the file server.
+    :type max_workers: int
+
+    :return:
+        Result class instance.
+
+        - .status True if successfully combined report(s). Otherwise False.
+        - .message will contain count of new families added, previous families retained, families removed, unchanged and re-parsed families.
+        - . result will contain list of FamilyDataFamily instances of families which changed
+
+        On exception:
+
+        - result.status (bool) will be False.
+        - result.message will contain generic exception message.
+        - result.result will be empty
+    :rtype: :class:`.Result`
+    """
+
+    return_value = Result()
+    try:
+        # checks:
+        # are past in path strings
+        if isinstance(combined_report_directory, str) == False:
+            raise TypeError(
+                "combined_report_directory should be of type string but is: {}".format(
+                    type(combined_report_directory)
+                )
+            )
+        if isinstance(new_report_directory, str) == False:
+            raise TypeError(
+                "new_report_directory should be of type string but is: {}".format(
+                    type(new_report_directory)
+                )
+            )
+
+        # read report rows
+        previous_rows_by_data_type = _read_report_rows_by_data_type(
+            combined_report_directory, single_file_per_data_type=True
+        )
+        new_rows_by_data_type = _read_report_rows_by_data_type(new_report_directory)
+
+        # check headers match since rows get merged into a single file per data type
+        for data_type, new_data in new_rows_by_data_type.items():
+            if (
+                data_type in previous_rows_by_data_type
+                and previous_rows_by_data_type[data_type][1] != new_data[1]
+            ):
+                raise ValueError(
+                    "Report files of data type {} have different headers.".format(
+                        data_type
+                    )
+                )
+
+        previous_family_keys, previous_rows_by_family = _group_rows_by_root_family(
+            previous_rows_by_data_type
+        )
+        new_family_keys, new_rows_by_family = _group_rows_by_root_family(
+            new_rows_by_data_type
+        )
+        return_value.append_message(
+            "Successfully read {} families from: {}".format(
+                len(previous_family_keys), combined_report_directory
+            )
+        )
+        return_value.append_message(
+            "Successfully read {} families from: {}".format(
+                len(new_family_keys), new_report_directory
+            )
+        )
+
+        # take new families as base line and append previous report families only which have no match in new families
+        combined_family_keys = list(new_family_keys)
+        rows_by_family = dict(new_rows_by_family)
+        rows_by_data_type = dict(previous_rows_by_data_type)
+        rows_by_data_type.update(new_rows_by_data_type)
+        previous_families_retained = 0
+        for family_key in previous_family_keys:
+            if family_key not in rows_by_family:
+                combined_family_keys.append(family_key)
+                rows_by_family[family_key] = previous_rows_by_family[family_key]
+                previous_families_retained += 1
+
+        return_value.append_message(
+            "Combined report contains {} new families and {} previous report families where retained.".format(
+                len(new_family_keys), previous_families_retained
+            )
+        )
+
+        # check family files on the file server
+        family_file_paths = [
+            _get_root_family_file_path(rows_by_family[family_key], rows_by_data_type)
+            for family_key in combined_family_keys
+        ]
+        family_file_stats = get_files_size_and_modified_time(
+            [file_path for file_path in family_file_paths if file_path is not None],
+            max_workers=max_workers,
+        )
+        family_file_stats_iterator = iter(family_file_stats)
+
+        # compare against manifest
+        manifest_file_path = os.path.join(
+            combined_report_directory, REPORT_MANIFEST_FILE_NAME
+        )
+        manifest_entries = _read_manifest(manifest_file_path)
+        manifest_families = []
+        retained_family_keys = []
+        changed_family_rows = {}
+        unchanged_families = 0
+        families_removed = 0
+        for family_key, family_file_path in zip(
+            combined_family_keys, family_file_paths
+        ):
+            # families without a root family base row can not be checked on the file server
+            file_stats = (None, None)
+            if family_file_path is not None:
+                file_stats = next(family_file_stats_iterator)
+            if file_stats is None:
+                return_value.append_message(
+                    "Removed family: {}".format(family_file_path)
+                )
+                families_removed += 1
+                continue
+            retained_family_keys.append(family_key)
+            family_rows = rows_by_family[family_key]
+            manifest_entry = {
+                "root_name_path": family_key[0],
+                "root_category_path": family_key[1],
+                "family_file_path": family_file_path,
+                "size": file_stats[0],
+                "mtime": file_stats[1],
+                "row_hash": _get_family_rows_hash(family_rows),
+            }
+            manifest_families.append(manifest_entry)
+            if manifest_entries.get(family_key, None) == manifest_entry:
+                unchanged_families += 1
+            else:
+                for data_type, rows in family_rows.items():
+                    if data_type in changed_family_rows:
+                        changed_family_rows[data_type].extend(rows)
+                    else:
+                        changed_family_rows[data_type] = list(rows)
+
+        if families_removed > 0:
+            return_value.append_message(
+                "Removed {} families from data set as they no longer exist on server.".format(
+                    families_removed
+                )
+            )
+        else:
+            return_value.append_message(
+                "All families still exist on server. None was removed from data set."
+            )
+
+        # convert rows of changed families into families
+        changed_families = []
+        if len(changed_family_rows) > 0:
+            changed_families_read_result = read_data_rows_into_families(
+                [
+                    [rows_by_data_type[data_type][1]] + rows
+                    for data_type, rows in sorted(changed_family_rows.items())
+                ]
+            )
+            if changed_families_read_result.status == False:
+                raise ValueError(changed_families_read_result.message)
+            changed_families = changed_families_read_result.result
+        return_value.append_message(
+            "{} families unchanged, {} families re-parsed.".format(
+                unchanged_families, len(retained_family_keys) - unchanged_families
+            )
+        )
+
+        # write combined report files, one per data type
+        for data_type in sorted(rows_by_data_type.keys()):
+            source_file_path, header, rows = rows_by_data_type[data_type]
+            data_type_rows = []
+            for family_key in retained_family_keys:
+                data_type_rows.extend(rows_by_family[family_key].get(data_type, []))
+            # keep the file name of the combined report if it exists
+            if data_type in previous_rows_by_data_type:
+                source_file_path = previous_rows_by_data_type[data_type][0]
+            write_report_data_as_csv(
+                file_name=os.path.join(
+                    combined_report_directory, os.path.basename(source_file_path)
+                ),
+                header=header,
+                data=data_type_rows,
+            )
+
+        # write the manifest
+        write_manifest_result = write_json_to_file(
+            {"version": REPORT_MANIFEST_VERSION, "families": manifest_families},
+            manifest_file_path,
+        )
+        if write_manifest_result.status == False:
+            raise ValueError(write_manifest_result.message)
+
+        return_value.result = changed_families
+
+    except Exception as e:
+        return_value.update_sep(
+            False, "An exception ocurred when refreshing combined report: {}".format(e)
+        )
+        return_value.result = []
+
+    return return_value
@@ -37,9 +37,10 @@ import json
 from duHast.Utilities.Objects import base
 from duHast.Revit.Views.Objects.Data.override_projection import OverrideProjection
 from duHast.Revit.Views.Objects.Data.override_cut import OverrideCut
+from duHast.Revit.Views.Objects.Data.override_digest import OverrideDigestMixin
 
 
-class OverrideByBase(base.Base):
+class OverrideByBase(OverrideDigestMixin, base.Base):
     def __init__(self, data_type="unknown", j=None, **kwargs):
         """
         Class constructor.
@@ -138,6 +139,24 @@ class OverrideByBase(base.Base):
     def __ne__(self, other):
         return not self.__eq__(other=other)
 
+    def _get_digest_values(self):
+        """
+        Returns the values digested: the same values compared when checking for equality.
+
+        :return: Values of this instance.
+        :rtype: list
+        """
+
+        return [
+            self.data_type,
+            self.halftone,
+            self.transparency,
+            self.is_visible,
+            self.override_projection.get_digest(),
+            self.override_cut.get_digest(),
+            self.are_overrides_present,
+        ]
+
     def __hash__(self):
         """
         Custom hash override
@@ -139,6 +139,16 @@ class OverrideByCategory(OverrideByBase):
     def __ne__(self, other):
         return not self.__eq__(other=other)
 
+    def _get_digest_values(self):
+        """
+        Returns the values digested: the same values compared when checking for equality.
+
+        :return: Values of this instance.
+        :rtype: list
+        """
+
+        return super(OverrideByCategory, self)._get_digest_values() + [self.detail_level]
+
     def __hash__(self):
         """
         Custom hash override
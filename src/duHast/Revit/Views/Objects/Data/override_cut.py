@@ -40,9 +40,14 @@ from duHast.Revit.Common.Objects.Data import (
     pattern_background,
     line_cut,
 )
+from duHast.Revit.Views.Objects.Data.override_digest import (
+    OverrideDigestMixin,
+    get_line_graphic_values,
+    get_pattern_graphic_values,
+)
 
 
-class OverrideCut(base.Base):
+class OverrideCut(OverrideDigestMixin, base.Base):
     data_type = "override_cut"
 
     def __init__(self, j=None, **kwargs):
@@ -112,6 +117,21 @@ class OverrideCut(base.Base):
     def __ne__(self, other):
         return not self.__eq__(other=other)
 
+    def _get_digest_values(self):
+        """
+        Returns the values digested: the same values compared when checking for equality.
+
+        :return: Values of this instance.
+        :rtype: tuple
+        """
+
+        return (
+            self.data_type,
+            get_pattern_graphic_values(self.pattern_background),
+            get_pattern_graphic_values(self.pattern_foreground),
+            get_line_graphic_values(self.line_cut),
+        )
+
     def __hash__(self):
         """
         Custom hash override
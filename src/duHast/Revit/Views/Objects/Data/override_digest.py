@@ -0,0 +1,147 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+Helper functions and mixin class used to compute stable content digests of view override objects.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Unlike the built in hash() digests are the same across processes and runs.
+
+"""
+
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import hashlib
+import json
+
+# BLAKE2 is not available in IronPython 2.7
+if hasattr(hashlib, "blake2b"):
+
+    def _get_hash_object():
+        return hashlib.blake2b(digest_size=16)
+
+else:
+
+    def _get_hash_object():
+        return hashlib.md5()
+
+
+def get_digest(values):
+    """
+    Returns a hex digest of a canonical json serialisation of the values past in.
+
+    :param values: Values to be digested. Nested lists and tuples of strings, numbers, booleans and None only.
+    :type values: list or tuple
+
+    :return: A 32 character hex digest.
+    :rtype: str
+    """
+
+    canonical = json.dumps(values, separators=(",", ":"), ensure_ascii=True)
+    hash_object = _get_hash_object()
+    hash_object.update(canonical.encode("utf-8"))
+    return hash_object.hexdigest()
+
+
+def get_colour_values(colour):
+    """
+    Returns the values used to compare colours.
+
+    :param colour: A colour instance.
+    :type colour: :class:`.ColourBase`
+
+    :return: Red, green and blue values.
+    :rtype: tuple
+    """
+
+    return (colour.red, colour.green, colour.blue)
+
+
+def get_pattern_graphic_values(pattern):
+    """
+    Returns the values used to compare pattern graphics (pattern settings are compared by name only).
+
+    :param pattern: A pattern background or foreground instance.
+    :type pattern: :class:`.PatternGraphicBase`
+
+    :return: Visibility, fill pattern name and colour values.
+    :rtype: tuple
+    """
+
+    return (
+        pattern.is_visible,
+        pattern.fill_pattern_setting.name,
+        get_colour_values(pattern.colour),
+    )
+
+
+def get_line_graphic_values(line):
+    """
+    Returns the values used to compare line graphics (pattern settings are compared by name only).
+
+    :param line: A line projection or line cut instance.
+    :type line: :class:`.LineGraphicBase`
+
+    :return: Weight, line pattern name and colour values.
+    :rtype: tuple
+    """
+
+    return (
+        line.weight,
+        line.line_pattern_settings.name,
+        get_colour_values(line.colour),
+    )
+
+
+class OverrideDigestMixin(object):
+    # digest cache: stored in a slot to keep it out of the instance dictionary used for json conversion
+    __slots__ = ("_digest",)
+
+    def _get_digest_values(self):
+        """
+        Returns the values digested: the same values compared when checking for equality.
+
+        Needs to be implemented by classes using this mixin.
+
+        :return: Values of this instance.
+        :rtype: list or tuple
+        """
+
+        raise NotImplementedError(
+            "{} needs to implement _get_digest_values".format(type(self).__name__)
+        )
+
+    def get_digest(self):
+        """
+        Returns a stable digest of all properties compared when checking for equality.
+
+        The digest is computed once and cached. Changes made to this instance after that are not reflected in the digest.
+
+        :return: A hex digest.
+        :rtype: str
+        """
+
+        digest = getattr(self, "_digest", None)
+        if digest is None:
+            digest = get_digest(self._get_digest_values())
+            self._digest = digest
+        return digest
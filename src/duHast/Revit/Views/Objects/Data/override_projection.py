@@ -40,9 +40,14 @@ from duHast.Revit.Common.Objects.Data import (
     pattern_background,
     line_projection,
 )
+from duHast.Revit.Views.Objects.Data.override_digest import (
+    OverrideDigestMixin,
+    get_line_graphic_values,
+    get_pattern_graphic_values,
+)
 
 
-class OverrideProjection(base.Base):
+class OverrideProjection(OverrideDigestMixin, base.Base):
     data_type = "override_projection"
 
     def __init__(self, j=None, **kwargs):
@@ -115,6 +120,21 @@ class OverrideProjection(base.Base):
     def __ne__(self, other):
         return not self.__eq__(other=other)
 
+    def _get_digest_values(self):
+        """
+        Returns the values digested: the same values compared when checking for equality.
+
+        :return: Values of this instance.
+        :rtype: tuple
+        """
+
+        return (
+            self.data_type,
+            get_pattern_graphic_values(self.pattern_background),
+            get_pattern_graphic_values(self.pattern_foreground),
+            get_line_graphic_values(self.line_projection),
+        )
+
     def __hash__(self):
         """
         Custom hash override
@@ -45,6 +45,10 @@ from duHast.Revit.Views.Objects.Data.override_by_filter import OverrideByFilter
 
 
 class ViewGraphicsSettings(base.Base):
+
+    # override lookup caches: stored in slots to keep them out of the instance dictionary used for json conversion
+    __slots__ = ("_category_index", "_filter_index")
+
     def __init__(self, view_name="", view_id=-1, j=None, **kwargs):
         """
         Class constructor.
@@ -103,19 +107,19 @@ class ViewGraphicsSettings(base.Base):
         difference = []
 
         # check category overrides
+        other_index = other_view_graphic_settings.get_category_override_index()
         for source_override_category in self.override_by_category:
-            for (
-                other_override_category
-            ) in other_view_graphic_settings.override_by_category:
-                if (
-                    source_override_category.main_category_name
-                    == other_override_category.main_category_name
-                    and source_override_category.sub_category_name
-                    == other_override_category.sub_category_name
-                ):
-                    if source_override_category != other_override_category:
-                        difference.append(source_override_category)
-                    break
+            other_override_category = other_index.get(
+                (
+                    source_override_category.main_category_name,
+                    source_override_category.sub_category_name,
+                )
+            )
+            if (
+                other_override_category is not None
+                and source_override_category != other_override_category
+            ):
+                difference.append(source_override_category)
 
         return difference
 
@@ -136,19 +140,76 @@ class ViewGraphicsSettings(base.Base):
         difference = []
 
         # check filter overrides
-        for source_override_category in self.override_by_filter:
-            for (
-                other_override_category
-            ) in other_view_graphic_settings.override_by_filter:
-                if (
-                    source_override_category.filter_name
-                    == other_override_category.filter_name
-                ):
-                    if source_override_category != other_override_category:
-                        difference.append(source_override_category)
-                    break
+        other_index = other_view_graphic_settings.get_filter_override_index()
+        for source_override_filter in self.override_by_filter:
+            other_override_filter = other_index.get(source_override_filter.filter_name)
+            if (
+                other_override_filter is not None
+                and source_override_filter != other_override_filter
+            ):
+                difference.append(source_override_filter)
         return difference
 
+    def _get_override_index(self, cache_name, overrides, get_key):
+        """
+        Returns a dictionary of overrides by key. The dictionary is built once and rebuilt only if the list of overrides got replaced or changed in length.
+
+        If more than one override has the same key, the first one is kept.
+
+        :param cache_name: Name of the slot the dictionary is cached in.
+        :type cache_name: str
+        :param overrides: List of overrides.
+        :type overrides: [:class:`.OverrideByBase`]
+        :param get_key: Function returning the key of an override.
+        :type get_key: func(:class:`.OverrideByBase`) -> var
+
+        :return: Dictionary of key to override.
+        :rtype: {var: :class:`.OverrideByBase`}
+        """
+
+        cached = getattr(self, cache_name, None)
+        if (
+            cached is not None
+            and cached[0] is overrides
+            and cached[1] == len(overrides)
+        ):
+            return cached[2]
+        index = {}
+        for override in overrides:
+            key = get_key(override)
+            if key not in index:
+                index[key] = override
+        setattr(self, cache_name, (overrides, len(overrides), index))
+        return index
+
+    def get_category_override_index(self):
+        """
+        Returns the category overrides of these settings by main and sub category name.
+
+        :return: Dictionary of (main category name, sub category name) to category override.
+        :rtype: {(str, str): :class:`.OverrideByCategory`}
+        """
+
+        return self._get_override_index(
+            "_category_index",
+            self.override_by_category,
+            lambda override: (override.main_category_name, override.sub_category_name),
+        )
+
+    def get_filter_override_index(self):
+        """
+        Returns the filter overrides of these settings by filter name.
+
+        :return: Dictionary of filter name to filter override.
+        :rtype: {str: :class:`.OverrideByFilter`}
+        """
+
+        return self._get_override_index(
+            "_filter_index",
+            self.override_by_filter,
+            lambda override: override.filter_name,
+        )
+
     def get_all_used_line_patterns(self):
         """
         Get all line patterns used in overrides
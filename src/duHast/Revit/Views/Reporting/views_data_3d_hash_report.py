@@ -2,6 +2,13 @@
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 This module contains the Revit view template data to 3D hash report functionality.
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module requires python >3.9 due to dependencies:
+
+- numpy
+
+Writing flattened reports to parquet or arrow files requires pyarrow.
+
 """
 #
 # License:
@@ -26,6 +33,10 @@ This module contains the Revit view template data to 3D hash report functionalit
 #
 #
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
 from duHast.Utilities.Objects import result as res
 from duHast.Revit.Views.Reporting.views_data_report import read_view_data_from_file
 from duHast.Utilities.files_get import (
@@ -69,6 +80,40 @@ def _load_json_data(files, progress_call_back=None):
     return json_data
 
 
+def _get_category_hash_table_data(vt_setting):
+    """
+    Returns a partly populated JSONThreeDStorage object for the view settings of a single file.
+
+    - column headers ( template names)
+    - row headers ( category names)
+    - hash table ( category overwrites )
+
+    :param vt_setting: List of view settings of a single file.
+    :type vt_setting: [:class:`.ViewGraphicsSettings`]
+    :return: A custom storage object.
+    :rtype: :class:`.JSONThreeDStorage`
+    """
+
+    column_headers = _get_hash_headers(vt_setting)
+    row_headers = _get_hash_rows_categories(vt_setting)
+    row_headers_filters = _get_hash_rows_filters(vt_setting)
+    hash_table_category_overrides = _get_hash_for_category_overrides(
+        headers=column_headers, row_headers=row_headers, views_settings=vt_setting
+    )
+    hash_table_filter_overrides = _get_hash_for_filter_overrides(
+        headers=column_headers,
+        row_headers=row_headers_filters,
+        views_settings=vt_setting,
+    )
+    storage = JSONThreeDStorage()
+    storage.column_headers = column_headers
+    storage.row_headers = row_headers
+    storage.row_headers_filters = row_headers_filters
+    storage.hash_table = hash_table_category_overrides
+    storage.hash_table_filters = hash_table_filter_overrides
+    return storage
+
+
 def _get_category_hash_table_data_by_file(view_settings, progress_call_back=None):
     """
     Returns a dictionary of partly populated JSONThreeDStorage objects.
@@ -88,24 +133,7 @@ def _get_category_hash_table_data_by_file(view_settings, progress_call_back=None
     dic_tables_by_file = {}
     counter = 0
     for key, vt_setting in view_settings.items():
-        column_headers = _get_hash_headers(vt_setting)
-        row_headers = _get_hash_rows_categories(vt_setting)
-        row_headers_filters = _get_hash_rows_filters(vt_setting)
-        hash_table_category_overrides = _get_hash_for_category_overrides(
-            headers=column_headers, row_headers=row_headers, views_settings=vt_setting
-        )
-        hash_table_filter_overrides = _get_hash_for_filter_overrides(
-            headers=column_headers,
-            row_headers=row_headers_filters,
-            views_settings=vt_setting,
-        )
-        storage = JSONThreeDStorage()
-        storage.column_headers = column_headers
-        storage.row_headers = row_headers
-        storage.row_headers_filters = row_headers_filters
-        storage.hash_table = hash_table_category_overrides
-        storage.hash_table_filters = hash_table_filter_overrides
-        dic_tables_by_file[key] = storage
+        dic_tables_by_file[key] = _get_category_hash_table_data(vt_setting)
         counter = counter + 1
         if progress_call_back is not None:
             progress_call_back(counter, len(view_settings))
@@ -113,6 +141,106 @@ def _get_category_hash_table_data_by_file(view_settings, progress_call_back=None
     return dic_tables_by_file
 
 
+def _get_category_hash_table_data_from_file(file_path):
+    """
+    Reads view template data from a single file and returns its hash table data.
+
+    This is the unit of work executed by worker processes.
+
+    :param file_path: Fully qualified file path to json file containing view template data.
+    :type file_path: str
+    :return: A custom storage object.
+    :rtype: :class:`.JSONThreeDStorage`
+    """
+
+    json_single_data = read_view_data_from_file(file_path=file_path)
+    return _get_category_hash_table_data(json_single_data)
+
+
+def _get_category_hash_table_data_by_file_parallel(
+    files, max_workers=None, progress_call_back=None, mp_context=None
+):
+    """
+    Reads view template data from files and builds hash table data per file using a pool of worker processes.
+
+    Hash values are based on override content digests, so equal overrides in different files get equal hash values regardless of the process they were calculated in.
+
+    :param files: List of fully qualified file path to json files containing view template data.
+    :type files: [str]
+    :param max_workers: Maximum number of worker processes. None uses the number of processors on the machine.
+    :type max_workers: int
+    :param progress_call_back: A call back function accepting as arguments the number of the current file processed and the number of overall files to be processed, defaults to None
+    :type progress_call_back: func(counter, overall_counter), optional
+    :param mp_context: Multiprocessing context used to start worker processes, defaults to None (platform default: spawn on Windows)
+    :type mp_context: multiprocessing.context.BaseContext, optional
+    :return: A dictionary where key is the file name without extension and value is an instance of a custom storage object. Keys are in the same order as the files past in.
+    :rtype: {str: [:class:`.JSONThreeDStorage`]}
+    """
+
+    storage_by_index = {}
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=mp_context
+    ) as executor:
+        futures = {}
+        for index, file_path in enumerate(files):
+            future = executor.submit(_get_category_hash_table_data_from_file, file_path)
+            futures[future] = index
+        counter = 0
+        for future in as_completed(futures):
+            storage_by_index[futures[future]] = future.result()
+            counter = counter + 1
+            if progress_call_back is not None:
+                progress_call_back(counter, len(files))
+
+    # keep the file order
+    dic_tables_by_file = {}
+    for index, file_path in enumerate(files):
+        dic_tables_by_file[get_file_name_without_ext(file_path=file_path)] = (
+            storage_by_index[index]
+        )
+    return dic_tables_by_file
+
+
+def _get_hash_mapper(hash_values):
+    """
+    Returns a dictionary mapping hash values to their index in a sorted list of all hash values.
+
+    Note 0, 1, -1 are special values and are not mapped. They occupy the first three indices of the list.
+
+    :param hash_values: All unique hash values.
+    :type hash_values: set(int)
+    :return: A dictionary where key is the hash value and value is the mapped value (index).
+    :rtype: {int: int}
+    """
+
+    # remove the special values from the sorted list and then re-insert them at the beginning
+    sorted_values = sorted(value for value in hash_values if value > 1 or value < -1)
+    hash_mapper = {}
+    for index, value in enumerate(sorted_values):
+        hash_mapper[value] = index + 3
+    return hash_mapper
+
+
+def _map_hash_table(hash_table, hash_mapper):
+    """
+    Returns a copy of the hash table where each hash value is replaced with its mapped value.
+
+    Note -1,0,1 are left unchanged.
+
+    :param hash_table: A 2D hash table.
+    :type hash_table: [[int]]
+    :param hash_mapper: A dictionary where key is the hash value and value is the mapped value.
+    :type hash_mapper: {int: int}
+    :return: The mapped 2D hash table.
+    :rtype: [[int]]
+    """
+
+    return [
+        [hash_mapper[entry] if (entry > 1 or entry < -1) else entry for entry in row]
+        for row in hash_table
+    ]
+
+
 def _map_hash_values_to_range(hash_data_by_file, progress_call_back=None):
     """
     Hash values returned from view templates have a really large range. This function maps them to their index in a sorted list.
@@ -127,85 +255,36 @@ def _map_hash_values_to_range(hash_data_by_file, progress_call_back=None):
     :rtype: {str: [:class:`.JSONThreeDStorage`]}
     """
 
-    hash_mapper_categories = []
-    hash_mapper_filters = []
+    hash_values_categories = set()
+    hash_values_filters = set()
     try:
-        # build a unique list of all hash values
+        # build a unique set of all hash values
         for key, hash_data in hash_data_by_file.items():
             for entry in hash_data.hash_table:
-                hash_mapper_categories = sorted(
-                    list(set(hash_mapper_categories) | set(entry))
-                )
+                hash_values_categories.update(entry)
             for entry in hash_data.hash_table_filters:
-                hash_mapper_filters = sorted(
-                    list(set(hash_mapper_filters) | set(entry))
-                )
+                hash_values_filters.update(entry)
 
-        # note 0, 1, -1 are special values and can not need to be changed!!
-        # remove them from the sorted list and then re-insert them at the beginning
-        if -1 in hash_mapper_categories:
-            index = hash_mapper_categories.index(-1)
-            hash_mapper_categories.pop(index)
-        if 0 in hash_mapper_categories:
-            index = hash_mapper_categories.index(0)
-            hash_mapper_categories.pop(index)
-        if 1 in hash_mapper_categories:
-            index = hash_mapper_categories.index(1)
-            hash_mapper_categories.pop(index)
-
-        hash_mapper_categories.insert(0, -1)
-        hash_mapper_categories.insert(0, 0)
-        hash_mapper_categories.insert(0, 1)
-
-        if -1 in hash_mapper_filters:
-            index = hash_mapper_filters.index(-1)
-            hash_mapper_filters.pop(index)
-        if 0 in hash_mapper_filters:
-            index = hash_mapper_filters.index(0)
-            hash_mapper_filters.pop(index)
-        if 1 in hash_mapper_filters:
-            index = hash_mapper_filters.index(1)
-            hash_mapper_filters.pop(index)
-
-        hash_mapper_filters.insert(0, -1)
-        hash_mapper_filters.insert(0, 0)
-        hash_mapper_filters.insert(0, 1)
-
-        # loop over current hash values and replace with index of value in mapper list
-        # preserve -1, 0, 1 values
+        # map hash values to their index in the sorted list of values
+        hash_mapper_categories = _get_hash_mapper(hash_values_categories)
+        hash_mapper_filters = _get_hash_mapper(hash_values_filters)
 
+        # loop over current hash values and replace with mapped value
+        # preserve -1, 0, 1 values
         call_back_progress_counter = 0
         for key, hash_data in hash_data_by_file.items():
             # update categories hash table
-            mapped_hash_table_categories = []
             try:
-                for row in hash_data.hash_table:
-                    new_row = []
-                    for entry in row:
-                        if entry > 1 or entry < -1:
-                            mapped_index = hash_mapper_categories.index(entry)
-                            new_row.append(mapped_index)
-                        else:
-                            new_row.append(entry)
-                    mapped_hash_table_categories.append(new_row)
-                # overwrite existing hash table
-                hash_data.hash_table = mapped_hash_table_categories
+                hash_data.hash_table = _map_hash_table(
+                    hash_data.hash_table, hash_mapper_categories
+                )
             except Exception as e:
                 raise ValueError("Failed to match category hash: {}".format(e))
             # update filters hash table
-            mapped_hash_table_filters = []
             try:
-                for row in hash_data.hash_table_filters:
-                    new_row = []
-                    for entry in row:
-                        if entry > 1 or entry < -1:
-                            mapped_index = hash_mapper_filters.index(entry)
-                            new_row.append(mapped_index)
-                        else:
-                            new_row.append(entry)
-                    mapped_hash_table_filters.append(new_row)
-                # overwrite existing hash table
-                hash_data.hash_table_filters = mapped_hash_table_filters
+                hash_data.hash_table_filters = _map_hash_table(
+                    hash_data.hash_table_filters, hash_mapper_filters
+                )
             except Exception as e:
                 raise ValueError("Failed to match filter hash: {}".format(e))
             # update call back
@@ -229,10 +308,11 @@ def _merge_column_headers(hash_data_by_file):
     """
 
     try:
-        data = []
+        data = set()
         # build list with unique entries
         for key, vt_setting in hash_data_by_file.items():
-            data = sorted(list(set(data) | set(vt_setting.column_headers)))
+            data.update(vt_setting.column_headers)
+        data = sorted(data)
 
         # this list is common for all files...update them
         for key, vt_setting in hash_data_by_file.items():
@@ -257,19 +337,14 @@ def _merge_row_headers(hash_data_by_file):
     """
 
     try:
-        data_category_names = []
-        data_filter_names = []
-        # build list with unique entries for category names
+        data_category_names = set()
+        data_filter_names = set()
+        # build lists with unique entries for category names and filter names
         for key, vt_setting in hash_data_by_file.items():
-            data_category_names = sorted(
-                list(set(data_category_names) | set(vt_setting.row_headers))
-            )
-
-        # build list with unique entries for filter names
-        for key, vt_setting in hash_data_by_file.items():
-            data_filter_names = sorted(
-                list(set(data_filter_names) | set(vt_setting.row_headers_filters))
-            )
+            data_category_names.update(vt_setting.row_headers)
+            data_filter_names.update(vt_setting.row_headers_filters)
+        data_category_names = sorted(data_category_names)
+        data_filter_names = sorted(data_filter_names)
 
         # these lists are common for all files...update them
         for key, vt_setting in hash_data_by_file.items():
@@ -304,10 +379,10 @@ def _get_padded_default_array(
     """
 
     # Create a new padded 2D array
-    padded_array = [
-        [-1 for entry in merged_column_headers] for entry in merged_row_headers
-    ]
-    return padded_array
+    padded_array = np.full(
+        (len(merged_row_headers), len(merged_column_headers)), -1, dtype=np.int64
+    )
+    return padded_array.tolist()
 
 
 def _assign_padded_default_array(hash_data_by_file, progress_call_back=None):
@@ -366,6 +441,33 @@ def _assign_padded_default_array(hash_data_by_file, progress_call_back=None):
 # ---------------------------- row indices ---------------------------------
 
 
+def _get_header_indices(merged_headers, merged_indices_by_id):
+    """
+    Returns a dictionary mapping each header to its index in the merged headers list.
+
+    Dictionaries are cached by list identity since all storage instances share the same merged header lists.
+
+    :param merged_headers: A list of unique headers.
+    :type merged_headers: [str]
+    :param merged_indices_by_id: Cache of dictionaries already built, where key is the id of the merged headers list.
+    :type merged_indices_by_id: {int: {str: int}}
+    :return: A dictionary where key is the header and value is the index of the header in the merged headers list.
+    :rtype: {str: int}
+    """
+
+    cached = merged_indices_by_id.get(id(merged_headers))
+    if cached is not None and cached[0] is merged_headers:
+        return cached[1]
+    indices = {}
+    for index, header in enumerate(merged_headers):
+        # keep the first index, same as list.index()
+        if header not in indices:
+            indices[header] = index
+    # store the list with the dictionary to guard against reuse of the id
+    merged_indices_by_id[id(merged_headers)] = (merged_headers, indices)
+    return indices
+
+
 def _assign_row_indices_pointer(hash_data_by_file, progress_call_back=None):
     """
     Creates row and index pointers per file which map the file specific rows and column to the overall padded array rows and columns.
@@ -384,21 +486,31 @@ def _assign_row_indices_pointer(hash_data_by_file, progress_call_back=None):
     result = res.Result()
     try:
         call_back_progress_counter = 0
+        # look up tables of header name to index in merged headers
+        # merged headers are the same for all files
+        merged_indices_by_id = {}
         # build row and column indices list for mapping of value hash table entries to default hash table
         for key, hash_by_file in hash_data_by_file.items():
+            merged_row_indices = _get_header_indices(
+                hash_by_file.merged_row_headers, merged_indices_by_id
+            )
+            merged_row_filter_indices = _get_header_indices(
+                hash_by_file.merged_row_headers_filters, merged_indices_by_id
+            )
+            merged_column_indices = _get_header_indices(
+                hash_by_file.merged_column_headers, merged_indices_by_id
+            )
             # Find the indices for row and column headers in the merged headers
             row_indices_categories_all = [
-                hash_by_file.merged_row_headers.index(row)
-                for row in hash_by_file.row_headers
+                merged_row_indices[row] for row in hash_by_file.row_headers
             ]
             row_indices_filters_all = [
-                hash_by_file.merged_row_headers_filters.index(row)
+                merged_row_filter_indices[row]
                 for row in hash_by_file.row_headers_filters
             ]
             # column header indices are the same for filters and categories
             column_indices_all = [
-                hash_by_file.merged_column_headers.index(col)
-                for col in hash_by_file.column_headers
+                merged_column_indices[col] for col in hash_by_file.column_headers
             ]
 
             hash_data_by_file[key].row_indices = row_indices_categories_all
@@ -439,11 +551,14 @@ def _update_default_array_values(row_indices, col_indices, default_array, value_
     :rtype: [[int],[int],]
     """
 
-    # Fill in the values from array_model_a
-    for i, row_index in enumerate(row_indices):
-        for j, col_index in enumerate(col_indices):
-            default_array[row_index][col_index] = value_array[i][j]
-    return default_array
+    if len(row_indices) == 0 or len(col_indices) == 0:
+        return default_array
+    # Fill in the values from the file specific array in one go
+    padded_array = np.array(default_array, dtype=np.int64)
+    padded_array[np.ix_(row_indices, col_indices)] = np.array(
+        value_array, dtype=np.int64
+    )[: len(row_indices), : len(col_indices)]
+    return padded_array.tolist()
 
 
 def _assign_default_array_values(hash_data_by_file, progress_call_back=None):
@@ -570,16 +685,64 @@ def _built_threeD_array(hash_data_by_file):
     return result
 
 
-def _flatten_category_threeD_array(
-    array_3d, sample_storage, model_names, hash_data_by_file, progress_call_back=None
+def _iter_flattened_threeD_array(
+    array_3d, column_headers, row_headers, row_key, model_names
 ):
     """
-    Flattens the 3D array build from hash tables from each file into a json structure easily read by power bi.
+    Flattens the 3D array one model (layer) at a time into columns.
 
     :param array_3d: A 3D array.
     :type array_3d: [[[]]]
-    :param sample_storage: Storage instance used to map view template names and category names using merged lists.
-    :type sample_storage: :class:`.JSONThreeDStorage`
+    :param column_headers: Merged view template names.
+    :type column_headers: [str]
+    :param row_headers: Merged category or filter names.
+    :type row_headers: [str]
+    :param row_key: Column name used for row headers ( 'category' or 'filter' )
+    :type row_key: str
+    :param model_names: List of all model names of which view template data is included in 3D hash array.
+    :type model_names: [str]
+    :return: Per model a dictionary of column name to column values. Columns are view_template, row key, model_name and hash_value.
+    :rtype: generator of {str: []}
+    """
+
+    for model_index, layer in enumerate(array_3d):
+        view_templates = []
+        rows = []
+        hash_values = []
+        for row_index, row in enumerate(layer):
+            row_header = row_headers[row_index]
+            for view_template, hash_value in enumerate(row):
+                view_templates.append(column_headers[view_template])
+                rows.append(row_header)
+                hash_values.append(hash_value)
+        yield {
+            "view_template": view_templates,
+            row_key: rows,
+            "model_name": [model_names[model_index]] * len(hash_values),
+            "hash_value": hash_values,
+        }
+
+
+def _flatten_threeD_array(
+    array_3d,
+    column_headers,
+    row_headers,
+    row_key,
+    model_names,
+    hash_data_by_file,
+    progress_call_back=None,
+):
+    """
+    Flattens the 3D array into a list of rows ( one dictionary per row ).
+
+    :param array_3d: A 3D array.
+    :type array_3d: [[[]]]
+    :param column_headers: Merged view template names.
+    :type column_headers: [str]
+    :param row_headers: Merged category or filter names.
+    :type row_headers: [str]
+    :param row_key: Column name used for row headers ( 'category' or 'filter' )
+    :type row_key: str
     :param model_names: List of all model names of which view template data is included in 3D hash array.
     :type model_names: [str]
     :param hash_data_by_file: A dictionary where key is the file name without extension and value is an instance of a custom storage object
@@ -588,8 +751,7 @@ def _flatten_category_threeD_array(
     :type progress_call_back: func(counter, overall_counter), optional
     :return:
         Result class instance.
-        - .status True if 3D array was successfully created. Otherwise False.
-        - .message will contain array size.
+        - .status True if 3D array was successfully flattened. Otherwise False.
         -. result will contain the flatten array as first value in list
     :rtype: :class:`.Result`
     """
@@ -599,19 +761,12 @@ def _flatten_category_threeD_array(
         call_back_progress_counter = 0
         # flatten 3D hash data for power bi
         flattened_data = []
-        for model_name, layer in enumerate(array_3d):
-            for category, row in enumerate(layer):
-                for view_template, hash_value in enumerate(row):
-                    flattened_data.append(
-                        {
-                            "view_template": sample_storage.merged_column_headers[
-                                view_template
-                            ],
-                            "category": sample_storage.merged_row_headers[category],
-                            "model_name": model_names[model_name],
-                            "hash_value": hash_value,
-                        }
-                    )
+        column_names = ["view_template", row_key, "model_name", "hash_value"]
+        for columns in _iter_flattened_threeD_array(
+            array_3d, column_headers, row_headers, row_key, model_names
+        ):
+            for values in zip(*[columns[name] for name in column_names]):
+                flattened_data.append(dict(zip(column_names, values)))
             call_back_progress_counter = call_back_progress_counter + 1
             if progress_call_back is not None:
                 progress_call_back(call_back_progress_counter, len(hash_data_by_file))
@@ -621,6 +776,41 @@ def _flatten_category_threeD_array(
     return result
 
 
+def _flatten_category_threeD_array(
+    array_3d, sample_storage, model_names, hash_data_by_file, progress_call_back=None
+):
+    """
+    Flattens the 3D array build from hash tables from each file into a json structure easily read by power bi.
+
+    :param array_3d: A 3D array.
+    :type array_3d: [[[]]]
+    :param sample_storage: Storage instance used to map view template names and category names using merged lists.
+    :type sample_storage: :class:`.JSONThreeDStorage`
+    :param model_names: List of all model names of which view template data is included in 3D hash array.
+    :type model_names: [str]
+    :param hash_data_by_file: A dictionary where key is the file name without extension and value is an instance of a custom storage object
+    :type hash_data_by_file: {str: [:class:`.JSONThreeDStorage`]}
+    :param progress_call_back: A call back function accepting as arguments the number of the current file processed and the number of overall files to be processed, defaults to None
+    :type progress_call_back: func(counter, overall_counter), optional
+    :return:
+        Result class instance.
+        - .status True if 3D array was successfully created. Otherwise False.
+        - .message will contain array size.
+        -. result will contain the flatten array as first value in list
+    :rtype: :class:`.Result`
+    """
+
+    return _flatten_threeD_array(
+        array_3d=array_3d,
+        column_headers=sample_storage.merged_column_headers,
+        row_headers=sample_storage.merged_row_headers,
+        row_key="category",
+        model_names=model_names,
+        hash_data_by_file=hash_data_by_file,
+        progress_call_back=progress_call_back,
+    )
+
+
 def _flatten_filter_threeD_array(
     array_3d, sample_storage, model_names, hash_data_by_file, progress_call_back=None
 ):
@@ -645,64 +835,63 @@ def _flatten_filter_threeD_array(
     :rtype: :class:`.Result`
     """
 
-    result = res.Result()
-    try:
-        call_back_progress_counter = 0
-        # flatten 3D hash data for power bi
-        flattened_data = []
-        for model_name, layer in enumerate(array_3d):
-            for filter, row in enumerate(layer):
-                for view_template, hash_value in enumerate(row):
-                    flattened_data.append(
-                        {
-                            "view_template": sample_storage.merged_column_headers[
-                                view_template
-                            ],
-                            "filter": sample_storage.merged_row_headers_filters[filter],
-                            "model_name": model_names[model_name],
-                            "hash_value": hash_value,
-                        }
-                    )
-            call_back_progress_counter = call_back_progress_counter + 1
-            if progress_call_back is not None:
-                progress_call_back(call_back_progress_counter, len(hash_data_by_file))
-        result.result.append(flattened_data)
-    except Exception as e:
-        result.update_sep(False, "Failed to flatten 3D array: {}".format(e))
-    return result
+    return _flatten_threeD_array(
+        array_3d=array_3d,
+        column_headers=sample_storage.merged_column_headers,
+        row_headers=sample_storage.merged_row_headers_filters,
+        row_key="filter",
+        model_names=model_names,
+        hash_data_by_file=hash_data_by_file,
+        progress_call_back=progress_call_back,
+    )
 
 
-def convert_vt_data_to_3d_flattened(json_files, progress_call_back=None):
+def _get_threeD_arrays(json_files, progress_call_back=None, max_workers=1):
     """
-    Converts view template graphic overrides data stored in files into flattened json formatted hash table array for import to power bi.
+    Converts view template graphic overrides data stored in files into 3D hash arrays for categories and filters.
 
     :param json_files: List of files containing view template data of Revit project files. ( One json file per Revit project file)
     :type json_files: [str]
     :param progress_call_back: A call back function accepting as arguments the number of the current file processed and the number of overall files to be processed, defaults to None
     :type progress_call_back: func(counter, overall_counter), optional
+    :param max_workers: Number of worker processes used to load files and calculate hash values. 1 (default) processes all files in this process. None uses the number of processors on the machine.
+    :type max_workers: int, optional
 
     :return:
         Result class instance.
-        - .status True if flattened array was successfully created. Otherwise False.
-        - .message will contain array size.
-        -. result will contain the flatten array as first value in list
+        - .status True if 3D arrays were successfully created. Otherwise False.
+        - .message will contain array sizes.
+        -. result will contain the category 3D array, the filter 3D array, a sample storage instance (merged headers), the model names and the hash data by file.
     :rtype: :class:`.Result`
     """
 
     result = res.Result()
     try:
-        # load json data from all files
-        json_data_loaded = _load_json_data(
-            files=json_files, progress_call_back=progress_call_back
-        )
-        result.append_message(
-            "Loaded json data from {} files.".format(len(json_data_loaded))
-        )
+        if max_workers == 1:
+            # load json data from all files
+            json_data_loaded = _load_json_data(
+                files=json_files, progress_call_back=progress_call_back
+            )
+            result.append_message(
+                "Loaded json data from {} files.".format(len(json_data_loaded))
+            )
 
-        # get hash tables, row and column data, key is the file name
-        hash_data_by_file = _get_category_hash_table_data_by_file(
-            json_data_loaded, progress_call_back=progress_call_back
-        )
+            # get hash tables, row and column data, key is the file name
+            hash_data_by_file = _get_category_hash_table_data_by_file(
+                json_data_loaded, progress_call_back=progress_call_back
+            )
+        else:
+            # load json data and get hash tables, row and column data using worker processes, key is the file name
+            hash_data_by_file = _get_category_hash_table_data_by_file_parallel(
+                files=json_files,
+                max_workers=max_workers,
+                progress_call_back=progress_call_back,
+            )
+            result.append_message(
+                "Loaded json data from {} files using worker processes.".format(
+                    len(hash_data_by_file)
+                )
+            )
 
         # map hash values to a range
         hash_data_by_file = _map_hash_values_to_range(hash_data_by_file)
@@ -764,43 +953,13 @@ def convert_vt_data_to_3d_flattened(json_files, progress_call_back=None):
                         # built a list of model names from the keys of the hash data dictionary
                         model_names = list(hash_data_by_file.keys())
 
-                        # flatten the category 3D array for power bi
-                        flatten_category_array_status = _flatten_category_threeD_array(
-                            array_3d=array_3d_categories,
-                            sample_storage=first_value,
-                            model_names=model_names,
-                            hash_data_by_file=hash_data_by_file,
-                            progress_call_back=progress_call_back,
-                        )
-                        result.update(flatten_category_array_status)
-
-                        # flatten the filter 3D array for power bi
-                        flatten_filter_array_status = _flatten_filter_threeD_array(
-                            array_3d=array_3d_filters,
-                            sample_storage=first_value,
-                            model_names=model_names,
-                            hash_data_by_file=hash_data_by_file,
-                            progress_call_back=progress_call_back,
-                        )
-                        result.update(flatten_filter_array_status)
-
-                        # check if all is ok
-                        if (
-                            flatten_category_array_status.status
-                            and flatten_filter_array_status.status
-                        ):
-                            # get the flattened 3D arrays
-                            result.result = [
-                                flatten_category_array_status.result[0],
-                                flatten_filter_array_status.result[0],
-                            ]
-                        else:
-                            raise ValueError(
-                                "Failed to flatten 3D arrays: {} and {}".format(
-                                    flatten_category_array_status.message,
-                                    flatten_filter_array_status.message,
-                                )
-                            )
+                        result.result = [
+                            array_3d_categories,
+                            array_3d_filters,
+                            first_value,
+                            model_names,
+                            hash_data_by_file,
+                        ]
                     else:
                         raise ValueError(
                             "Failed to build 3D arrays: {}".format(
@@ -825,9 +984,266 @@ def convert_vt_data_to_3d_flattened(json_files, progress_call_back=None):
                     assign_padded_default_hash_table_status.message
                 )
             )
+    except Exception as e:
+        result.update_sep(
+            status=False,
+            message="Failed to build 3D arrays with: {}".format(e),
+        )
+    return result
+
+
+def convert_vt_data_to_3d_flattened(
+    json_files, progress_call_back=None, max_workers=1
+):
+    """
+    Converts view template graphic overrides data stored in files into flattened json formatted hash table array for import to power bi.
+
+    Loading files and calculating override hash values can be spread over a pool of worker processes ( max_workers other than 1 ).
+    Note: When using worker processes on Windows the calling script needs to be guarded by if __name__ == "__main__":
+
+    :param json_files: List of files containing view template data of Revit project files. ( One json file per Revit project file)
+    :type json_files: [str]
+    :param progress_call_back: A call back function accepting as arguments the number of the current file processed and the number of overall files to be processed, defaults to None
+    :type progress_call_back: func(counter, overall_counter), optional
+    :param max_workers: Number of worker processes used to load files and calculate hash values. 1 (default) processes all files in this process. None uses the number of processors on the machine.
+    :type max_workers: int, optional
+
+    :return:
+        Result class instance.
+        - .status True if flattened array was successfully created. Otherwise False.
+        - .message will contain array size.
+        -. result will contain the flatten array as first value in list
+    :rtype: :class:`.Result`
+    """
+
+    result = res.Result()
+    try:
+        arrays_status = _get_threeD_arrays(
+            json_files=json_files,
+            progress_call_back=progress_call_back,
+            max_workers=max_workers,
+        )
+        result.update(arrays_status)
+        if arrays_status.status == False:
+            raise ValueError(arrays_status.message)
+        (
+            array_3d_categories,
+            array_3d_filters,
+            sample_storage,
+            model_names,
+            hash_data_by_file,
+        ) = arrays_status.result
+
+        # flatten the category 3D array for power bi
+        flatten_category_array_status = _flatten_category_threeD_array(
+            array_3d=array_3d_categories,
+            sample_storage=sample_storage,
+            model_names=model_names,
+            hash_data_by_file=hash_data_by_file,
+            progress_call_back=progress_call_back,
+        )
+        result.update(flatten_category_array_status)
+
+        # flatten the filter 3D array for power bi
+        flatten_filter_array_status = _flatten_filter_threeD_array(
+            array_3d=array_3d_filters,
+            sample_storage=sample_storage,
+            model_names=model_names,
+            hash_data_by_file=hash_data_by_file,
+            progress_call_back=progress_call_back,
+        )
+        result.update(flatten_filter_array_status)
+
+        # check if all is ok
+        if flatten_category_array_status.status and flatten_filter_array_status.status:
+            # get the flattened 3D arrays
+            result.result = [
+                flatten_category_array_status.result[0],
+                flatten_filter_array_status.result[0],
+            ]
+        else:
+            raise ValueError(
+                "Failed to flatten 3D arrays: {} and {}".format(
+                    flatten_category_array_status.message,
+                    flatten_filter_array_status.message,
+                )
+            )
     except Exception as e:
         result.update_sep(
             status=False,
             message="Failed to build flattened 3D array with: {}".format(e),
         )
     return result
+
+
+# ---------------------------- columnar output -------------------------
+
+#: Columnar file format: parquet
+COLUMNAR_FORMAT_PARQUET = "parquet"
+#: Columnar file format: arrow IPC file
+COLUMNAR_FORMAT_ARROW = "arrow"
+
+
+def _get_columnar_schema(pa, row_key):
+    """
+    Returns the schema of a flattened 3D array table.
+
+    :param pa: The pyarrow module.
+    :type pa: module
+    :param row_key: Column name used for row headers ( 'category' or 'filter' )
+    :type row_key: str
+    :return: Table schema with columns view_template, row key, model_name and hash_value.
+    :rtype: pyarrow.Schema
+    """
+
+    return pa.schema(
+        [
+            ("view_template", pa.string()),
+            (row_key, pa.string()),
+            ("model_name", pa.string()),
+            ("hash_value", pa.int64()),
+        ]
+    )
+
+
+def _write_columnar_file(pa, layers, output_file_path, row_key, file_format):
+    """
+    Writes flattened 3D array layers to a parquet or arrow file. Each layer ( model ) is written as a separate row group ( record batch ).
+
+    :param pa: The pyarrow module.
+    :type pa: module
+    :param layers: Flattened 3D array, one dictionary of column name to column values per model.
+    :type layers: generator of {str: []}
+    :param output_file_path: Fully qualified file path of the output file.
+    :type output_file_path: str
+    :param row_key: Column name used for row headers ( 'category' or 'filter' )
+    :type row_key: str
+    :param file_format: COLUMNAR_FORMAT_PARQUET or COLUMNAR_FORMAT_ARROW
+    :type file_format: str
+    :return: Number of rows written.
+    :rtype: int
+    """
+
+    schema = _get_columnar_schema(pa, row_key)
+    if file_format == COLUMNAR_FORMAT_PARQUET:
+        import pyarrow.parquet as pq
+
+        writer = pq.ParquetWriter(output_file_path, schema)
+    else:
+        writer = pa.ipc.new_file(output_file_path, schema)
+    number_of_rows = 0
+    try:
+        for columns in layers:
+            table = pa.Table.from_pydict(columns, schema=schema)
+            writer.write_table(table)
+            number_of_rows = number_of_rows + table.num_rows
+    finally:
+        writer.close()
+    return number_of_rows
+
+
+def write_vt_data_3d_flattened_to_columnar_files(
+    json_files,
+    category_output_file_path,
+    filter_output_file_path,
+    file_format=COLUMNAR_FORMAT_PARQUET,
+    progress_call_back=None,
+    max_workers=1,
+):
+    """
+    Converts view template graphic overrides data stored in files into flattened hash table arrays and writes them to columnar files for import to power bi.
+
+    Rows are written one model at a time ( one row group per model ) without building the flattened json structure in memory.
+    Columns are: view_template, category ( or filter ), model_name and hash_value.
+
+    Requires pyarrow. If pyarrow is not installed no files are written and the status returned is False.
+
+    :param json_files: List of files containing view template data of Revit project files. ( One json file per Revit project file)
+    :type json_files: [str]
+    :param category_output_file_path: Fully qualified file path of the category output file.
+    :type category_output_file_path: str
+    :param filter_output_file_path: Fully qualified file path of the filter output file.
+    :type filter_output_file_path: str
+    :param file_format: COLUMNAR_FORMAT_PARQUET (default) or COLUMNAR_FORMAT_ARROW ( arrow IPC file )
+    :type file_format: str, optional
+    :param progress_call_back: A call back function accepting as arguments the number of the current file processed and the number of overall files to be processed, defaults to None
+    :type progress_call_back: func(counter, overall_counter), optional
+    :param max_workers: Number of worker processes used to load files and calculate hash values. 1 (default) processes all files in this process. None uses the number of processors on the machine.
+    :type max_workers: int, optional
+
+    :return:
+        Result class instance.
+        - .status True if both files were written successfully. Otherwise False.
+        - .message will contain array sizes and number of rows written.
+        -. result will contain the category output file path as first value in list and the filter output file path as the second value in list
+    :rtype: :class:`.Result`
+    """
+
+    result = res.Result()
+    try:
+        if file_format not in (COLUMNAR_FORMAT_PARQUET, COLUMNAR_FORMAT_ARROW):
+            raise ValueError("Unsupported file format: {}".format(file_format))
+
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required to write {} files but is not installed.".format(
+                    file_format
+                )
+            )
+
+        arrays_status = _get_threeD_arrays(
+            json_files=json_files,
+            progress_call_back=progress_call_back,
+            max_workers=max_workers,
+        )
+        result.update(arrays_status)
+        if arrays_status.status == False:
+            raise ValueError(arrays_status.message)
+        (
+            array_3d_categories,
+            array_3d_filters,
+            sample_storage,
+            model_names,
+            hash_data_by_file,
+        ) = arrays_status.result
+        # release the 3D array references held by the result
+        result.result = []
+
+        for array_3d, row_headers, row_key, output_file_path in [
+            (
+                array_3d_categories,
+                sample_storage.merged_row_headers,
+                "category",
+                category_output_file_path,
+            ),
+            (
+                array_3d_filters,
+                sample_storage.merged_row_headers_filters,
+                "filter",
+                filter_output_file_path,
+            ),
+        ]:
+            layers = _iter_flattened_threeD_array(
+                array_3d,
+                sample_storage.merged_column_headers,
+                row_headers,
+                row_key,
+                model_names,
+            )
+            number_of_rows = _write_columnar_file(
+                pa, layers, output_file_path, row_key, file_format
+            )
+            result.append_message(
+                "Wrote {} {} rows to: {}".format(
+                    number_of_rows, row_key, output_file_path
+                )
+            )
+            result.result.append(output_file_path)
+    except Exception as e:
+        result.update_sep(
+            status=False,
+            message="Failed to write flattened 3D arrays with: {}".format(e),
+        )
+    return result
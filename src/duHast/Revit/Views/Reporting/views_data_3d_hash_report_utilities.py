@@ -37,6 +37,25 @@ FILTER_NOT_ENABLED = 2
 # filter or category does not exist in view or model
 DOES_NOT_EXIST = -1
 
+#: number of hex digits of an override digest used as hash value (fits into a 64 bit integer)
+DIGEST_HEX_DIGITS = 15
+
+
+def _get_hash_value(override):
+    """
+    Returns a hash value of an override based on its content digest.
+
+    Unlike the built in hash() the value is the same across processes and runs. \
+        Values are offset so they never clash with the fixed hash values above.
+
+    :param override: A category or filter override instance.
+    :type override: :class:`.OverrideByBase`
+    :return: The hash value.
+    :rtype: int
+    """
+
+    return int(override.get_digest()[:DIGEST_HEX_DIGITS], 16) + FILTER_NOT_ENABLED + 1
+
 
 def _get_hash_headers(views_settings):
     """
@@ -85,6 +104,23 @@ def _get_hash_rows_filters(views_settings):
     return rows
 
 
+def _get_views_settings_by_name(views_settings):
+    """
+    Returns view graphic settings by view name. If more than one setting has the same view name, the first one is kept.
+
+    :param views_settings: An instance of view graphic settings class storing Revit view template data.
+    :type views_settings: :class:`.ViewGraphicsSettings`
+    :return: Dictionary of view name to view graphic settings.
+    :rtype: {str: :class:`.ViewGraphicsSettings`}
+    """
+
+    views_settings_by_name = {}
+    for setting in views_settings:
+        if setting.view_name not in views_settings_by_name:
+            views_settings_by_name[setting.view_name] = setting
+    return views_settings_by_name
+
+
 def _get_hash_for_category_overrides(headers, row_headers, views_settings):
     """
     Returns a list with a hash values for each Revit category override in a given view template.
@@ -104,35 +140,22 @@ def _get_hash_for_category_overrides(headers, row_headers, views_settings):
     # loop over rows and get the hash of the row value
     # return the hash table
     table_hash = {}
+    views_settings_by_name = _get_views_settings_by_name(views_settings)
     for header_view_name in headers:
         # find the view (template)
-        matching_template = next(
-            (
-                instance
-                for instance in views_settings
-                if instance.view_name == header_view_name
-            ),
-            None,
-        )
+        matching_template = views_settings_by_name.get(header_view_name)
         if matching_template == None:
             raise ValueError(
                 "Impossible!!! No match found for view: [{}]".format(header_view_name)
             )
+        category_index = matching_template.get_category_override_index()
 
         # get category hashes
         for row in row_headers:
             # split to get main and sub category name
             name_parts = row.split(" :: ", 1)
-            # Find a matching instance based on the two properties using a lambda expression and filter function
-            matching_category = next(
-                (
-                    instance
-                    for instance in matching_template.override_by_category
-                    if instance.main_category_name == name_parts[0]
-                    and instance.sub_category_name == name_parts[1]
-                ),
-                None,
-            )
+            # Find a matching instance based on the two properties
+            matching_category = category_index.get(tuple(name_parts))
 
             # set a default value
             hash_value = DOES_NOT_EXIST
@@ -152,7 +175,7 @@ def _get_hash_for_category_overrides(headers, row_headers, views_settings):
                     hash_value = NO_OVERRIDE
                 else:
                     # category is visible and an override is applied
-                    hash_value = hash(matching_category)
+                    hash_value = _get_hash_value(matching_category)
 
             # add to table
             if row in table_hash:
@@ -189,32 +212,20 @@ def _get_hash_for_filter_overrides(headers, row_headers, views_settings):
     # loop over rows and get the hash of the row value
     # return the hash table
     table_hash = {}
+    views_settings_by_name = _get_views_settings_by_name(views_settings)
     for header_view_name in headers:
         # find the view (template)
-        matching_template = next(
-            (
-                instance
-                for instance in views_settings
-                if instance.view_name == header_view_name
-            ),
-            None,
-        )
+        matching_template = views_settings_by_name.get(header_view_name)
         if matching_template == None:
             raise ValueError(
                 "Impossible!!! No match found for view [{}]".format(header_view_name)
             )
+        filter_index = matching_template.get_filter_override_index()
 
         # get category hashes
         for row in row_headers:
-            # Find a matching instance based on the two properties using a lambda expression and filter function
-            matching_filter = next(
-                (
-                    instance
-                    for instance in matching_template.override_by_filter
-                    if instance.filter_name == row
-                ),
-                None,
-            )
+            # Find a matching instance based on the filter name
+            matching_filter = filter_index.get(row)
 
             # set a default value
             hash_value = DOES_NOT_EXIST
@@ -240,7 +251,7 @@ def _get_hash_for_filter_overrides(headers, row_headers, views_settings):
                     hash_value = FILTER_NOT_ENABLED
                 else:
                     # elements filtered are visible and an override is present and the filter is enabled
-                    hash_value = hash(matching_filter)
+                    hash_value = _get_hash_value(matching_filter)
 
             # add to table
             if row in table_hash:
@@ -29,6 +29,8 @@ This module contains a number of helper functions relating to Revit warnings.
 import clr
 import System
 
+from duHast.Utilities.Objects.disjoint_set import DisjointSet
+
 # -------------------------------------------- common variables --------------------
 
 
@@ -139,64 +141,17 @@ def get_warnings_grouped_by_relation(doc, guid):
     # get all warning relating to a guid
     warnings = get_warnings_by_guid(doc, guid)
 
-    warning_grouping = {}
-    counter = 0
+    # group element ids related through warnings, including groups connected by later warnings
+    warning_grouping = DisjointSet()
     for warning in warnings:
-        match = False
         element_ids = warning.GetFailingElements()
 
         # just in case there are more than 2 elements in the warning
         if len(element_ids) != 2:
             continue
 
-        # initialise the first warning group
-        if len(warning_grouping) == 0:
-            warning_grouping[counter] = [
-                element_ids[0].IntegerValue,
-                element_ids[1].IntegerValue,
-            ]
-            continue
+        warning_grouping.union(
+            element_ids[0].IntegerValue, element_ids[1].IntegerValue
+        )
 
-        # check if the warning relates to an existing group
-        for key, value in warning_grouping.items():
-            if (
-                element_ids[0].IntegerValue in value
-                and element_ids[1].IntegerValue not in value
-            ):
-                warning_grouping[key].append(element_ids[1].IntegerValue)
-                # print("added {} to group {}".format( element_ids[1].IntegerValue, counter))
-                match = True
-                break
-            elif (
-                element_ids[1].IntegerValue in value
-                and element_ids[0].IntegerValue not in value
-            ):
-                warning_grouping[key].append(element_ids[0].IntegerValue)
-                # print("added {} to group {}".format( element_ids[0].IntegerValue, counter))
-                match = True
-                break
-            elif (
-                element_ids[1].IntegerValue in value
-                and element_ids[0].IntegerValue in value
-            ):
-                # print("matched {} {} to group {} {}".format( element_ids[0].IntegerValue, element_ids[1].IntegerValue, counter, value))
-                match = True
-                break
-            else:
-                pass
-                # print("no match for {} {} in {}".format(element_ids[0].IntegerValue, element_ids[1].IntegerValue, value))
-        if not match:
-            counter += 1
-            warning_grouping[counter] = [
-                element_ids[0].IntegerValue,
-                element_ids[1].IntegerValue,
-            ]
-            # print("new counter group: {} to group {}, {}".format(counter, element_ids[0].IntegerValue, element_ids[1].IntegerValue,))
-            # new warning grouping is required
-
-    sorted_warning_grouping = {}
-    # sort the values in the dictionary
-    for key, value in warning_grouping.items():
-        warning_grouping[key] = sorted(value)
-        sorted_warning_grouping[sorted(value)[0]] = sorted(value)
-    return sorted_warning_grouping
+    return warning_grouping.get_groups()
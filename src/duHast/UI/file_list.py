@@ -46,12 +46,12 @@ from duHast.UI import workloader as wl
 from duHast.Utilities.Objects import result as res
 from duHast.Utilities.files_io import (
     is_back_up_file,
-    get_file_size as files_io_get_file_size,
+    get_files_size_and_modified_time,
     FILE_SIZE_IN_KB,
 )
 from duHast.Utilities.files_get import (
     get_files,
-    get_files_from_directory_walker_with_filters_simple,
+    get_files_from_directory_scan,
 )
 from duHast.Utilities.files_csv import get_first_row_in_csv_file, read_csv_file
 from duHast.Utilities.files_tab import get_first_row_in_file_no_strip
@@ -63,7 +63,9 @@ from duHast.Revit.BIM360.util_bim_360 import get_bim_360_file_data
 # -------------
 
 
-def get_revit_files_for_processing(location, include_sub_dirs, file_extension):
+def get_revit_files_for_processing(
+    location, include_sub_dirs, file_extension, max_workers=1
+):
     """
     Extracts file data from varies sources:
         - bim 360 task text file
@@ -77,6 +79,8 @@ def get_revit_files_for_processing(location, include_sub_dirs, file_extension):
     :type includeSubDirs: bool
     :param fileExtension: File type filter in '.ext'
     :type fileExtension: str
+    :param max_workers: Number of threads used to get file sizes of files in a task list file or to scan top level sub directories, defaults to 1
+    :type max_workers: int, optional
 
     :return: List of MyFileItem objects.
     :rtype: :class:`.MyFileItem`
@@ -86,14 +90,16 @@ def get_revit_files_for_processing(location, include_sub_dirs, file_extension):
     try:
         if os.path.isfile(location):
             # got a text file...could either be BIM360 data or a file task list
-            revit_files = _get_file_data_from_text_file(location)
+            revit_files = _get_file_data_from_text_file(
+                location, max_workers=max_workers
+            )
         elif os.path.isdir(location):
             # check a to search for files is to include sub dirs
             revit_files_unfiltered = []
             if include_sub_dirs:
                 # get revit files in input dir and subdirs (with backup files removed already)
                 revit_files_unfiltered = get_revit_files_incl_sub_dirs(
-                    location, file_extension
+                    location, file_extension, max_workers=max_workers
                 )
             else:
                 # get revit files in input dir (with backup files removed already)
@@ -114,12 +120,16 @@ def get_revit_files_for_processing(location, include_sub_dirs, file_extension):
     return revit_files
 
 
-def _get_files_from_list_file(file_path_csv):
+def _get_files_from_list_file(file_path_csv, max_workers=1):
     """
     Reads server based file data, the fully qualified file path, from a task file list file in csv format.
 
+    File sizes are read using a number of threads to overlap the wait for slow (network) file systems.
+
     :param filePathCSV: The fully qualified file path to the task list file.
     :type filePathCSV: str
+    :param max_workers: Number of threads used to get file sizes, defaults to 1 (no additional threads)
+    :type max_workers: int, optional
 
     :return: A list of MyFileitem objects. If an exception occured an empty list will be returned.
     :rtype: :class:`.MyFileItem`
@@ -132,18 +142,24 @@ def _get_files_from_list_file(file_path_csv):
         # check whether anything came back
         if len(rows) > 0:
             # process rows
-            for row_data in rows:
-                if len(row_data) > 0:
-                    file_size = files_io_get_file_size(row_data[0], FILE_SIZE_IN_KB)
-                    dummy = fi.MyFileItem(row_data[0], file_size)
-                    revit_files.append(dummy)
+            file_paths = [row_data[0] for row_data in rows if len(row_data) > 0]
+            files_stats = get_files_size_and_modified_time(
+                file_paths, max_workers=max_workers
+            )
+            for file_path, file_stats in zip(file_paths, files_stats):
+                # default value if file does not exist
+                file_size = -1
+                if file_stats is not None:
+                    file_size = file_stats[0] / FILE_SIZE_IN_KB
+                dummy = fi.MyFileItem(file_path, file_size)
+                revit_files.append(dummy)
     except Exception as e:
         # return an empty list which will cause this script to abort
         revit_files = []
     return revit_files
 
 
-def get_files_from_csv_list_file(file_path_csv, file_extension):
+def get_files_from_csv_list_file(file_path_csv, file_extension, max_workers=1):
     """
     Reads server based file data, the fully qualified file path, from a task file list file in csv format.
 
@@ -151,23 +167,27 @@ def get_files_from_csv_list_file(file_path_csv, file_extension):
     :type filePathCSV: str
     :param fileExtension: The file extension filter in format '.ext'
     :type fileExtension: str
+    :param max_workers: Number of threads used to get file sizes, defaults to 1 (no additional threads)
+    :type max_workers: int, optional
     :return: A list of MyFileitem objects. If an exception occured an empty list will be returned.
     :rtype: :class:`.MyFileItem`
     """
 
-    revit_files = _get_files_from_list_file(file_path_csv)
+    revit_files = _get_files_from_list_file(file_path_csv, max_workers=max_workers)
     # filter out files with wrong extension
     revit_files = [f for f in revit_files if f.name.lower().endswith(file_extension)]
     return revit_files
 
 
-def _get_file_data_from_text_file(file_path):
+def _get_file_data_from_text_file(file_path, max_workers=1):
     """
     Reads a file server based task list file. This file can either be a BIM360 task list file or \
         a task list file containing file server based file path in a single column.
 
     :param filePath: The fully qualified file path to the task list file.
     :type filePath: str
+    :param max_workers: Number of threads used to get file sizes of server based files, defaults to 1 (no additional threads)
+    :type max_workers: int, optional
     :return: A list of MyFileitem objects.
     :rtype: :class:`.MyFileItem`
     """
@@ -189,7 +209,7 @@ def _get_file_data_from_text_file(file_path):
         if len(row) > 2:
             files = get_bim_360_file_data(file_path)
         else:
-            files = _get_files_from_list_file(file_path)
+            files = _get_files_from_list_file(file_path, max_workers=max_workers)
     return files
 
 
@@ -217,30 +237,37 @@ def get_revit_files(directory, file_extension):
     return files
 
 
-def get_revit_files_incl_sub_dirs(directory, file_extension):
+def get_revit_files_incl_sub_dirs(
+    directory, file_extension, cache_file_path=None, max_workers=1
+):
     """
     Returns files in a given directory and its sub directories of a given file extension.
 
+    The directory tree is scanned once with file sizes taken from the directory listing. \
+        Refer to :func:`duHast.Utilities.files_get.get_files_from_directory_scan`.
+
     :param directory: The fully qualified directory path.
     :type directory: str
     :param file_extension: The file extension filter in format '.ext'
     :type file_extension: str
+    :param cache_file_path: Fully qualified file path of a scan cache file. Directories not modified since the last scan are not listed again. Defaults to None (no cache)
+    :type cache_file_path: str, optional
+    :param max_workers: Number of threads used to scan top level sub directories, defaults to 1
+    :type max_workers: int, optional
 
     :return: List of file items
     :rtype: [:class:`.FileItem`]
     """
 
     files = []
-    # Get the list of all files in directory tree at given path
-    list_of_files = get_files_from_directory_walker_with_filters_simple(
-        directory, file_extension
+    # Get the list of all files and their size in directory tree at given path
+    list_of_files = get_files_from_directory_scan(
+        directory, file_extension, cache_file_path, max_workers
     )
 
-    for f in list_of_files:
+    for f, size in list_of_files:
         # check if this is a back up file,
         if is_back_up_file(f) == False:
-            # Get size and add to list of files.
-            size = os.path.getsize(f)
             files.append(fi.MyFileItem(f, size))
     return files
 
@@ -259,6 +286,22 @@ def get_file_size(item):
     return item.size
 
 
+def get_runtime_history_key(item):
+    """
+    Helper used to look up a file item in a runtime history table built from batch processor log files.
+
+    :param item: A file item object instance.
+    :type item: :class:`.FileItem`
+
+    :return: The BIM 360 file guid for cloud models, otherwise the item name (fully qualified file path).
+    :rtype: str
+    """
+
+    if item.bim_360_file_guid is not None:
+        return item.bim_360_file_guid
+    return item.name
+
+
 def bucket_to_task_list_file_system(item):
     """
     Default task list content for files on a file server location.
@@ -348,10 +391,14 @@ def write_file_list(
     task_files_number,
     file_getter,
     file_data_processor=bucket_to_task_list_file_system,
+    runtime_history=None,
+    refine=False,
 ):
     """
     Writes out all task list(s) to file(s).
 
+    Files are distributed by file size or, if a runtime history is provided, by their runtime in previous batch processing sessions.
+
     :param directory_path: Fully qualified directory path containing files to be added to task lists.
     :type directory_path: str
     :param file_extension: A file extension filter in format '.ext'
@@ -364,6 +411,10 @@ def write_file_list(
     :type file_getter: func(str, str) -> :class:`.FileItem`
     :param file_data_processor: Function processing file item and returns a string to be written to task list file, defaults to BucketToTaskListFileSystem
     :type file_data_processor: func(:class:`.FileItem`) -> str, optional
+    :param runtime_history: Dictionary of fully qualified file path (or BIM 360 file guid) to runtime in seconds, defaults to None. Files without history fall back to file size.
+    :type runtime_history: {str: float}, optional
+    :param refine: Flag indicating whether to refine the workload distribution using the Karmarkar-Karp method, defaults to False
+    :type refine: bool, optional
 
     :return:
         Result class instance.
@@ -384,7 +435,14 @@ def write_file_list(
     # get revit files in input dir
     revit_files = file_getter(directory_path, file_extension)
     # build bucket list
-    buckets = wl.distribute_workload(task_files_number, revit_files, get_file_size)
+    get_workload_size = get_file_size
+    if runtime_history:
+        get_workload_size = wl.get_workload_size_from_runtime_history(
+            revit_files, runtime_history, get_file_size, get_runtime_history_key
+        )
+    buckets = wl.distribute_workload(
+        task_files_number, revit_files, get_workload_size, refine=refine
+    )
     try:
         # write out file lists
         counter = 0
@@ -30,26 +30,29 @@ The below function attempt to fill these buckets evenly measured on file size.
 #
 #
 
-import clr
-
-clr.AddReference("System.Core")
-from System import Linq
-
-clr.ImportExtensions(Linq)
+import heapq
 
 from duHast.UI.Objects import workload_bucket as wb
 
 
-def distribute_workload(number_of_buckets, items, getWorkloadSize):
+def distribute_workload(number_of_buckets, items, getWorkloadSize, refine=False):
     """
     Distributes a given number of items evenly by workload size into workload buckets.
 
+    Items are assigned biggest first to the bucket with the smallest workload (longest processing time first). \
+        The bucket with the smallest workload is kept at the top of a heap.
+
+    If refine is True the items are also partitioned using the Karmarkar-Karp largest differencing method and \
+        whichever partition has the smaller largest bucket workload is returned.
+
     :param numberOfBuckets: The number of buckets items are to be distributed to
     :type numberOfBuckets: int
     :param items: A list of items.
     :type items: [foo]
     :param getWorkloadSize: A function returning the workload size from an item.
     :type getWorkloadSize: func(foo) -> int
+    :param refine: Flag indicating whether to refine the distribution using the Karmarkar-Karp method, defaults to False
+    :type refine: bool, optional
 
     :return: A list of workload bucket objects containing items.
     :rtype: list[ :class:`.WorkloadBucket`]
@@ -69,16 +72,21 @@ def distribute_workload(number_of_buckets, items, getWorkloadSize):
         # sort list by workload size in descending order (biggest item first)
         itemToWorkLoadValues = sort(itemToWorkLoadValues)
 
-        # load up with buckets
-        for bucket in itemToWorkLoadValues:
-            # find bucket with smallest work load value
-            lowBucket = min(
-                workload_buckets, key=lambda work_bucket: work_bucket.workload_value
+        partition = _get_partition_longest_processing_time(
+            number_of_buckets, itemToWorkLoadValues
+        )
+        if refine:
+            partition_kk = _get_partition_karmarkar_karp(
+                number_of_buckets, itemToWorkLoadValues
             )
-            # add new item to bucket list
-            lowBucket.add_item(bucket[0])
-            # increase work bucket size by size of item added
-            lowBucket.set_workload_value(lowBucket.workload_value + bucket[1])
+            if max(p[0] for p in partition_kk) < max(p[0] for p in partition):
+                partition = partition_kk
+
+        # load up buckets
+        for bucket, (workload_value, bucket_items) in zip(workload_buckets, partition):
+            for item in bucket_items:
+                bucket.add_item(item)
+            bucket.set_workload_value(workload_value)
 
     except Exception as e:
         print(e)
@@ -87,6 +95,120 @@ def distribute_workload(number_of_buckets, items, getWorkloadSize):
     return workload_buckets
 
 
+def _get_partition_longest_processing_time(number_of_buckets, item_workload_values):
+    """
+    Assigns items, sorted by workload in descending order, to the bucket with the smallest workload.
+
+    Ties are resolved by bucket index, so the first bucket gets the first item.
+
+    :return: List of [workload value, items] per bucket.
+    :rtype: [[int, [foo]]]
+    """
+
+    partition = [[0, []] for x in range(number_of_buckets)]
+    # heap of (workload value, bucket index), smallest workload on top
+    heap = [(0, x) for x in range(number_of_buckets)]
+    for item, workload_value in item_workload_values:
+        bucket_workload_value, index = heap[0]
+        partition[index][1].append(item)
+        partition[index][0] = bucket_workload_value + workload_value
+        heapq.heapreplace(heap, (partition[index][0], index))
+    return partition
+
+
+def _get_partition_karmarkar_karp(number_of_buckets, item_workload_values):
+    """
+    Partitions items using the multi way Karmarkar-Karp largest differencing method.
+
+    Each item starts as a partition of its own: the item in one subset, all other subsets empty. \
+        The two partitions with the largest difference between their biggest and smallest subset are merged \
+        by combining the biggest subset of one with the smallest subset of the other, until one partition is left.
+
+    :return: List of [workload value, items] per bucket, sorted by workload value in descending order.
+    :rtype: [[int, [foo]]]
+    """
+
+    if len(item_workload_values) == 0:
+        return [[0, []] for x in range(number_of_buckets)]
+    heap = []
+    # counter used to keep heap entries with the same difference in insertion order
+    counter = 0
+    for item, workload_value in item_workload_values:
+        subsets = [[workload_value, [item]]] + [
+            [0, []] for x in range(number_of_buckets - 1)
+        ]
+        heapq.heappush(heap, (-workload_value, counter, subsets))
+        counter += 1
+    while len(heap) > 1:
+        subsets_a = heapq.heappop(heap)[2]
+        subsets_b = heapq.heappop(heap)[2]
+        # subsets are kept in descending order: combine biggest with smallest
+        merged = [
+            [a[0] + b[0], a[1] + b[1]]
+            for a, b in zip(subsets_a, reversed(subsets_b))
+        ]
+        merged.sort(key=lambda x: x[0], reverse=True)
+        heapq.heappush(heap, (merged[-1][0] - merged[0][0], counter, merged))
+        counter += 1
+    return heap[0][2]
+
+
+def get_workload_size_from_runtime_history(
+    items, runtime_history, getWorkloadSize, get_history_key
+):
+    """
+    Returns a function estimating the workload of an item from its runtime in previous batch processing sessions.
+
+    Items without a runtime history fall back to their workload size, scaled to seconds by the ratio of runtime \
+        to workload size of all items which do have a runtime history. If no item has a runtime history the workload size is used as is.
+
+    :param items: A list of items.
+    :type items: [foo]
+    :param runtime_history: Dictionary of history key to runtime in seconds. Refer to batch_processor_log_utils.get_runtime_history
+    :type runtime_history: {str: float}
+    :param getWorkloadSize: A function returning the workload size from an item. Used as fallback.
+    :type getWorkloadSize: func(foo) -> int
+    :param get_history_key: A function returning the key of an item in the runtime history.
+    :type get_history_key: func(foo) -> str
+
+    :return: A function returning the estimated workload from an item.
+    :rtype: func(foo) -> float
+    """
+
+    # history keys are file path: ignore case
+    history = dict(
+        (_get_normalised_key(key), runtime) for key, runtime in runtime_history.items()
+    )
+    runtime_total = 0.0
+    size_total = 0.0
+    for item in items:
+        key = _get_normalised_key(get_history_key(item))
+        if key in history:
+            runtime_total = runtime_total + history[key]
+            size_total = size_total + getWorkloadSize(item)
+    if runtime_total == 0 or size_total == 0:
+        return getWorkloadSize
+    seconds_per_size = runtime_total / size_total
+
+    def get_workload(item):
+        key = _get_normalised_key(get_history_key(item))
+        if key in history:
+            return history[key]
+        return getWorkloadSize(item) * seconds_per_size
+
+    return get_workload
+
+
+def _get_normalised_key(key):
+    """
+    Returns a runtime history key in lower case.
+    """
+
+    if key is None:
+        return None
+    return key.lower()
+
+
 def sort(sub_li):
     """
     Python code to sort the tuples using second element of sublist. Inplace way to sort using sort().
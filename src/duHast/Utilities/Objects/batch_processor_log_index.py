@@ -0,0 +1,398 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+A single pass index over a Revit Batch Processor session log file.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+The log file is read and json decoded once only. While reading, the index records:
+
+- the list of Revit files batch processor was asked to process and whether they exist
+- per Revit file: the row offsets of each processing block and any exception messages found in it
+
+Process status queries are then answered from the index without re-reading the log file.
+
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import json
+from datetime import datetime
+
+from duHast.Utilities.Objects import base
+
+#: Message indicating the start of the list of files to be processed
+FILE_LIST_START_MARKER = "Revit Files for processing"
+#: Messages indicating the end of the list of files to be processed
+FILE_LIST_END_MARKERS = ["Starting batch operation..."]
+#: Message indicating the start of a file processing block
+PROCESSING_START_MARKER = "\t- Processing file ("
+#: Messages indicating the end of a file processing block
+PROCESSING_END_MARKERS = [
+    "\t- Task script operation completed.",
+    "\t- Operation aborted.",
+]
+#: Message identifying a cloud model
+CLOUD_MODEL_MARKER = "CLOUD MODEL"
+
+#: Message returned when no processing block was found for a file
+MESSAGE_NO_MATCH = "[Failed to retrieve processing data for file.]"
+#: Message returned when a file was processed without any exceptions
+MESSAGE_OK = "[ok]"
+
+#: Date and time formats used in log rows, tried in order. Start and end time stamps of a block must match the same format.
+TIME_STAMP_FORMATS = ["%d/%m/%Y %H:%M:%S", "%m/%d/%Y %H:%M:%S", "%Y-%m-%d %H:%M:%S"]
+
+
+class LogBlock(base.Base):
+    def __init__(self, start_row, file_name=""):
+        """
+        Class constructor.
+
+        :param start_row: The row index (zero based) of the first message in this block.
+        :type start_row: int
+        :param file_name: The fully qualified file path of the Revit file processed in this block.
+        :type file_name: str
+        """
+
+        super(LogBlock, self).__init__()
+
+        self.start_row = start_row
+        self.end_row = -1
+        self.file_name = file_name
+        # list of [row index, stripped message] for any row containing an exception message
+        self.exception_hits = []
+        # flag indicating whether an end marker was found for this block
+        self.is_closed = False
+        # utc date and time of the first and last row of this block in format 'date time'
+        self.start_time_stamp = None
+        self.end_time_stamp = None
+
+    def get_status(self):
+        """
+        Returns the process status and message of this block.
+
+        If more then one exception message was found, the last one is reported.
+
+        :return: A process status and a message.
+        :rtype: bool, str or [str]
+        """
+
+        if len(self.exception_hits) > 0:
+            return False, [self.exception_hits[-1][1]]
+        return True, MESSAGE_OK
+
+    def get_duration(self):
+        """
+        Returns the time in seconds it took to process the file of this block.
+
+        :return: The duration in seconds or None if the block is not closed or its time stamps could not be parsed.
+        :rtype: float or None
+        """
+
+        if (
+            not self.is_closed
+            or self.start_time_stamp is None
+            or self.end_time_stamp is None
+        ):
+            return None
+        for time_stamp_format in TIME_STAMP_FORMATS:
+            try:
+                start = datetime.strptime(self.start_time_stamp, time_stamp_format)
+                end = datetime.strptime(self.end_time_stamp, time_stamp_format)
+            except ValueError:
+                continue
+            duration = (end - start).total_seconds()
+            if duration >= 0:
+                return duration
+        return None
+
+
+class BatchProcessorLogIndex(base.Base):
+    def __init__(self, exception_messages, file_path=None):
+        """
+        Class constructor.
+
+        :param exception_messages: Message snippets which indicate processing of a file went bad.
+        :type exception_messages: [str]
+        :param file_path: Fully qualified file path to a json formatted log file. If provided the file will be indexed straight away.
+        :type file_path: str
+        """
+
+        super(BatchProcessorLogIndex, self).__init__()
+
+        self.exception_messages = exception_messages
+        # list of [file name, file exists status]
+        self.files_processed = []
+        # file name -> list of LogBlock instances (in log order)
+        self.blocks_by_file = {}
+        # number of rows indexed
+        self.row_count = 0
+
+        if file_path is not None:
+            self.index_file(file_path)
+
+    def index_file(self, file_path):
+        """
+        Reads and indexes a batch processor log file. The file is streamed line by line.
+
+        :param file_path: Fully qualified file path to a json formatted log file.
+        :type file_path: str
+        """
+
+        with open(file_path) as f:
+            self.index_lines(f)
+
+    def index_lines(self, lines):
+        """
+        Indexes json formatted log rows.
+
+        :param lines: An iterable of json formatted log file rows.
+        :type lines: iterable of str
+        """
+
+        # file list block (there should just be one...)
+        in_file_list = False
+        file_list_done = False
+        file_list_messages = []
+
+        # file processing blocks
+        current_block = None
+        current_messages = []
+
+        for line in lines:
+            if not line.strip():
+                continue
+            row_data = json.loads(line)
+            message = row_data["message"]["message"]
+            row = self.row_count
+            self.row_count = self.row_count + 1
+
+            # file list section
+            if not file_list_done:
+                if not in_file_list and message.startswith(FILE_LIST_START_MARKER):
+                    in_file_list = True
+                if in_file_list:
+                    if self._starts_with_any(message, FILE_LIST_END_MARKERS):
+                        in_file_list = False
+                        file_list_done = True
+                        self.files_processed = self._parse_file_list(
+                            file_list_messages
+                        )
+                    else:
+                        file_list_messages.append(message)
+
+            # file processing sections
+            if current_block is None and message.startswith(PROCESSING_START_MARKER):
+                current_block = LogBlock(row)
+                current_block.start_time_stamp = self._get_time_stamp(row_data)
+                current_messages = []
+            if current_block is not None:
+                if self._starts_with_any(message, PROCESSING_END_MARKERS):
+                    current_block.end_row = row
+                    current_block.end_time_stamp = self._get_time_stamp(row_data)
+                    current_block.is_closed = True
+                    self._add_block(current_block, current_messages)
+                    current_block = None
+                else:
+                    current_messages.append(message)
+                    self._check_for_exception(current_block, row, message)
+
+        # check for open blocks
+        if in_file_list:
+            self.files_processed = self._parse_file_list(file_list_messages)
+        if current_block is not None:
+            # keep this data...hopefully there is an exception message in there!!
+            current_block.end_row = self.row_count - 1
+            self._add_block(current_block, current_messages)
+
+    def _starts_with_any(self, message, markers):
+        """
+        Checks whether a message starts with any of the markers provided.
+        """
+
+        for marker in markers:
+            if message.startswith(marker):
+                return True
+        return False
+
+    def _get_time_stamp(self, row_data):
+        """
+        Returns the utc date and time of a log row in format 'date time' or None if not available.
+        """
+
+        try:
+            return "{} {}".format(row_data["date"]["utc"], row_data["time"]["utc"])
+        except (KeyError, TypeError):
+            return None
+
+    def _check_for_exception(self, block, row, message):
+        """
+        Records any exception message contained in a log message against the block.
+        """
+
+        for exception_message in self.exception_messages:
+            if exception_message in message:
+                block.exception_hits.append([row, message.strip()])
+                break
+
+    def _add_block(self, block, messages):
+        """
+        Gets the file name from the block messages and adds the block to the file index.
+        """
+
+        block.file_name = self._get_file_name_from_messages(messages)
+        if block.file_name in self.blocks_by_file:
+            self.blocks_by_file[block.file_name].append(block)
+        else:
+            self.blocks_by_file[block.file_name] = [block]
+
+    def _get_file_name_from_messages(self, messages):
+        """
+        Extracts the file name from the messages of a processing block.
+
+        - cloud model: ['\\t- Processing file (1 of 1): CLOUD MODEL', '\\t- ', '\\t- \\tProject ID: GUID', '\\t- \\tModel ID: GUID',...]
+        - file server: ['\\t- Processing file (x of y): file path',...]
+
+        :return: The fully qualified file path (or cloud model id) of the file processed
+        :rtype: str
+        """
+
+        if CLOUD_MODEL_MARKER in messages[0]:
+            if len(messages) < 4:
+                return ""
+            return messages[3].strip()[len("\t- \t") - 1 :]
+        # the file counter is not of fixed length: (1 of 9) vs (10 of 400)
+        return messages[0].strip().partition("): ")[2]
+
+    def _parse_file_list(self, messages):
+        """
+        Parses the file list block. Each file block is proceeded by an empty message row.
+
+        :return: a list of lists in format [[filepath, file exists status]]
+        :rtype: [[str, bool]]
+        """
+
+        files = []
+        for x in range(len(messages)):
+            if messages[x] == "" and x + 3 <= len(messages):
+                if CLOUD_MODEL_MARKER in messages[x + 1]:
+                    # substitute file name with file GUID, fake the status always exists
+                    # (RBP does not check upfront whether a cloud model exists!)
+                    files.append([messages[x + 3].strip(), True])
+                else:
+                    file_status = (
+                        "YES" in messages[x + 2] or "Project ID" in messages[x + 2]
+                    )
+                    files.append([messages[x + 1].strip(), file_status])
+        return files
+
+    def get_files_not_found(self):
+        """
+        Returns all files flagged by batch processor as not found.
+
+        :return: list of lists in format: [[filename, status as bool]]
+        :rtype: [[str, bool]]
+        """
+
+        return [f for f in self.files_processed if f[1] == False]
+
+    def get_files_found(self):
+        """
+        Returns the fully qualified file path of all files flagged by batch processor as found.
+
+        :return: list of fully qualified file path
+        :rtype: [str]
+        """
+
+        return [f[0] for f in self.files_processed if f[1] != False]
+
+    def get_blocks(self, file_name):
+        """
+        Returns all processing blocks of a given file.
+
+        :param file_name: Fully qualified file path of Revit file which was processed.
+        :type file_name: str
+
+        :return: List of log blocks, empty list if no match was found.
+        :rtype: [:class:`.LogBlock`]
+        """
+
+        return self.blocks_by_file.get(file_name, [])
+
+    def get_process_status(self, file_name):
+        """
+        Checks whether any exception occurred when processing a specific revit file.
+
+        If a file got processed more then once, the status of the last processing block is returned.
+
+        :param file_name: Fully qualified file path of Revit file which was processed.
+        :type file_name: str
+
+        :return: A process status and a message.
+
+            - process status: True if no exception occurred during revit file processing, otherwise false
+            - message: the exception message recorded in the log file.
+
+        :rtype: bool, str
+        """
+
+        blocks = self.get_blocks(file_name)
+        if len(blocks) == 0:
+            return False, MESSAGE_NO_MATCH
+        return blocks[-1].get_status()
+
+    def process_log_files(self):
+        """
+        Returns the process status of all files listed in the log file.
+
+        :return: returns list of arrays in format:
+            [[processed Revit file name, status of processing (true or false), message]]
+        :rtype: [[str]]
+        """
+
+        files_process_status = []
+        for file_name in self.get_files_found():
+            status, message = self.get_process_status(file_name)
+            files_process_status.append([file_name, status, message])
+        for f in self.get_files_not_found():
+            files_process_status.append([f[0], False, ["File not found"]])
+        return files_process_status
+
+    def get_file_runtimes(self):
+        """
+        Returns the time it took to process each file in this log.
+
+        If a file got processed more then once, the duration of the last processing block with a known duration is returned.
+        Files without any closed processing block are not included.
+
+        :return: Dictionary of file name (fully qualified file path or cloud model id) to duration in seconds.
+        :rtype: {str: float}
+        """
+
+        runtimes = {}
+        for file_name, blocks in self.blocks_by_file.items():
+            for block in reversed(blocks):
+                duration = block.get_duration()
+                if duration is not None:
+                    runtimes[file_name] = duration
+                    break
+        return runtimes
@@ -0,0 +1,137 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+A disjoint set ( union-find ) class to group related items.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+from duHast.Utilities.Objects import base
+
+
+class DisjointSet(base.Base):
+    """
+    A class grouping items which are related to each other ( directly or through other items ) into groups ( connected components ).
+
+    Uses union by size and path compression, so adding relations and finding the group of an item take near constant time.
+
+    Example Usage:
+    ```python
+    disjoint_set = DisjointSet()
+    disjoint_set.union(1, 2)
+    disjoint_set.union(3, 4)
+    disjoint_set.union(2, 3)
+    disjoint_set.get_groups()  # {1: [1, 2, 3, 4]}
+    ```
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initializes a new instance of the DisjointSet class.
+        """
+
+        super(DisjointSet, self).__init__(**kwargs)
+
+        # parent item by item, root items are their own parent
+        self.parents = {}
+        # number of items in group by root item
+        self.sizes = {}
+
+    def add(self, item):
+        """
+        Adds an item as a group of its own if it is not already known.
+
+        :param item: The item to add. Must be hashable.
+        :type item: var
+        """
+
+        if item not in self.parents:
+            self.parents[item] = item
+            self.sizes[item] = 1
+
+    def find(self, item):
+        """
+        Returns the root item of the group an item belongs to. Unknown items are added as a group of their own.
+
+        :param item: The item.
+        :type item: var
+        :return: The root item of the group.
+        :rtype: var
+        """
+
+        self.add(item)
+        root = item
+        while self.parents[root] != root:
+            root = self.parents[root]
+        # path compression: point all items on the path directly to the root
+        while self.parents[item] != root:
+            next_item = self.parents[item]
+            self.parents[item] = root
+            item = next_item
+        return root
+
+    def union(self, item_a, item_b):
+        """
+        Merges the groups of two related items.
+
+        :param item_a: An item.
+        :type item_a: var
+        :param item_b: An item related to item_a.
+        :type item_b: var
+        :return: The root item of the merged group.
+        :rtype: var
+        """
+
+        root_a = self.find(item_a)
+        root_b = self.find(item_b)
+        if root_a == root_b:
+            return root_a
+        # attach the smaller group to the larger group
+        if self.sizes[root_a] < self.sizes[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parents[root_b] = root_a
+        self.sizes[root_a] = self.sizes[root_a] + self.sizes.pop(root_b)
+        return root_a
+
+    def get_groups(self):
+        """
+        Returns all groups.
+
+        Items need to be sortable.
+
+        :return: A dictionary where key is the lowest item in a group and value is a list of all items in the group ( including the key ) in ascending order.
+        :rtype: dict
+        """
+
+        items_by_root = {}
+        for item in self.parents:
+            root = self.find(item)
+            if root in items_by_root:
+                items_by_root[root].append(item)
+            else:
+                items_by_root[root] = [item]
+        groups = {}
+        for items in items_by_root.values():
+            items.sort()
+            groups[items[0]] = items
+        return groups
@@ -12,8 +12,14 @@ Example Usage:
     result.update_sep(True, "Process completed successfully")  # Update the status and append a new message
     print(result)  # Print the result object
 
+Messages are stored in a list and only joined into a single string when the `message` property is read. Appending messages is therefore linear in the number of messages.
+
+For long running processes the number of messages retained can be capped ( bounded mode ): only the most recent messages are kept and a summary line reports how many messages were omitted.
+
+    result = Result(max_messages=100)  # keep the last 100 messages only
+
 Methods:
-    __init__(self):
+    __init__(self, max_messages=None):
         Initializes the Result object with default values for `message`, `status`, and `result`
 
     __repr__(self):
@@ -32,7 +38,9 @@ Methods:
         Updates the status property of the Result object
 
 Fields:
-    message: A string representing the message of the result
+    message: A string representing the message of the result (property)
+    max_messages: Maximum number of messages retained, None if unbounded
+    omitted_message_count: Number of messages dropped in bounded mode
     status: A boolean representing the status of the result
     result: A list to store the result items
    
@@ -62,11 +70,16 @@ Fields:
 #
 #
 
+from collections import OrderedDict
+
 from duHast.Utilities.Objects import base
 
 
 class Result(base.Base):
-    def __init__(self):
+    #: default message value
+    DEFAULT_MESSAGE = "-"
+
+    def __init__(self, max_messages=None):
         """
         Class constructor.
 
@@ -74,14 +87,185 @@ class Result(base.Base):
         - status default value is True
         - result default value is []
 
+        :param max_messages: Maximum number of messages retained. If exceeded, older messages are dropped and a summary line is added to the message. Defaults to None (no limit).
+        :type max_messages: int, optional
         """
 
         super(Result, self).__init__()
 
-        self.message = "-"
+        if max_messages is not None and max_messages < 1:
+            raise ValueError("max_messages must be None or greater than 0")
+        self.max_messages = max_messages
+        self.omitted_message_count = 0
+        # message buffer, joined when message property is read
+        self._messages = []
+        self._message_cache = None
+        self.message = Result.DEFAULT_MESSAGE
         self.status = True
         self.result = []
 
+    @property
+    def message(self):
+        """
+        Property: returns all messages retained, separated by a new line.
+
+        In bounded mode a summary line with the number of omitted messages is added at the start.
+
+        :return: The message, default is -
+        :rtype: str
+        """
+
+        if self._message_cache is None:
+            self._trim_messages()
+            if len(self._messages) == 0:
+                self._message_cache = Result.DEFAULT_MESSAGE
+            elif len(self._messages) == 1 and self.omitted_message_count == 0:
+                self._message_cache = self._messages[0]
+            else:
+                lines = ["{}".format(m) for m in self._messages]
+                if self.omitted_message_count > 0:
+                    lines.insert(
+                        0,
+                        "...{} earlier messages omitted...".format(
+                            self.omitted_message_count
+                        ),
+                    )
+                self._message_cache = "\n".join(lines)
+        return self._message_cache
+
+    @message.setter
+    def message(self, value):
+        """
+        Property: replaces all messages with the value past in.
+
+        :param value: The new message.
+        :type value: str
+        """
+
+        self.omitted_message_count = 0
+        if value == Result.DEFAULT_MESSAGE:
+            self._messages = []
+        else:
+            self._messages = [value]
+        self._message_cache = None
+
+    def get_messages(self):
+        """
+        Returns a copy of the list of messages retained.
+
+        :return: List of messages, empty if no message was added.
+        :rtype: [str]
+        """
+
+        self._trim_messages()
+        return list(self._messages)
+
+    def _add_messages(self, messages, omitted_message_count=0):
+        """
+        Adds messages to the buffer and drops the oldest messages if the maximum number of messages is exceeded.
+
+        :param messages: The messages to be added.
+        :type messages: [str]
+        :param omitted_message_count: Number of messages already omitted from the messages past in.
+        :type omitted_message_count: int
+        """
+
+        self._messages.extend(messages)
+        self.omitted_message_count = self.omitted_message_count + omitted_message_count
+        if self.max_messages is not None:
+            # trim in chunks to keep appending linear
+            if len(self._messages) >= 2 * self.max_messages:
+                self._trim_messages()
+        self._message_cache = None
+
+    def _trim_messages(self):
+        """
+        Drops the oldest messages exceeding the maximum number of messages.
+        """
+
+        if self.max_messages is not None and len(self._messages) > self.max_messages:
+            drop_count = len(self._messages) - self.max_messages
+            del self._messages[:drop_count]
+            self.omitted_message_count = self.omitted_message_count + drop_count
+
+    def _get_properties(self):
+        """
+        Returns the public properties of the result, as serialised before messages were buffered.
+
+        The internal message buffer is replaced by the joined message.
+
+        :return: Dictionary of message, status and result.
+        :rtype: OrderedDict
+        """
+
+        return OrderedDict(
+            [("message", self.message), ("status", self.status), ("result", self.result)]
+        )
+
+    def _default_json_handler(self, o):
+        """
+        Json handler serialising result instances ( including nested ones ) by their public properties.
+
+        :param o: The object to be serialised.
+        :type o: object
+        :return: A json serialisable representation of the object.
+        :rtype: dict or str
+        """
+
+        if isinstance(o, Result):
+            return o._get_properties()
+        return super(Result, self)._default_json_handler(o)
+
+    def string_to_utf(self, o):
+        """
+        Json handler used in utf-8 conversion, serialising result instances by their public properties.
+
+        :param o: The object to be serialised.
+        :type o: object
+        :return: A json serialisable representation of the object.
+        :rtype: dict or str
+        """
+
+        if isinstance(o, Result):
+            return o._get_properties()
+        return super(Result, self).string_to_utf(o)
+
+    def __str__(self, indent=0):
+        """
+        Formatted output including indentation of message, status and result.
+
+        :param indent: The level of indentation, defaults to 0
+        :type indent: int, optional
+
+        :return: A string representing the result properties and their values
+        :rtype: str
+        """
+
+        output = []
+        for attr_name, attr_value in self._get_properties().items():
+            if isinstance(attr_value, list):
+                output.append(" " * indent + "{}:".format(attr_name))
+                output.append(self._format_list(attr_value, indent + 2))
+            else:
+                output.append(" " * indent + "{}: {}".format(attr_name, attr_value))
+        return "\n".join(output)
+
+    def class_to_dict(self):
+        """
+        Returns message, status and result as a dictionary.
+
+        :return: A dictionary of the result properties names and their values
+        :rtype: {str:var,}
+        """
+
+        class_dict = {}
+        for key, value in self._get_properties().items():
+            if self._is_primitive(value) or not hasattr(value, "class_to_dict"):
+                class_dict[key] = value
+            else:
+                class_dict[key] = value.class_to_dict()
+        return class_dict
+
     def __repr__(self):
         # Split the message string into individual lines
         lines = self.message.splitlines()
@@ -104,13 +288,14 @@ class Result(base.Base):
         """
 
         try:
-            if self.message == "-":
-                self.message = "{}".format(message)
-            else:
-                self.message = "{}\n{}".format(self.message, message)
+            message = "{}".format(message)
+            if len(self._messages) == 0 and message == Result.DEFAULT_MESSAGE:
+                # appending the default value to the default value does not change anything
+                return
+            self._add_messages([message])
         except Exception as e:
-            self.message = "{} \nAn exception in result class occurred!!! {}".format(
-                self.message, e
+            self._add_messages(
+                ["An exception in result class occurred!!! {}".format(e)]
             )
 
     def update(self, otherResult):
@@ -130,8 +315,11 @@ class Result(base.Base):
 
         try:
             # check if default message string, if so do not update
-            if otherResult.message != "-":
-                self.append_message(otherResult.message)
+            otherResult._trim_messages()
+            if len(otherResult._messages) > 0:
+                self._add_messages(
+                    otherResult._messages, otherResult.omitted_message_count
+                )
             self.status = self.status & otherResult.status
             # check if result property that was passed in has values
             if any(otherResult.result):
@@ -59,6 +59,7 @@ import json
 
 # custom result class from common library
 from duHast.Utilities.Objects import result as res
+from duHast.Utilities.Objects.batch_processor_log_index import BatchProcessorLogIndex
 
 # library from common library
 from duHast.Utilities import files_io as fileIO, files_get as fileGet
@@ -327,6 +328,9 @@ def process_log_file(file_path):
     - find Revit files processed:
     - check whether an exception occurred when processing any of the above files.
 
+    The log file is read once only into a :class:`.BatchProcessorLogIndex` which is then used to answer\
+        process status queries per Revit file.
+
     :param file_path: Fully qualified file path to json formatted log file
     :type file_path: str
 
@@ -336,38 +340,57 @@ def process_log_file(file_path):
     """
 
     files_process_status = []
-    # get all files processed
     try:
-        files_processed = get_files_processed(file_path)
-        # check whether any file not founds came back
-        try:
-            files_not_found = get_files_not_found(files_processed)
-            try:
-                # filter files_processed by files not found
-                files_to_check = filter_files_not_found(
-                    files_processed, files_not_found
-                )
-                # check for exceptions during file processing
-                for file_to_check in files_to_check:
-                    try:
-                        status, message = get_process_status(file_to_check, file_path)
-                    except Exception as e:
-                        output("GetProcessStatus: " + str(e))
-                    dummy = [file_to_check, status, message]
-                    files_process_status.append(dummy)
-                # add files not found
-                for f in files_not_found:
-                    dummy = [f[0], False, ["File not found"]]
-                    files_process_status.append(dummy)
-            except Exception as e:
-                output("FileToCheck: " + str(e))
-        except Exception as e:
-            output("GetFilesNotFound: " + str(e))
+        log_index = get_log_index(file_path)
+        files_process_status = log_index.process_log_files()
     except Exception as e:
-        output("GetFilesProcessed: " + str(e))
+        output("ProcessLogFile: " + str(e))
     return files_process_status
 
 
+def get_log_index(file_path):
+    """
+    Reads a batch processor log file once and returns an index of files processed and their processing blocks.
+
+    :param file_path: Fully qualified file path to json formatted log file
+    :type file_path: str
+
+    :return: An index instance.
+    :rtype: :class:`.BatchProcessorLogIndex`
+    """
+
+    return BatchProcessorLogIndex(
+        exception_messages=EXCEPTION_MESSAGES, file_path=file_path
+    )
+
+
+def get_runtime_history(log_file_paths):
+    """
+    Builds a runtime history table from previous batch processor log files.
+
+    Each log file is read once. If a file was processed in more than one log, the mean runtime is returned.
+
+    :param log_file_paths: Fully qualified file paths of json formatted log files.
+    :type log_file_paths: [str]
+
+    :return: Dictionary of file name (fully qualified file path or cloud model id) to mean runtime in seconds.
+    :rtype: {str: float}
+    """
+
+    runtimes_by_file = {}
+    for log_file_path in log_file_paths:
+        try:
+            log_index = get_log_index(log_file_path)
+            for file_name, runtime in log_index.get_file_runtimes().items():
+                runtimes_by_file.setdefault(file_name, []).append(runtime)
+        except Exception as e:
+            output("GetRuntimeHistory: {} {}".format(log_file_path, e))
+    return dict(
+        (file_name, sum(runtimes) / len(runtimes))
+        for file_name, runtimes in runtimes_by_file.items()
+    )
+
+
 # filtering files not found from overall file list
 #
 # filesProcessed: list of arrays, first entry in array is fully qualified file path
@@ -390,6 +413,8 @@ def get_process_status(file_to_check, log_file_path):
     """
     Reads a log file and checks whether any exception occurred when processing a specific revit file.
 
+    Note: This reads the entire log file on each call. When checking more than one file use :func:`get_log_index` instead.
+
     :param file_to_check: Fully qualified file path of Revit file which was processed
     :type file_to_check: str
     :param log_file_path: The fully qualified batch processor session log file path.
@@ -28,14 +28,13 @@ Helper functions relating to combining text files.
 
 
 import codecs
+import csv
 import glob
 import os
+import shutil
+import tempfile
 from duHast.Utilities.files_io import get_file_name_without_ext
 from duHast.Utilities.files_get import get_files_single_directory
-from duHast.Utilities.files_tab import get_unique_headers as get_unique_headers_tab
-from duHast.Utilities.files_tab import read_tab_separated_file, write_report_data
-from duHast.Utilities.files_csv import get_unique_headers as get_unique_headers_csv
-from duHast.Utilities.files_csv import read_csv_file, write_report_data_as_csv
 from duHast.Utilities.files_json import read_json_data_from_file, write_json_to_file
 
 
@@ -81,15 +80,13 @@ def combine_files(
         for file_ in file_list:
             try:
                 line_counter = 0
-                fp = codecs.open(file_, "r", encoding="utf-8")
-                # fp = open(file_, "r")
-                lines = fp.readlines()
-                fp.close()
-                for line in lines:
-                    # ensure header from first file is copied over
-                    if file_counter == 0 and line_counter == 0 or line_counter != 0:
-                        result.write(line)
-                    line_counter += 1
+                # read line by line rather than the entire file into memory
+                with codecs.open(file_, "r", encoding="utf-8") as fp:
+                    for line in fp:
+                        # ensure header from first file is copied over
+                        if file_counter == 0 and line_counter == 0 or line_counter != 0:
+                            result.write(line)
+                        line_counter += 1
 
                 file_counter += 1
             except Exception as e:
@@ -135,12 +132,9 @@ def combine_files_basic(
     file_list = file_getter(folder_path, file_prefix, file_suffix, file_extension)
     with open(os.path.join(folder_path, out_put_file_name), "w") as f:
         for file_ in file_list:
-            fp = open(file_, "r")
-            lines = fp.readlines()
-            fp.close()
-            for line in lines:
-                f.write(line)
-        f.close()
+            with open(file_, "r") as fp:
+                for line in fp:
+                    f.write(line)
 
 
 def append_to_file(source_file, append_file, ignore_first_row=False):
@@ -159,26 +153,14 @@ def append_to_file(source_file, append_file, ignore_first_row=False):
 
     flag = True
     try:
-        # read file to append into memory...hopefully will never get in GB range in terms of file size
-        fp = codecs.open(append_file, "r", encoding="utf-8")
-        lines = fp.readlines()
-        fp.close()
-        with codecs.open(source_file, "a", encoding="utf-8") as f:
-            if ignore_first_row == False:
-                for line in lines:
-                    f.write(line)
-            else:
-                # check if only a header row in file?
-                if len(lines) > 1:
-                    for x in range(1, len(lines)):
-                        f.write(lines[x])
-                        # get out to avoid out of index exception
-                        # if I change the for loop to be
-                        # for x in range(1, len(lines)-1):
-                        # it will not process files with two rows only ( a header and a single data row! )
-                        if x == len(lines) - 1:
-                            break
-
+        # copy the file to append line by line rather than reading it into memory
+        with codecs.open(append_file, "r", encoding="utf-8") as fp:
+            with codecs.open(source_file, "a", encoding="utf-8") as f:
+                line_counter = 0
+                for line in fp:
+                    if ignore_first_row == False or line_counter != 0:
+                        f.write(line)
+                    line_counter += 1
     except Exception:
         flag = False
     return flag
@@ -207,6 +189,334 @@ def _format_headers(headers_in_file, file):
     return headers_in_file
 
 
+def _read_rows(file_path, dialect):
+    """
+    Reads a delimited text file row by row.
+
+    :param file_path: The fully qualified file path.
+    :type file_path: str
+    :param dialect: The csv dialect of the file: 'excel' for comma separated or 'excel-tab' for tab separated files.
+    :type dialect: str
+    :return: A generator returning each row as a list of strings.
+    :rtype: generator of [str]
+    """
+
+    with open(file_path) as f:
+        reader = csv.reader(f, dialect=dialect)
+        for row in reader:
+            yield row
+
+
+def _get_unique_headers_from_files(file_list, dialect):
+    """
+    Gets a list of alphabetically sorted headers from the first row of each file.
+
+    Empty headers are replaced by a unique name (refer to :func:`_format_headers`).
+
+    :param file_list: List of fully qualified file path.
+    :type file_list: [str]
+    :param dialect: The csv dialect of the files.
+    :type dialect: str
+    :return: List of unique headers, list of files which could not be read and their exception.
+    :rtype: [str], [str]
+    """
+
+    headers_unique = set()
+    errors = []
+    for file_ in file_list:
+        try:
+            for row in _read_rows(file_, dialect):
+                headers_unique.update(_format_headers(row, file_))
+                # only the header row is required
+                break
+        except Exception as e:
+            errors.append(
+                "File: {} failed to read headers with exception: {}".format(file_, e)
+            )
+    return sorted(headers_unique), errors
+
+
+def _get_column_mapper(unique_headers, headers_in_file):
+    """
+    Maps each unique header to the index of the same header in a file.
+
+    :param unique_headers: The unique headers of all files combined.
+    :type unique_headers: [str]
+    :param headers_in_file: The headers of a single file.
+    :type headers_in_file: [str]
+    :return: List of column indices in the file, -1 where the file does not contain the header.
+    :rtype: [int]
+    """
+
+    header_indices = {}
+    for index, header in enumerate(headers_in_file):
+        # keep the first index of duplicate headers
+        if header not in header_indices:
+            header_indices[header] = index
+    return [header_indices.get(header, -1) for header in unique_headers]
+
+
+def _map_row(row, column_mapper):
+    """
+    Maps the values of a row to the unique headers.
+
+    :param row: A data row of a file.
+    :type row: [str]
+    :param column_mapper: Column index in the row for each unique header, -1 where the header does not exist in the file.
+    :type column_mapper: [int]
+    :return: The padded row.
+    :rtype: [str]
+    """
+
+    padded_row = []
+    for cm in column_mapper:
+        if cm == -1:
+            # this column does not exist in this file
+            padded_row.append("N/A")
+        elif cm >= len(row):
+            # less columns in row than mapper index
+            padded_row.append("index out of bounds")
+        else:
+            padded_row.append(row[cm])
+    return padded_row
+
+
+def _get_files_to_combine(file_list, out_put_file_path):
+    """
+    Removes the combined file from the list of files to be combined.
+
+    :param file_list: List of fully qualified file path of files to be combined.
+    :type file_list: [str]
+    :param out_put_file_path: The fully qualified file path of the combined file.
+    :type out_put_file_path: str
+    :return: List of files to be combined.
+    :rtype: [str]
+    """
+
+    out_put_file_path = os.path.normcase(os.path.abspath(out_put_file_path))
+    return [
+        file_
+        for file_ in file_list
+        if os.path.normcase(os.path.abspath(file_)) != out_put_file_path
+    ]
+
+
+def _get_row_writer(f, dialect):
+    """
+    Returns a function writing a row to an open file.
+
+    :param f: The open file.
+    :type f: file
+    :param dialect: The csv dialect: 'excel-tab' for tab separated or 'excel' for comma separated rows.
+    :type dialect: str
+    :return: Function writing a single row.
+    :rtype: func(row)
+    """
+
+    if dialect == "excel-tab":
+        # tab separated files are written without quoting
+        def write_row(row):
+            f.write("\t".join(row) + "\n")
+
+        return write_row
+    return csv.writer(f, dialect=dialect).writerow
+
+
+def _write_file_rows(file_, headers, dialect, write_row):
+    """
+    Reads a file row by row, maps each data row to the unique headers and writes it.
+
+    :param file_: Fully qualified file path of the file to be combined.
+    :type file_: str
+    :param headers: The unique headers of all files combined.
+    :type headers: [str]
+    :param dialect: The csv dialect of the file.
+    :type dialect: str
+    :param write_row: Function writing a single row.
+    :type write_row: func(row)
+    :return: An error message if the file failed to combine, otherwise None.
+    :rtype: str or None
+    """
+
+    try:
+        column_mapper = None
+        for row in _read_rows(file_, dialect):
+            if column_mapper is None:
+                # header row: match up unique headers with headers from this file
+                column_mapper = _get_column_mapper(headers, _format_headers(row, file_))
+            elif len(row) > 0:
+                write_row(_map_row(row, column_mapper))
+    except Exception as e:
+        return "File: {} failed to combine with exception: {}".format(file_, e)
+    return None
+
+
+def combine_files_header_independent_streamed(
+    file_list, out_put_file_path, dialect="excel-tab"
+):
+    """
+    Combines report files into one file, files may have different number / named columns.
+
+    Files are read row by row and rows are written to the combined file as they are read, so memory use does not depend on the file sizes:
+
+    - the unique headers are read from the first row of each file
+    - each file is then read and its rows are mapped to the unique headers and written to the combined file
+
+    Columns which are unique to some files will have as a value 'N/A' in files where those columns do not exist.
+    Empty rows are ignored. The combined file is not combined with itself if it is included in the list of files.
+
+    :param file_list: List of fully qualified file path of files to be combined.
+    :type file_list: [str]
+    :param out_put_file_path: The fully qualified file path of the combined file.
+    :type out_put_file_path: str
+    :param dialect: The csv dialect of the files: 'excel-tab' for tab separated (default) or 'excel' for comma separated files.
+    :type dialect: str, optional
+    :raises ValueError: If any file failed to combine. All other files are combined.
+    """
+
+    file_list = _get_files_to_combine(file_list, out_put_file_path)
+    headers, errors = _get_unique_headers_from_files(file_list, dialect)
+    with codecs.open(out_put_file_path, "w", encoding="utf-8") as result:
+        write_row = _get_row_writer(result, dialect)
+        write_row(headers)
+        for file_ in file_list:
+            error = _write_file_rows(file_, headers, dialect, write_row)
+            if error is not None:
+                errors.append(error)
+
+    # raise any errors
+    if len(errors) > 0:
+        raise ValueError("\n".join(errors))
+
+
+def _write_shard(file_list, headers, dialect, shard_file_path):
+    """
+    Combines files into a shard file without a header row. This is the unit of work executed by worker processes.
+
+    :param file_list: List of fully qualified file path of files to be combined into the shard.
+    :type file_list: [str]
+    :param headers: The unique headers of all files combined.
+    :type headers: [str]
+    :param dialect: The csv dialect of the files.
+    :type dialect: str
+    :param shard_file_path: The fully qualified file path of the shard file.
+    :type shard_file_path: str
+    :return: List of error messages of files which failed to combine, in file order.
+    :rtype: [str]
+    """
+
+    errors = []
+    with codecs.open(shard_file_path, "w", encoding="utf-8") as shard:
+        write_row = _get_row_writer(shard, dialect)
+        for file_ in file_list:
+            error = _write_file_rows(file_, headers, dialect, write_row)
+            if error is not None:
+                errors.append(error)
+    return errors
+
+
+def combine_files_header_independent_parallel(
+    file_list,
+    out_put_file_path,
+    dialect="excel-tab",
+    max_workers=None,
+    files_per_shard=20,
+):
+    """
+    Combines report files into one file using a pool of worker processes, files may have different number / named columns.
+
+    - the files are split into shards of consecutive files
+    - worker processes read the unique headers of each shard, then combine the files of each shard into a shard file
+    - shard files are appended to the combined file in file order as soon as all previous shards are done
+
+    The combined file is the same as the one written by :func:`combine_files_header_independent_streamed`.
+    Note: When using worker processes on Windows the calling script needs to be guarded by if __name__ == "__main__":
+
+    :param file_list: List of fully qualified file path of files to be combined.
+    :type file_list: [str]
+    :param out_put_file_path: The fully qualified file path of the combined file.
+    :type out_put_file_path: str
+    :param dialect: The csv dialect of the files: 'excel-tab' for tab separated (default) or 'excel' for comma separated files.
+    :type dialect: str, optional
+    :param max_workers: Number of worker processes. None uses the number of processors on the machine. 1 combines all files in this process.
+    :type max_workers: int, optional
+    :param files_per_shard: Number of files combined into a single shard file by a worker process, defaults to 20
+    :type files_per_shard: int, optional
+    :raises ValueError: If any file failed to combine. All other files are combined.
+    """
+
+    if max_workers == 1:
+        combine_files_header_independent_streamed(
+            file_list, out_put_file_path, dialect=dialect
+        )
+        return
+
+    # not available in all python versions, hence imported here
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    file_list = _get_files_to_combine(file_list, out_put_file_path)
+    shards = [
+        file_list[i : i + files_per_shard]
+        for i in range(0, len(file_list), files_per_shard)
+    ]
+    shard_directory = tempfile.mkdtemp()
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # read unique headers of each shard
+            headers = set()
+            header_errors_by_shard = {}
+            futures = {}
+            for index, shard_files in enumerate(shards):
+                future = executor.submit(
+                    _get_unique_headers_from_files, shard_files, dialect
+                )
+                futures[future] = index
+            for future in as_completed(futures):
+                shard_headers, shard_errors = future.result()
+                headers.update(shard_headers)
+                header_errors_by_shard[futures[future]] = shard_errors
+            headers = sorted(headers)
+
+            with codecs.open(out_put_file_path, "w", encoding="utf-8") as result:
+                _get_row_writer(result, dialect)(headers)
+
+            # combine shards and append them to the combined file in file order
+            errors_by_shard = {}
+            futures = {}
+            for index, shard_files in enumerate(shards):
+                future = executor.submit(
+                    _write_shard,
+                    shard_files,
+                    headers,
+                    dialect,
+                    os.path.join(shard_directory, "{}.shard".format(index)),
+                )
+                futures[future] = index
+            next_shard = 0
+            with open(out_put_file_path, "ab") as result:
+                for future in as_completed(futures):
+                    errors_by_shard[futures[future]] = future.result()
+                    while next_shard in errors_by_shard:
+                        shard_file_path = os.path.join(
+                            shard_directory, "{}.shard".format(next_shard)
+                        )
+                        with open(shard_file_path, "rb") as shard:
+                            shutil.copyfileobj(shard, result)
+                        os.remove(shard_file_path)
+                        next_shard += 1
+    finally:
+        shutil.rmtree(shard_directory, ignore_errors=True)
+
+    # raise any errors, in the same order as the streamed combiner
+    errors = []
+    for index in range(len(shards)):
+        errors.extend(header_errors_by_shard[index])
+    for index in range(len(shards)):
+        errors.extend(errors_by_shard[index])
+    if len(errors) > 0:
+        raise ValueError("\n".join(errors))
+
+
 def combine_files_header_independent(
     folder_path,
     file_prefix="",
@@ -220,6 +530,8 @@ def combine_files_header_independent(
     Columns which are unique to some files will have as a value 'N/A' in files where those columns do not exist.
     File need to use <tab> character as column separator
 
+    Files are combined row by row (refer to :func:`combine_files_header_independent_streamed`).
+
     :param folder_path: Folder path from which to get files to be combined and to which the combined file will be saved.
     :type folder_path: str
     :param file_prefix: Filter: File name starts with this value
@@ -230,54 +542,17 @@ def combine_files_header_independent(
     :type file_extension: str, format '.extension'
     :param out_put_file_name: The file name of the combined file, defaults to 'result.txt'
     :type out_put_file_name: str, optional
+    :raises ValueError: If any file failed to combine. All other files are combined.
     """
 
     file_list = glob.glob(
         folder_path + "\\" + file_prefix + "*" + file_suffix + file_extension
     )
-    # build list of unique headers
-    headers = get_unique_headers_tab(file_list)
-    combined_file_name = os.path.join(folder_path, out_put_file_name)
-    # loop over files to be combined
-    file_counter = 0
-    for file in file_list:
-        line_counter = 0
-        column_mapper = []
-        lines = read_tab_separated_file(file)
-        lines_to_be_transferred = []
-        for line in lines:
-            # read the headers in file
-            if line_counter == 0:
-                # replace any empty strings in header
-                headers_in_file = _format_headers(line, file)
-                # match up unique headers with headers from this file
-                # build header mapping
-                for unique_header in headers:
-                    if unique_header in headers_in_file:
-                        column_mapper.append(headers_in_file.index(unique_header))
-                    else:
-                        column_mapper.append(-1)
-            # ensure unique header is written to file
-            if file_counter == 0 and line_counter == 0:
-                lines_to_be_transferred.append(headers)
-            elif line_counter != 0:
-                padded_row = []
-                for cm in column_mapper:
-                    if cm == -1:
-                        # this column does not exist in this file
-                        padded_row.append("N/A")
-                    elif cm > len(line):
-                        # less columns in file than mapper index (should'nt happen??)
-                        padded_row.append("index out of bounds")
-                    else:
-                        padded_row.append(line[cm])
-                lines_to_be_transferred.append(padded_row)
-            line_counter += 1
-        # write file data to combined file
-        write_report_data(
-            combined_file_name, header=[], data=lines_to_be_transferred, write_type="a"
-        )
-        file_counter += 1
+    combine_files_header_independent_streamed(
+        file_list,
+        os.path.join(folder_path, out_put_file_name),
+        dialect="excel-tab",
+    )
 
 
 def combine_files_csv_header_independent(
@@ -293,6 +568,8 @@ def combine_files_csv_header_independent(
     Columns which are unique to some files will have as a value 'N/A' in files where those columns do not exist.
     File need to use <,> character as column separator. (.CSV)
 
+    Files are combined row by row (refer to :func:`combine_files_header_independent_streamed`).
+
     :param folder_path: Folder path from which to get files to be combined and to which the combined file will be saved.
     :type folder_path: str
     :param file_prefix: Filter: File name starts with this value
@@ -303,56 +580,17 @@ def combine_files_csv_header_independent(
     :type file_extension: str, format '.extension'
     :param out_put_file_name: The file name of the combined file, defaults to 'result.csv'
     :type out_put_file_name: str, optional
+    :raises ValueError: If any file failed to combine. All other files are combined.
     """
 
     file_list = glob.glob(
         folder_path + "\\" + file_prefix + "*" + file_suffix + file_extension
     )
-    # build list of unique headers
-    headers = get_unique_headers_csv(file_list)
-    combined_file_name = os.path.join(folder_path, out_put_file_name)
-
-    # loop over files and combine...
-    file_counter = 0
-    for file in file_list:
-        line_counter = 0
-        column_mapper = []
-        lines = read_csv_file(file, increaseMaxFieldSizeLimit=False)
-        lines_to_be_transferred = []
-        for line in lines:
-            # read the headers in file
-            if line_counter == 0:
-                # replace any empty strings in header
-                headers_in_file = _format_headers(line, file)
-                # match up unique headers with headers from this file
-                # build header mapping
-                for unique_header in headers:
-                    if unique_header in headers_in_file:
-                        column_mapper.append(headers_in_file.index(unique_header))
-                    else:
-                        column_mapper.append(-1)
-            # ensure unique header is written to file
-            if file_counter == 0 and line_counter == 0:
-                lines_to_be_transferred.append(headers)
-            elif line_counter != 0:
-                # map data columns to headers
-                padded_row = []
-                for cm in column_mapper:
-                    if cm == -1:
-                        # this column does not exist in this file
-                        padded_row.append("N/A")
-                    elif cm > len(line):
-                        # less columns in file than mapper index (should'nt happen??)
-                        padded_row.append("index out of bounds")
-                    else:
-                        padded_row.append(line[cm])
-                lines_to_be_transferred.append(padded_row)
-            line_counter += 1
-        # write file data to combined file
-        write_report_data_as_csv(
-            combined_file_name, header=[], data=lines_to_be_transferred, write_type="a"
-        )
-        file_counter += 1
+    combine_files_header_independent_streamed(
+        file_list,
+        os.path.join(folder_path, out_put_file_name),
+        dialect="excel",
+    )
 
 
 def combine_files_json(
@@ -29,8 +29,12 @@ Helper functions relating to retrieving file information.
 import glob
 
 from duHast.Utilities.files_io import get_file_name_without_ext
+from duHast.Utilities.files_json import read_json_data_from_file, write_json_to_file
 import os
 
+#: version of the directory scan cache file format, cache files of a different version are ignored
+SCAN_CACHE_VERSION = 1
+
 
 def get_files_single_directory(folder_path, file_prefix, file_suffix, file_extension):
     """
@@ -101,6 +105,182 @@ def get_files_from_directory_walker_with_filters_simple(folder_path, file_extens
     return files_found
 
 
+def _scan_directory(directory_path, file_extension):
+    """
+    Lists a single directory.
+
+    Uses os.scandir where available (the file size is taken from the directory entry) and falls back to os.listdir otherwise (IronPython).
+
+    :param directory_path: Fully qualified directory path.
+    :type directory_path: str
+    :param file_extension: Filter: File needs to have this file extension
+    :type file_extension: str, format '.extension'
+
+    :return: Sorted sub directory names and sorted [file name, file size] of files matching the file extension.
+    :rtype: [str], [[str, int]]
+    """
+
+    sub_directories = []
+    files = []
+    if hasattr(os, "scandir"):
+        for entry in os.scandir(directory_path):
+            if entry.is_dir(follow_symlinks=False):
+                sub_directories.append(entry.name)
+            elif entry.name.endswith(file_extension) and entry.is_file():
+                files.append([entry.name, entry.stat().st_size])
+    else:
+        for name in os.listdir(directory_path):
+            path = os.path.join(directory_path, name)
+            if os.path.isdir(path) and not os.path.islink(path):
+                sub_directories.append(name)
+            elif name.endswith(file_extension) and os.path.isfile(path):
+                files.append([name, os.path.getsize(path)])
+    sub_directories.sort()
+    files.sort()
+    return sub_directories, files
+
+
+def _scan_directory_cached(directory_path, file_extension, cache):
+    """
+    Lists a single directory unless its modified time matches the cache entry of a previous scan.
+
+    :return: Modified time, sorted sub directory names and sorted [file name, file size] of files matching the file extension.
+    :rtype: [float, [str], [[str, int]]]
+    """
+
+    modified_time = os.stat(directory_path).st_mtime
+    cached = cache.get(directory_path)
+    if cached is not None and cached[0] == modified_time:
+        return cached
+    sub_directories, files = _scan_directory(directory_path, file_extension)
+    return [modified_time, sub_directories, files]
+
+
+def _scan_directory_tree(directory_path, file_extension, cache):
+    """
+    Scans a directory and its sub directories.
+
+    Directories with the same modified time as recorded in the cache are not listed again. Their sub directories are still checked.
+
+    Note: A directory modified time changes when files are added, removed or renamed, not when a file is changed. \
+        File sizes of cached directories may therefore be out of date.
+
+    :param directory_path: Fully qualified directory path.
+    :type directory_path: str
+    :param file_extension: Filter: File needs to have this file extension
+    :type file_extension: str, format '.extension'
+    :param cache: Directory path to [modified time, sub directory names, [file name, file size]] of a previous scan.
+    :type cache: {str: [float, [str], [[str, int]]]}
+
+    :return: List of [fully qualified file path, file size] and the cache entries of all directories scanned.
+    :rtype: [[str, int]], {str: [float, [str], [[str, int]]]}
+    """
+
+    files_found = []
+    scanned = {}
+    stack = [directory_path]
+    while len(stack) > 0:
+        path = stack.pop()
+        try:
+            scanned[path] = _scan_directory_cached(path, file_extension, cache)
+        except OSError:
+            # directory got removed or can not be accessed
+            continue
+        modified_time, sub_directories, files = scanned[path]
+        for name, size in files:
+            files_found.append([os.path.join(path, name), size])
+        # depth first, in name order
+        for name in reversed(sub_directories):
+            stack.append(os.path.join(path, name))
+    return files_found, scanned
+
+
+def _read_scan_cache(cache_file_path, folder_path, file_extension):
+    """
+    Reads a directory scan cache file. Returns an empty cache if the file does not exist or was written for a different folder or file extension.
+
+    :return: Directory path to [modified time, sub directory names, [file name, file size]].
+    :rtype: {str: [float, [str], [[str, int]]]}
+    """
+
+    if cache_file_path is None or not os.path.exists(cache_file_path):
+        return {}
+    data = read_json_data_from_file(cache_file_path)
+    if (
+        data.get("version") != SCAN_CACHE_VERSION
+        or data.get("folder_path") != folder_path
+        or data.get("file_extension") != file_extension
+    ):
+        return {}
+    return data.get("directories", {})
+
+
+def get_files_from_directory_scan(
+    folder_path, file_extension, cache_file_path=None, max_workers=1
+):
+    """
+    Returns all files and their size in a directory and nested subdirectories where file name matches file extension filter value.
+
+    Each directory is listed once using os.scandir, which provides the file size without another call per file.
+
+    If a cache file path is provided, the scan result is stored in that file and on the next run directories \
+        which have not been modified since are not listed again.
+
+    :param folder_path: Root folder path from which to get files.
+    :type folder_path: str
+    :param file_extension: Filter: File needs to have this file extension
+    :type file_extension: str, format '.extension'
+    :param cache_file_path: Fully qualified file path of a json formatted scan cache file, defaults to None (no cache)
+    :type cache_file_path: str, optional
+    :param max_workers: Number of threads used to scan top level sub directories, defaults to 1 (scan in the calling thread). Values below 1 also scan in the calling thread, None uses the thread pool default.
+    :type max_workers: int, optional
+
+    :return: A list of [fully qualified file path, file size] of all files matching the file extension, in directory order.
+    :rtype: [[str, int]]
+    """
+
+    cache = _read_scan_cache(cache_file_path, folder_path, file_extension)
+    if max_workers is not None and max_workers <= 1:
+        files_found, scanned = _scan_directory_tree(folder_path, file_extension, cache)
+    else:
+        # only scan the top level directory here, then scan its sub directories in parallel
+        files_found, scanned = [], {}
+        sub_directories = []
+        try:
+            scanned[folder_path] = _scan_directory_cached(
+                folder_path, file_extension, cache
+            )
+            modified_time, sub_directories, files = scanned[folder_path]
+            files_found = [[os.path.join(folder_path, n), size] for n, size in files]
+        except OSError:
+            pass
+        if len(sub_directories) > 0:
+            # threads: listing directories is waiting on the file system, not the interpreter
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(
+                    lambda name: _scan_directory_tree(
+                        os.path.join(folder_path, name), file_extension, cache
+                    ),
+                    sub_directories,
+                )
+                for sub_files_found, sub_scanned in results:
+                    files_found.extend(sub_files_found)
+                    scanned.update(sub_scanned)
+    if cache_file_path is not None:
+        write_json_to_file(
+            {
+                "version": SCAN_CACHE_VERSION,
+                "folder_path": folder_path,
+                "file_extension": file_extension,
+                "directories": scanned,
+            },
+            cache_file_path,
+        )
+    return files_found
+
+
 def files_as_dictionary(
     folder_path, file_prefix, file_suffix, file_extension, include_sub_dirs=False
 ):
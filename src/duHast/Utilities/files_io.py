@@ -29,6 +29,7 @@ Helper functions relating to file IO operations.
 import os
 import shutil
 import re
+import threading
 
 # from System.IO import Path
 
@@ -49,6 +50,109 @@ def file_exist(full_file_path):
     return value
 
 
+def _map_file_paths(func, full_file_paths, max_workers=1):
+    """
+    Calls a function once for each unique file path, using a number of threads to overlap the wait for slow (network) file systems.
+
+    :param func: A function accepting a file path as argument.
+    :type func: func(str)
+    :param full_file_paths: List of fully qualified file paths
+    :type full_file_paths: [str]
+    :param max_workers: Maximum number of threads used, defaults to 1 (no additional threads)
+    :type max_workers: int, optional
+    :return: List of function return values in the same order as the file paths past in.
+    :rtype: [var]
+    """
+
+    unique_file_paths = list(set(full_file_paths))
+    value_by_file_path = {}
+
+    if max_workers <= 1 or len(unique_file_paths) < 2:
+        for file_path in unique_file_paths:
+            value_by_file_path[file_path] = func(file_path)
+    else:
+        file_paths_iterator = iter(unique_file_paths)
+        lock = threading.Lock()
+        # marks the end of the file paths (a file path could be None)
+        no_more_files = object()
+
+        def worker():
+            while True:
+                with lock:
+                    file_path = next(file_paths_iterator, no_more_files)
+                if file_path is no_more_files:
+                    return
+                value = func(file_path)
+                with lock:
+                    value_by_file_path[file_path] = value
+
+        threads = [
+            threading.Thread(target=worker)
+            for i in range(min(max_workers, len(unique_file_paths)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    return [value_by_file_path[file_path] for file_path in full_file_paths]
+
+
+def files_exist(full_file_paths, max_workers=1):
+    """
+    Checks whether files exist, using a number of threads to overlap the wait for slow (network) file systems.
+
+    Each unique file path is only checked once.
+
+    :param full_file_paths: List of fully qualified file paths
+    :type full_file_paths: [str]
+    :param max_workers: Maximum number of threads used to check files, defaults to 1 (no additional threads)
+    :type max_workers: int, optional
+    :return: List of flags in the same order as the file paths past in: True file exists, otherwise False
+    :rtype: [bool]
+    """
+
+    return _map_file_paths(file_exist, full_file_paths, max_workers=max_workers)
+
+
+def get_file_size_and_modified_time(full_file_path):
+    """
+    Returns the size and last modified time of a file.
+
+    :param full_file_path: Fully qualified file path
+    :type full_file_path: str
+    :return: Size in bytes and last modified time in seconds since the epoch, or None if the file does not exist.
+    :rtype: (int, float) or None
+    """
+
+    try:
+        if not os.path.isfile(full_file_path):
+            return None
+        file_stat = os.stat(full_file_path)
+        return (file_stat.st_size, file_stat.st_mtime)
+    except Exception:
+        return None
+
+
+def get_files_size_and_modified_time(full_file_paths, max_workers=1):
+    """
+    Returns the size and last modified time of files, using a number of threads to overlap the wait for slow (network) file systems.
+
+    Each unique file path is only checked once.
+
+    :param full_file_paths: List of fully qualified file paths
+    :type full_file_paths: [str]
+    :param max_workers: Maximum number of threads used to check files, defaults to 1 (no additional threads)
+    :type max_workers: int, optional
+    :return: List in the same order as the file paths past in of: size in bytes and last modified time, or None if a file does not exist.
+    :rtype: [(int, float) or None]
+    """
+
+    return _map_file_paths(
+        get_file_size_and_modified_time, full_file_paths, max_workers=max_workers
+    )
+
+
 def file_delete(full_file_path):
     """
     Deletes file.
@@ -33,11 +33,15 @@ import os
 MODULE_DIRECTORY = os.path.dirname(__file__)
 # build flow directory name
 TEST_DIRECTORY = os.path.dirname(MODULE_DIRECTORY)
-# build duHast and duHast sample directories
-DU_HAST_TEST_DIRECTORY = os.path.dirname(os.path.dirname(TEST_DIRECTORY))
-SAMPLE_FILES_DIRECTORY = os.path.join(DU_HAST_TEST_DIRECTORY, r"test/_rbp_flow/_sampleFiles")
+# build duHast sample directory
+SAMPLE_FILES_DIRECTORY = os.path.join(TEST_DIRECTORY, "_rbp_flow", "_sampleFiles")
 
 # data test file name
 JSON_GEO_DATA_TEST_FILE = "geo_data.json"
 # data fully qualified file path
-JSON_GEO_DATA_TEST_FILE_FULL = os.path.join(SAMPLE_FILES_DIRECTORY,JSON_GEO_DATA_TEST_FILE)
\ No newline at end of file
+JSON_GEO_DATA_TEST_FILE_FULL = os.path.join(SAMPLE_FILES_DIRECTORY,JSON_GEO_DATA_TEST_FILE)
+
+# multi level data test file: rooms and ceilings on three levels
+JSON_GEO_DATA_MULTI_LEVEL_TEST_FILE_FULL = os.path.join(
+    MODULE_DIRECTORY, "CeilingsToRooms_01", "geo_data_multi_level.json"
+)
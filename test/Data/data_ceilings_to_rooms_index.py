@@ -0,0 +1,199 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains ceiling to room intersection tests using a spatial index.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import os
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Utilities.files_io import get_directory_path_from_file_path
+from duHast.Data.Utils.data_import import ReadDataFromFile
+from duHast.Data.Objects import data_ceiling as dc
+from duHast.Data.Objects import data_room as dr
+from duHast.Data import data_to_shapely as dToS
+from duHast.Data import process_ceilings_to_rooms as ceilings_to_rooms
+
+#: rooms and ceilings on three levels, refer to EXPECTED_CEILINGS_BY_ROOM
+TEST_DATA_FILE = os.path.join(
+    get_directory_path_from_file_path(__file__),
+    "CeilingsToRooms_01",
+    "geo_data_multi_level.json",
+)
+
+#: expected ceiling ids per room id. The test file also contains ceilings which:
+#: - only touch a room along an edge (103) or at a corner (104)
+#: - overlap a room by less than 0.1 percent of the room area (105)
+#: - do not overlap any room (106, 108)
+#: - are on a level without rooms (109)
+EXPECTED_CEILINGS_BY_ROOM = {
+    1: [101, 102],
+    2: [102],
+    3: [107],
+}
+
+#: ceilings with no room on the same level overlapping their bounding box
+EXPECTED_CEILINGS_WITHOUT_CANDIDATES = [106, 108]
+
+
+def _get_brute_force_ceilings_by_room(data_source_path):
+    """
+    Intersects every ceiling with every room on the same level without a spatial index.
+
+    :return: Dictionary of room id to sorted ceiling ids.
+    :rtype: {int: [int]}
+    """
+
+    data_reader = ReadDataFromFile(data_source_path)
+    data_reader.load_data()
+    ceilings_by_room = {}
+    for level_name in data_reader.get_level_names():
+        rooms = data_reader.get_data_by_level_and_data_type(
+            level_name, dr.DataRoom.data_type
+        )
+        ceilings = data_reader.get_data_by_level_and_data_type(
+            level_name, dc.DataCeiling.data_type
+        )
+        room_polygons = dToS.get_shapely_polygons_from_geo_object(
+            rooms, dr.DataRoom.data_type
+        )
+        ceiling_polygons = dToS.get_shapely_polygons_from_geo_object(
+            ceilings, dc.DataCeiling.data_type
+        )
+        rooms_by_id = dict((r.instance_properties.id, r) for r in rooms)
+        ceilings_by_id = dict((c.instance_properties.id, c) for c in ceilings)
+        for room_id, polygons in room_polygons.items():
+            for room_polygon in polygons:
+                for ceiling_id, ceiling_polygon_list in ceiling_polygons.items():
+                    for ceiling_polygon in ceiling_polygon_list:
+                        ceilings_to_rooms._intersect_ceiling_vs_room(
+                            ceiling_id,
+                            ceiling_polygon,
+                            room_id,
+                            room_polygon,
+                            rooms_by_id,
+                            ceilings_by_id,
+                        )
+        for room in rooms:
+            ceilings_by_room[room.instance_properties.id] = sorted(
+                c.instance_properties.id for c in room.associated_elements
+            )
+    return ceilings_by_room
+
+
+class DataCeilingsToRoomsIndex(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataCeilingsToRoomsIndex, self).__init__(
+            test_name="ceilings to rooms spatial index"
+        )
+
+    def _check_index_candidates(self):
+        """
+        Checks spatial index candidates include every ceiling intersecting a room and exclude ceilings far away.
+        """
+
+        data_reader = ReadDataFromFile(TEST_DATA_FILE)
+        data_reader.load_data()
+        ceilings_with_candidates = set()
+        all_ceilings = set()
+        for level_name in data_reader.get_level_names():
+            room_polygons = dToS.get_shapely_polygons_from_geo_object(
+                data_reader.get_data_by_level_and_data_type(
+                    level_name, dr.DataRoom.data_type
+                ),
+                dr.DataRoom.data_type,
+            )
+            ceiling_polygons = dToS.get_shapely_polygons_from_geo_object(
+                data_reader.get_data_by_level_and_data_type(
+                    level_name, dc.DataCeiling.data_type
+                ),
+                dc.DataCeiling.data_type,
+            )
+            all_ceilings.update(ceiling_polygons.keys())
+            ceiling_index = dToS.build_polygon_index(ceiling_polygons)
+            for polygons in room_polygons.values():
+                for room_polygon in polygons:
+                    candidates = dToS.query_polygon_index(ceiling_index, room_polygon)
+                    candidate_ids = [entry[0] for entry in candidates]
+                    ceilings_with_candidates.update(candidate_ids)
+                    # brute force: every ceiling intersecting (or touching) the room must be a candidate
+                    for ceiling_id, ceiling_polygon_list in ceiling_polygons.items():
+                        for ceiling_polygon in ceiling_polygon_list:
+                            if ceiling_polygon.intersects(room_polygon):
+                                assert ceiling_id in candidate_ids, (
+                                    ceiling_id,
+                                    candidate_ids,
+                                )
+        assert len(all_ceilings) == 9
+        for ceiling_id in EXPECTED_CEILINGS_WITHOUT_CANDIDATES:
+            assert ceiling_id not in ceilings_with_candidates, ceiling_id
+        # an empty index returns no candidates
+        empty_index = dToS.build_polygon_index({})
+        assert empty_index[0] is None
+        assert dToS.query_polygon_index(empty_index, None) == []
+
+    def test(self):
+        """
+        Matches ceilings to rooms using the spatial index and compares the result with a brute force intersection of all ceilings and rooms.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+        try:
+            self._check_index_candidates()
+            return_value.append_message("Spatial index candidates checked.")
+
+            ceilings_result = ceilings_to_rooms.get_ceilings_by_room(TEST_DATA_FILE)
+            assert ceilings_result.status == True
+            ceilings_by_room = {}
+            for rooms, ceilings in ceilings_result.result.values():
+                for room in rooms:
+                    ceilings_by_room[room.instance_properties.id] = sorted(
+                        c.instance_properties.id for c in room.associated_elements
+                    )
+            brute_force_ceilings_by_room = _get_brute_force_ceilings_by_room(
+                TEST_DATA_FILE
+            )
+            assert ceilings_by_room == brute_force_ceilings_by_room, (
+                ceilings_by_room,
+                brute_force_ceilings_by_room,
+            )
+            assert ceilings_by_room == EXPECTED_CEILINGS_BY_ROOM, ceilings_by_room
+            return_value.append_message(
+                "Ceilings by room match brute force intersection: {}".format(
+                    ceilings_by_room
+                )
+            )
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
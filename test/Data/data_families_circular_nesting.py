@@ -34,6 +34,7 @@ from duHast.Utilities.files_io import get_directory_path_from_file_path
 from duHast.Utilities.Objects.result import Result
 from duHast.Revit.Family.Data.family_base_data_circular_referencing import (
     check_families_have_circular_references,
+    get_circular_references_in_library,
 )
 from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (NESTING_SEPARATOR)
 
@@ -145,6 +146,23 @@ class DataCircularNestingFamilies(test.Test):
                 test_files_directory=TEST_REPORT_DIRECTORY_MULTIPLE,
             )
             return_value.update(test_result_multiple)
+
+            # library wide circular references are returned as cycles of family name, family category
+            test_result_library = get_circular_references_in_library(
+                TEST_REPORT_DIRECTORY_MULTIPLE
+            )
+            assert test_result_library.status == True, test_result_library.message
+            assert test_result_library.result == [
+                [
+                    ("Label_Text_1_5mm_ANN", "Generic Annotations"),
+                    ("Sample_Family_Seven", "Electrical Fixtures"),
+                    ("Label_Text_Rotation_1_5mm_ANN", "Generic Annotations"),
+                    ("Label_Text_1_5mm_ANN", "Generic Annotations"),
+                ]
+            ], test_result_library.result
+            return_value.append_message(
+                "Library circular references: {}".format(test_result_library.result)
+            )
         except Exception as e:
             return_value.update_sep(
                 False,
@@ -0,0 +1,266 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains family data container storage uniqueness tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Revit.Family.Data.Objects.family_data_container import FamilyDataContainer
+from duHast.Revit.Family.Data.Objects.family_base_data_storage import (
+    FamilyBaseDataStorage,
+)
+from duHast.Revit.Categories.Data.Objects.category_data_storage import (
+    FamilyCategoryDataStorage,
+)
+from duHast.Revit.LinePattern.Data.Objects.line_pattern_data_storage import (
+    FamilyLinePatternDataStorage,
+)
+from duHast.Revit.SharedParameters.Data.Objects.shared_parameter_data_storage import (
+    FamilySharedParameterDataStorage,
+)
+from duHast.Revit.Warnings.Data.Objects.warnings_data_storage import (
+    FamilyWarningsDataStorage,
+)
+
+
+def _base(root_name_path):
+    """
+    Returns a family base storage instance of a family in the Generic Models category.
+    """
+
+    return FamilyBaseDataStorage(
+        root_name_path=root_name_path,
+        root_category_path="Generic Models",
+        family_name=root_name_path,
+        family_file_path="C:\\temp\\{}.rfa".format(root_name_path),
+    )
+
+
+def _category(root_name_path, name, element_id, use_counter=0):
+    """
+    Returns a category storage instance belonging to a family in the Generic Models category.
+    """
+
+    return FamilyCategoryDataStorage(
+        root_name_path=root_name_path,
+        root_category_path="Generic Models",
+        family_name=root_name_path,
+        family_file_path="-",
+        use_counter=use_counter,
+        used_by=None,
+        category_name="Generic Models",
+        sub_category_name=name,
+        sub_category_id=element_id,
+        category_graphics_style_three_d="-",
+        category_graphics_style_cut="-",
+        category_graphics_style_projection="-",
+        property_material_name="-",
+        property_material_id="-",
+        property_line_weight_cut_name="-",
+        property_line_weight_projection_name="-",
+        property_line_colour_red_name="-",
+        property_line_colour_green_name="-",
+        property_line_colour_blue="-",
+    )
+
+
+def _line_pattern(root_name_path, name, element_id, use_counter=0):
+    """
+    Returns a line pattern storage instance belonging to a family in the Generic Models category.
+    """
+
+    return FamilyLinePatternDataStorage(
+        root_name_path=root_name_path,
+        root_category_path="Generic Models",
+        family_name=root_name_path,
+        family_file_path="-",
+        use_counter=use_counter,
+        used_by=None,
+        pattern_name=name,
+        pattern_id=element_id,
+    )
+
+
+def _shared_parameter(root_name_path, name, element_id, use_counter=0):
+    """
+    Returns a shared parameter storage instance belonging to a family in the Generic Models category.
+    """
+
+    return FamilySharedParameterDataStorage(
+        root_name_path=root_name_path,
+        root_category_path="Generic Models",
+        family_name=root_name_path,
+        family_file_path="-",
+        parameter_guid="guid-{}".format(element_id),
+        parameter_name=name,
+        parameter_id=element_id,
+        use_counter=use_counter,
+        used_by=None,
+    )
+
+
+def _warning(root_name_path, name, element_id, use_counter=0):
+    """
+    Returns a warnings storage instance belonging to a family in the Generic Models category.
+
+    The use counter past in is stored as the related element ids: it is not part of the warning identity.
+    """
+
+    return FamilyWarningsDataStorage(
+        root_name_path=root_name_path,
+        root_category_path="Generic Models",
+        family_name=root_name_path,
+        family_file_path="-",
+        warning_text=name,
+        warning_guid=element_id,
+        warning_related_ids=str(use_counter),
+        warning_other_ids="-",
+    )
+
+
+#: per storage type: name, storage property, identity keys property, storage factory and duplicate error message start
+STORAGE_TYPES = [
+    (
+        "category",
+        "category_data_storage",
+        "_category_storage_keys",
+        _category,
+        "Category storage is not unique",
+    ),
+    (
+        "line pattern",
+        "line_pattern_data_storage",
+        "_line_pattern_storage_keys",
+        _line_pattern,
+        "Line pattern storage is not unique",
+    ),
+    (
+        "shared parameter",
+        "shared_parameter_data_storage",
+        "_shared_parameter_storage_keys",
+        _shared_parameter,
+        "Shared parameter storage is not unique",
+    ),
+    (
+        "warnings",
+        "warnings_data_storage",
+        "_warnings_storage_keys",
+        _warning,
+        "Warnings storage is not unique",
+    ),
+]
+
+
+class DataFamiliesContainerUniqueStorage(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataFamiliesContainerUniqueStorage, self).__init__(
+            test_name="family data container unique storage"
+        )
+
+    def _expect_value_error(self, func, expected_message_start):
+        """
+        Calls func and checks it raises a value error starting with the expected message.
+        """
+
+        try:
+            func()
+        except ValueError as e:
+            assert str(e).startswith(expected_message_start), str(e)
+            return
+        raise AssertionError(
+            "Expected value error: {}".format(expected_message_start)
+        )
+
+    def test(self):
+        """
+        Adds unique and duplicate storage instances of all storage types to a family data container.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+        try:
+            container = FamilyDataContainer(family_base_data_storage=_base("Family_A"))
+            for name, storage_name, keys_name, factory, message in STORAGE_TYPES:
+                container.add_data_storage(factory("Family_A", "Dash", "101"))
+                container.add_data_storage(factory("Family_A", "Dot", "102"))
+                assert len(getattr(container, storage_name)) == 2, name
+                assert len(getattr(container, keys_name)) == 2, name
+
+                # identical instance
+                self._expect_value_error(
+                    lambda: container.add_data_storage(
+                        factory("Family_A", "Dash", "101")
+                    ),
+                    message,
+                )
+                # same identity but a different property not part of the identity
+                self._expect_value_error(
+                    lambda: container.add_data_storage(
+                        factory("Family_A", "Dash", "101", use_counter=3)
+                    ),
+                    message,
+                )
+                # different family nesting path takes precedence over uniqueness check
+                self._expect_value_error(
+                    lambda: container.add_data_storage(
+                        factory("Family_B", "Dash", "101")
+                    ),
+                    "other root_name_path and root_category_path must match current values",
+                )
+                assert len(getattr(container, storage_name)) == 2, name
+                assert len(getattr(container, keys_name)) == 2, name
+                return_value.append_message("Duplicate {} rejected.".format(name))
+
+            # a new family base storage with a different path wipes the container storage and identity keys
+            container.add_data_storage(_base("Family_B"))
+            for name, storage_name, keys_name, factory, message in STORAGE_TYPES:
+                assert len(getattr(container, storage_name)) == 0, name
+                assert len(getattr(container, keys_name)) == 0, name
+                # the identity of a wiped instance can be added again
+                container.add_data_storage(factory("Family_B", "Dash", "101"))
+                assert len(getattr(container, storage_name)) == 1, name
+                self._expect_value_error(
+                    lambda: container.add_data_storage(
+                        factory("Family_B", "Dash", "101")
+                    ),
+                    message,
+                )
+                return_value.append_message(
+                    "{} added after family base storage changed.".format(
+                        name.capitalize()
+                    )
+                )
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
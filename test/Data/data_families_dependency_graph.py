@@ -0,0 +1,118 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains family dependency graph circular reference tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2024, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Revit.Family.Data.Objects.family_dependency_graph import (
+    FamilyDependencyGraph,
+)
+from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (
+    NESTING_SEPARATOR,
+)
+
+#: number of families in a nesting chain without circular references
+CHAIN_LENGTH = 5000
+
+
+def _path(*nodes):
+    """
+    Returns a family name nesting path and family category nesting path from (family name, family category) tuples.
+    """
+
+    return (
+        NESTING_SEPARATOR.join([node[0] for node in nodes]),
+        NESTING_SEPARATOR.join([node[1] for node in nodes]),
+    )
+
+
+class DataFamiliesDependencyGraph(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataFamiliesDependencyGraph, self).__init__(
+            test_name="family dependency graph circular references"
+        )
+
+    def test(self):
+        """
+        Finds circular references in a family dependency graph.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+        try:
+            a = ("Family_A", "Generic Models")
+            b = ("Family_B", "Generic Models")
+            c = ("Family_C", "Generic Annotations")
+            d = ("Family_D", "Generic Annotations")
+            # same name as family D but different category
+            d_other = ("Family_D", "Furniture")
+            e = ("Family_E", "Furniture")
+
+            graph = FamilyDependencyGraph()
+            # A nests B nests C, C nests A as a separate root family: circular across root families
+            graph.add_nesting_path(*_path(a, b, c))
+            graph.add_nesting_path(*_path(c, a))
+            # D nests itself via E
+            graph.add_nesting_path(*_path(d, e, d))
+            # no circular reference: category differs
+            graph.add_nesting_path(*_path(d_other, b))
+            # family nesting itself
+            graph.add_nesting_path(*_path(e, e))
+
+            circular_references = graph.get_circular_references()
+            assert circular_references == [
+                [a, b, c, a],
+                [d, e, d],
+            ], circular_references
+            assert graph.get_circular_reference_nodes() == set([a, b, c, d, e])
+            return_value.append_message("Circular references found: {}".format(circular_references))
+
+            # deep nesting chain without circular references
+            chain = [("Family_{}".format(i), "Generic Models") for i in range(CHAIN_LENGTH)]
+            chain_graph = FamilyDependencyGraph()
+            for i in range(1, CHAIN_LENGTH):
+                chain_graph.add_edge(chain[i - 1], chain[i])
+            assert chain_graph.get_circular_references() == []
+            assert len(chain_graph.get_strongly_connected_components()) == CHAIN_LENGTH
+            # close the chain
+            chain_graph.add_edge(chain[-1], chain[0])
+            circular_references = chain_graph.get_circular_references()
+            assert len(circular_references) == 1
+            assert len(circular_references[0]) == CHAIN_LENGTH + 1
+            return_value.append_message("Deep nesting chain processed.")
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
@@ -0,0 +1,212 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains a benchmark finding missing families in large synthetic family libraries.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2024, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+
+
+import gc
+import os
+import time
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Revit.Family.Data.family_report_reader import read_data_into_families
+from duHast.Revit.Family.Data.family_base_data_missing_families import (
+    process_families,
+    get_unique_nested_families_from_path_data,
+    get_unique_root_families_from_family_data,
+    get_missing_families,
+)
+from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (
+    NESTING_SEPARATOR,
+)
+
+#: number of root families in the largest synthetic library
+NUMBER_OF_ROOT_FAMILIES = 12000
+#: depth of the nesting chain of missing families in each root family
+MISSING_NESTING_DEPTH = 3
+#: maximum allowed increase in processing time when doubling the number of families ( linear is 2, quadratic is 4 )
+MAX_SCALING_FACTOR = 3.0
+#: number of times each library is processed, the fastest time is used to reduce timing noise
+NUMBER_OF_RUNS = 3
+
+
+class DataMissingFamiliesBenchmark(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataMissingFamiliesBenchmark, self).__init__(
+            test_name="find missing families in large family library"
+        )
+
+    def _write_report(self, tmp_dir, file_name, number_of_roots):
+        """
+        Writes a synthetic family base report. Each root family nests:
+
+        - the next root family ( not missing )
+        - a chain of families which do not exist as root families ( missing )
+        """
+
+        rows = ["data_type,root_name_path,root_category_path,family_name,family_file_path"]
+        for i in range(number_of_roots):
+            root_name = "Root_Family_{}".format(i)
+            rows.append(
+                "FamilyBase,{},Generic Models,{},C:\\temp\\{}.rfa".format(
+                    root_name, root_name, root_name
+                )
+            )
+            # nest the next root family
+            next_root_name = "Root_Family_{}".format((i + 1) % number_of_roots)
+            rows.append(
+                "FamilyBase,{},{},{},-".format(
+                    root_name + NESTING_SEPARATOR + next_root_name,
+                    "Generic Models" + NESTING_SEPARATOR + "Generic Models",
+                    next_root_name,
+                )
+            )
+            # nest a chain of missing families
+            name_path = root_name
+            category_path = "Generic Models"
+            for depth in range(MISSING_NESTING_DEPTH):
+                nested_name = "Missing_Family_{}_{}".format(i, depth)
+                name_path = name_path + NESTING_SEPARATOR + nested_name
+                category_path = category_path + NESTING_SEPARATOR + "Generic Annotations"
+                rows.append(
+                    "FamilyBase,{},{},{},-".format(name_path, category_path, nested_name)
+                )
+        self.write_file_with_data(file_name, tmp_dir, rows)
+
+    def _time_missing_families(
+        self, tmp_dir, number_of_roots, number_of_runs=NUMBER_OF_RUNS
+    ):
+        """
+        Writes a synthetic library report, reads it into families and times finding the missing families.
+
+        Checks the longest nesting paths and missing families found.
+
+        :return: elapsed time in seconds ( fastest run )
+        :rtype: float
+        """
+
+        directory = os.path.join(tmp_dir, str(number_of_roots))
+        os.mkdir(directory)
+        self._write_report(directory, "FamilyBaseDataCombinedReport.csv", number_of_roots)
+        read_result = read_data_into_families(directory)
+        assert read_result.status == True
+        families = [family for family in read_result.result if family.is_root_family]
+        assert len(families) == number_of_roots
+
+        elapsed = None
+        for i in range(number_of_runs):
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.time()
+                families_longest_path = [
+                    entry[1] for entry in process_families(families, [])
+                ]
+                missing_families = get_missing_families(
+                    root_families=get_unique_root_families_from_family_data(families),
+                    nested_families=get_unique_nested_families_from_path_data(
+                        families_longest_path
+                    ),
+                )
+                elapsed_run = time.time() - start
+            finally:
+                gc.enable()
+            if elapsed is None or elapsed_run < elapsed:
+                elapsed = elapsed_run
+        # one longest path per nested chain
+        assert len(families_longest_path) == 2 * number_of_roots
+        assert len(missing_families) == number_of_roots * MISSING_NESTING_DEPTH
+        assert ("Missing_Family_0_0", "Generic Annotations") in missing_families
+        return elapsed
+
+    def test(self):
+        """
+        Finds missing families in synthetic libraries of increasing size and checks processing time scales near linear.
+
+        The timing check only runs if benchmarks are enabled (refer to :func:`test.utils.test.benchmarks_enabled`), otherwise the largest\
+            library is processed once and checked for correctness only.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+
+        def action(tmp_dir):
+            action_return_value = Result()
+            try:
+                if not test.benchmarks_enabled():
+                    elapsed = self._time_missing_families(
+                        tmp_dir, NUMBER_OF_ROOT_FAMILIES, number_of_runs=1
+                    )
+                    action_return_value.append_message(
+                        "Found missing families in {} root families in {:.3f}s. Timing check skipped, set {}=1 to run it.".format(
+                            NUMBER_OF_ROOT_FAMILIES,
+                            elapsed,
+                            test.RUN_BENCHMARKS_ENVIRONMENT_VARIABLE,
+                        )
+                    )
+                    return action_return_value.status, action_return_value.message
+                elapsed_half = self._time_missing_families(
+                    tmp_dir, NUMBER_OF_ROOT_FAMILIES // 2
+                )
+                elapsed_full = self._time_missing_families(
+                    tmp_dir, NUMBER_OF_ROOT_FAMILIES
+                )
+                scaling = elapsed_full / max(elapsed_half, 0.001)
+                action_return_value.append_message(
+                    "Found missing families in {} root families in {:.3f}s and {} root families in {:.3f}s. Scaling factor: {:.2f} (max {})".format(
+                        NUMBER_OF_ROOT_FAMILIES // 2,
+                        elapsed_half,
+                        NUMBER_OF_ROOT_FAMILIES,
+                        elapsed_full,
+                        scaling,
+                        MAX_SCALING_FACTOR,
+                    )
+                )
+                assert scaling < MAX_SCALING_FACTOR
+            except Exception as e:
+                action_return_value.update_sep(
+                    False,
+                    "An exception occurred in function {} : {}".format(
+                        self.test_name, e
+                    ),
+                )
+            return action_return_value.status, action_return_value.message
+
+        try:
+            flag, message = self.call_with_temp_directory(action)
+            return_value.update_sep(flag, message)
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
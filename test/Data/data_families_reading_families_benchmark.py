@@ -0,0 +1,187 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains a benchmark reading large synthetic family base reports into family instances.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+
+import gc
+import os
+import time
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Revit.Family.Data.family_report_reader import read_data_into_families
+from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (
+    NESTING_SEPARATOR,
+)
+
+#: number of report rows of the largest synthetic report
+NUMBER_OF_ROWS = 50000
+#: number of nested families per root family in the synthetic report
+NESTED_PER_ROOT = 4
+#: maximum allowed increase in read time when doubling the number of rows ( linear is 2, quadratic is 4 )
+MAX_SCALING_FACTOR = 3.0
+#: number of times each report is read, the fastest read is used to reduce timing noise
+NUMBER_OF_READS = 3
+#: number of report rows used when timing benchmarks are not enabled ( correctness check only )
+NUMBER_OF_ROWS_NO_TIMING = 5000
+
+
+class DataReadFamiliesBenchmark(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataReadFamiliesBenchmark, self).__init__(
+            test_name="read large family base report into family instances"
+        )
+
+    def _write_report(self, tmp_dir, file_name, number_of_rows):
+        """
+        Writes a synthetic family base report with root families and nested families to file.
+
+        :return: Number of root families written to the report.
+        :rtype: int
+        """
+
+        rows = ["data_type,root_name_path,root_category_path,family_name,family_file_path"]
+        number_of_roots = number_of_rows // (NESTED_PER_ROOT + 1)
+        for i in range(number_of_roots):
+            root_name = "Root_Family_{}".format(i)
+            root_category = "Generic Models"
+            rows.append(
+                "FamilyBase,{},{},{},C:\\temp\\{}.rfa".format(
+                    root_name, root_category, root_name, root_name
+                )
+            )
+            for j in range(NESTED_PER_ROOT):
+                nested_name = "Nested_Family_{}_{}".format(i, j)
+                rows.append(
+                    "FamilyBase,{},{},{},-".format(
+                        root_name + NESTING_SEPARATOR + nested_name,
+                        root_category + NESTING_SEPARATOR + "Generic Annotations",
+                        nested_name,
+                    )
+                )
+        self.write_file_with_data(file_name, tmp_dir, rows)
+        return number_of_roots
+
+    def _time_read(self, tmp_dir, number_of_rows, number_of_reads=NUMBER_OF_READS):
+        """
+        Writes a synthetic report and times reading it into families.
+
+        The report is read more than once and the fastest read time is returned. Garbage collection is disabled while reading,\
+            since collection passes triggered by the growing number of objects add noise to the timing.
+
+        :param number_of_reads: Number of times the report is read, defaults to NUMBER_OF_READS
+        :type number_of_reads: int, optional
+
+        :return: elapsed time in seconds
+        :rtype: float
+        """
+
+        directory = os.path.join(tmp_dir, str(number_of_rows))
+        os.mkdir(directory)
+        number_of_roots = self._write_report(
+            directory, "FamilyBaseDataCombinedReport.csv", number_of_rows
+        )
+        elapsed = None
+        for i in range(number_of_reads):
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.time()
+                read_result = read_data_into_families(directory)
+                elapsed_read = time.time() - start
+            finally:
+                gc.enable()
+            if elapsed is None or elapsed_read < elapsed:
+                elapsed = elapsed_read
+        assert read_result.status == True
+        assert len(read_result.result) == number_of_roots
+        for family in read_result.result:
+            assert len(family.nested_families_unsorted) == NESTED_PER_ROOT
+        return elapsed
+
+    def test(self):
+        """
+        Reads synthetic family base reports of increasing size and checks read time scales near linear.
+
+        The timing check only runs if benchmarks are enabled (refer to :func:`test.utils.test.benchmarks_enabled`), otherwise a single smaller\
+            report is read and checked for correctness only.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+
+        def action(tmp_dir):
+            action_return_value = Result()
+            try:
+                if not test.benchmarks_enabled():
+                    elapsed = self._time_read(
+                        tmp_dir, NUMBER_OF_ROWS_NO_TIMING, number_of_reads=1
+                    )
+                    action_return_value.append_message(
+                        "Read {} rows in {:.3f}s. Timing check skipped, set {}=1 to run it.".format(
+                            NUMBER_OF_ROWS_NO_TIMING,
+                            elapsed,
+                            test.RUN_BENCHMARKS_ENVIRONMENT_VARIABLE,
+                        )
+                    )
+                    return action_return_value.status, action_return_value.message
+                elapsed_half = self._time_read(tmp_dir, NUMBER_OF_ROWS // 2)
+                elapsed_full = self._time_read(tmp_dir, NUMBER_OF_ROWS)
+                scaling = elapsed_full / max(elapsed_half, 0.001)
+                action_return_value.append_message(
+                    "Read {} rows in {:.3f}s and {} rows in {:.3f}s. Scaling factor: {:.2f} (max {})".format(
+                        NUMBER_OF_ROWS // 2,
+                        elapsed_half,
+                        NUMBER_OF_ROWS,
+                        elapsed_full,
+                        scaling,
+                        MAX_SCALING_FACTOR,
+                    )
+                )
+                assert scaling < MAX_SCALING_FACTOR
+            except Exception as e:
+                action_return_value.update_sep(
+                    False,
+                    "An exception occurred in function {} : {}".format(
+                        self.test_name, e
+                    ),
+                )
+            return action_return_value.status, action_return_value.message
+
+        try:
+            flag, message = self.call_with_temp_directory(action)
+            return_value.update_sep(flag, message)
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
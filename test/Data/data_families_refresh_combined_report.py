@@ -0,0 +1,189 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains incremental combined family report refresh tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2024, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+
+
+import os
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Revit.Family.Data.family_report_utils import (
+    refresh_combined_report,
+    REPORT_MANIFEST_FILE_NAME,
+)
+from duHast.Revit.Family.Data.family_report_reader import read_data_into_families
+from duHast.Revit.Family.Data.Objects.family_base_data_processor_defaults import (
+    NESTING_SEPARATOR,
+)
+
+FAMILY_BASE_HEADER = "data_type,root_name_path,root_category_path,family_name,family_file_path"
+LINE_PATTERN_HEADER = "data_type,root_name_path,root_category_path,family_name,family_file_path,use_counter,used_by,pattern_name,pattern_id"
+
+
+class DataRefreshCombinedReport(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataRefreshCombinedReport, self).__init__(
+            test_name="refresh combined family report"
+        )
+
+    def _write_family_file(self, directory, family_name, content="family"):
+        """
+        Writes a stand in family file and returns its path.
+        """
+
+        self.write_file_with_data(family_name + ".rfa", directory, [content])
+        return os.path.join(directory, family_name + ".rfa")
+
+    def _write_report(self, directory, families, pattern_id="101"):
+        """
+        Writes a family base and line pattern report. Each root family contains one nested family.
+        """
+
+        os.mkdir(directory)
+        family_base_rows = [FAMILY_BASE_HEADER]
+        line_pattern_rows = [LINE_PATTERN_HEADER]
+        for family_name, family_file_path in families:
+            nested_name_path = family_name + NESTING_SEPARATOR + "Nested"
+            nested_category_path = "Generic Models" + NESTING_SEPARATOR + "Generic Models"
+            family_base_rows.append(
+                "FamilyBase,{},Generic Models,{},{}".format(
+                    family_name, family_name, family_file_path
+                )
+            )
+            family_base_rows.append(
+                "FamilyBase,{},{},Nested,-".format(nested_name_path, nested_category_path)
+            )
+            line_pattern_rows.append(
+                "LinePattern,{},{},Nested,-,1,None,Dash,{}".format(
+                    nested_name_path, nested_category_path, pattern_id
+                )
+            )
+        self.write_file_with_data("FamilyBaseDataCombinedReport.csv", directory, family_base_rows)
+        self.write_file_with_data("FamilyLinePatternsCombinedReport.csv", directory, line_pattern_rows)
+
+    def _get_message_line(self, message, start):
+        """
+        Returns the first message line starting with start.
+        """
+
+        for line in message.split("\n"):
+            if line.startswith(start):
+                return line
+        return None
+
+    def test(self):
+        """
+        Refreshes a combined report a number of times and checks only changed families get re-parsed.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+
+        def action(tmp_dir):
+            action_return_value = Result()
+            try:
+                family_directory = os.path.join(tmp_dir, "families")
+                os.mkdir(family_directory)
+                families = [
+                    (name, self._write_family_file(family_directory, name))
+                    for name in ["Family_A", "Family_B", "Family_C"]
+                ]
+                combined_directory = os.path.join(tmp_dir, "combined")
+                self._write_report(combined_directory, families)
+                empty_directory = os.path.join(tmp_dir, "empty")
+                os.mkdir(empty_directory)
+
+                # no manifest yet: all families get re-parsed
+                refresh_result = refresh_combined_report(combined_directory, empty_directory)
+                assert refresh_result.status == True, refresh_result.message
+                assert len(refresh_result.result) == 3
+                assert os.path.exists(os.path.join(combined_directory, REPORT_MANIFEST_FILE_NAME))
+                assert self._get_message_line(refresh_result.message, "0 families unchanged, 3 families re-parsed.") is not None
+                action_return_value.append_message("First refresh re-parsed all families.")
+
+                # nothing changed
+                refresh_result = refresh_combined_report(combined_directory, empty_directory)
+                assert refresh_result.status == True, refresh_result.message
+                assert len(refresh_result.result) == 0
+                assert self._get_message_line(refresh_result.message, "3 families unchanged, 0 families re-parsed.") is not None
+                action_return_value.append_message("Unchanged refresh re-parsed no families.")
+
+                # family file changed on file server and a family got deleted
+                self._write_family_file(family_directory, "Family_B", "family changed")
+                os.remove(families[2][1])
+                refresh_result = refresh_combined_report(combined_directory, empty_directory)
+                assert refresh_result.status == True, refresh_result.message
+                assert [family.family_name for family in refresh_result.result] == ["Family_B"]
+                assert self._get_message_line(refresh_result.message, "Removed family: {}".format(families[2][1])) is not None
+                assert self._get_message_line(refresh_result.message, "1 families unchanged, 1 families re-parsed.") is not None
+                action_return_value.append_message("Changed family file re-parsed and deleted family removed.")
+
+                # new report with changed report rows of a family
+                new_directory = os.path.join(tmp_dir, "new")
+                self._write_report(new_directory, [families[0]], pattern_id="202")
+                refresh_result = refresh_combined_report(combined_directory, new_directory)
+                assert refresh_result.status == True, refresh_result.message
+                assert [family.family_name for family in refresh_result.result] == ["Family_A"]
+                assert self._get_message_line(refresh_result.message, "1 families unchanged, 1 families re-parsed.") is not None
+
+                # check combined report content
+                read_result = read_data_into_families(combined_directory)
+                assert read_result.status == True, read_result.message
+                root_families = sorted(
+                    [family for family in read_result.result if family.is_root_family],
+                    key=lambda family: family.family_name,
+                )
+                assert [family.family_name for family in root_families] == ["Family_A", "Family_B"]
+                with open(os.path.join(combined_directory, "FamilyLinePatternsCombinedReport.csv")) as f:
+                    line_pattern_rows = [row for row in f.read().splitlines() if row]
+                assert len(line_pattern_rows) == 3
+                assert line_pattern_rows[1].startswith("LinePattern,Family_A")
+                assert line_pattern_rows[1].endswith(",202")
+                action_return_value.append_message("New report rows replaced combined report rows.")
+            except Exception as e:
+                action_return_value.update_sep(
+                    False,
+                    "An exception occurred in function {} : {}".format(
+                        self.test_name, e
+                    ),
+                )
+            return action_return_value.status, action_return_value.message
+
+        try:
+            flag, message = self.call_with_temp_directory(action)
+            return_value.update_sep(flag, message)
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
@@ -0,0 +1,239 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains family report cache tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2024, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+
+import os
+import shutil
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Utilities.files_io import get_directory_path_from_file_path
+from duHast.Revit.Family.Data.family_report_reader import (
+    read_data_into_family_containers,
+)
+from duHast.Revit.Family.Data.family_report_cache import (
+    REPORT_CACHE_FILE_NAME,
+    get_report_cache_rows_file_path,
+)
+from duHast.Revit.Family.Data.Objects.family_data_container_lazy import (
+    FamilyDataContainerLazy,
+    STORAGE_PROPERTIES,
+)
+
+TEST_REPORT_DIRECTORY_MULTIPLE = os.path.join(
+    get_directory_path_from_file_path(__file__), "ReadContainer_02"
+)
+
+#: container storage lists compared between containers read from file and from cache
+STORAGE_LISTS = [value[1] for value in STORAGE_PROPERTIES.values()]
+
+#: container storage key sets compared between containers read from file and from cache
+STORAGE_KEY_SETS = [
+    value[2] for value in STORAGE_PROPERTIES.values() if value[2] is not None
+]
+
+
+def _get_containers_by_key(containers):
+    """
+    Returns a dictionary of family nesting path and family category nesting path to container.
+    """
+
+    return dict(
+        ((c.family_nesting_path, c.family_category_nesting_path), c)
+        for c in containers
+    )
+
+
+class DataFamiliesReportCache(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataFamiliesReportCache, self).__init__(
+            test_name="family report cache"
+        )
+
+    def _compare_containers(self, expected_containers, cached_containers):
+        """
+        Checks containers read from cache match containers read from report files.
+        """
+
+        expected = _get_containers_by_key(expected_containers)
+        cached = _get_containers_by_key(cached_containers)
+        assert sorted(expected.keys()) == sorted(cached.keys())
+        for key, expected_container in expected.items():
+            cached_container = cached[key]
+            assert isinstance(cached_container, type(expected_container))
+            assert cached_container.family_name == expected_container.family_name
+            assert (
+                cached_container.family_category == expected_container.family_category
+            )
+            assert (
+                cached_container.family_file_path
+                == expected_container.family_file_path
+            )
+            assert cached_container.is_root_family == expected_container.is_root_family
+            for storage_list_name in STORAGE_LISTS:
+                expected_storage = getattr(expected_container, storage_list_name)
+                cached_storage = getattr(cached_container, storage_list_name)
+                assert len(cached_storage) == len(expected_storage)
+                for expected_instance, cached_instance in zip(
+                    expected_storage, cached_storage
+                ):
+                    assert type(cached_instance) is type(expected_instance)
+                    assert cached_instance == expected_instance
+                    assert [
+                        (type(used_by), vars(used_by))
+                        for used_by in getattr(cached_instance, "used_by", [])
+                    ] == [
+                        (type(used_by), vars(used_by))
+                        for used_by in getattr(expected_instance, "used_by", [])
+                    ]
+            for key_set_name in STORAGE_KEY_SETS:
+                assert getattr(cached_container, key_set_name) == getattr(
+                    expected_container, key_set_name
+                )
+            # once all storage is loaded the container properties match
+            assert sorted(vars(cached_container).keys()) == sorted(
+                vars(expected_container).keys()
+            )
+
+    def test(self):
+        """
+        Reads a report into family containers with and without cache and checks the results match.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+
+        def action(tmp_dir):
+            action_return_value = Result()
+            try:
+                for file_name in os.listdir(TEST_REPORT_DIRECTORY_MULTIPLE):
+                    shutil.copy(
+                        os.path.join(TEST_REPORT_DIRECTORY_MULTIPLE, file_name),
+                        tmp_dir,
+                    )
+                cache_file_path = os.path.join(tmp_dir, REPORT_CACHE_FILE_NAME)
+
+                # without cache no cache file is written
+                expected_result = read_data_into_family_containers(tmp_dir)
+                assert expected_result.status == True
+                assert os.path.exists(cache_file_path) == False
+
+                # first read with cache writes the cache file
+                first_read_result = read_data_into_family_containers(
+                    tmp_dir, use_cache=True
+                )
+                assert first_read_result.status == True
+                assert os.path.exists(cache_file_path)
+                for data_type in STORAGE_PROPERTIES:
+                    assert os.path.exists(
+                        get_report_cache_rows_file_path(cache_file_path, data_type)
+                    )
+                assert "from cache" not in first_read_result.message
+                self._compare_containers(
+                    expected_result.result, first_read_result.result
+                )
+
+                # second read with cache reads the cache file
+                cached_read_result = read_data_into_family_containers(
+                    tmp_dir, use_cache=True
+                )
+                assert cached_read_result.status == True
+                assert "from cache" in cached_read_result.message
+                # storage instances are only created on first access
+                for container in cached_read_result.result:
+                    assert isinstance(container, FamilyDataContainerLazy)
+                    assert container.family_nesting_path is not None
+                    for storage_list_name in STORAGE_LISTS:
+                        assert (
+                            len(vars(container).get(storage_list_name, [])) == 0
+                        )
+                self._compare_containers(
+                    expected_result.result, cached_read_result.result
+                )
+                action_return_value.append_message(
+                    "Read {} family containers from cache.".format(
+                        len(cached_read_result.result)
+                    )
+                )
+
+                # storage uniqueness checks still work on containers read from cache
+                container = [
+                    c
+                    for c in cached_read_result.result
+                    if len(c.line_pattern_data_storage) > 0
+                ][0]
+                try:
+                    container.add_data_storage(container.line_pattern_data_storage[0])
+                    raise AssertionError("Duplicate line pattern storage was added.")
+                except ValueError:
+                    pass
+
+                # changing a report file invalidates the cache
+                report_file_path = os.path.join(
+                    tmp_dir, "FamilyBaseDataCombinedReport_multiple.csv"
+                )
+                with open(report_file_path, "r") as f:
+                    rows = f.readlines()
+                with open(report_file_path, "w") as f:
+                    f.writelines(rows[:-1])
+                changed_result = read_data_into_family_containers(
+                    tmp_dir, use_cache=True
+                )
+                assert changed_result.status == True
+                assert "Report files changed since cache was written" in (
+                    changed_result.message
+                )
+                self._compare_containers(
+                    read_data_into_family_containers(tmp_dir).result,
+                    changed_result.result,
+                )
+                action_return_value.append_message(
+                    "Cache re-written after report file changed."
+                )
+            except Exception as e:
+                action_return_value.update_sep(
+                    False,
+                    "An exception occurred in function {} : {}".format(
+                        self.test_name, e
+                    ),
+                )
+            return action_return_value.status, action_return_value.message
+
+        try:
+            flag, message = self.call_with_temp_directory(action)
+            return_value.update_sep(flag, message)
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
@@ -0,0 +1,163 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains vectorised point in polygon and polygon loop nesting tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import random
+
+import numpy as np
+from shapely.geometry import Point, Polygon
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Geometry import polygon_containment as pc
+
+#: concave polygon ( U shape ) with a 3D point
+CONCAVE_POLYGON = [
+    [0.0, 0.0, 0.0],
+    [10.0, 0.0],
+    [10.0, 10.0],
+    [7.0, 10.0],
+    [7.0, 3.0],
+    [3.0, 3.0],
+    [3.0, 10.0],
+    [0.0, 10.0],
+]
+
+
+def _square(x, y, width):
+    """
+    Returns a counter clockwise square polygon loop.
+
+    :rtype: [[float]]
+    """
+
+    return [[x, y], [x + width, y], [x + width, y + width], [x, y + width]]
+
+
+#: nested loops by name:
+#: - outer_a contains holes hole_a_1 and hole_a_2
+#: - island_a is within hole_a_1 and contains hole_island_a
+#: - outer_b is a separate exterior loop next to outer_a, it contains hole_b
+NESTED_LOOPS = {
+    "outer_a": _square(0.0, 0.0, 100.0),
+    "hole_a_1": _square(10.0, 10.0, 40.0),
+    "hole_a_2": _square(60.0, 60.0, 20.0),
+    "island_a": _square(15.0, 15.0, 20.0),
+    "hole_island_a": _square(20.0, 20.0, 5.0),
+    "outer_b": _square(200.0, 0.0, 50.0),
+    "hole_b": _square(210.0, 10.0, 10.0),
+}
+
+#: expected exterior loops and their holes, ordered by area
+EXPECTED_HIERARCHY = {
+    "outer_a": ["hole_a_1", "hole_a_2"],
+    "outer_b": ["hole_b"],
+    "island_a": ["hole_island_a"],
+}
+
+
+class DataPolygonContainment(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataPolygonContainment, self).__init__(test_name="polygon containment")
+
+    def _check_points_in_polygon(self):
+        """
+        Compares vectorised point in polygon results with shapely for random points.
+        """
+
+        random.seed(11)
+        # avoid points on the polygon boundary: their result is not defined
+        points = [
+            [
+                random.randint(-20, 220) / 20.0 + 0.025,
+                random.randint(-20, 220) / 20.0 + 0.025,
+            ]
+            for i in range(500)
+        ]
+        shapely_polygon = Polygon([p[:2] for p in CONCAVE_POLYGON])
+        expected = [shapely_polygon.contains(Point(p)) for p in points]
+        assert pc.points_in_polygon(points, CONCAVE_POLYGON).tolist() == expected
+        # orientation of the polygon does not matter
+        assert (
+            pc.points_in_polygon(points, CONCAVE_POLYGON[::-1]).tolist() == expected
+        )
+
+        polygons = [CONCAVE_POLYGON] + list(NESTED_LOOPS.values())
+        points_by_polygon = pc.points_in_polygons(points, polygons)
+        assert points_by_polygon.shape == (len(polygons), len(points))
+        for index, polygon in enumerate(polygons):
+            assert np.array_equal(
+                points_by_polygon[index], pc.points_in_polygon(points, polygon)
+            ), index
+
+        # empty input and degenerated polygons
+        assert pc.points_in_polygon([], CONCAVE_POLYGON).shape == (0,)
+        assert pc.points_in_polygon(points, [[0.0, 0.0], [1.0, 1.0]]).any() == False
+        assert pc.points_in_polygons([], polygons).shape == (len(polygons), 0)
+
+    def _check_loops_hierarchy(self):
+        """
+        Checks exterior and hole loops of nested loops given in random order.
+        """
+
+        names = list(NESTED_LOOPS.keys())
+        random.seed(5)
+        for i in range(10):
+            random.shuffle(names)
+            hierarchy = pc.build_loops_hierarchy([NESTED_LOOPS[n] for n in names])
+            hierarchy_by_name = dict(
+                (names[key], [names[hole] for hole in holes])
+                for key, holes in hierarchy.items()
+            )
+            assert hierarchy_by_name == EXPECTED_HIERARCHY, hierarchy_by_name
+            # exterior loops are ordered by area
+            assert list(hierarchy_by_name.keys()) == list(EXPECTED_HIERARCHY.keys())
+        assert pc.build_loops_hierarchy([]) == {}
+        assert pc.build_loops_hierarchy([_square(0.0, 0.0, 1.0)]) == {0: []}
+
+    def test(self):
+        """
+        Compares vectorised point in polygon results with shapely and builds a loop hierarchy from nested loops.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+        try:
+            self._check_points_in_polygon()
+            return_value.append_message("Points in polygon match shapely.")
+            self._check_loops_hierarchy()
+            return_value.append_message("Loop hierarchy matches expected hierarchy.")
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
@@ -29,7 +29,10 @@ This module contains data read from file tests .
 from test.utils import test
 import os
 
-from test.Data.data import JSON_GEO_DATA_TEST_FILE_FULL
+from test.Data.data import (
+    JSON_GEO_DATA_TEST_FILE_FULL,
+    JSON_GEO_DATA_MULTI_LEVEL_TEST_FILE_FULL,
+)
 from duHast.Data.Utils.data_import import ReadDataFromFile
 
 
@@ -51,10 +54,44 @@ class DataReadFromFile(test.Test):
         flag = True
         message = "-"
         try:
-                # read json file and convert into data objects
+            # read sample file exported from a model
             data_reader = ReadDataFromFile(JSON_GEO_DATA_TEST_FILE_FULL)
             data_reader.load_data()
-            
+            assert len(data_reader.data) == 2
+            assert data_reader.get_level_names() == ["LV 01"]
+
+            # read json file and convert into data objects
+            data_reader = ReadDataFromFile(JSON_GEO_DATA_MULTI_LEVEL_TEST_FILE_FULL)
+            data_reader.load_data()
+            assert len(data_reader.data) == 12
+
+            # check level and data type indexes match a full scan of the data
+            level_names = []
+            for d in data_reader.data:
+                if d.level.name not in level_names:
+                    level_names.append(d.level.name)
+            assert data_reader.get_level_names() == level_names
+            assert level_names == ["LV 01", "LV 02", "LV 03"]
+            for level_name in level_names:
+                assert data_reader.get_data_by_level(level_name) == [
+                    d for d in data_reader.data if d.level.name == level_name
+                ]
+                for data_type in data_reader.SUPPORTED_DATA_TYPES:
+                    assert data_reader.get_data_by_level_and_data_type(
+                        level_name, data_type
+                    ) == [
+                        d
+                        for d in data_reader.data
+                        if d.level.name == level_name and d.data_type == data_type
+                    ]
+            for data_type in data_reader.SUPPORTED_DATA_TYPES:
+                assert data_reader.get_data_by_type(data_type) == [
+                    d for d in data_reader.data if d.data_type == data_type
+                ]
+            assert data_reader.get_data_by_level("no such level") == []
+            message = "Indexed {} data objects on {} levels.".format(
+                len(data_reader.data), len(level_names)
+            )
 
             #flag_one, message_one = self.call_with_temp_directory(action_one)
             #flag_two, message_two = self.call_with_temp_directory(action_two)
@@ -0,0 +1,202 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains streamed room and ceiling data file reading tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed. 
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits; 
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+
+import json
+import os
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Data.Utils.data_import import ReadDataFromFile
+from duHast.Data.Objects import data_ceiling as dc
+from duHast.Data.Objects import data_room as dr
+
+
+def _data_object(data_type, element_id, level_name):
+    """
+    Returns a minimal json formatted room or ceiling data object.
+    """
+
+    return {
+        "data_type": data_type,
+        "instance_properties": {
+            "data_type": "instance_properties",
+            "id": element_id,
+            "properties": {},
+        },
+        "level": {
+            "data_type": "level",
+            "name": level_name,
+            "id": 1,
+            "offset_from_level": 0.0,
+        },
+    }
+
+
+def _export(level_name, first_id):
+    """
+    Returns a json formatted single export containing one room and one ceiling on the given level.
+    """
+
+    return {
+        "date processed": "2023_06_28_18_41_09",
+        "file name": "test_model",
+        dr.DataRoom.data_type: [
+            _data_object(dr.DataRoom.data_type, first_id, level_name)
+        ],
+        dc.DataCeiling.data_type: [
+            _data_object(dc.DataCeiling.data_type, first_id + 1, level_name)
+        ],
+    }
+
+
+class DataReadFromFileStreamed(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataReadFromFileStreamed, self).__init__(
+            test_name="data_read_from_file_streamed"
+        )
+
+    def test(self):
+        """
+        Reads a json lines file containing malformed lines in streamed mode.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+
+        # a room with an invalid level entry
+        bad_room = _data_object(dr.DataRoom.data_type, 99, "LV 01")
+        bad_room["level"] = "not a level"
+        rows = [
+            json.dumps(_export("LV 01", 1)),
+            "{this is not json",
+            "",
+            json.dumps([_export("LV 02", 3), _export("LV 03", 5)]),
+            json.dumps({"date processed": "-", dr.DataRoom.data_type: [bad_room]}),
+            json.dumps("just a string"),
+            # rooms are not a list, the ceiling on the same line is still loaded
+            json.dumps(
+                {
+                    "date processed": "-",
+                    dr.DataRoom.data_type: None,
+                    dc.DataCeiling.data_type: [
+                        _data_object(dc.DataCeiling.data_type, 7, "LV 04")
+                    ],
+                }
+            ),
+        ]
+        #: number of valid exports used to check debug messages do not grow with the file size
+        number_of_exports = 50
+
+        def action(tmp_dir):
+            action_return_value = Result()
+            try:
+                self.write_file_with_data("geo_data.jsonl", tmp_dir, rows)
+                file_path = os.path.join(tmp_dir, "geo_data.jsonl")
+
+                # load everything
+                data_reader = ReadDataFromFile(file_path)
+                data_reader.load_data_streamed()
+                assert len(data_reader.data) == 7
+                assert data_reader.get_level_names() == [
+                    "LV 01",
+                    "LV 02",
+                    "LV 03",
+                    "LV 04",
+                ]
+                assert [line[0] for line in data_reader.malformed_lines] == [
+                    2,
+                    5,
+                    6,
+                    7,
+                ]
+                action_return_value.append_message(
+                    "Malformed lines: {}".format(data_reader.malformed_lines)
+                )
+
+                # filter by level and data type while reading
+                data_reader = ReadDataFromFile(file_path)
+                data_reader.load_data_streamed(
+                    level_names=["LV 02", "LV 03"],
+                    data_types=[dc.DataCeiling.data_type],
+                )
+                assert [d.instance_properties.id for d in data_reader.data] == [4, 6]
+                assert data_reader.get_data_by_type(dr.DataRoom.data_type) == []
+                action_return_value.append_message(
+                    "Filtered data objects: {}".format(len(data_reader.data))
+                )
+
+                # debug messages are summarised rather than added per json document
+                self.write_file_with_data(
+                    "geo_data_single.jsonl", tmp_dir, [json.dumps(_export("LV 01", 1))]
+                )
+                single_reader = ReadDataFromFile(
+                    os.path.join(tmp_dir, "geo_data_single.jsonl")
+                )
+                single_reader.load_data_streamed()
+                self.write_file_with_data(
+                    "geo_data_large.jsonl",
+                    tmp_dir,
+                    [
+                        json.dumps(_export("LV 01", i * 2))
+                        for i in range(number_of_exports)
+                    ],
+                )
+                data_reader = ReadDataFromFile(
+                    os.path.join(tmp_dir, "geo_data_large.jsonl")
+                )
+                data_reader.load_data_streamed()
+                assert len(data_reader.data) == number_of_exports * 2
+                assert len(data_reader.debug_messages) == len(
+                    single_reader.debug_messages
+                ), data_reader.debug_messages
+                action_return_value.append_message(
+                    "Debug messages: {}".format(data_reader.debug_messages)
+                )
+            except Exception as e:
+                action_return_value.update_sep(
+                    False,
+                    "An exception occurred in function {} : {}".format(
+                        self.test_name, e
+                    ),
+                )
+            return action_return_value.status, action_return_value.message
+
+        try:
+            flag, message = self.call_with_temp_directory(action)
+            return_value.update_sep(flag, message)
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
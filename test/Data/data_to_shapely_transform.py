@@ -0,0 +1,169 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains polygon loop transformation tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import copy
+import math
+
+import numpy as np
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Data import data_to_shapely as dToS
+from duHast.Data.Objects.Properties.Geometry.geometry_polygon import DataPolygon
+
+#: rotation of the test polygon around the Z axis in degrees
+ROTATION_ANGLE = 30.0
+#: translation of the test polygon
+TRANSLATION = [945737.6456106724, 20545096.538269494, 176.24671916010493]
+
+
+def _get_per_point_coordinates(loop, rotation_coord, translation_coord):
+    """
+    Transforms loop points one at a time, the way points were transformed before the vectorised implementation.
+
+    :return: List of translated points
+    :rtype: [[float]]
+    """
+
+    matrix = np.transpose(
+        np.array(
+            [list(row) + [0.0] for row in rotation_coord]
+            + [list(translation_coord) + [1.0]]
+        )
+    )
+    coordinates = []
+    for point in loop:
+        z = point[2] if len(point) > 2 else 0.0
+        translated_point = np.dot(matrix, [point[0], point[1], z, 1.0])
+        coordinates.append(list(translated_point[:3]))
+    return coordinates
+
+
+class DataToShapelyTransform(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataToShapelyTransform, self).__init__(
+            test_name="polygon loop transformation"
+        )
+
+    def test(self):
+        """
+        Compares vectorised loop transformation with a per point transformation for a translated and rotated polygon.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+        try:
+            angle = math.radians(ROTATION_ANGLE)
+            rotation_coord = [
+                [math.cos(angle), -math.sin(angle), 0.0],
+                [math.sin(angle), math.cos(angle), 0.0],
+                [0.0, 0.0, 1.0],
+            ]
+            geometry_object = DataPolygon(
+                j={
+                    "translation_coord": list(TRANSLATION),
+                    "rotation_coord": copy.deepcopy(rotation_coord),
+                    # mix of 3D and 2D points
+                    "outer_loop": [
+                        [0.0, 0.0, 0.0],
+                        [10.0, 0.0, 0.0],
+                        [10.0, 5.0],
+                        [0.0, 5.0],
+                    ],
+                    "inner_loops": [
+                        [[2.0, 1.0], [4.0, 1.0], [4.0, 3.0], [2.0, 3.0]],
+                        # less than 3 points: ignored
+                        [[6.0, 1.0], [7.0, 1.0]],
+                    ],
+                }
+            )
+            original_geometry = copy.deepcopy(vars(geometry_object))
+
+            translation_matrix = dToS.get_translation_matrix(geometry_object)
+            original_matrix = translation_matrix.copy()
+
+            outer_loop = dToS.get_outer_loop_as_coordinates(
+                geometry_object, translation_matrix
+            )
+            expected_outer_loop = _get_per_point_coordinates(
+                geometry_object.outer_loop, rotation_coord, TRANSLATION
+            )
+            assert outer_loop.shape == (4, 3)
+            assert np.allclose(outer_loop, expected_outer_loop)
+            # the first point is moved by the translation only
+            assert np.allclose(outer_loop[0], TRANSLATION)
+            # the second point is rotated
+            assert np.allclose(
+                outer_loop[1],
+                [
+                    TRANSLATION[0] + 10.0 * math.cos(angle),
+                    TRANSLATION[1] + 10.0 * math.sin(angle),
+                    TRANSLATION[2],
+                ],
+            )
+
+            inner_loops = dToS.get_inner_loops_as_coordinates(
+                geometry_object, translation_matrix
+            )
+            assert len(inner_loops) == 1
+            assert np.allclose(
+                inner_loops[0],
+                _get_per_point_coordinates(
+                    geometry_object.inner_loops[0], rotation_coord, TRANSLATION
+                ),
+            )
+            return_value.append_message(
+                "Vectorised coordinates match per point coordinates."
+            )
+
+            # shapely points helpers return the same coordinates
+            outer_points = dToS.get_outer_loop_as_shapely_points(
+                geometry_object, translation_matrix
+            )
+            assert np.allclose(
+                [[p.x, p.y, p.z] for p in outer_points], expected_outer_loop
+            )
+
+            # inputs are not changed
+            assert np.array_equal(translation_matrix, original_matrix)
+            assert vars(geometry_object) == original_geometry
+            assert dToS.get_loop_as_coordinates([], translation_matrix).shape == (
+                0,
+                3,
+            )
+            return_value.append_message("Input geometry and matrix unchanged.")
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
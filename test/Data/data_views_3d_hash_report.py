@@ -0,0 +1,158 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains view template 3D hash report regression tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import json
+import multiprocessing
+import os
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Utilities.files_io import get_directory_path_from_file_path
+from duHast.Revit.Views.Reporting import views_data_3d_hash_report as hash_report
+
+#: directory containing view template data of two models and the expected report output
+TEST_DATA_DIRECTORY = os.path.join(
+    get_directory_path_from_file_path(__file__), "ViewTemplates_01"
+)
+
+#: view template data files, one per model
+TEST_DATA_FILES = [
+    os.path.join(TEST_DATA_DIRECTORY, "model_a.json"),
+    os.path.join(TEST_DATA_DIRECTORY, "model_b.json"),
+]
+
+#: flattened report output of the list based implementation, hash values replaced by their order of first occurrence
+EXPECTED_OUTPUT_FILE = os.path.join(TEST_DATA_DIRECTORY, "expected_flattened.json")
+
+
+def _get_canonical_rows(rows):
+    """
+    Replaces mapped hash values by the order of their first occurrence.
+
+    Mapped hash values depend on the hash values calculated, which may change with the python version or hash seed. Equal overrides
+    still share the same value and special values ( -1, 0, 1 ) are left unchanged.
+
+    :param rows: Flattened report rows.
+    :type rows: [{str: var}]
+    :return: Copy of the rows with canonical hash values.
+    :rtype: [{str: var}]
+    """
+
+    value_mapper = {}
+    canonical_rows = []
+    for row in rows:
+        canonical_row = dict(row)
+        value = row["hash_value"]
+        if value > 1 or value < -1:
+            if value not in value_mapper:
+                value_mapper[value] = len(value_mapper) + 3
+            canonical_row["hash_value"] = value_mapper[value]
+        canonical_rows.append(canonical_row)
+    return canonical_rows
+
+
+class DataViews3dHashReport(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataViews3dHashReport, self).__init__(
+            test_name="view template 3D hash report"
+        )
+
+    def test(self):
+        """
+        Converts view template data of two models into the flattened 3D hash report and compares it with the expected output.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+        try:
+            with open(EXPECTED_OUTPUT_FILE) as f:
+                expected = json.load(f)
+            report_result = hash_report.convert_vt_data_to_3d_flattened(TEST_DATA_FILES)
+            assert report_result.status == True, report_result.message
+            categories, filters = report_result.result
+            for rows, expected_rows, row_key in [
+                (categories, expected["categories"], "category"),
+                (filters, expected["filters"], "filter"),
+            ]:
+                # mapped hash values are a range starting at 3
+                mapped_values = set(
+                    row["hash_value"]
+                    for row in rows
+                    if row["hash_value"] > 1 or row["hash_value"] < -1
+                )
+                assert mapped_values == set(range(3, len(mapped_values) + 3)), (
+                    mapped_values
+                )
+                canonical_rows = _get_canonical_rows(rows)
+                assert len(canonical_rows) == len(expected_rows), (
+                    len(canonical_rows),
+                    len(expected_rows),
+                )
+                for row, expected_row in zip(canonical_rows, expected_rows):
+                    assert row == expected_row, (row, expected_row)
+                return_value.append_message(
+                    "{} rows match expected output: {}".format(row_key, len(rows))
+                )
+
+            # hash values calculated in worker processes match those calculated in this process
+            parallel_result = hash_report.convert_vt_data_to_3d_flattened(
+                TEST_DATA_FILES, max_workers=2
+            )
+            assert parallel_result.status == True, parallel_result.message
+            assert parallel_result.result == report_result.result
+            return_value.append_message("Parallel output matches sequential output.")
+
+            # spawned worker processes do not share this process hash seed (as on Windows)
+            storage_sequential = hash_report._get_category_hash_table_data_by_file(
+                hash_report._load_json_data(TEST_DATA_FILES)
+            )
+            storage_spawned = hash_report._get_category_hash_table_data_by_file_parallel(
+                TEST_DATA_FILES,
+                max_workers=2,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            assert list(storage_spawned.keys()) == list(storage_sequential.keys())
+            for key, storage in storage_sequential.items():
+                assert storage_spawned[key].hash_table == storage.hash_table, key
+                assert (
+                    storage_spawned[key].hash_table_filters
+                    == storage.hash_table_filters
+                ), key
+            return_value.append_message(
+                "Spawned worker hash tables match sequential hash tables."
+            )
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
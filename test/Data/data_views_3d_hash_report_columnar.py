@@ -0,0 +1,154 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains view template 3D hash report columnar file output tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import os
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Revit.Views.Reporting import views_data_3d_hash_report as hash_report
+from test.Data.data_views_3d_hash_report import TEST_DATA_FILES
+
+
+class DataViews3dHashReportColumnar(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataViews3dHashReportColumnar, self).__init__(
+            test_name="view template 3D hash report columnar output"
+        )
+
+    def test(self):
+        """
+        Writes the flattened 3D hash report of two models to columnar files and compares the rows read back with the flattened json report.
+
+        Requires pyarrow: without it, only checks that no files are written and the status returned is False.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            pa = None
+
+        def action(tmp_dir):
+            action_return_value = Result()
+            try:
+                if pa is None:
+                    write_result = (
+                        hash_report.write_vt_data_3d_flattened_to_columnar_files(
+                            TEST_DATA_FILES,
+                            os.path.join(tmp_dir, "categories.parquet"),
+                            os.path.join(tmp_dir, "filters.parquet"),
+                        )
+                    )
+                    assert write_result.status == False
+                    assert "pyarrow" in write_result.message
+                    assert write_result.result == []
+                    assert os.listdir(tmp_dir) == []
+                    action_return_value.append_message(
+                        "pyarrow is not installed: columnar output check skipped."
+                    )
+                    return action_return_value.status, action_return_value.message
+
+                report_result = hash_report.convert_vt_data_to_3d_flattened(
+                    TEST_DATA_FILES
+                )
+                assert report_result.status == True, report_result.message
+                categories, filters = report_result.result
+
+                for file_format in [
+                    hash_report.COLUMNAR_FORMAT_PARQUET,
+                    hash_report.COLUMNAR_FORMAT_ARROW,
+                ]:
+                    write_result = (
+                        hash_report.write_vt_data_3d_flattened_to_columnar_files(
+                            TEST_DATA_FILES,
+                            os.path.join(tmp_dir, "categories." + file_format),
+                            os.path.join(tmp_dir, "filters." + file_format),
+                            file_format=file_format,
+                        )
+                    )
+                    assert write_result.status == True, write_result.message
+                    category_file, filter_file = write_result.result
+                    for rows, file_path in [
+                        (categories, category_file),
+                        (filters, filter_file),
+                    ]:
+                        if file_format == hash_report.COLUMNAR_FORMAT_PARQUET:
+                            parquet_file = pq.ParquetFile(file_path)
+                            # one row group per model
+                            assert parquet_file.metadata.num_row_groups == len(
+                                TEST_DATA_FILES
+                            )
+                            written_rows = parquet_file.read().to_pylist()
+                        else:
+                            with pa.memory_map(file_path) as source:
+                                reader = pa.ipc.open_file(source)
+                                assert reader.num_record_batches == len(
+                                    TEST_DATA_FILES
+                                )
+                                written_rows = reader.read_all().to_pylist()
+                        assert written_rows == rows, file_path
+                    action_return_value.append_message(
+                        "{} rows match flattened report: {} categories, {} filters".format(
+                            file_format, len(categories), len(filters)
+                        )
+                    )
+
+                # unsupported formats are reported
+                write_result = hash_report.write_vt_data_3d_flattened_to_columnar_files(
+                    TEST_DATA_FILES,
+                    os.path.join(tmp_dir, "categories.csv"),
+                    os.path.join(tmp_dir, "filters.csv"),
+                    file_format="csv",
+                )
+                assert write_result.status == False
+                assert write_result.result == []
+            except Exception as e:
+                action_return_value.update_sep(
+                    False,
+                    "An exception occurred in function {} : {}".format(
+                        self.test_name, e
+                    ),
+                )
+            return action_return_value.status, action_return_value.message
+
+        try:
+            flag, message = self.call_with_temp_directory(action)
+            return_value.update_sep(flag, message)
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
@@ -0,0 +1,143 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains view graphics settings override lookup tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import os
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Utilities.files_io import get_directory_path_from_file_path
+from duHast.Revit.Views.Reporting.views_data_report import read_view_data_from_file
+from duHast.Revit.Views.Objects.Data.override_by_category import OverrideByCategory
+from duHast.Revit.Views.Objects.Data.override_by_filter import OverrideByFilter
+
+#: view template data file
+TEST_DATA_FILE = os.path.join(
+    get_directory_path_from_file_path(__file__),
+    "ViewTemplates_01",
+    "model_a.json",
+)
+
+
+def _get_differing_overrides_brute_force(source_overrides, other_overrides, get_key):
+    """
+    Compares every source override with every other override, the way differing overrides were found before the lookup dictionaries.
+
+    :return: Source overrides with a matching other override which is not equal.
+    :rtype: [:class:`.OverrideByBase`]
+    """
+
+    difference = []
+    for source_override in source_overrides:
+        for other_override in other_overrides:
+            if get_key(source_override) == get_key(other_override):
+                if source_override != other_override:
+                    difference.append(source_override)
+                break
+    return difference
+
+
+def _get_category_key(override):
+    return (override.main_category_name, override.sub_category_name)
+
+
+def _get_filter_key(override):
+    return override.filter_name
+
+
+class DataViewsGraphicsSettingsIndex(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataViewsGraphicsSettingsIndex, self).__init__(
+            test_name="view graphics settings override lookup"
+        )
+
+    def test(self):
+        """
+        Compares differing overrides found using lookup dictionaries with a brute force comparison.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+        try:
+            view_settings = read_view_data_from_file(file_path=TEST_DATA_FILE)
+            assert len(view_settings) == 2
+            for source in view_settings:
+                for other in view_settings:
+                    assert source.get_differing_category_overrides(
+                        other
+                    ) == _get_differing_overrides_brute_force(
+                        source.override_by_category,
+                        other.override_by_category,
+                        _get_category_key,
+                    )
+                    assert source.get_differing_filter_overrides(
+                        other
+                    ) == _get_differing_overrides_brute_force(
+                        source.override_by_filter,
+                        other.override_by_filter,
+                        _get_filter_key,
+                    )
+            source, other = view_settings
+            assert len(source.get_differing_category_overrides(other)) > 0
+            return_value.append_message("Differing overrides match brute force.")
+
+            # lookups are not added to the instance properties
+            assert "_category_index" not in vars(source)
+            assert "_category_index" not in source.to_json()
+
+            # the first override of a duplicate key is returned
+            duplicate = OverrideByCategory(
+                main_category_name=source.override_by_category[0].main_category_name,
+                sub_category_name=source.override_by_category[0].sub_category_name,
+            )
+            source.override_by_category.append(duplicate)
+            index = source.get_category_override_index()
+            assert len(index) == len(source.override_by_category) - 1
+            assert (
+                index[_get_category_key(duplicate)] is source.override_by_category[0]
+            )
+
+            # lookups are rebuilt when overrides are added or replaced
+            new_filter = OverrideByFilter(filter_name="new filter")
+            source.override_by_filter.append(new_filter)
+            assert source.get_filter_override_index()["new filter"] is new_filter
+            source.override_by_filter = [new_filter]
+            assert list(source.get_filter_override_index().keys()) == ["new filter"]
+            source.override_by_category = []
+            assert source.get_category_override_index() == {}
+            assert other.get_differing_category_overrides(source) == []
+            return_value.append_message("Lookups follow override changes.")
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
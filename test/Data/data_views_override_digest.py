@@ -0,0 +1,200 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains view override content digest tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import json
+import os
+import subprocess
+import sys
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Utilities.files_io import get_directory_path_from_file_path
+from duHast.Revit.Views.Reporting.views_data_report import read_view_data_from_file
+from duHast.Revit.Views.Reporting import views_data_3d_hash_report_utilities as utils
+from duHast.Revit.Views.Objects.Data.override_by_category import OverrideByCategory
+from duHast.Revit.Views.Objects.Data.override_by_filter import OverrideByFilter
+
+#: view template data file
+TEST_DATA_FILE = os.path.join(
+    get_directory_path_from_file_path(__file__),
+    "ViewTemplates_01",
+    "model_a.json",
+)
+
+#: script printing the digests of all category overrides in the test data file
+DIGEST_SCRIPT = """
+import sys
+from duHast.Revit.Views.Reporting.views_data_report import read_view_data_from_file
+for setting in read_view_data_from_file(file_path=sys.argv[1]):
+    for override in setting.override_by_category:
+        print(override.get_digest())
+"""
+
+
+def _get_digests(view_settings):
+    """
+    Returns the digests of all category overrides.
+    """
+
+    return [
+        override.get_digest()
+        for setting in view_settings
+        for override in setting.override_by_category
+    ]
+
+
+def _get_first_category_override():
+    """
+    Returns the first category override read from the test data file (without a digest computed).
+    """
+
+    return read_view_data_from_file(file_path=TEST_DATA_FILE)[0].override_by_category[0]
+
+
+class DataViewsOverrideDigest(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DataViewsOverrideDigest, self).__init__(
+            test_name="view override digest"
+        )
+
+    def _check_digest_matches_equality(self, view_settings):
+        """
+        Checks overrides with equal digests are equal and overrides with different digests are not.
+        """
+
+        overrides = [
+            override
+            for setting in view_settings
+            for override in setting.override_by_category + setting.override_by_filter
+        ]
+        assert len(overrides) == 9
+        for override_a in overrides:
+            for override_b in overrides:
+                assert (override_a.get_digest() == override_b.get_digest()) == (
+                    override_a == override_b
+                ), (override_a, override_b)
+        assert len(set(o.get_digest() for o in overrides)) > 1
+
+        # pattern settings are compared by name only
+        override = _get_first_category_override()
+        other = _get_first_category_override()
+        other.override_projection.pattern_background.fill_pattern_setting.id = 12345
+        assert override == other
+        assert override.get_digest() == other.get_digest()
+        # changed nested value
+        other = _get_first_category_override()
+        other.override_cut.line_cut.colour.red = (
+            other.override_cut.line_cut.colour.red + 1
+        )
+        assert override != other
+        assert override.get_digest() != other.get_digest()
+        # category and filter overrides do not share digests
+        assert (
+            OverrideByCategory().get_digest() != OverrideByFilter().get_digest()
+        )
+
+    def _check_digest_cached(self):
+        """
+        Checks the digest is computed once and not added to the instance properties.
+        """
+
+        override = _get_first_category_override()
+        properties = vars(override).copy()
+        digest = override.get_digest()
+        assert len(digest) == 32
+        assert vars(override) == properties
+        assert "_digest" not in override.to_json()
+        # changes after the digest was computed are not reflected
+        override.halftone = not override.halftone
+        assert override.get_digest() == digest
+        fresh = _get_first_category_override()
+        fresh.halftone = not fresh.halftone
+        assert fresh.get_digest() != digest
+
+    def _check_digest_stable_across_processes(self, view_settings):
+        """
+        Checks digests computed in processes with different hash seeds match.
+        """
+
+        expected = _get_digests(view_settings)
+        for hash_seed in ["1", "2"]:
+            env = dict(os.environ)
+            env["PYTHONHASHSEED"] = hash_seed
+            env["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p)
+            output = subprocess.check_output(
+                [sys.executable, "-c", DIGEST_SCRIPT, TEST_DATA_FILE], env=env
+            )
+            assert output.decode("utf-8").split() == expected, hash_seed
+
+    def test(self):
+        """
+        Checks view override digests are stable, cached and match equality.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+        try:
+            view_settings = read_view_data_from_file(file_path=TEST_DATA_FILE)
+            self._check_digest_matches_equality(view_settings)
+            return_value.append_message("Digests match equality.")
+            self._check_digest_cached()
+            return_value.append_message("Digests are cached.")
+            self._check_digest_stable_across_processes(view_settings)
+            return_value.append_message("Digests are stable across processes.")
+
+            # hash values used in the report do not clash with fixed values
+            headers = utils._get_hash_headers(view_settings)
+            rows = utils._get_hash_rows_categories(view_settings)
+            table = utils._get_hash_for_category_overrides(
+                headers, rows, view_settings
+            )
+            values = set(value for row in table for value in row)
+            assert all(
+                value > utils.FILTER_NOT_ENABLED
+                for value in values
+                if value
+                not in [
+                    utils.NO_OVERRIDE,
+                    utils.SWITCHED_OFF,
+                    utils.DOES_NOT_EXIST,
+                ]
+            )
+            assert table == utils._get_hash_for_category_overrides(
+                headers, rows, read_view_data_from_file(file_path=TEST_DATA_FILE)
+            )
+            return_value.append_message("Report hash values are stable.")
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
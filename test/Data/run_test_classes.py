@@ -32,8 +32,11 @@ from test.utils.run_tests import RunTest
 # import test classes
 from test.Data import (
     data_families_reading_families,
+    data_families_reading_families_benchmark,
+    data_families_missing_families_benchmark,
     data_families_container_reading_single,
     data_families_container_reading_multiple,
+    data_families_container_unique_storage,
     data_families_culling_nested_families,
     data_families_reading_family_base_report,
     data_families_reading_categories_report,
@@ -41,9 +44,21 @@ from test.Data import (
     data_families_reading_shared_parameters_report,
     data_families_reading_family_warnings_report,
     data_families_circular_nesting,
+    data_families_dependency_graph,
     data_families_find_none_nested_root_families,
     data_families_find_host_families_needing_rename,
     data_families_combine_reports,
+    data_families_refresh_combined_report,
+    data_families_report_cache,
+    data_ceilings_to_rooms_index,
+    data_to_shapely_transform,
+    data_polygon_containment,
+    data_read_file,
+    data_read_file_streamed,
+    data_views_3d_hash_report,
+    data_views_3d_hash_report_columnar,
+    data_views_override_digest,
+    data_views_graphics_settings_index,
 )
 
 
@@ -68,12 +83,27 @@ def run_tests():
         ["Data Read Families Warnings Report", data_families_reading_family_warnings_report.DataReadFamiliesWarningsReport],
         ["Data Read Families Container-single", data_families_container_reading_single.DataReadFamiliesIntoContainer],
         ["Data Read Families Container-multiple", data_families_container_reading_multiple.DataReadFamiliesIntoContainers],
+        ["Data Families Container Unique Storage", data_families_container_unique_storage.DataFamiliesContainerUniqueStorage],
         ["Data Read Families Into Family Instances", data_families_reading_families.DataReadFamiliesIntoFamilyInstances],
+        ["Data Read Large Report Into Family Instances", data_families_reading_families_benchmark.DataReadFamiliesBenchmark],
+        ["Data Find Missing Families In Large Library", data_families_missing_families_benchmark.DataMissingFamiliesBenchmark],
         #["Data Find None Nested Root families", data_families_find_none_nested_root_families.DataFindNoneNestedRootFamilies],
         ["Data Nested Family culling", data_families_culling_nested_families.DataCullingNestedFamilies],
         ["Data find circular nesting", data_families_circular_nesting.DataCircularNestingFamilies],
+        ["Data Family Dependency Graph", data_families_dependency_graph.DataFamiliesDependencyGraph],
+        ["Data Read From File", data_read_file.DataReadFromFile],
+        ["Data Read From File Streamed", data_read_file_streamed.DataReadFromFileStreamed],
         #["Data Find Host Families With Families To Rename", data_families_find_host_families_needing_rename.DataFindHostFamiliesWithFamiliesToRename],
         #["Data Combine Reports", data_families_combine_reports.DataCombineFamiliesReports],
+        ["Data Refresh Combined Report", data_families_refresh_combined_report.DataRefreshCombinedReport],
+        ["Data Family Report Cache", data_families_report_cache.DataFamiliesReportCache],
+        ["Data Ceilings To Rooms Spatial Index", data_ceilings_to_rooms_index.DataCeilingsToRoomsIndex],
+        ["Data Polygon Loop Transformation", data_to_shapely_transform.DataToShapelyTransform],
+        ["Data Polygon Containment", data_polygon_containment.DataPolygonContainment],
+        ["Data View Template 3D Hash Report", data_views_3d_hash_report.DataViews3dHashReport],
+        ["Data View Template 3D Hash Report Columnar Output", data_views_3d_hash_report_columnar.DataViews3dHashReportColumnar],
+        ["Data View Override Digest", data_views_override_digest.DataViewsOverrideDigest],
+        ["Data View Graphics Settings Override Lookup", data_views_graphics_settings_index.DataViewsGraphicsSettingsIndex],
     ]
 
     try:
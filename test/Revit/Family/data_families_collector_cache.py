@@ -0,0 +1,336 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains family data collector nested family cache tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed. 
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits; 
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+from Autodesk.Revit.DB import StorageType
+
+from test.Revit.TestUtils import revit_test
+from duHast.Revit.Family.Data.Objects.family_data_collector import (
+    RevitFamilyDataCollector,
+)
+from duHast.Revit.Family.Data.Objects.ifamily_processor import IFamilyProcessor
+from duHast.Revit.Family.Data.Objects.ifamily_data import IFamilyData
+from duHast.Revit.Family.Data.Objects.family_base_data_storage import (
+    FamilyBaseDataStorage,
+)
+from duHast.Utilities.Objects import result as res
+
+
+#: GUID of the shared parameter used in fake family types
+FIRE_RATING_GUID = "8d3a1f3e-5b1c-4c1f-9a59-2f3c9b0c6d21"
+
+
+class FakeCategory(object):
+    def __init__(self, name):
+        self.Name = name
+
+
+class FakeDefinition(object):
+    def __init__(self, name):
+        self.Name = name
+
+
+class FakeParameter(object):
+    """
+    Stand in for a family type parameter storing a text value.
+    """
+
+    def __init__(self, name, value, guid=None):
+        self.Definition = FakeDefinition(name)
+        self.IsShared = guid is not None
+        self.GUID = guid
+        self.StorageType = StorageType.String
+        self.value = value
+
+    def AsString(self):
+        return self.value
+
+    def AsValueString(self):
+        return self.value
+
+
+class FakeFamilySymbol(object):
+    """
+    Stand in for a family type. The type name is stored as a parameter as well.
+    """
+
+    def __init__(self, type_name, parameters):
+        self.Parameters = [FakeParameter("Type Name", type_name)] + parameters
+
+
+class FakeFamily(object):
+    """
+    Stand in for a family element nested into a fake family document.
+    """
+
+    def __init__(self, family_document, category_name, symbol_ids):
+        self.family_document = family_document
+        self.Name = family_document.Title
+        self.FamilyCategory = FakeCategory(category_name)
+        self.symbol_ids = symbol_ids
+        self.IsEditable = True
+        self.IsValidObject = True
+
+    def GetFamilySymbolIds(self):
+        return self.symbol_ids
+
+
+class FakeFamilyDocument(object):
+    """
+    Stand in for a family document. Counts how often nested families are opened for editing.
+    """
+
+    def __init__(self, title, open_counter):
+        self.Title = title
+        self.PathName = ""
+        self.IsFamilyDocument = True
+        # elements by id, ids are the index in this list
+        self.elements = []
+        self.family_ids = []
+        self.open_counter = open_counter
+
+    def _add_element(self, element):
+        self.elements.append(element)
+        return len(self.elements) - 1
+
+    def nest(self, family_document, category_name, types):
+        """
+        Nests a family document.
+
+        :param types: List of type names and their parameters.
+        :type types: [[str, [FakeParameter]]]
+        :return: The nested family element.
+        :rtype: FakeFamily
+        """
+
+        symbol_ids = [
+            self._add_element(FakeFamilySymbol(type_name, parameters))
+            for type_name, parameters in types
+        ]
+        family = FakeFamily(family_document, category_name, symbol_ids)
+        self.family_ids.append(self._add_element(family))
+        return family
+
+    def GetElement(self, element_id):
+        return self.elements[element_id]
+
+    def EditFamily(self, family):
+        self.open_counter[family.Name] = self.open_counter.get(family.Name, 0) + 1
+        return family.family_document
+
+    def Close(self, save):
+        pass
+
+
+class FakeFamilyData(IFamilyData):
+    """
+    Stores a single family base storage instance describing the document processed.
+    """
+
+    def process(self, doc):
+        self.data.append(
+            FamilyBaseDataStorage(
+                root_name_path=self.root_path,
+                root_category_path=self.root_category_path,
+                family_name=doc.Title,
+                family_file_path="-",
+            )
+        )
+
+    def get_data(self):
+        return self.data
+
+
+class FakeFamilyProcessor(IFamilyProcessor):
+    def __init__(self):
+        super(FakeFamilyProcessor, self).__init__(data_type="FakeFamilyProcessor")
+
+    def process(self, doc, root_path, root_category_path):
+        data = FakeFamilyData(root_path, root_category_path)
+        data.process(doc)
+        self.data.append(data)
+
+
+class FakeFamilyDataCollector(RevitFamilyDataCollector):
+    """
+    Collector reading nested families from fake family documents instead of using a Revit element collector.
+    """
+
+    def _get_family_ids(self, doc):
+        return list(doc.family_ids)
+
+
+class DataFamilyCollectorCache(revit_test.RevitTest):
+    def __init__(self, doc):
+        # store document in base class
+        super(DataFamilyCollectorCache, self).__init__(
+            doc=doc, test_name="family data collector nested family cache"
+        )
+
+    def _get_shared_types(self, width_type_b="1200", fire_rating_guid=FIRE_RATING_GUID):
+        """
+        Returns type names and parameters of the shared nested family.
+
+        :return: List of type names and their parameters.
+        :rtype: [[str, [FakeParameter]]]
+        """
+
+        return [
+            [
+                "Type A",
+                [
+                    FakeParameter("Width", "900"),
+                    FakeParameter("Fire Rating", "60", fire_rating_guid),
+                ],
+            ],
+            [
+                "Type B",
+                [
+                    FakeParameter("Width", width_type_b),
+                    FakeParameter("Fire Rating", "60", fire_rating_guid),
+                ],
+            ],
+        ]
+
+    def _check_signatures(self):
+        """
+        Checks the nested family signature changes with type names, parameter values and shared parameter GUIDs only.
+        """
+
+        collector = RevitFamilyDataCollector([])
+        assert collector.use_nested_family_cache == False
+        open_counter = {}
+        shared = FakeFamilyDocument("Shared", open_counter)
+        host = FakeFamilyDocument("Host", open_counter)
+        family = host.nest(shared, "Generic Models", self._get_shared_types())
+        # same types in a different order
+        family_reordered = host.nest(
+            shared, "Generic Models", list(reversed(self._get_shared_types()))
+        )
+        # same type names but a different parameter value
+        family_other_value = host.nest(
+            shared, "Generic Models", self._get_shared_types(width_type_b="1500")
+        )
+        # same type names and values but a different shared parameter
+        family_other_guid = host.nest(
+            shared,
+            "Generic Models",
+            self._get_shared_types(
+                fire_rating_guid="c4f2ab46-0d41-4a6a-9f0a-6d7a3f0b2e11"
+            ),
+        )
+        signature = collector._get_nested_family_signature(host, family)
+        assert signature == collector._get_nested_family_signature(
+            host, family_reordered
+        )
+        assert signature != collector._get_nested_family_signature(
+            host, family_other_value
+        )
+        assert signature != collector._get_nested_family_signature(
+            host, family_other_guid
+        )
+
+    def _collect(self, use_nested_family_cache):
+        """
+        Collects data from a root family nesting two host families, both nesting the same shared family which nests another family.
+        A third host nests a family of the same name and category but different types.
+        A fourth host nests a family of the same name, category and type names but a different type parameter value.
+
+        :return: number of times each family document was opened and the collected name nesting paths
+        :rtype: {str:int}, [str]
+        """
+
+        open_counter = {}
+        deep = FakeFamilyDocument("Deep", open_counter)
+        shared = FakeFamilyDocument("Shared", open_counter)
+        shared.nest(deep, "Generic Annotations", [["Type 1", []]])
+        shared_other_types = FakeFamilyDocument("Shared", open_counter)
+        shared_other_content = FakeFamilyDocument("Shared", open_counter)
+        host_one = FakeFamilyDocument("Host_One", open_counter)
+        host_one.nest(shared, "Generic Models", self._get_shared_types())
+        host_two = FakeFamilyDocument("Host_Two", open_counter)
+        host_two.nest(
+            shared, "Generic Models", list(reversed(self._get_shared_types()))
+        )
+        host_three = FakeFamilyDocument("Host_Three", open_counter)
+        host_three.nest(shared_other_types, "Generic Models", [["Type C", []]])
+        host_four = FakeFamilyDocument("Host_Four", open_counter)
+        host_four.nest(
+            shared_other_content,
+            "Generic Models",
+            self._get_shared_types(width_type_b="1500"),
+        )
+        root = FakeFamilyDocument("Root", open_counter)
+        for host in [host_one, host_two, host_three, host_four]:
+            root.nest(host, "Furniture", [["Default", []]])
+
+        processor = FakeFamilyProcessor()
+        collector = FakeFamilyDataCollector(
+            [processor], use_nested_family_cache=use_nested_family_cache
+        )
+        collect_result = collector.process_family(root, "Root", "Furniture")
+        assert collect_result.status == True, collect_result.message
+        storage_paths = [
+            [storage.root_name_path, storage.root_category_path]
+            for storage in processor.get_data()
+        ]
+        return open_counter, storage_paths
+
+    def test(self):
+        """
+        Checks nested family signatures and collects data from fake family documents with and without the nested family cache.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = res.Result()
+
+        try:
+            self._check_signatures()
+            return_value.append_message("Nested family signatures checked.")
+            open_counter_cached, storage_paths_cached = self._collect(True)
+            open_counter, storage_paths = self._collect(False)
+            # same data, in the same order, is collected with and without cache
+            assert storage_paths_cached == storage_paths, "{} vs {}".format(
+                storage_paths_cached, storage_paths
+            )
+            assert [
+                "Root :: Host_Two :: Shared :: Deep",
+                "Furniture :: Furniture :: Generic Models :: Generic Annotations",
+            ] in storage_paths_cached
+            assert ["Root :: Host_Three :: Shared", "Furniture :: Furniture :: Generic Models"] in storage_paths_cached
+            assert ["Root :: Host_Four :: Shared", "Furniture :: Furniture :: Generic Models"] in storage_paths_cached
+            # shared family (and its nested family) is only opened once with cache
+            # shared families with different types or different type parameter values are opened separately
+            assert open_counter == {"Host_One": 1, "Host_Two": 1, "Host_Three": 1, "Host_Four": 1, "Shared": 4, "Deep": 2}, open_counter
+            assert open_counter_cached == {"Host_One": 1, "Host_Two": 1, "Host_Three": 1, "Host_Four": 1, "Shared": 3, "Deep": 1}, open_counter_cached
+            return_value.append_message("Nested family cache reused data of shared nested family.")
+        except Exception as e:
+            return_value.update_sep(False, "An exception occurred in function {} : {}".format(self.test_name, e))
+
+        return return_value
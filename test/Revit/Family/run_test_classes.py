@@ -32,6 +32,7 @@ from duHast.Utilities.Objects import result as res
 
 # import test classes
 from test.Revit.Family.data_families_processor_base import DataProcessorBaseData
+from test.Revit.Family.data_families_collector_cache import DataFamilyCollectorCache
 
 def run_family_tests(doc):
     """
@@ -51,6 +52,7 @@ def run_family_tests(doc):
 
     run_tests = [
         ["Family Base Data", DataProcessorBaseData],
+        ["Family Data Collector Cache", DataFamilyCollectorCache],
     ]
 
     runner = RevitRunTest(run_tests)
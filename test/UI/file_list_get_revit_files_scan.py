@@ -0,0 +1,202 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains cached directory scan tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed. 
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits; 
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import os
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Utilities.files_get import (
+    get_files_from_directory_scan,
+    get_files_from_directory_walker_with_filters_simple,
+)
+from duHast.Utilities.files_io import FILE_SIZE_IN_KB
+from duHast.UI.file_list import (
+    get_revit_files_incl_sub_dirs,
+    get_files_from_csv_list_file,
+)
+
+#: test files relative to the temp directory
+TEST_FILES = [
+    "root.rvt",
+    "root.0001.rvt",
+    "notes.txt",
+    os.path.join("A", "a_1.rvt"),
+    os.path.join("A", "a_2.rvt"),
+    os.path.join("A", "Deep", "Deeper", "a_deep.rvt"),
+    os.path.join("B", "b_1.rvt"),
+    os.path.join("B", "b_1.txt"),
+    os.path.join("C", "Empty", "readme.txt"),
+]
+
+
+def _write_file(file_path, size):
+    """
+    Writes a file of a given size in bytes, creating any missing directories.
+    """
+
+    directory = os.path.dirname(file_path)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    with open(file_path, "w") as f:
+        f.write("x" * size)
+
+
+class GetRevitFilesScan(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(GetRevitFilesScan, self).__init__(test_name="get_revit_files_scan")
+
+    def _check_scan(self, tmp_dir):
+        """
+        Compares directory scans, with and without threads and cache, with the directory walker.
+        """
+
+        root = os.path.join(tmp_dir, "project")
+        for counter, file_name in enumerate(TEST_FILES):
+            _write_file(os.path.join(root, file_name), counter + 1)
+        expected = sorted(
+            [f, os.path.getsize(f)]
+            for f in get_files_from_directory_walker_with_filters_simple(root, ".rvt")
+        )
+        assert len(expected) == 6, expected
+
+        for max_workers in [0, 1, 3]:
+            result = get_files_from_directory_scan(root, ".rvt", max_workers=max_workers)
+            assert sorted(result) == expected, (max_workers, result)
+            # directory order: files first, then sub directories by name
+            assert [os.path.relpath(f[0], root) for f in result] == [
+                "root.0001.rvt",
+                "root.rvt",
+                os.path.join("A", "a_1.rvt"),
+                os.path.join("A", "a_2.rvt"),
+                os.path.join("A", "Deep", "Deeper", "a_deep.rvt"),
+                os.path.join("B", "b_1.rvt"),
+            ], result
+
+        # first run writes the cache, second run reads it
+        cache_file_path = os.path.join(tmp_dir, "scan_cache.json")
+        for max_workers in [1, 3]:
+            assert (
+                get_files_from_directory_scan(
+                    root, ".rvt", cache_file_path, max_workers
+                )
+                == get_files_from_directory_scan(root, ".rvt", max_workers=max_workers)
+            )
+            assert os.path.exists(cache_file_path)
+            assert sorted(
+                get_files_from_directory_scan(root, ".rvt", cache_file_path, max_workers)
+            ) == expected
+
+        # unchanged directories are not listed again: remove a file but keep the directory modified time
+        directory_b = os.path.join(root, "B")
+        stat_b = os.stat(directory_b)
+        os.remove(os.path.join(directory_b, "b_1.rvt"))
+        os.utime(directory_b, (stat_b.st_atime, stat_b.st_mtime))
+        result = get_files_from_directory_scan(root, ".rvt", cache_file_path)
+        assert os.path.join(directory_b, "b_1.rvt") in [f[0] for f in result]
+        # without cache the file is gone
+        result = get_files_from_directory_scan(root, ".rvt")
+        assert os.path.join(directory_b, "b_1.rvt") not in [f[0] for f in result]
+
+        # a new file changes the modified time of a nested directory: it is picked up
+        deeper = os.path.join(root, "A", "Deep", "Deeper")
+        stat_deeper = os.stat(deeper)
+        _write_file(os.path.join(deeper, "a_new.rvt"), 5)
+        os.utime(deeper, (stat_deeper.st_atime, stat_deeper.st_mtime + 10))
+        result = get_files_from_directory_scan(root, ".rvt", cache_file_path, 3)
+        assert os.path.join(deeper, "a_new.rvt") in [f[0] for f in result], result
+
+        # a cache written for another file extension is ignored
+        result = get_files_from_directory_scan(root, ".txt", cache_file_path)
+        assert sorted(os.path.relpath(f[0], root) for f in result) == [
+            os.path.join("B", "b_1.txt"),
+            os.path.join("C", "Empty", "readme.txt"),
+            "notes.txt",
+        ], result
+
+        # back up files are removed from the Revit file list
+        file_items = get_revit_files_incl_sub_dirs(root, ".rvt", max_workers=2)
+        assert [os.path.relpath(f.name, root) for f in file_items] == [
+            "root.rvt",
+            os.path.join("A", "a_1.rvt"),
+            os.path.join("A", "a_2.rvt"),
+            os.path.join("A", "Deep", "Deeper", "a_deep.rvt"),
+            os.path.join("A", "Deep", "Deeper", "a_new.rvt"),
+        ], file_items
+        assert [f.size for f in file_items] == [1, 4, 5, 6, 5]
+
+        # task list file: sizes of server based files in KB, -1 if a file does not exist
+        task_list_file_path = os.path.join(tmp_dir, "task_list.csv")
+        task_file_paths = [f.name for f in file_items] + [
+            os.path.join(root, "missing.rvt")
+        ]
+        with open(task_list_file_path, "w") as f:
+            f.write("\n".join(task_file_paths))
+        for max_workers in [1, 3]:
+            file_items_listed = get_files_from_csv_list_file(
+                task_list_file_path, ".rvt", max_workers=max_workers
+            )
+            assert [f.name for f in file_items_listed] == task_file_paths
+            assert [f.size for f in file_items_listed] == [
+                size / FILE_SIZE_IN_KB for size in [1, 4, 5, 6, 5]
+            ] + [-1], file_items_listed
+
+    def test(self):
+        """
+        Test cached directory scan.
+
+        :return: True if all tests past, otherwise False
+        :rtype: bool
+        """
+
+        return_value = Result()
+
+        def action(tmp_dir):
+            action_return_value = Result()
+            try:
+                self._check_scan(tmp_dir)
+                action_return_value.append_message("Directory scan checked.")
+            except Exception as e:
+                action_return_value.update_sep(
+                    False,
+                    "An exception occurred in function {} : {}".format(
+                        self.test_name, e
+                    ),
+                )
+            return action_return_value.status, action_return_value.message
+
+        try:
+            flag, message = self.call_with_temp_directory(action)
+            return_value.update_sep(flag, message)
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
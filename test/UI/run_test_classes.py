@@ -34,7 +34,9 @@ from test.UI import (
     file_list_bucket_to_task_list_item_b360,
     file_list_is_back_up_file,
     file_list_get_revit_files,
+    file_list_get_revit_files_scan,
     workloader,
+    workloader_runtime_history,
     file_list_write_revit_task_file,
 )
 
@@ -54,8 +56,13 @@ def run_tests():
     run_tests = [
         ['Is Back Up File', file_list_is_back_up_file.IsBackUpFile],
         ['Get Revit Files', file_list_get_revit_files.GetRevitFiles],
+        ["Get Revit Files Scan", file_list_get_revit_files_scan.GetRevitFilesScan],
         ["File List Bucket To Task List Item BIM 360", file_list_bucket_to_task_list_item_b360.BucketToTaskListBIM360],
         ["Workloader", workloader.Workloader],
+        [
+            "Workloader Runtime History",
+            workloader_runtime_history.WorkloaderRuntimeHistory,
+        ],
         ["Write Revit Task List", file_list_write_revit_task_file.WriteRevitTaskFile],
     ]
 
@@ -0,0 +1,209 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains heap based workloader and runtime history tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed. 
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits; 
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import json
+import os
+import random
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Utilities.Objects.batch_processor_log_index import BatchProcessorLogIndex
+from duHast.UI.workloader import (
+    distribute_workload,
+    get_workload_size_from_runtime_history,
+)
+from duHast.UI.Objects.file_item import MyFileItem
+from duHast.UI.file_list import (
+    get_file_size,
+    get_runtime_history_key,
+    write_file_list,
+)
+
+
+def _log_row(message, time_utc):
+    """
+    Returns a json formatted batch processor log row.
+    """
+
+    return json.dumps(
+        {
+            "date": {"local": "17/12/2020", "utc": "17/12/2020"},
+            "time": {"local": time_utc, "utc": time_utc},
+            "sessionId": "235e2180-dc33-4d61-8773-1005a59344c0",
+            "message": {"msgId": "", "message": message},
+        }
+    )
+
+
+def _get_makespan(buckets):
+    """
+    Returns the largest bucket workload.
+    """
+
+    return max(bucket.workload_value for bucket in buckets)
+
+
+class WorkloaderRuntimeHistory(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(WorkloaderRuntimeHistory, self).__init__(
+            test_name="workloader_runtime_history"
+        )
+
+    def _check_distribution(self):
+        """
+        Checks the heap based distribution and the Karmarkar-Karp refinement.
+        """
+
+        items = [MyFileItem("file_{}.rvt".format(size), size) for size in [8, 7, 6, 5, 4]]
+        # longest processing time first: [8, 5, 4] and [7, 6]
+        buckets = distribute_workload(2, items, get_file_size)
+        assert [b.workload_value for b in buckets] == [17, 13]
+        assert [[i.size for i in b.items] for b in buckets] == [[8, 5, 4], [7, 6]]
+        # refined: [8, 5, 4] vs [7, 6] improves to a largest bucket of 16
+        buckets = distribute_workload(2, items, get_file_size, refine=True)
+        assert _get_makespan(buckets) == 16, [b.workload_value for b in buckets]
+        assert sorted(i.size for b in buckets for i in b.items) == [4, 5, 6, 7, 8]
+        for bucket in buckets:
+            assert bucket.workload_value == sum(i.size for i in bucket.items)
+        # no items
+        buckets = distribute_workload(3, [], get_file_size, refine=True)
+        assert [b.items for b in buckets] == [[], [], []]
+
+        # refinement never makes the largest bucket bigger
+        random_generator = random.Random(42)
+        for x in range(20):
+            items = [
+                MyFileItem("file_{}.rvt".format(i), random_generator.randint(1, 1000))
+                for i in range(random_generator.randint(5, 60))
+            ]
+            number_of_buckets = random_generator.randint(2, 6)
+            buckets_lpt = distribute_workload(number_of_buckets, items, get_file_size)
+            buckets_refined = distribute_workload(
+                number_of_buckets, items, get_file_size, refine=True
+            )
+            assert _get_makespan(buckets_refined) <= _get_makespan(buckets_lpt)
+            assert sorted(i.name for b in buckets_refined for i in b.items) == sorted(
+                i.name for i in items
+            )
+
+    def _check_runtime_history(self, tmp_dir):
+        """
+        Checks runtimes read from a log file are used as workload, falling back to scaled file size.
+        """
+
+        file_slow = "P:\\something\\FileSlow.rvt"
+        file_fast = "P:\\something\\FileFast.rvt"
+        rows = [
+            _log_row("Starting batch operation...", "10:00:00"),
+            _log_row("\t- Processing file (1 of 3): " + file_slow, "10:00:00"),
+            _log_row("\t- Task script operation completed.", "10:10:00"),
+            _log_row("\t- Processing file (2 of 3): " + file_fast, "10:10:00"),
+            _log_row("\t- Task script operation completed.", "10:11:00"),
+            # not closed: no runtime
+            _log_row("\t- Processing file (3 of 3): P:\\something\\FileOpen.rvt", "10:11:00"),
+        ]
+        self.write_file_with_data("session.log", tmp_dir, rows)
+        log_index = BatchProcessorLogIndex(
+            exception_messages=[], file_path=os.path.join(tmp_dir, "session.log")
+        )
+        runtime_history = log_index.get_file_runtimes()
+        assert runtime_history == {file_slow: 600.0, file_fast: 60.0}, runtime_history
+
+        # the slow file is the smallest file, the new file has no history
+        items = [
+            MyFileItem(file_slow.lower(), 10),
+            MyFileItem(file_fast, 100),
+            MyFileItem("P:\\something\\FileNew.rvt", 55),
+        ]
+        get_workload = get_workload_size_from_runtime_history(
+            items, runtime_history, get_file_size, get_runtime_history_key
+        )
+        # 660 seconds for 110 size units
+        assert [get_workload(i) for i in items] == [600.0, 60.0, 330.0]
+        # without any matching history the file size is used
+        get_workload = get_workload_size_from_runtime_history(
+            items, {}, get_file_size, get_runtime_history_key
+        )
+        assert [get_workload(i) for i in items] == [10, 100, 55]
+
+        # task lists are balanced by runtime: the slow file gets a task list of its own
+        result = write_file_list(
+            tmp_dir,
+            ".rvt",
+            tmp_dir,
+            2,
+            lambda directory, extension: items,
+            runtime_history=runtime_history,
+        )
+        assert result.status, result.message
+        task_lists = []
+        for counter in range(2):
+            with open(os.path.join(tmp_dir, "Tasklist_{}.txt".format(counter))) as f:
+                task_lists.append(f.read().split("\n"))
+        assert task_lists == [
+            [file_slow.lower()],
+            ["P:\\something\\FileNew.rvt", file_fast],
+        ], task_lists
+
+    def test(self):
+        """
+        Test heap based workload distribution and runtime history workload.
+
+        :return: True if all tests past, otherwise False
+        :rtype: bool
+        """
+
+        return_value = Result()
+        try:
+            self._check_distribution()
+            return_value.append_message("Heap based distribution checked.")
+
+            def action(tmp_dir):
+                action_return_value = Result()
+                try:
+                    self._check_runtime_history(tmp_dir)
+                    action_return_value.append_message("Runtime history checked.")
+                except Exception as e:
+                    action_return_value.update_sep(
+                        False,
+                        "An exception occurred in function {} : {}".format(
+                            self.test_name, e
+                        ),
+                    )
+                return action_return_value.status, action_return_value.message
+
+            flag, message = self.call_with_temp_directory(action)
+            return_value.update_sep(flag, message)
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
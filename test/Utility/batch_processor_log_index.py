@@ -0,0 +1,171 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains batch processor log index tests .
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+from test.utils import test
+import os
+import json
+
+from duHast.Utilities.Objects.batch_processor_log_index import (
+    BatchProcessorLogIndex,
+    MESSAGE_OK,
+    MESSAGE_NO_MATCH,
+)
+
+# copy of batch_processor_log_utils.EXCEPTION_MESSAGES (that module requires the .net framework)
+EXCEPTION_MESSAGES = [
+    "ERROR: An error occurred while executing the task script! Operation",
+    "WARNING: Timed-out",
+    "Exception: [Exception]",
+    "\t- \tMessage: An unrecoverable error has occurred.  The program will now be terminated.",
+    "Script Exception:",
+]
+
+
+def _log_row(message):
+    """
+    Returns a json formatted batch processor log row.
+    """
+
+    return json.dumps(
+        {
+            "date": {"local": "17/12/2020", "utc": "17/12/2020"},
+            "time": {"local": "16:49:28", "utc": "05:49:28"},
+            "sessionId": "235e2180-dc33-4d61-8773-1005a59344c0",
+            "message": {"msgId": "", "message": message},
+        }
+    )
+
+
+class BatchProcessorLogIndexTest(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(BatchProcessorLogIndexTest, self).__init__(
+            test_name="batch_processor_log_index"
+        )
+
+    def test(self):
+        """
+        batch processor log index test
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        flag = True
+        message = "-"
+        try:
+            file_ok = "P:\\something\\FileOk.rvt"
+            file_bad = "P:\\something\\FileBad.rvt"
+            file_missing = "P:\\something\\FileMissing.rvt"
+            file_not_processed = "P:\\something\\FileNotProcessed.rvt"
+
+            messages = [
+                "Session ID: <2020-12-17T05:49:27.559Z>",
+                "Revit Files for processing (4):",
+            ]
+            for file_name, exists in [
+                (file_ok, "YES"),
+                (file_bad, "YES"),
+                (file_missing, "NO"),
+                (file_not_processed, "YES"),
+            ]:
+                messages = messages + [
+                    "",
+                    "\t" + file_name,
+                    "\tFile exists: " + exists,
+                    "\tFile size: 86.93MB",
+                ]
+            messages = messages + [
+                "",
+                "Starting batch operation...",
+                "\t- Processing file (1 of 4): " + file_ok,
+                "\t- some message",
+                "\t- Task script operation completed.",
+                # processing counter with more than one digit
+                "\t- Processing file (10 of 400): " + file_bad,
+                "\t- Script Exception: something went wrong",
+                "\t- WARNING: Timed-out",
+                "\t- Operation aborted.",
+            ]
+
+            def action_one(tmp_dir):
+                flag_action = True
+                message_action = ""
+                try:
+                    log_file_path = os.path.join(tmp_dir, "session.log")
+                    self.write_file_with_data(
+                        "session.log", tmp_dir, [_log_row(m) for m in messages]
+                    )
+                    log_index = BatchProcessorLogIndex(
+                        exception_messages=EXCEPTION_MESSAGES,
+                        file_path=log_file_path,
+                    )
+                    result = log_index.process_log_files()
+                    expected_result = [
+                        [file_ok, True, MESSAGE_OK],
+                        [file_bad, False, ["- WARNING: Timed-out"]],
+                        [file_not_processed, False, MESSAGE_NO_MATCH],
+                        [file_missing, False, ["File not found"]],
+                    ]
+                    message_action = "result: {} \nvs \nexpected: {}".format(
+                        result, expected_result
+                    )
+                    assert result == expected_result
+                    # check block offsets
+                    blocks = log_index.get_blocks(file_bad)
+                    assert len(blocks) == 1
+                    assert blocks[0].start_row == 23
+                    assert blocks[0].end_row == 26
+                    assert len(blocks[0].exception_hits) == 2
+                except Exception as e:
+                    flag_action = False
+                    message_action = (
+                        message_action
+                        + "\n"
+                        + (
+                            "An exception occurred in function {} : {}".format(
+                                self.test_name, e
+                            )
+                        )
+                    )
+                return flag_action, message_action
+
+            flag, message = self.call_with_temp_directory(action_one)
+
+        except Exception as e:
+            flag = False
+            message = (
+                message
+                + "\n"
+                + (
+                    "An exception occurred in function {} : {}".format(
+                        self.test_name, e
+                    )
+                )
+            )
+        return flag, message
@@ -0,0 +1,165 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains parallel combine files tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed. 
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits; 
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+from test.utils import test
+import os
+
+from duHast.Utilities.files_combine import (
+    combine_files_header_independent_streamed,
+    combine_files_header_independent_parallel,
+)
+
+#: number of test files combined
+NUMBER_OF_FILES = 45
+
+
+class FileCombineFilesParallel(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(FileCombineFilesParallel, self).__init__(
+            test_name="combines_files_parallel"
+        )
+
+    def _write_test_files(self, tmp_dir, separator):
+        """
+        Writes test files with varying headers. Every 7th file does not exist and every 11th file only has a header row.
+
+        :return: List of fully qualified file path.
+        :rtype: [str]
+        """
+
+        file_list = []
+        for i in range(NUMBER_OF_FILES):
+            file_name = "test_file_{}.txt".format(i)
+            file_list.append(os.path.join(tmp_dir, file_name))
+            if i % 7 == 3:
+                continue
+            headers = ["header {}".format(j) for j in range(i % 4, i % 4 + 3)]
+            rows = [separator.join(headers)]
+            if i % 11 != 5:
+                for row in range(i % 5 + 1):
+                    rows.append(
+                        separator.join(
+                            "data {}_{}_{}".format(i, row, header) for header in headers
+                        )
+                    )
+            self.write_file_with_data(file_name, tmp_dir, rows)
+        return file_list
+
+    def _combine(self, combine_function, file_list, out_put_file_path, **kwargs):
+        """
+        Combines files and returns the combined file content and the error message raised.
+
+        :return: Combined file content, error message
+        :rtype: bytes, str
+        """
+
+        error = None
+        try:
+            combine_function(file_list, out_put_file_path, **kwargs)
+        except ValueError as e:
+            error = str(e)
+        with open(out_put_file_path, "rb") as f:
+            return f.read(), error
+
+    def test(self):
+        """
+        Compares files combined in parallel with files combined by the streamed combiner.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        flag = True
+        message = "-"
+
+        def action(tmp_dir):
+            flag_action = True
+            message_action = ""
+            try:
+                for dialect, separator in [("excel-tab", "\t"), ("excel", ",")]:
+                    directory = os.path.join(tmp_dir, dialect)
+                    os.mkdir(directory)
+                    file_list = self._write_test_files(directory, separator)
+                    expected, expected_error = self._combine(
+                        combine_files_header_independent_streamed,
+                        file_list,
+                        os.path.join(directory, "expected.txt"),
+                        dialect=dialect,
+                    )
+                    assert expected_error is not None
+                    assert expected.count(b"\n") > NUMBER_OF_FILES
+                    for max_workers in [1, 2]:
+                        result, error = self._combine(
+                            combine_files_header_independent_parallel,
+                            file_list,
+                            os.path.join(
+                                directory, "result_{}.txt".format(max_workers)
+                            ),
+                            dialect=dialect,
+                            max_workers=max_workers,
+                            files_per_shard=4,
+                        )
+                        assert result == expected, "{} vs {}".format(
+                            result, expected
+                        )
+                        assert error == expected_error, "{} vs {}".format(
+                            error, expected_error
+                        )
+                    message_action = message_action + "\n" + (
+                        "{}: parallel and streamed combined files match. Errors: {}".format(
+                            dialect, expected_error.count("\n") + 1
+                        )
+                    )
+            except Exception as e:
+                flag_action = False
+                message_action = (
+                    message_action
+                    + "\n"
+                    + (
+                        "An exception occurred in function {} : {}".format(
+                            self.test_name, e
+                        )
+                    )
+                )
+            return flag_action, message_action
+
+        try:
+            flag, message = self.call_with_temp_directory(action)
+        except Exception as e:
+            flag = False
+            message = (
+                message
+                + "\n"
+                + (
+                    "An exception occurred in function {} : {}".format(
+                        self.test_name, e
+                    )
+                )
+            )
+        return flag, message
@@ -0,0 +1,155 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains streamed combine files tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed. 
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits; 
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+from test.utils import test
+import os
+
+from duHast.Utilities.files_csv import read_csv_file
+from duHast.Utilities.files_tab import read_tab_separated_file
+from duHast.Utilities.files_combine import (
+    combine_files_header_independent_streamed,
+)
+
+
+class FileCombineFilesStreamed(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(FileCombineFilesStreamed, self).__init__(
+            test_name="combines_files_streamed"
+        )
+
+    def test(self):
+        """
+        streamed combine files test with variant headers
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        flag = True
+        message = "-"
+
+        # file name, rows
+        test_files_tab = [
+            ["test_file_one.txt", ["header 1\theader 2", "data 1_1\tdata 1_2", ""]],
+            [
+                "test_file_two.txt",
+                [
+                    "header 3\theader 1\t",
+                    "data 2_3\tdata 2_1\tdata 2_empty",
+                    # short row
+                    "data 3_3",
+                ],
+            ],
+            ["test_file_three.txt", ["header 2"]],
+        ]
+        expected_result_tab = [
+            ["header 1", "header 2", "header 3", "test_file_two.Empty.0"],
+            ["data 1_1", "data 1_2", "N/A", "N/A"],
+            ["data 2_1", "N/A", "data 2_3", "data 2_empty"],
+            ["index out of bounds", "N/A", "data 3_3", "index out of bounds"],
+        ]
+
+        test_files_csv = [
+            ["test_file_one.csv", ["header 1,header 2", 'data 1,"data, 2"']],
+            ["test_file_two.csv", ["header 2,header 3", "data 3,data 4"]],
+        ]
+        expected_result_csv = [
+            ["header 1", "header 2", "header 3"],
+            ["data 1", "data, 2", "N/A"],
+            ["N/A", "data 3", "data 4"],
+        ]
+
+        def action(tmp_dir):
+            flag_action = True
+            message_action = ""
+            try:
+                # tab separated files, including a file which does not exist
+                file_list = []
+                for file_name, rows in test_files_tab:
+                    self.write_file_with_data(file_name, tmp_dir, rows)
+                    file_list.append(os.path.join(tmp_dir, file_name))
+                file_list.insert(1, os.path.join(tmp_dir, "does_not_exist.txt"))
+                combined_file = os.path.join(tmp_dir, "result.txt")
+                # the combined file is not combined with itself
+                file_list.append(combined_file)
+                try:
+                    combine_files_header_independent_streamed(
+                        file_list, combined_file
+                    )
+                    assert False, "Expected an exception for missing file"
+                except ValueError as e:
+                    assert "does_not_exist.txt" in str(e), str(e)
+                    assert "result.txt" not in str(e), str(e)
+                result = read_tab_separated_file(combined_file)
+                message_action = "result: {} \nvs \nexpected: {}".format(
+                    result, expected_result_tab
+                )
+                assert result == expected_result_tab
+
+                # comma separated files
+                file_list = []
+                for file_name, rows in test_files_csv:
+                    self.write_file_with_data(file_name, tmp_dir, rows)
+                    file_list.append(os.path.join(tmp_dir, file_name))
+                combined_file = os.path.join(tmp_dir, "result.csv")
+                combine_files_header_independent_streamed(
+                    file_list, combined_file, dialect="excel"
+                )
+                result = read_csv_file(combined_file)
+                message_action = message_action + "\n" + (
+                    "result: {} \nvs \nexpected: {}".format(result, expected_result_csv)
+                )
+                assert result == expected_result_csv
+            except Exception as e:
+                flag_action = False
+                message_action = (
+                    message_action
+                    + "\n"
+                    + (
+                        "An exception occurred in function {} : {}".format(
+                            self.test_name, e
+                        )
+                    )
+                )
+            return flag_action, message_action
+
+        try:
+            flag, message = self.call_with_temp_directory(action)
+        except Exception as e:
+            flag = False
+            message = (
+                message
+                + "\n"
+                + (
+                    "An exception occurred in function {} : {}".format(
+                        self.test_name, e
+                    )
+                )
+            )
+        return flag, message
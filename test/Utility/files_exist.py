@@ -0,0 +1,111 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains multiple files exist tests . 
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed. 
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits; 
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+from test.utils import test
+import os
+
+from duHast.Utilities.files_io import (
+    files_exist,
+)
+
+
+class FilesExist(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(FilesExist, self).__init__(test_name="files_exist")
+
+    def test(self):
+        """
+        Test files_exist.
+
+        :return: True if all tests past, otherwise False
+        :rtype: bool
+        """
+
+        flag = True
+        message = "-"
+        try:
+            # test data
+            test_files = ["test_file_{}.txt".format(i) for i in range(20)]
+
+            def action_one(tmp_dir):
+                flag_action = True
+                message_action = ""
+                try:
+                    self.write_test_files(test_files, tmp_dir)
+                    # mix of existing, missing and duplicate file paths
+                    file_paths = []
+                    expected_result = []
+                    for i, file_name in enumerate(test_files):
+                        file_paths.append(os.path.join(tmp_dir, file_name))
+                        expected_result.append(True)
+                        file_paths.append(os.path.join(tmp_dir, "missing_" + file_name))
+                        expected_result.append(False)
+                    file_paths.append(file_paths[0])
+                    expected_result.append(True)
+                    file_paths.append(None)
+                    expected_result.append(False)
+
+                    for max_workers in [1, 4]:
+                        result = files_exist(file_paths, max_workers=max_workers)
+                        message_action = (
+                            message_action
+                            + "\n"
+                            + " workers {}: {} vs {}".format(
+                                max_workers, result, expected_result
+                            )
+                        )
+                        assert expected_result == result
+                    assert files_exist([], max_workers=4) == []
+                except Exception as e:
+                    flag_action = False
+                    message_action = (
+                        message_action
+                        + "\n"
+                        + (
+                            "An exception occurred in function  {} : {}".format(
+                                self.test_name, e
+                            )
+                        )
+                    )
+                return flag_action, message_action
+
+            flag, message = self.call_with_temp_directory(action_one)
+
+        except Exception as e:
+            flag = False
+            message = (
+                message
+                + "\n"
+                + (
+                    "An exception occurred in function {} : {}".format(
+                        self.test_name, e
+                    )
+                )
+            )
+        return flag, message
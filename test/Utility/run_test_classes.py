@@ -34,11 +34,14 @@ from test.Utility import (
     get_date_stamp_directory,
     get_date_stamp_file,
     file_exist,
+    files_exist,
     file_delete,
     file_copy,
     file_combine_files,
     file_combine_files_tab_independent_headers,
     file_combine_files_csv_independent_headers,
+    file_combine_files_streamed,
+    file_combine_files_parallel,
     file_append_files,
     file_rename,
     file_get_directory_path,
@@ -56,6 +59,9 @@ from test.Utility import (
     util_string_to_bool,
     file_json_write_data,
     file_json_read_data,
+    batch_processor_log_index,
+    util_result_messages,
+    util_disjoint_set,
 )
 
 
@@ -79,7 +85,10 @@ def run_tests():
         ["Pad Single Digit String", util_pad_single_digit_string.PadSingleDigitString],
         ["Remove Items From List", util_remove_items.RemoveItemsFromList],
         ["Parse String To Bool", util_string_to_bool.StringToBool],
+        ["Result Messages", util_result_messages.ResultMessages],
+        ["Disjoint Set Grouping", util_disjoint_set.DisjointSetGrouping],
         ["File Exist", file_exist.FileExist],
+        ["Files Exist", files_exist.FilesExist],
         ["File Delete", file_delete.FileDelete],
         ["File Copy", file_copy.FileCopy],
         ["File Rename", file_rename.FileRename],
@@ -103,9 +112,15 @@ def run_tests():
             "Combine files csv varied headers",
             file_combine_files_csv_independent_headers.FileCombineFilesIndependentHeadersCSV,
         ],
+        ["Combine files streamed", file_combine_files_streamed.FileCombineFilesStreamed],
+        ["Combine files parallel", file_combine_files_parallel.FileCombineFilesParallel],
         ["File append another file", file_append_files.FileAppendFile],
         ["Write JSON data to file", file_json_write_data.FileJSONWriteData],
         ["Read JSON data from file", file_json_read_data.FileJSONReadData],
+        [
+            "Batch processor log index",
+            batch_processor_log_index.BatchProcessorLogIndexTest,
+        ],
     ]
 
     # run tests
@@ -0,0 +1,137 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains disjoint set ( union-find ) grouping tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed.
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits;
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+import random
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+from duHast.Utilities.Objects.disjoint_set import DisjointSet
+
+
+def _get_groups_brute_force(pairs):
+    """
+    Returns connected components of related pairs by walking all relations of each item.
+
+    :return: A dictionary where key is the lowest item in a group and value is a list of all items in the group in ascending order.
+    :rtype: {int: [int]}
+    """
+
+    related = {}
+    for a, b in pairs:
+        related.setdefault(a, set()).add(b)
+        related.setdefault(b, set()).add(a)
+    groups = {}
+    visited = set()
+    for item in related:
+        if item in visited:
+            continue
+        group = []
+        stack = [item]
+        visited.add(item)
+        while stack:
+            current = stack.pop()
+            group.append(current)
+            for other in related[current]:
+                if other not in visited:
+                    visited.add(other)
+                    stack.append(other)
+        group.sort()
+        groups[group[0]] = group
+    return groups
+
+
+def _get_groups(pairs):
+    """
+    Returns groups of related pairs using a disjoint set.
+
+    :rtype: {int: [int]}
+    """
+
+    disjoint_set = DisjointSet()
+    for a, b in pairs:
+        disjoint_set.union(a, b)
+    return disjoint_set.get_groups()
+
+
+class DisjointSetGrouping(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(DisjointSetGrouping, self).__init__(test_name="disjoint set grouping")
+
+    def test(self):
+        """
+        Groups related integer pairs and compares the groups with a brute force connected components search.
+
+        :return: True if all tests past, otherwise False
+        :rtype: _bool
+        """
+
+        return_value = Result()
+        try:
+            # two groups which are connected by a later pair
+            pairs = [(10, 2), (3, 4), (2, 3), (7, 7), (8, 9)]
+            groups = _get_groups(pairs)
+            assert groups == {2: [2, 3, 4, 10], 7: [7], 8: [8, 9]}, groups
+            assert _get_groups([]) == {}
+            return_value.append_message("Groups: {}".format(groups))
+
+            # random pairs in any order result in the same groups
+            random.seed(7)
+            pairs = [
+                (random.randint(0, 2000), random.randint(0, 2000)) for i in range(1500)
+            ]
+            expected = _get_groups_brute_force(pairs)
+            for i in range(3):
+                random.shuffle(pairs)
+                assert _get_groups(pairs) == expected
+                # swapping items within pairs does not change the groups either
+                assert _get_groups([(b, a) for a, b in pairs]) == expected
+            return_value.append_message(
+                "Random pairs grouped into {} groups.".format(len(expected))
+            )
+
+            # a long chain: after finding the root all items point directly to it
+            disjoint_set = DisjointSet()
+            for i in range(1000):
+                disjoint_set.parents[i + 1] = i
+                disjoint_set.parents.setdefault(i, i)
+            disjoint_set.sizes[0] = 1001
+            root = disjoint_set.find(1000)
+            assert root == 0
+            assert all(
+                parent == root for parent in disjoint_set.parents.values()
+            ), "path not compressed"
+            assert disjoint_set.union(500, 1000) == root
+            assert disjoint_set.get_groups() == {0: list(range(1001))}
+            return_value.append_message("Path compressed.")
+        except Exception as e:
+            return_value.update_sep(
+                False,
+                "An exception occurred in function {} : {}".format(self.test_name, e),
+            )
+        return return_value.status, return_value.message
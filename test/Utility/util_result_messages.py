@@ -0,0 +1,141 @@
+"""
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+This module contains result class message tests.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+"""
+#
+# License:
+#
+#
+# Revit Batch Processor Sample Code
+#
+# BSD License
+# Copyright 2023, Jan Christel
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without modification, are permitted provided that the following conditions are met:
+
+# - Redistributions of source code must retain the above copyright notice, this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice, this list of conditions and the following disclaimer in the documentation and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors may be used to endorse or promote products derived from this software without specific prior written permission.
+#
+# This software is provided by the copyright holder "as is" and any express or implied warranties, including, but not limited to, the implied warranties of merchantability and fitness for a particular purpose are disclaimed. 
+# In no event shall the copyright holder be liable for any direct, indirect, incidental, special, exemplary, or consequential damages (including, but not limited to, procurement of substitute goods or services; loss of use, data, or profits; 
+# or business interruption) however caused and on any theory of liability, whether in contract, strict liability, or tort (including negligence or otherwise) arising in any way out of the use of this software, even if advised of the possibility of such damage.
+#
+#
+#
+
+import json
+from collections import OrderedDict
+
+from test.utils import test
+
+from duHast.Utilities.Objects.result import Result
+
+
+class ResultMessages(test.Test):
+    def __init__(self):
+        # store document in base class
+        super(ResultMessages, self).__init__(test_name="result messages")
+
+    def test(self):
+        """
+        result class message test
+
+        :return: True if all tests past, otherwise False. A message containing results.
+        :rtype: bool, str
+        """
+
+        flag = True
+        message = "-"
+        try:
+            # default message
+            result = Result()
+            assert result.message == "-"
+            result.append_message("-")
+            assert result.message == "-"
+
+            # appended messages are separated by a new line
+            result.append_message("one")
+            result.append_message("two")
+            message = "{} \nvs \n{}".format(result.message, "one\ntwo")
+            assert result.message == "one\ntwo"
+
+            # setting the message replaces all messages
+            result.message = "three"
+            assert result.message == "three"
+            assert result.get_messages() == ["three"]
+            result.message = result.message + " and four"
+            assert result.message == "three and four"
+
+            # update ignores default messages of other result
+            other = Result()
+            other.update_sep(False, "five")
+            result.update(other)
+            result.update(Result())
+            message = message + "\n" + (
+                "{} \nvs \n{}".format(result.message, "three and four\nfive")
+            )
+            assert result.message == "three and four\nfive"
+            assert result.status == False
+
+            # bounded mode keeps the most recent messages only
+            bounded = Result(max_messages=3)
+            for i in range(10):
+                bounded.append_message("message {}".format(i))
+            expected = "...7 earlier messages omitted...\nmessage 7\nmessage 8\nmessage 9"
+            message = message + "\n" + (
+                "{} \nvs \n{}".format(bounded.message, expected)
+            )
+            assert bounded.message == expected
+            assert bounded.omitted_message_count == 7
+            assert bounded.get_messages() == ["message 7", "message 8", "message 9"]
+
+            # omitted message count is carried over when updating an unbounded result
+            result = Result()
+            result.update(bounded)
+            assert result.omitted_message_count == 7
+            assert result.message == expected
+
+            # serialised output contains the joined message, not the message buffer
+            result = Result()
+            result.append_message("one")
+            result.append_message("two")
+            nested = Result()
+            nested.update_sep(False, "nested")
+            result.result.append(nested)
+            json_data = json.loads(result.to_json())
+            message = message + "\n" + "{}".format(json_data)
+            assert json_data == {
+                "message": "one\ntwo",
+                "status": True,
+                "result": [{"message": "nested", "status": False, "result": []}],
+            }
+            assert json.loads(result.to_json_utf()) == json_data
+            assert list(
+                json.loads(Result().to_json(), object_pairs_hook=OrderedDict).keys()
+            ) == [
+                "message",
+                "status",
+                "result",
+            ]
+            for output in [result.to_json(), str(result), repr(result)]:
+                assert "_messages" not in output, output
+                assert "_message_cache" not in output, output
+            assert "message: \n...one\n...two" in repr(result)
+            assert "message: one\ntwo" in str(result)
+            assert result.class_to_dict()["message"] == "one\ntwo"
+
+        except Exception as e:
+            flag = False
+            message = (
+                message
+                + "\n"
+                + (
+                    "An exception occurred in function {} : {}".format(
+                        self.test_name, e
+                    )
+                )
+            )
+        return flag, message
@@ -71,32 +71,34 @@ all_tests = [
 all_results = []
 
 
-# run tests
-for test_result in all_tests:
-    result = test_result.run_tests()
-    all_results.append(result)
-
-#: overall tests outcome: true of all tests successfully executed, otherwise False
-its_all_good = True
-
-# print("all_results \n",all_results)
-# check out what came back
-for batch_result in all_results:
-    # print('batch result\n', batch_result)
-    for result in batch_result:
-        #print('result\n', result)
-        # print(batch_result[result])
-        its_all_good = its_all_good & batch_result[result][0]
-        # write to log
-        if(batch_result[result][0] == False):
-            output("{} - Test: {} failed with message {}".format(time_stamp(), result, batch_result[result][1]))
-        else:
-            output("{} - Test: {} [{}]".format(time_stamp(), result, batch_result[result][0]))
+# worker processes started by tests import this module again: only run tests in the main process
+if __name__ == "__main__":
+    # run tests
+    for test_result in all_tests:
+        result = test_result.run_tests()
+        all_results.append(result)
+
+    #: overall tests outcome: true of all tests successfully executed, otherwise False
+    its_all_good = True
+
+    # print("all_results \n",all_results)
+    # check out what came back
+    for batch_result in all_results:
+        # print('batch result\n', batch_result)
+        for result in batch_result:
+            #print('result\n', result)
+            # print(batch_result[result])
+            its_all_good = its_all_good & batch_result[result][0]
+            # write to log
+            if(batch_result[result][0] == False):
+                output("{} - Test: {} failed with message {}".format(time_stamp(), result, batch_result[result][1]))
+            else:
+                output("{} - Test: {} [{}]".format(time_stamp(), result, batch_result[result][0]))
         
 
-# pass any error back to caller in powershell script
-if(its_all_good):
-    #sys.exit(1)
-    sys.exit(0)
-else:
-    sys.exit(1)
\ No newline at end of file
+    # pass any error back to caller in powershell script
+    if(its_all_good):
+        #sys.exit(1)
+        sys.exit(0)
+    else:
+        sys.exit(1)
\ No newline at end of file
@@ -33,6 +33,20 @@ import tempfile
 
 from duHast.Utilities.Objects import base
 
+#: environment variable enabling timing benchmarks when set to 1 ( these are slow and depend on machine load )
+RUN_BENCHMARKS_ENVIRONMENT_VARIABLE = "DUHAST_RUN_BENCHMARKS"
+
+
+def benchmarks_enabled():
+    """
+    Checks whether timing benchmarks are to be run.
+
+    :return: True if the benchmark environment variable is set to 1, otherwise False
+    :rtype: bool
+    """
+
+    return os.environ.get(RUN_BENCHMARKS_ENVIRONMENT_VARIABLE, "") == "1"
+
 
 class Test(base.Base):
     def __init__(self, test_name):